@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Run the offline browser-stack benchmark against local fixture pages and write JSON/Markdown reports."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aeiva.tool.meta.browser_stack.benchmark_harness import (
+    default_scenarios,
+    run_browser_benchmark,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark browser_stack operations on local fixture pages.")
+    parser.add_argument("--iterations", type=int, default=5, help="Runs per scenario.")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("--timeout-ms", type=int, default=15_000, help="Per-operation timeout in milliseconds.")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="Scenario name filter (repeatable): large_dom, nested_frames, long_form, infinite_scroll.",
+    )
+    parser.add_argument("--output-dir", default=None, help="Write JSON/Markdown reports into this directory.")
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> int:
+    scenarios = [item for item in default_scenarios() if not args.scenario or item.name in args.scenario]
+    if not scenarios:
+        print("No scenarios selected. Adjust --scenario.")
+        return 2
+    report = await run_browser_benchmark(
+        scenarios=scenarios,
+        iterations=args.iterations,
+        headless=not args.headed,
+        timeout_ms=args.timeout_ms,
+    )
+    payload = report.to_dict()
+    if args.output_dir:
+        output_dir = Path(args.output_dir).expanduser().resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        json_path = output_dir / f"browser-stack-benchmark-{stamp}.json"
+        md_path = output_dir / f"browser-stack-benchmark-{stamp}.md"
+        json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        md_path.write_text(report.render_markdown(), encoding="utf-8")
+        print(f"JSON report: {json_path}")
+        print(f"Markdown report: {md_path}")
+    print(report.render_markdown())
+    errors = sum(item["errors"] for item in payload["operations"].values())
+    return 0 if errors == 0 else 1
+
+
+def main() -> int:
+    return asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
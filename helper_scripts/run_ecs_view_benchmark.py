@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark incremental ECS views and change queries at high entity counts and low churn."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from dataclasses import dataclass
+from time import perf_counter
+
+from aeiva.ecs.ecs import World
+
+
+@dataclass
+class Position:
+    x: float
+    y: float
+
+
+@dataclass
+class Velocity:
+    vx: float
+    vy: float
+
+
+@dataclass
+class Health:
+    hp: int
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark ECS view caching and change detection.")
+    parser.add_argument("--entities", type=int, default=100_000, help="Entity count.")
+    parser.add_argument("--churn", type=float, default=0.01, help="Fraction of entities touched per tick.")
+    parser.add_argument("--ticks", type=int, default=20, help="Ticks to time.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def _populate(world: World, count: int) -> list:
+    layouts = (
+        lambda i: (Position(i, i), Velocity(1, 0)),
+        lambda i: (Position(i, i), Velocity(0, 1), Health(100)),
+        lambda i: (Position(i, i), Health(100)),
+        lambda i: (Position(i, i), Velocity(1, 1), Tag("unit")),
+    )
+    return [world.create_entity(*layouts[i % len(layouts)](i)) for i in range(count)]
+
+
+def _churn(world: World, entities: list, rng: random.Random, fraction: float) -> None:
+    for _ in range(max(1, int(len(entities) * fraction))):
+        position = rng.randrange(len(entities))
+        eid = entities[position]
+        roll = rng.random()
+        if roll < 0.7:
+            world.add_component(eid, Position(rng.random(), rng.random()))
+        elif roll < 0.85:
+            if world.has_component(eid, Health):
+                world.remove_component(eid, Health)
+            else:
+                world.add_component(eid, Health(50))
+        else:
+            world.destroy_entity(eid, immediate=True)
+            entities[position] = world.create_entity(Position(0, 0), Velocity(1, 0))
+
+
+def _cold_view(world: World, *types):
+    world._cache_view_single.clear()
+    world._cache_view_multi.clear()
+    return world.view(*types)
+
+
+def _full_scan(world: World, since_tick: int) -> list:
+    out = []
+    for arch in world._archetype_by_type.get(Position, ()):
+        ticks = arch.ticks[Position]
+        for row, stamp in enumerate(ticks):
+            if stamp > since_tick:
+                out.append(arch.entities[row])
+    return out
+
+
+def main() -> int:
+    args = _parse_args()
+    rng = random.Random(args.seed)
+    world = World()
+    entities = _populate(world, args.entities)
+    world.view(Position, Velocity)
+
+    timings = {"incremental_view_ms": 0.0, "cold_view_ms": 0.0, "changed_ms": 0.0, "full_scan_ms": 0.0}
+    changed_total = 0
+    for _ in range(args.ticks):
+        since = world.tick
+        world.update()
+        _churn(world, entities, rng, args.churn)
+
+        started = perf_counter()
+        warm = world.view(Position, Velocity)
+        timings["incremental_view_ms"] += (perf_counter() - started) * 1000
+
+        started = perf_counter()
+        cold = _cold_view(world, Position, Velocity)
+        timings["cold_view_ms"] += (perf_counter() - started) * 1000
+        assert len(warm) == len(cold)
+
+        started = perf_counter()
+        changed = world.changed(Position, since)
+        timings["changed_ms"] += (perf_counter() - started) * 1000
+
+        started = perf_counter()
+        scanned = _full_scan(world, since)
+        timings["full_scan_ms"] += (perf_counter() - started) * 1000
+        assert len(changed) == len(scanned)
+        changed_total += len(changed)
+
+    report = {
+        "entities": args.entities,
+        "churn": args.churn,
+        "ticks": args.ticks,
+        "avg_changed_per_tick": changed_total / args.ticks,
+        **{name: round(total / args.ticks, 3) for name, total in timings.items()},
+    }
+    report["view_speedup"] = round(report["cold_view_ms"] / max(report["incremental_view_ms"], 1e-9), 1)
+    report["changed_speedup"] = round(report["full_scan_ms"] / max(report["changed_ms"], 1e-9), 1)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark snapshot element matching on synthetic 200- and 2,000-node snapshots."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from aeiva.tool.meta.browser_stack.element_matching import (
+    _find_click_target_candidates_from_nodes,
+    _find_confirm_target_from_nodes,
+    _find_select_target_from_nodes,
+    _find_type_target_from_nodes,
+    _match_snapshot_nodes,
+)
+
+_WORDS = (
+    "email address first last name phone city country state zip street search submit "
+    "continue next cancel close done apply departure return date passengers promo code "
+    "newsletter terms privacy account password company title notes"
+).split()
+_ROLES = ("button", "link", "textbox", "combobox", "option", "input", "select", "checkbox", "div")
+
+
+def _synthetic_nodes(count: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    nodes = []
+    for i in range(count):
+        role = rng.choice(_ROLES)
+        label = " ".join(rng.sample(_WORDS, 2))
+        nodes.append(
+            {
+                "ref": f"e{i}",
+                "scope": "main",
+                "tag": "input" if role in {"textbox", "input", "combobox"} else "button",
+                "role": role,
+                "name": label.title(),
+                "text": label if role in {"button", "link", "option"} else "",
+                "aria_label": "",
+                "placeholder": label if role == "textbox" else "",
+                "value": "",
+                "aria_valuenow": "",
+                "input_type": "text" if role in {"textbox", "input"} else "",
+                "dom_id": f"field-{i}",
+                "name_attr": label.replace(" ", "_"),
+                "label_text": label,
+                "readonly": False,
+                "disabled": rng.random() < 0.05,
+                "selector": f'[data-aeiva-ref="e{i}"]',
+                "fallback_selector": f"form > div:nth-of-type({i + 1}) > {role}",
+            }
+        )
+    return nodes
+
+
+def _queries(nodes: List[Dict[str, Any]]) -> List[Callable[[List[Dict[str, Any]]], Any]]:
+    return [
+        lambda n: _find_type_target_from_nodes(n, value_text="Ada", field_hint="first name"),
+        lambda n: _find_type_target_from_nodes(n, value_text="ada@example.com", field_hint="email"),
+        lambda n: _find_type_target_from_nodes(n, value_text="2026-05-01", field_hint="departure date"),
+        lambda n: _find_select_target_from_nodes(n, values=["Canada"], field_hint="country"),
+        lambda n: _find_click_target_candidates_from_nodes(n, query_text="submit"),
+        lambda n: _find_confirm_target_from_nodes(n),
+        lambda n: _match_snapshot_nodes(n, "promo code"),
+    ]
+
+
+def _measure(nodes: List[Dict[str, Any]], repeats: int, warm: bool) -> Dict[str, float]:
+    queries = _queries(nodes)
+    samples: List[float] = []
+    for _ in range(repeats):
+        # A fresh list defeats the per-snapshot index cache (one query per snapshot).
+        target = nodes if warm else list(nodes)
+        start = time.perf_counter()
+        for query in queries:
+            if not warm:
+                target = list(nodes)
+            query(target)
+        samples.append((time.perf_counter() - start) * 1000.0 / len(queries))
+    samples.sort()
+    return {
+        "per_query_ms_p50": round(statistics.median(samples), 4),
+        "per_query_ms_p95": round(samples[int(len(samples) * 0.95) - 1], 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark indexed snapshot element matching.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 2000])
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        nodes = _synthetic_nodes(size, args.seed)
+        results.append(
+            {
+                "nodes": size,
+                "index_per_query": _measure(nodes, args.repeats, warm=False),
+                "index_shared": _measure(nodes, args.repeats, warm=True),
+            }
+        )
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
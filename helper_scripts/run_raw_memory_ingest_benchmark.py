@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Burst-ingest benchmark for RawMemoryNeuron journal writes (buffered vs direct)."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from typing import Any, Dict
+
+from aeiva.cognition.memory.raw_memory import RawMemoryNeuron
+from aeiva.event.event_names import EventNames
+from aeiva.neuron import Signal
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark raw memory burst ingest.")
+    parser.add_argument("--users", type=int, default=8, help="Distinct users writing concurrently.")
+    parser.add_argument("--sessions", type=int, default=50, help="Sessions per user.")
+    parser.add_argument("--utterances", type=int, default=20, help="Utterances per session.")
+    parser.add_argument("--fsync-policy", default="session", choices=["none", "session", "always"])
+    return parser.parse_args()
+
+
+async def _measure_loop_lag(stop: asyncio.Event, samples: list) -> None:
+    interval = 0.001
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - start - interval)
+
+
+async def _run_once(args: argparse.Namespace, buffered: bool) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as base_dir:
+        neuron = RawMemoryNeuron(config={
+            "raw_memory": {"base_dir": base_dir, "timezone": "UTC"},
+            "buffered_writes": buffered,
+            "fsync_policy": args.fsync_policy,
+        })
+        await neuron.setup()
+        stop = asyncio.Event()
+        lag: list = []
+        monitor = asyncio.create_task(_measure_loop_lag(stop, lag))
+
+        start = time.perf_counter()
+        for session in range(args.sessions):
+            for user in range(args.users):
+                sid = f"u{user}-s{session}"
+                for turn in range(args.utterances):
+                    await neuron.process(Signal(
+                        source=EventNames.RAW_MEMORY_UTTERANCE,
+                        data={"user_id": f"user{user}", "session_id": sid, "content": f"turn {turn} " * 8},
+                    ))
+                await neuron.process(Signal(
+                    source=EventNames.RAW_MEMORY_SESSION_END,
+                    data={"user_id": f"user{user}", "session_id": sid},
+                ))
+        await neuron.graceful_shutdown(timeout=5)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await monitor
+        lag.sort()
+        return {
+            "mode": "buffered" if buffered else "direct",
+            "sessions": args.users * args.sessions,
+            "utterances": args.users * args.sessions * args.utterances,
+            "elapsed_s": round(elapsed, 4),
+            "sessions_per_s": round(args.users * args.sessions / elapsed, 1),
+            "loop_lag_p99_ms": round(lag[int(len(lag) * 0.99)] * 1000, 3) if lag else 0.0,
+            "loop_lag_max_ms": round(lag[-1] * 1000, 3) if lag else 0.0,
+        }
+
+
+async def _run(args: argparse.Namespace) -> int:
+    results = [await _run_once(args, buffered=False), await _run_once(args, buffered=True)]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+def main() -> int:
+    return asyncio.run(_run(_parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -215,19 +215,33 @@ class Agent:
         for neuron in self._get_neurons():
             await neuron.setup()
 
-    async def _run_startup_tasks(self) -> None:
+    async def _run_startup_tasks(self, start_background: bool = True) -> None:
         """Run one-shot startup tasks after neuron setup."""
         if self.raw_memory_summary:
+            if self.raw_memory_summary.config.startup_catchup_background:
+                # Catchup can take many LLM calls; don't hold up agent startup.
+                # Without a long-lived loop (sync setup) it starts in run().
+                if start_background:
+                    self._start_background_catchup()
+                return
             try:
                 result = await self.raw_memory_summary.startup_catchup()
                 logger.info("SummaryMemory startup catchup result: %s", result)
             except Exception as exc:
                 logger.warning("SummaryMemory startup catchup failed: %s", exc)
 
-    async def _setup_runtime(self) -> None:
+    def _start_background_catchup(self) -> None:
+        """Start (or resume) background summary catchup if configured."""
+        summary = self.raw_memory_summary
+        if summary is None or not summary.config.startup_catchup_background:
+            return
+        if summary.catchup_progress().get("state") in ("idle", "cancelled"):
+            summary.start_background_catchup()
+
+    async def _setup_runtime(self, start_background: bool = True) -> None:
         """Create and initialize runtime neurons and startup tasks."""
         await self._setup_neurons()
-        await self._run_startup_tasks()
+        await self._run_startup_tasks(start_background=start_background)
 
     def _bind_tool_executor_context(self):
         """Bind action executor for the current async context."""
@@ -257,7 +271,7 @@ class Agent:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            asyncio.run(self._setup_runtime())
+            asyncio.run(self._setup_runtime(start_background=False))
         else:
             raise RuntimeError("Agent.setup() called inside a running event loop; use await setup_async().")
 
@@ -298,6 +312,8 @@ class Agent:
         if self.perception:
             await self.perception.start_sensors()
 
+        self._start_background_catchup()
+
         # Start raw memory session if provided
         if self.raw_memory and raw_memory_session:
             await self.event_bus.emit(EventNames.RAW_MEMORY_SESSION_START, payload=raw_memory_session)
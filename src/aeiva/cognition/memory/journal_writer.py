@@ -0,0 +1,219 @@
+"""
+Buffered journal writer for raw Markdown memory.
+
+Appends are buffered in memory per file and written in batches by a worker
+thread, keeping file handles open between flushes. Flushes happen when the
+buffer reaches ``flush_bytes``, every ``flush_interval`` seconds, or when the
+caller asks (session end, shutdown).
+
+fsync policies:
+    none     - rely on the OS page cache
+    session  - fsync on explicit flushes (session end) and on close
+    always   - fsync after every flush
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("none", "session", "always")
+
+
+class JournalWriter:
+    """
+    Batching append-only writer shared by raw memory journals.
+
+    append() never touches the disk; it only queues content.  Disk I/O runs
+    in flush_sync(), which async callers reach through asyncio.to_thread.
+    """
+
+    def __init__(
+        self,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        fsync_policy: str = "session",
+        max_open_files: int = 16,
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy!r} (expected one of {FSYNC_POLICIES})")
+        self.flush_bytes = max(0, int(flush_bytes))
+        self.flush_interval = float(flush_interval)
+        self.fsync_policy = fsync_policy
+        self.max_open_files = max(1, int(max_open_files))
+
+        self._pending: Dict[Path, List[str]] = {}
+        self._headers: Dict[Path, str] = {}
+        self._pending_bytes = 0
+        self._handles: "OrderedDict[Path, TextIO]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._timer_task: Optional[asyncio.Task] = None
+
+        self.appends = 0
+        self.flushes = 0
+        self.bytes_written = 0
+        self.fsyncs = 0
+
+    # ---- buffering ----
+
+    def append(self, path: Path, content: str, header: str = "") -> None:
+        """Queue content for ``path``; ``header`` is written if the file is new."""
+        with self._lock:
+            chunks = self._pending.setdefault(path, [])
+            if path not in self._headers:
+                self._headers[path] = header
+            chunks.append(content)
+            self._pending_bytes += len(content)
+            self.appends += 1
+            over = bool(self.flush_bytes) and self._pending_bytes >= self.flush_bytes
+        if over:
+            self._schedule_flush()
+
+    def pending_text(self, path: Path) -> str:
+        """Return content queued for ``path`` but not yet written."""
+        with self._lock:
+            return "".join(self._pending.get(path, ()))
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a worker thread or sync code: already off the loop.
+            self.flush_sync()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self.flush())
+            self._flush_task.add_done_callback(self._flush_done)
+
+    @staticmethod
+    def _flush_done(task: "asyncio.Task[int]") -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Journal writer background flush failed: %s", exc, exc_info=exc)
+
+    # ---- flushing ----
+
+    def flush_sync(self, paths: Optional[Iterable[Path]] = None, fsync: Optional[bool] = None) -> int:
+        """Write queued content to disk.  Returns the number of bytes written."""
+        if fsync is None:
+            fsync = self.fsync_policy == "always"
+        written = 0
+        with self._io_lock:
+            # Take under the I/O lock so concurrent flushes keep append order.
+            batch = self._take(paths)
+            for path, header, chunks in batch:
+                data = "".join(chunks)
+                handle = self._open(path, header)
+                handle.write(data)
+                handle.flush()
+                if fsync:
+                    os.fsync(handle.fileno())
+                    self.fsyncs += 1
+                written += len(data)
+            if batch:
+                self.flushes += 1
+                self.bytes_written += written
+        return written
+
+    async def flush(self, paths: Optional[Iterable[Path]] = None, fsync: Optional[bool] = None) -> int:
+        paths = list(paths) if paths is not None else None
+        return await asyncio.to_thread(self.flush_sync, paths, fsync)
+
+    def flush_session_sync(self, paths: Iterable[Path]) -> int:
+        """Flush at a session boundary, honouring the ``session`` fsync policy."""
+        return self.flush_sync(paths, fsync=self.fsync_policy != "none")
+
+    async def flush_session(self, paths: Iterable[Path]) -> int:
+        return await asyncio.to_thread(self.flush_session_sync, list(paths))
+
+    def _take(self, paths: Optional[Iterable[Path]]) -> List[Tuple[Path, str, List[str]]]:
+        with self._lock:
+            keys = list(self._pending) if paths is None else [p for p in paths if p in self._pending]
+            batch = []
+            for path in keys:
+                chunks = self._pending.pop(path)
+                header = self._headers.pop(path, "")
+                self._pending_bytes -= sum(len(chunk) for chunk in chunks)
+                batch.append((path, header, chunks))
+            return batch
+
+    def _open(self, path: Path, header: str) -> TextIO:
+        handle = self._handles.get(path)
+        if handle is not None and not handle.closed:
+            self._handles.move_to_end(path)
+            return handle
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = path.open("a", encoding="utf-8")
+        if handle.tell() == 0 and header:
+            handle.write(header)
+        self._handles[path] = handle
+        while len(self._handles) > self.max_open_files:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+        return handle
+
+    # ---- lifecycle ----
+
+    def start(self) -> None:
+        """Start the periodic flush timer on the running loop."""
+        if self.flush_interval <= 0:
+            return
+        if self._timer_task is not None and not self._timer_task.done():
+            return
+        self._timer_task = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._pending_bytes:
+                continue
+            try:
+                await self.flush()
+            except OSError as exc:
+                logger.warning("Journal writer periodic flush failed: %s", exc)
+
+    def close_sync(self) -> None:
+        """Flush everything and close open handles."""
+        self.flush_sync(fsync=self.fsync_policy != "none")
+        with self._io_lock:
+            while self._handles:
+                _, handle = self._handles.popitem(last=False)
+                try:
+                    handle.close()
+                except OSError as exc:
+                    logger.warning("Failed to close journal file: %s", exc)
+
+    async def close(self) -> None:
+        timer, self._timer_task = self._timer_task, None
+        if timer is not None and not timer.done():
+            timer.cancel()
+            await asyncio.gather(timer, return_exceptions=True)
+        if self._flush_task is not None and not self._flush_task.done():
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+        await asyncio.to_thread(self.close_sync)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "appends": self.appends,
+            "flushes": self.flushes,
+            "bytes_written": self.bytes_written,
+            "fsyncs": self.fsyncs,
+            "pending_bytes": self._pending_bytes,
+            "open_files": len(self._handles),
+            "fsync_policy": self.fsync_policy,
+        }
@@ -3,6 +3,8 @@ Raw Markdown memory (journal + neuron).
 
 Stores dialogue sessions in daily Markdown files and keeps
 long-term user memory in <username>.md under each user folder.
+The neuron writes through a buffered JournalWriter so disk I/O stays off
+the event loop.
 """
 
 from __future__ import annotations
@@ -11,18 +13,22 @@ import json
 import asyncio
 import logging
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, tzinfo
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 from uuid import uuid4
 
 from aeiva.config.base_config import BaseConfig
+from aeiva.cognition.memory.journal_writer import JournalWriter
 from aeiva.neuron import BaseNeuron, NeuronConfig, Signal
 from aeiva.event.event_names import EventNames
 
 logger = logging.getLogger(__name__)
 
+_SESSION_HEADING = re.compile(r"^## Session (\S+)", re.MULTILINE)
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -101,7 +107,11 @@ class RawMemoryJournal:
             YY-WeekWW.md          # Weekly summary
     """
 
-    def __init__(self, config: Optional[Union[RawMemoryConfig, Dict[str, Any]]] = None):
+    def __init__(
+        self,
+        config: Optional[Union[RawMemoryConfig, Dict[str, Any]]] = None,
+        writer: Optional[JournalWriter] = None,
+    ):
         if config is None:
             self.config = RawMemoryConfig()
         elif isinstance(config, dict):
@@ -114,6 +124,12 @@ class RawMemoryJournal:
         self._user_dir = self._base_dir / self.user_id
         self._sessions: Dict[str, RawSession] = {}
         self._tzinfo = self._resolve_timezone(self.config.timezone)
+        # Optional buffered writer; without one every append hits the disk.
+        self._writer = writer
+        # Session ids already in each daily file, so session end does not
+        # re-read the whole file. Filled lazily; written from I/O threads.
+        self._written_sessions: Dict[Path, Set[str]] = {}
+        self._written_lock = threading.Lock()
 
         user_memory_name = self.config.user_memory_file or f"{self.user_id}.md"
         self._user_memory_path = self._user_dir / user_memory_name
@@ -165,15 +181,38 @@ class RawMemoryJournal:
         meta: Optional[Dict[str, Any]] = None,
         user_memory_updates: Optional[Sequence[str]] = None,
     ) -> Path:
+        end_time = end_time or _utc_now()
+        daily_path, block = self.close_session(session_id, end_time=end_time, summary=summary, meta=meta)
+        self.write_session_block(daily_path, session_id, block, end_time, user_memory_updates)
+        return daily_path
+
+    def close_session(
+        self,
+        session_id: str,
+        end_time: Optional[datetime] = None,
+        summary: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Path, str]:
+        """Drop the session from memory and render its block; no file I/O."""
         end_time = end_time or _utc_now()
         session = self._sessions.pop(session_id, None)
         if session is None:
             session = RawSession(session_id=session_id, start_time=end_time)
+        return self._daily_path(end_time), self._format_session_block(session, end_time, summary, meta)
 
-        content = self._format_session_block(session, end_time, summary, meta)
-        daily_path = self._daily_path(end_time)
+    def write_session_block(
+        self,
+        daily_path: Path,
+        session_id: str,
+        block: str,
+        end_time: datetime,
+        user_memory_updates: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Append a block from `close_session` unless the daily file already has it (may hit disk)."""
         if not self._session_block_exists(daily_path, session_id):
-            self._append_to_file(daily_path, content, header=f"# {self._date_key(end_time)}\n\n")
+            self._append_to_file(daily_path, block, header=f"# {self._date_key(end_time)}\n\n")
+            with self._written_lock:
+                self._written_sessions.setdefault(daily_path, set()).add(session_id)
 
         if user_memory_updates:
             self.append_user_memory(
@@ -182,8 +221,6 @@ class RawMemoryJournal:
                 session_id=session_id,
             )
 
-        return daily_path
-
     def render_session(
         self,
         session_id: str,
@@ -398,6 +435,9 @@ class RawMemoryJournal:
         return period
 
     def _append_to_file(self, path: Path, content: str, header: str) -> None:
+        if self._writer is not None:
+            self._writer.append(path, content, header=header)
+            return
         path.parent.mkdir(parents=True, exist_ok=True)
         if not path.exists():
             path.write_text(header, encoding="utf-8")
@@ -405,14 +445,23 @@ class RawMemoryJournal:
             f.write(content)
 
     def _session_block_exists(self, path: Path, session_id: str) -> bool:
+        with self._written_lock:
+            known = self._written_sessions.get(path)
+        if known is None:
+            known = self._scan_session_ids(path)
+            with self._written_lock:
+                known = self._written_sessions.setdefault(path, known)
+        return session_id in known
+
+    @staticmethod
+    def _scan_session_ids(path: Path) -> Set[str]:
         if not path.exists():
-            return False
-        marker = f"## Session {session_id}"
+            return set()
         try:
             text = path.read_text(encoding="utf-8")
         except OSError:
-            return False
-        return marker in text
+            return set()
+        return set(_SESSION_HEADING.findall(text))
 
     @staticmethod
     def _resolve_timezone(value: Optional[str]) -> Optional[tzinfo]:
@@ -458,6 +507,11 @@ class RawMemoryNeuronConfig(NeuronConfig):
     output_event: str = EventNames.RAW_MEMORY_RESULT
     auto_start_session: bool = True
     auto_close_on_reply: bool = False
+    buffered_writes: bool = True
+    flush_bytes: int = 64 * 1024
+    flush_interval: float = 1.0
+    fsync_policy: str = "session"
+    max_open_files: int = 16
 
 
 class RawMemoryNeuron(BaseNeuron):
@@ -488,6 +542,15 @@ class RawMemoryNeuron(BaseNeuron):
         self._active_sessions: Dict[str, str] = {}
         self._assistant_buffers: Dict[str, List[str]] = {}
         self._events_processed = 0
+        self._pending_writes: Set[asyncio.Task] = set()
+        self._writer: Optional[JournalWriter] = None
+        if self.config.buffered_writes:
+            self._writer = JournalWriter(
+                flush_bytes=self.config.flush_bytes,
+                flush_interval=self.config.flush_interval,
+                fsync_policy=self.config.fsync_policy,
+                max_open_files=self.config.max_open_files,
+            )
 
     @classmethod
     def build_config(cls, data: Any) -> RawMemoryNeuronConfig:
@@ -505,8 +568,18 @@ class RawMemoryNeuron(BaseNeuron):
             output_event=data.get("output_event", EventNames.RAW_MEMORY_RESULT),
             auto_start_session=data.get("auto_start_session", True),
             auto_close_on_reply=data.get("auto_close_on_reply", False),
+            buffered_writes=bool(data.get("buffered_writes", True)),
+            flush_bytes=int(data.get("flush_bytes", 64 * 1024)),
+            flush_interval=float(data.get("flush_interval", 1.0)),
+            fsync_policy=str(data.get("fsync_policy", "session")),
+            max_open_files=int(data.get("max_open_files", 16)),
         )
 
+    async def setup(self) -> None:
+        await super().setup()
+        if self._writer is not None:
+            self._writer.start()
+
     async def process(self, signal: Signal) -> Optional[Dict[str, Any]]:
         self._events_processed += 1
         try:
@@ -519,7 +592,7 @@ class RawMemoryNeuron(BaseNeuron):
             if source == EventNames.RAW_MEMORY_UTTERANCE:
                 return self._handle_explicit_utterance(signal)
             if source == EventNames.RAW_MEMORY_USER_UPDATE:
-                return self._handle_user_update(signal)
+                return await self._handle_user_update(signal)
             if source == EventNames.AGENT_STOP:
                 return await self._handle_agent_stop(signal)
             perception_prefix = EventNames.ALL_PERCEPTION[:-1]
@@ -608,15 +681,11 @@ class RawMemoryNeuron(BaseNeuron):
             return journal.daily_path(end_time)
 
         session_text = journal.render_session(session_id=session_id, end_time=end_time)
-        path = journal.end_session(
-            session_id=session_id,
-            end_time=end_time,
-            summary=summary,
-            meta=meta,
-            user_memory_updates=user_updates,
-        )
+        # Session state changes here on the loop; only file I/O goes to a thread.
+        path, block = journal.close_session(session_id, end_time=end_time, summary=summary, meta=meta)
         self._active_sessions.pop(user_id, None)
         self._assistant_buffers.pop(user_id, None)
+        await asyncio.to_thread(self._write_closed_session, journal, path, session_id, block, end_time, user_updates)
         await self._emit_session_closed(
             signal=signal,
             user_id=user_id,
@@ -650,7 +719,7 @@ class RawMemoryNeuron(BaseNeuron):
         )
         return {"success": True, "session_id": session_id, "role": role}
 
-    def _handle_user_update(self, signal: Signal) -> Dict[str, Any]:
+    async def _handle_user_update(self, signal: Signal) -> Dict[str, Any]:
         payload = signal.data if isinstance(signal.data, dict) else {}
         user_id = self._extract_user_id(signal)
         updates = payload.get("updates") or payload.get("content")
@@ -666,6 +735,8 @@ class RawMemoryNeuron(BaseNeuron):
             session_id=session_id,
             meta=meta,
         )
+        if self._writer is not None:
+            await self._writer.flush([path])
         return {"success": True, "path": str(path)}
 
     async def _emit_session_closed(
@@ -767,7 +838,9 @@ class RawMemoryNeuron(BaseNeuron):
         )
 
         if self.config.auto_close_on_reply and final:
-            journal.end_session(session_id=session_id, end_time=_from_signal_ts(signal))
+            end_time = _from_signal_ts(signal)
+            path, block = journal.close_session(session_id, end_time=end_time)
+            self._schedule_session_write(journal, path, session_id, block, end_time)
             self._active_sessions.pop(user_id, None)
             self._assistant_buffers.pop(user_id, None)
 
@@ -785,9 +858,59 @@ class RawMemoryNeuron(BaseNeuron):
                 user_memory_file=self.config.raw_memory.user_memory_file,
                 timezone=self.config.raw_memory.timezone,
             )
-            self._journals[user_key] = RawMemoryJournal(cfg)
+            self._journals[user_key] = RawMemoryJournal(cfg, writer=self._writer)
         return self._journals[user_key]
 
+    def _write_closed_session(
+        self,
+        journal: RawMemoryJournal,
+        daily_path: Path,
+        session_id: str,
+        block: str,
+        end_time: datetime,
+        user_updates: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Write a closed session and make it durable before others read the daily file.
+
+        Runs in a worker thread: the block write and the flush share one hop.
+        """
+        journal.write_session_block(daily_path, session_id, block, end_time, user_updates)
+        if self._writer is not None:
+            self._writer.flush_session_sync([daily_path, journal._user_memory_path])
+
+    def _schedule_session_write(
+        self,
+        journal: RawMemoryJournal,
+        daily_path: Path,
+        session_id: str,
+        block: str,
+        end_time: datetime,
+    ) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_closed_session(journal, daily_path, session_id, block, end_time)
+            return
+        task = asyncio.create_task(
+            asyncio.to_thread(self._write_closed_session, journal, daily_path, session_id, block, end_time)
+        )
+        self._pending_writes.add(task)
+        task.add_done_callback(lambda done: self._session_write_done(session_id, done))
+
+    def _session_write_done(self, session_id: str, task: asyncio.Task) -> None:
+        self._pending_writes.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Failed to write raw memory session %s: %s", session_id, exc, exc_info=exc)
+
+    def health_check(self) -> dict:
+        """Return health status with journal writer counters."""
+        health = super().health_check()
+        health["journal_writer"] = self._writer.stats() if self._writer is not None else None
+        return health
+
 
     def _ensure_session(self, user_id: str) -> str:
         session_id = self._active_sessions.get(user_id)
@@ -880,18 +1003,30 @@ class RawMemoryNeuron(BaseNeuron):
         )
 
     async def teardown(self) -> None:
-        self._close_all_sessions()
+        await self._close_all_sessions()
+        if self._pending_writes:
+            await asyncio.gather(*list(self._pending_writes), return_exceptions=True)
+        if self._writer is not None:
+            # Durability point: everything buffered reaches disk before exit.
+            await self._writer.close()
         await super().teardown()
 
-    def _close_all_sessions(self) -> None:
+    async def _close_all_sessions(self) -> None:
         if not self._active_sessions:
             return
         end_time = _utc_now()
+        closed = []
         for user_id, session_id in list(self._active_sessions.items()):
             journal = self._journal(user_id)
+            closed.append((journal, session_id, *journal.close_session(session_id, end_time=end_time)))
+        self._active_sessions.clear()
+        self._assistant_buffers.clear()
+        await asyncio.to_thread(self._write_sessions, closed, end_time)
+
+    @staticmethod
+    def _write_sessions(closed: List[Tuple[RawMemoryJournal, str, Path, str]], end_time: datetime) -> None:
+        for journal, session_id, path, block in closed:
             try:
-                journal.end_session(session_id=session_id, end_time=end_time)
+                journal.write_session_block(path, session_id, block, end_time)
             except Exception as exc:
                 logger.warning("Failed to close session %s: %s", session_id, exc)
-        self._active_sessions.clear()
-        self._assistant_buffers.clear()
@@ -4,6 +4,8 @@ SummaryMemoryNeuron: LLM-based summarization for raw memory.
 Primary mechanism: **startup catchup** — on every program start, scan recent
 daily files for unsummarized sessions and missing period summaries, then
 generate them via LLM.  This eliminates all shutdown-timing dependencies.
+Catchup runs as a checkpointed background job with bounded concurrency, so
+agent startup never waits on the backlog.
 
 The event-based path (raw_memory.session.closed) is kept as a best-effort
 bonus for immediate feedback when the shutdown is clean.
@@ -18,13 +20,14 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from aeiva.neuron import BaseNeuron, NeuronConfig, Signal
 from aeiva.cognition.memory.raw_memory import RawMemoryConfig, RawMemoryJournal
 from aeiva.event.event_names import EventNames
 from aeiva.llm.llm_client import LLMClient
 from aeiva.llm.llm_gateway_config import LLMGatewayConfig
+from aeiva.llm.rate_limiter import llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,11 @@ DEFAULT_INPUT_EVENTS = [
     EventNames.RAW_MEMORY_SUMMARY_REQUEST,
 ]
 DEFAULT_SUMMARY_PERIODS = ["dialogue", "daily", "weekly", "monthly", "yearly"]
+DEFAULT_CATCHUP_CHECKPOINT_FILE = ".summary_catchup.json"
+
+# Catchup stages: each period is built from the summaries of the stage before it.
+_CATCHUP_STAGES = {"dialogue": 0, "daily": 0, "weekly": 1, "monthly": 2, "yearly": 3}
+_CATCHUP_STAGE_NAMES = {0: "dialogue/daily", 1: "weekly", 2: "monthly", 3: "yearly"}
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are a memory summarizer for an AI assistant. "
@@ -50,6 +58,18 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@dataclass
+class _CatchupJob:
+    """One unit of startup catchup work (a session or a period summary)."""
+
+    key: str
+    period: str
+    timestamp: datetime
+    stage: int
+    session_id: Optional[str] = None
+    block: str = ""
+
+
 @dataclass
 class SummaryMemoryNeuronConfig(NeuronConfig):
     raw_memory: RawMemoryConfig = field(default_factory=RawMemoryConfig)
@@ -57,6 +77,9 @@ class SummaryMemoryNeuronConfig(NeuronConfig):
     input_events: List[str] = field(default_factory=lambda: DEFAULT_INPUT_EVENTS.copy())
     summary_periods: List[str] = field(default_factory=lambda: DEFAULT_SUMMARY_PERIODS.copy())
     startup_catchup_enabled: bool = True
+    startup_catchup_background: bool = True
+    startup_catchup_concurrency: int = 3
+    startup_catchup_checkpoint_file: Optional[str] = DEFAULT_CATCHUP_CHECKPOINT_FILE
     summary_temperature: float = 0.2
     summary_max_chars: int = 8000
     system_prompt: str = DEFAULT_SYSTEM_PROMPT
@@ -68,6 +91,7 @@ class SummaryMemoryNeuron(BaseNeuron):
 
     Two mechanisms:
     1. **startup_catchup()** — scan files on startup, fill gaps (primary).
+       Runs in the background via start_background_catchup() by default.
     2. **process()** — handle raw_memory.session.closed events (best-effort).
     """
 
@@ -90,6 +114,11 @@ class SummaryMemoryNeuron(BaseNeuron):
         self._llm_client: Optional[LLMClient] = None
         self._enabled = True
         self._last_session_end: Dict[str, datetime] = {}
+        self._catchup_task: Optional[asyncio.Task] = None
+        self._catchup_running = False
+        # Serializes "summary exists?" with the write that follows it.
+        self._write_lock = asyncio.Lock()
+        self._catchup_progress: Dict[str, Any] = {"state": "idle"}
 
     @classmethod
     def build_config(cls, data: Any) -> SummaryMemoryNeuronConfig:
@@ -107,6 +136,11 @@ class SummaryMemoryNeuron(BaseNeuron):
             input_events=data.get("input_events", DEFAULT_INPUT_EVENTS.copy()),
             summary_periods=data.get("summary_periods", DEFAULT_SUMMARY_PERIODS.copy()),
             startup_catchup_enabled=bool(data.get("startup_catchup_enabled", True)),
+            startup_catchup_background=bool(data.get("startup_catchup_background", True)),
+            startup_catchup_concurrency=int(data.get("startup_catchup_concurrency", 3)),
+            startup_catchup_checkpoint_file=data.get(
+                "startup_catchup_checkpoint_file", DEFAULT_CATCHUP_CHECKPOINT_FILE,
+            ),
             summary_temperature=data.get("summary_temperature", 0.2),
             summary_max_chars=data.get("summary_max_chars", 8000),
             system_prompt=data.get("system_prompt", DEFAULT_SYSTEM_PROMPT),
@@ -129,48 +163,245 @@ class SummaryMemoryNeuron(BaseNeuron):
         """
         Catch up on missed summaries from previous runs.
 
-        Called once at agent startup.  Scans recent daily files for
-        unsummarized sessions and missing period summaries, then generates
-        them via LLM.
+        Scans recent daily files for unsummarized sessions and missing period
+        summaries, then generates them via LLM with bounded concurrency.
+        Stages run in dependency order (dialogue/daily, weekly, monthly,
+        yearly) and every finished job is checkpointed, so an interrupted
+        catchup resumes where it stopped on the next start.
+        """
+        reason = self._catchup_skip_reason()
+        if reason:
+            return {"skipped": True, "reason": reason}
+        return await self._run_catchup()
+
+    def start_background_catchup(self) -> Optional[asyncio.Task]:
+        """
+        Schedule startup catchup as a background task and return it.
+
+        Agent startup does not wait on the returned task; progress is
+        available through catchup_progress().
         """
+        reason = self._catchup_skip_reason()
+        if reason:
+            self._catchup_progress["state"] = "skipped"
+            self._catchup_progress["reason"] = reason
+            return None
+        if self._catchup_task and not self._catchup_task.done():
+            return self._catchup_task
+        self._catchup_task = asyncio.create_task(
+            self._run_catchup_logged(), name=f"{self.name}.startup_catchup",
+        )
+        return self._catchup_task
+
+    def catchup_progress(self) -> Dict[str, Any]:
+        """Return a snapshot of startup catchup progress metrics."""
+        progress = dict(self._catchup_progress)
+        progress["results"] = dict(progress.get("results") or {})
+        started = progress.get("started_at")
+        if started is not None:
+            finished = progress.get("finished_at") or _utc_now().timestamp()
+            progress["elapsed_seconds"] = round(finished - started, 3)
+        return progress
+
+    def health_check(self) -> dict:
+        """Return health status with startup catchup progress."""
+        health = super().health_check()
+        health["startup_catchup"] = self.catchup_progress()
+        return health
+
+    async def graceful_shutdown(self, timeout: float = None) -> None:
+        await self._cancel_catchup()
+        await super().graceful_shutdown(timeout)
+
+    def _catchup_in_progress(self) -> bool:
+        # A scheduled task counts before its first step; catchup plans the
+        # same sessions and periods as the session-start handler.
+        task = self._catchup_task
+        return self._catchup_running or (task is not None and not task.done())
+
+    def _catchup_skip_reason(self) -> Optional[str]:
         if not self.config.startup_catchup_enabled:
             logger.info("SummaryMemoryNeuron startup catchup disabled by config")
-            return {"skipped": True, "reason": "disabled_by_config"}
-
+            return "disabled_by_config"
         if not self._enabled:
             logger.info("SummaryMemoryNeuron disabled, skipping startup catchup")
-            return {"skipped": True, "reason": "llm_unavailable"}
+            return "llm_unavailable"
+        return None
 
+    async def _run_catchup_logged(self) -> Dict[str, Any]:
+        try:
+            result = await self._run_catchup()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("SummaryMemory background catchup failed: %s", exc, exc_info=True)
+            return {"success": False, "error": str(exc)}
+        logger.info("SummaryMemory background catchup result: %s", result)
+        return result
+
+    async def _cancel_catchup(self) -> None:
+        task = self._catchup_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _run_catchup(self) -> Dict[str, Any]:
         user_id = self.config.raw_memory.user_id
         results = {"dialogue_summaries": 0, "period_summaries": 0, "user_updates": 0}
+        progress = self._catchup_progress
+        progress.update({
+            "state": "running",
+            "reason": None,
+            "stage": None,
+            "total": 0,
+            "completed": 0,
+            "resumed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "deferred": 0,
+            "started_at": _utc_now().timestamp(),
+            "finished_at": None,
+            "results": results,
+        })
+
+        self._catchup_running = True
+        try:
+            jobs = await asyncio.to_thread(self._plan_catchup_jobs, user_id)
+            done = await self._load_catchup_checkpoint(user_id)
+            progress["total"] = len(jobs)
+
+            stages: Dict[int, List[_CatchupJob]] = {}
+            for job in jobs:
+                if job.key in done:
+                    progress["resumed"] += 1
+                    continue
+                stages.setdefault(job.stage, []).append(job)
+
+            # Only keep checkpoint keys that belong to the current plan.
+            done &= {job.key for job in jobs}
+            semaphore = asyncio.Semaphore(max(1, int(self.config.startup_catchup_concurrency)))
+            checkpoint_lock = asyncio.Lock()
+
+            async def run_job(job: _CatchupJob) -> bool:
+                async with semaphore:
+                    progress["in_flight"] += 1
+                    try:
+                        await self._run_catchup_job(user_id, job, results)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as exc:
+                        logger.warning("Startup catchup job %s failed: %s", job.key, exc)
+                        progress["failed"] += 1
+                        return False
+                    finally:
+                        progress["in_flight"] -= 1
+                async with checkpoint_lock:
+                    done.add(job.key)
+                    await self._save_catchup_checkpoint(user_id, done)
+                progress["completed"] += 1
+                return True
+
+            ordered = sorted(stages.items())
+            for index, (stage, stage_jobs) in enumerate(ordered):
+                progress["stage"] = _CATCHUP_STAGE_NAMES.get(stage, str(stage))
+                outcomes = await asyncio.gather(*(run_job(job) for job in stage_jobs))
+                if not all(outcomes):
+                    # Higher periods are built from lower ones; retry them next run.
+                    progress["deferred"] = sum(len(rest) for _, rest in ordered[index + 1:])
+                    break
+        except asyncio.CancelledError:
+            progress["state"] = "cancelled"
+            raise
+        except Exception:
+            progress["state"] = "failed"
+            raise
+        finally:
+            self._catchup_running = False
+            progress["in_flight"] = 0
+            progress["finished_at"] = _utc_now().timestamp()
+
+        progress["state"] = "completed" if not progress["failed"] else "partial"
+        progress["stage"] = None
+        logger.info("Startup catchup complete: %s", results)
+        return results
 
-        # 1. Summarize unsummarized dialogue sessions
+    def _plan_catchup_jobs(self, user_id: str) -> List[_CatchupJob]:
+        jobs: List[_CatchupJob] = []
         for sid, block, ts in self._find_unsummarized_sessions(user_id):
-            context = self._strip_summary_sections(block)
-            context = self._normalize_context(context)
-            if not context:
-                continue
-            logger.info("Startup: summarizing session %s...", sid[:8])
-            summary, updates = await self._summarize("dialogue", context, {"session_id": sid}, ts)
-            if summary:
-                self._write_dialogue_summary(user_id, sid, summary, ts, None)
-                results["dialogue_summaries"] += 1
-            elif self._should_write_empty_summary(context):
-                self._write_dialogue_summary(user_id, sid, "", ts, {"skipped": True})
-                results["dialogue_summaries"] += 1
-            if updates:
-                self._write_user_updates(user_id, updates, ts, sid, None)
-                results["user_updates"] += len(updates)
-
-        # 2. Fill missing period summaries for recent complete periods
+            jobs.append(_CatchupJob(
+                key=f"dialogue:{sid}", period="dialogue", timestamp=ts,
+                stage=_CATCHUP_STAGES["dialogue"], session_id=sid, block=block,
+            ))
         periods = [p.lower() for p in self.config.summary_periods]
         for period, ts in self._find_missing_period_summaries(user_id, periods):
-            logger.info("Startup: generating %s summary...", period)
-            await self._summarize_period(user_id, period, ts, {})
+            jobs.append(_CatchupJob(
+                key=f"{period}:{self._period_key(period, ts)}", period=period,
+                timestamp=ts, stage=_CATCHUP_STAGES[period],
+            ))
+        return jobs
+
+    async def _run_catchup_job(
+        self, user_id: str, job: _CatchupJob, results: Dict[str, int],
+    ) -> None:
+        if job.period != "dialogue":
+            logger.info("Startup: generating %s summary...", job.period)
+            await self._summarize_period(user_id, job.period, job.timestamp, {})
             results["period_summaries"] += 1
+            return
 
-        logger.info("Startup catchup complete: %s", results)
-        return results
+        sid, ts = job.session_id or "", job.timestamp
+        context = self._strip_summary_sections(job.block)
+        context = self._normalize_context(context)
+        if not context:
+            return
+        if await self._summary_exists(user_id, "dialogue", ts, sid):
+            return
+        logger.info("Startup: summarizing session %s...", sid[:8])
+        summary, updates = await self._summarize("dialogue", context, {"session_id": sid}, ts)
+        written, update_count = await self._store_dialogue_summary(
+            user_id, sid, context, summary, updates, ts, None,
+        )
+        results["dialogue_summaries"] += int(written)
+        results["user_updates"] += update_count
+
+    def _catchup_checkpoint_path(self, user_id: str) -> Optional[Path]:
+        name = self.config.startup_catchup_checkpoint_file
+        if not name:
+            return None
+        return self._user_dir(user_id) / name
+
+    async def _load_catchup_checkpoint(self, user_id: str) -> Set[str]:
+        path = self._catchup_checkpoint_path(user_id)
+        if path is None or not path.exists():
+            return set()
+        try:
+            data = json.loads(await self._read_file(path))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable catchup checkpoint %s: %s", path, exc)
+            return set()
+        completed = data.get("completed") if isinstance(data, dict) else None
+        return {str(key) for key in completed} if isinstance(completed, list) else set()
+
+    async def _save_catchup_checkpoint(self, user_id: str, done: Set[str]) -> None:
+        path = self._catchup_checkpoint_path(user_id)
+        if path is None:
+            return
+        payload = json.dumps(
+            {"completed": sorted(done), "updated_at": _utc_now().isoformat()},
+            ensure_ascii=False, indent=2,
+        )
+
+        def _write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(path)
+
+        try:
+            await asyncio.to_thread(_write)
+        except OSError as exc:
+            logger.warning("Failed to write catchup checkpoint %s: %s", path, exc)
 
     def _find_unsummarized_sessions(self, user_id: str) -> List[Tuple[str, str, datetime]]:
         """Find sessions in recent daily files that lack a summary."""
@@ -301,6 +532,9 @@ class SummaryMemoryNeuron(BaseNeuron):
         payload = signal.data if isinstance(signal.data, dict) else {}
         user_id = self._extract_user_id(signal)
         results: Dict[str, Any] = {"dialogue": False, "periods": [], "user_updates": 0}
+        if self._catchup_in_progress():
+            # Catchup already covers the latest session and missing periods.
+            return {"success": True, "skipped": True, "reason": "catchup_in_progress"}
 
         # Dialogue summary for the most recent unsummarized session
         latest = self._find_latest_unsummarized_session(user_id)
@@ -313,15 +547,11 @@ class SummaryMemoryNeuron(BaseNeuron):
                     summary, updates = await self._summarize(
                         "dialogue", context, {"session_id": sid}, ts,
                     )
-                    if summary:
-                        self._write_dialogue_summary(user_id, sid, summary, ts, payload.get("meta"))
-                        results["dialogue"] = True
-                    elif self._should_write_empty_summary(context):
-                        self._write_dialogue_summary(user_id, sid, "", ts, {"skipped": True})
-                        results["dialogue"] = True
-                    if updates:
-                        self._write_user_updates(user_id, updates, ts, sid, payload.get("meta"))
-                        results["user_updates"] += len(updates)
+                    written, update_count = await self._store_dialogue_summary(
+                        user_id, sid, context, summary, updates, ts, payload.get("meta"),
+                    )
+                    results["dialogue"] = written
+                    results["user_updates"] += update_count
 
         # Missing period summaries for the most recent completed periods
         periods = [p.lower() for p in self.config.summary_periods]
@@ -349,20 +579,10 @@ class SummaryMemoryNeuron(BaseNeuron):
                     summary, user_updates = await self._summarize(
                         "dialogue", context, payload, end_time,
                     )
-                    if summary:
-                        self._write_dialogue_summary(user_id, session_id, summary, end_time, payload.get("meta"))
-                        results["dialogue"] = True
-                    elif self._should_write_empty_summary(context):
-                        self._write_dialogue_summary(
-                            user_id,
-                            session_id,
-                            "",
-                            end_time,
-                            {"skipped": True},
-                        )
-                        results["dialogue"] = True
-                    if user_updates:
-                        self._write_user_updates(user_id, user_updates, end_time, session_id, payload.get("meta"))
+                    written, _ = await self._store_dialogue_summary(
+                        user_id, session_id, context, summary, user_updates, end_time, payload.get("meta"),
+                    )
+                    results["dialogue"] = written
 
         # Period crossing detection
         prev_end = self._last_session_end.get(user_id)
@@ -397,12 +617,16 @@ class SummaryMemoryNeuron(BaseNeuron):
             return {"success": True, "skipped": True, "reason": "empty_context"}
 
         summary, user_updates = await self._summarize(period, context, payload, timestamp)
-        if summary:
-            self._write_summary(user_id, period, summary, timestamp, session_id, payload.get("meta"))
-        elif self._should_write_empty_summary(context):
-            self._write_summary(user_id, period, "", timestamp, session_id, {"skipped": True})
-        if user_updates:
-            self._write_user_updates(user_id, user_updates, timestamp, session_id, payload.get("meta"))
+        async with self._write_lock:
+            if await self._summary_exists(user_id, period, timestamp, session_id):
+                # Written by catchup or another handler while the LLM was running.
+                return {"success": True, "skipped": True, "reason": "already_summarized"}
+            if summary:
+                self._write_summary(user_id, period, summary, timestamp, session_id, payload.get("meta"))
+            elif self._should_write_empty_summary(context):
+                self._write_summary(user_id, period, "", timestamp, session_id, {"skipped": True})
+            if user_updates:
+                self._write_user_updates(user_id, user_updates, timestamp, session_id, payload.get("meta"))
 
         return {"success": True, "summary_emitted": bool(summary), "user_updates": len(user_updates)}
 
@@ -430,7 +654,9 @@ class SummaryMemoryNeuron(BaseNeuron):
         messages = self._build_messages(period, context, payload, timestamp)
         logger.info("Calling LLM for %s summary (%d chars context)", period, len(context))
         try:
-            response = await self._llm_client.agenerate(messages)
+            # Summaries yield to interactive turns when the provider is saturated.
+            with llm_priority("background"):
+                response = await self._llm_client.agenerate(messages)
             summary, user_updates = self._parse_llm_response(response)
             if not summary and self._count_utterances(context) >= 2:
                 summary = self._fallback_summary(context)
@@ -572,12 +798,45 @@ class SummaryMemoryNeuron(BaseNeuron):
         if not context:
             return
         summary, user_updates = await self._summarize(period, context, payload, timestamp)
-        if summary:
-            self._write_summary(user_id, period, summary, timestamp, None, payload.get("meta"))
-        elif self._should_write_empty_summary(context):
-            self._write_summary(user_id, period, "", timestamp, None, {"skipped": True})
-        if user_updates:
-            self._write_user_updates(user_id, user_updates, timestamp, None, payload.get("meta"))
+        async with self._write_lock:
+            if await self._summary_exists(user_id, period, timestamp, None):
+                return
+            if summary:
+                self._write_summary(user_id, period, summary, timestamp, None, payload.get("meta"))
+            elif self._should_write_empty_summary(context):
+                self._write_summary(user_id, period, "", timestamp, None, {"skipped": True})
+            if user_updates:
+                self._write_user_updates(user_id, user_updates, timestamp, None, payload.get("meta"))
+
+    async def _store_dialogue_summary(
+        self,
+        user_id: str,
+        session_id: str,
+        context: str,
+        summary: str,
+        updates: List[str],
+        timestamp: datetime,
+        meta: Optional[Dict[str, Any]],
+    ) -> Tuple[bool, int]:
+        """
+        Write a session summary and its user updates.
+
+        Nothing is written when the summary appeared while the LLM was
+        running. Returns (summary_written, user_updates_written).
+        """
+        async with self._write_lock:
+            if await self._summary_exists(user_id, "dialogue", timestamp, session_id):
+                return False, 0
+            written = False
+            if summary:
+                self._write_dialogue_summary(user_id, session_id, summary, timestamp, meta)
+                written = True
+            elif self._should_write_empty_summary(context):
+                self._write_dialogue_summary(user_id, session_id, "", timestamp, {"skipped": True})
+                written = True
+            if updates:
+                self._write_user_updates(user_id, updates, timestamp, session_id, meta)
+        return written, len(updates)
 
     def _paths_for_period(self, user_id: str, period: str, timestamp: datetime) -> List[Path]:
         journal = self._journal(user_id)
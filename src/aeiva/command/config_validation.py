@@ -177,6 +177,7 @@ def normalize_metaui_config(config_dict: Dict[str, Any]) -> None:
         "upload_max_total_bytes",
         "upload_max_files_per_event",
         "event_history_limit",
+        "send_queue_frames",
     ):
         if key in metaui_cfg:
             metaui_cfg[key] = _as_positive_int(metaui_cfg[key], path=f"metaui_config.{key}")
@@ -212,6 +213,13 @@ def normalize_metaui_config(config_dict: Dict[str, Any]) -> None:
             parsed.append(item.strip().lower())
         metaui_cfg["event_bridge_event_types"] = parsed
 
+    slow_client_policy = metaui_cfg.get("slow_client_policy")
+    if slow_client_policy is not None:
+        policy = str(slow_client_policy).strip().lower()
+        if policy not in {"close", "drop"}:
+            raise ConfigValidationError("metaui_config.slow_client_policy must be 'close' or 'drop'")
+        metaui_cfg["slow_client_policy"] = policy
+
     for key in ("token", "token_env_var", "upload_base_dir", "desktop_log_file"):
         if key in metaui_cfg and metaui_cfg[key] is not None:
             value = metaui_cfg[key]
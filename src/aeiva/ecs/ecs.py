@@ -1,25 +1,41 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+from functools import partial
 from dataclasses import dataclass
+from itertools import chain
 from time import perf_counter
 import inspect
+import sys
 from contextlib import contextmanager
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     TypeVar,
+    get_type_hints,
     overload,
     TypeVarTuple,
     Unpack,
 )
 
+try:
+    import numpy as np
+except ImportError:  # only needed for `numeric_component` types
+    np = None  # type: ignore[assignment]
+
 # --------------------------
 # Typing
 # --------------------------
@@ -33,8 +49,14 @@ EntityId = int
 # Systems
 # --------------------------
 class System:
-    """Synchronous system; override `update(self, world, *args, **kwargs)`."""
+    """
+    Synchronous system; override `update(self, world, *args, **kwargs)`.
+    `reads` / `writes` declare component access for `World.aupdate_parallel`;
+    a system that declares neither is scheduled as if it touched everything.
+    """
     priority: int = 0
+    reads: Tuple[Type[Any], ...] = ()
+    writes: Tuple[Type[Any], ...] = ()
     def setup(self, world: "World") -> None:  # optional hook
         pass
     def update(self, world: "World", *args: Any, **kwargs: Any) -> None:
@@ -42,39 +64,276 @@ class System:
 
 
 class AsyncSystem:
-    """Asynchronous system; override `async update(self, world, *args, **kwargs)`."""
+    """Asynchronous system; override `async update(self, world, *args, **kwargs)`. See `System` for `reads` / `writes`."""
     priority: int = 0
+    reads: Tuple[Type[Any], ...] = ()
+    writes: Tuple[Type[Any], ...] = ()
     async def setup(self, world: "World") -> None:  # optional hook
         pass
     async def update(self, world: "World", *args: Any, **kwargs: Any) -> None:
         raise NotImplementedError
 
 
+def _systems_conflict(a: System | AsyncSystem, b: System | AsyncSystem) -> bool:
+    """True if `a` and `b` may not run at the same time (write/write or read/write overlap)."""
+    if not (a.reads or a.writes) or not (b.reads or b.writes):
+        return True
+    a_writes, b_writes = set(a.writes), set(b.writes)
+    return bool(a_writes & (b_writes | set(b.reads))) or bool(b_writes & set(a.reads))
+
+
+# --------------------------
+# Numeric components (NumPy column storage)
+# --------------------------
+_NUMERIC_FIELD_DTYPES: Dict[Any, str] = {float: "f8", int: "i8", bool: "?"}
+
+
+def numeric_component(cls: Optional[Type[T]] = None, *, dtype: Optional[Mapping[str, Any]] = None) -> Any:
+    """
+    Class decorator for fixed-shape numeric dataclasses. Such components are stored in
+    growable NumPy structured arrays (one per archetype) instead of per-entity objects,
+    and `World.columns(T)` hands out zero-copy array views for vectorized updates.
+
+    Field dtypes are inferred from `float` / `int` / `bool` annotations; use `dtype` to
+    override, e.g. `dtype={"pos": ("f4", (3,))}` for a fixed-size vector field.
+
+    Per-entity access (`get_component`, `view`, ...) returns a live reference that reads
+    and writes the entity's row, so `p.x += 1` keeps working.
+    """
+    def wrap(klass: Type[T]) -> Type[T]:
+        if np is None:
+            raise ImportError("numeric_component requires numpy.")
+        if not dataclasses.is_dataclass(klass):
+            raise TypeError(f"numeric_component expects a dataclass, got {klass.__name__}.")
+        hints = get_type_hints(klass)
+        overrides = dict(dtype or {})
+        spec: List[Tuple[Any, ...]] = []
+        for field in dataclasses.fields(klass):
+            item = overrides.pop(field.name, None) or _NUMERIC_FIELD_DTYPES.get(hints.get(field.name))
+            if item is None:
+                raise TypeError(
+                    f"{klass.__name__}.{field.name}: cannot infer a NumPy dtype; pass dtype={{...}}."
+                )
+            spec.append((field.name, *item) if isinstance(item, tuple) else (field.name, item))
+        if overrides:
+            raise TypeError(f"{klass.__name__}: dtype overrides for unknown fields {sorted(overrides)}.")
+        klass.__ecs_dtype__ = np.dtype(spec)  # type: ignore[attr-defined]
+        klass.__ecs_ref__ = _make_component_ref(klass)  # type: ignore[attr-defined]
+        return klass
+
+    return wrap if cls is None else wrap(cls)
+
+
+def _is_numeric(component_type: Type[Any]) -> bool:
+    return getattr(component_type, "__ecs_dtype__", None) is not None
+
+
+def _from_numpy(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value.copy()
+
+
+class _ComponentRef:
+    """Live handle on one entity's row of a numeric component; resolves the row on every access."""
+    __slots__ = ()
+
+    def __init__(self, world: "World", eid: EntityId, component_type: Type[Any]) -> None:
+        object.__setattr__(self, "_world", world)
+        object.__setattr__(self, "_eid", eid)
+        object.__setattr__(self, "_type", component_type)
+
+    def _locate(self) -> Tuple["_NumericColumn", int]:
+        world = self._world
+        index = world._assert_live(self._eid)
+        arch = world._entity_arch[index]; assert arch is not None
+        col = arch.columns.get(self._type)
+        if col is None:
+            raise KeyError(f"Entity {self._eid} does not have component {self._type.__name__}.")
+        return col, world._entity_row[index]  # type: ignore[return-value]
+
+    def _read(self, name: str) -> Any:
+        col, row = self._locate()
+        value = col.data[name][row]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def _write(self, name: str, value: Any) -> None:
+        col, row = self._locate()
+        col.data[name][row] = value
+        self._world.mark_changed(self._eid, self._type)
+
+    def copy(self) -> Any:
+        """Detached plain instance with the current values."""
+        col, row = self._locate()
+        return col[row]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, self._type):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in self._type.__ecs_dtype__.names
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+def _make_component_ref(klass: Type[Any]) -> Type[_ComponentRef]:
+    def field(name: str) -> property:
+        return property(lambda self: self._read(name), lambda self, value: self._write(name, value))
+
+    namespace: Dict[str, Any] = {name: field(name) for name in klass.__ecs_dtype__.names}
+    namespace["__slots__"] = ("_world", "_eid", "_type")
+    return type(f"{klass.__name__}Ref", (_ComponentRef, klass), namespace)
+
+
+def _component_type(component: Any) -> Type[Any]:
+    return component._type if isinstance(component, _ComponentRef) else type(component)
+
+
+class _NumericColumn:
+    """
+    Stand-in for an archetype's component list: a structured array with spare capacity.
+    Indexing returns/accepts plain component instances; `data[:size]` is the live array.
+    """
+    __slots__ = ("component_type", "names", "data", "size")
+
+    def __init__(self, component_type: Type[Any]) -> None:
+        self.component_type = component_type
+        self.names: Tuple[str, ...] = component_type.__ecs_dtype__.names
+        self.data = np.zeros(8, dtype=component_type.__ecs_dtype__)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, row: int) -> Any:
+        record = self.data[row]
+        return self.component_type(**{name: _from_numpy(record[name]) for name in self.names})
+
+    def __setitem__(self, row: int, value: Any) -> None:
+        self.data[row] = tuple(getattr(value, name) for name in self.names)
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self.data):
+            return
+        grown = np.zeros(max(size, 2 * len(self.data)), dtype=self.data.dtype)
+        grown[: self.size] = self.data[: self.size]
+        self.data = grown
+
+    def append(self, value: Any) -> None:
+        self._reserve(self.size + 1)
+        self[self.size] = value
+        self.size += 1
+
+    def extend(self, values: Any) -> None:
+        """Append many instances, or a structured array with this column's dtype."""
+        count = len(values)
+        self._reserve(self.size + count)
+        if isinstance(values, np.ndarray):
+            self.data[self.size : self.size + count] = values
+        else:
+            names = self.names
+            self.data[self.size : self.size + count] = [tuple(getattr(v, name) for name in names) for v in values]
+        self.size += count
+
+    def pop(self) -> None:
+        self.size -= 1
+
+    def move(self, src: int, dst: int) -> None:
+        self.data[dst] = self.data[src]
+
+    def array(self) -> Any:
+        return self.data[: self.size]
+
+
+def _new_column(component_type: Type[Any]) -> Any:
+    return _NumericColumn(component_type) if _is_numeric(component_type) else []
+
+
 # --------------------------
 # Archetype storage
 # --------------------------
+_ROW_LOG_MIN = 256
+
+
 class Archetype:
     """
     Columnar storage for entities that share the same component-type set (signature).
     - signature: frozenset of component types
     - entities: list[int] of entity indices (internal, not handles)
     - columns: dict[Type, list[object]] where lists are aligned with `entities`
+      (a `_NumericColumn` for `numeric_component` types)
+    - ticks: dict[Type, list[int]], world tick at which each component was last added/replaced
+    - version: bumped on every row write; `touched_since` replays the rows written since a version
     """
-    __slots__ = ("signature", "entities", "columns")
+    __slots__ = ("signature", "entities", "columns", "ticks", "version", "_row_log", "_row_log_base")
 
     def __init__(self, signature: frozenset[Type[Any]]) -> None:
         self.signature = signature
         self.entities: List[int] = []
-        self.columns: Dict[Type[Any], List[Any]] = {ct: [] for ct in signature}
+        self.columns: Dict[Type[Any], Any] = {ct: _new_column(ct) for ct in signature}
+        self.ticks: Dict[Type[Any], List[int]] = {ct: [] for ct in signature}
+        self.version: int = 0
+        self._row_log: List[int] = []
+        self._row_log_base: int = 0
+
+    def _touch(self, row: int) -> None:
+        self.version += 1
+        self._row_log.append(row)
+        # Past this size a full rebuild is as cheap as replaying the log.
+        if len(self._row_log) > max(_ROW_LOG_MIN, len(self.entities)):
+            self._row_log = []
+            self._row_log_base = self.version
+
+    def touched_since(self, version: int) -> Optional[Set[int]]:
+        """Rows written after `version`, or None if the log no longer reaches back that far."""
+        if version < self._row_log_base:
+            return None
+        return set(self._row_log[version - self._row_log_base:])
 
-    def add_row(self, entity_index: int, values: Dict[Type[Any], Any]) -> int:
-        """Append a row, given a dict of component values for this signature. Returns row index."""
+    def add_row(
+        self,
+        entity_index: int,
+        values: Dict[Type[Any], Any],
+        ticks: Optional[Dict[Type[Any], int]] = None,
+        tick: int = 0,
+    ) -> int:
+        """Append a row, given a dict of component values for this signature. Returns row index.
+        Components missing from `ticks` are stamped with `tick`."""
         row = len(self.entities)
         self.entities.append(entity_index)
         for ct in self.signature:
             self.columns[ct].append(values[ct])
+            self.ticks[ct].append(ticks.get(ct, tick) if ticks else tick)
+        self._touch(row)
         return row
 
+    def extend_rows(self, entity_indices: List[int], columns: Mapping[Type[Any], Any], tick: int) -> int:
+        """Append one row per entity index from per-type column sequences. Returns the first new row."""
+        start = len(self.entities)
+        count = len(entity_indices)
+        self.entities.extend(entity_indices)
+        for ct in self.signature:
+            self.columns[ct].extend(columns[ct])
+            self.ticks[ct].extend([tick] * count)
+        self.version += count
+        self._row_log.extend(range(start, start + count))
+        if len(self._row_log) > max(_ROW_LOG_MIN, len(self.entities)):
+            self._row_log = []
+            self._row_log_base = self.version
+        return start
+
+    def set_value(self, row: int, component_type: Type[Any], value: Any, tick: int) -> None:
+        """Replace one component in place."""
+        self.columns[component_type][row] = value
+        self.ticks[component_type][row] = tick
+        self._touch(row)
+
+    def row_ticks(self, row: int) -> Dict[Type[Any], int]:
+        return {ct: self.ticks[ct][row] for ct in self.signature}
+
     def pop_row_swap(self, row: int) -> Tuple[int, Dict[Type[Any], Any]]:
         """
         Remove a row by swapping with the last row (O(1)).
@@ -87,7 +346,12 @@ class Archetype:
             moved_entity = self.entities[last]
             self.entities[row] = moved_entity
             for ct in self.signature:
-                self.columns[ct][row] = self.columns[ct][last]
+                col = self.columns[ct]
+                if isinstance(col, _NumericColumn):
+                    col.move(last, row)
+                else:
+                    col[row] = col[last]
+                self.ticks[ct][row] = self.ticks[ct][last]
         else:
             moved_entity = -1
 
@@ -95,9 +359,111 @@ class Archetype:
         self.entities.pop()
         for ct in self.signature:
             self.columns[ct].pop()
+            self.ticks[ct].pop()
+        self._touch(row)
         return moved_entity, removed_values
 
 
+class CommandBuffer:
+    """
+    Records structural changes (spawn/destroy/add/remove) to apply later in one pass,
+    e.g. while iterating a view. `World.commands` is applied at the end of every update
+    (and at each `aupdate_parallel` stage barrier); a standalone buffer is applied with
+    `apply(world)`. Runs of spawns with the same component-type set go through
+    `spawn_batch`, runs of destroys through `destroy_batch`. Commands aimed at entities
+    that are dead by then are skipped.
+    """
+    __slots__ = ("_ops",)
+
+    def __init__(self) -> None:
+        self._ops: List[Tuple[str, Any, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def spawn(self, *components: Any) -> None:
+        self._ops.append(("spawn", frozenset(_component_type(c) for c in components), components))
+
+    def destroy(self, eid: EntityId) -> None:
+        self._ops.append(("destroy", eid, None))
+
+    def add_component(self, eid: EntityId, component: Any) -> None:
+        self._ops.append(("add", eid, component))
+
+    def remove_component(self, eid: EntityId, component_type: Type[Any]) -> None:
+        self._ops.append(("remove", eid, component_type))
+
+    def apply(self, world: "World") -> None:
+        ops, self._ops = self._ops, []
+        i = 0
+        while i < len(ops):
+            kind, target, payload = ops[i]
+            j = i + 1
+            if kind == "spawn":
+                while j < len(ops) and ops[j][0] == "spawn" and ops[j][1] == target:
+                    j += 1
+                if target:
+                    rows = [op[2] for op in ops[i:j]]
+                    world.spawn_batch({
+                        ct: [c for row in rows for c in row if _component_type(c) is ct] for ct in target
+                    })
+                else:
+                    for _ in range(j - i):
+                        world.create_entity()
+            elif kind == "destroy":
+                while j < len(ops) and ops[j][0] == "destroy":
+                    j += 1
+                world.destroy_batch([op[1] for op in ops[i:j] if world.entity_exists(op[1])], immediate=True)
+            elif world.entity_exists(target):
+                if kind == "add":
+                    world.add_component(target, payload)
+                elif world.has_component(target, payload):
+                    world.remove_component(target, payload)
+            i = j
+
+
+def _swap_remove_rows(arch: "Archetype", rows: List[int]) -> List[Tuple[int, int]]:
+    """Swap-remove `rows` from `arch` without collecting values. Returns (row, moved entity index) fills."""
+    moves: List[Tuple[int, int]] = []
+    entities = arch.entities
+    cols = [(arch.columns[ct], arch.ticks[ct]) for ct in arch.signature]
+    # Largest first: the tail row moved into a hole is never another pending row.
+    for row in sorted(rows, reverse=True):
+        last = len(entities) - 1
+        if row != last:
+            entities[row] = entities[last]
+            moves.append((row, entities[row]))
+            for col, ticks in cols:
+                if isinstance(col, _NumericColumn):
+                    col.move(last, row)
+                else:
+                    col[row] = col[last]
+                ticks[row] = ticks[last]
+        entities.pop()
+        for col, ticks in cols:
+            col.pop()
+            ticks.pop()
+        arch._touch(row)
+    return moves
+
+
+class _ViewCache:
+    """
+    Incrementally maintained result of `World.view(*types)`.
+    One segment of result rows per candidate archetype; a segment is patched from the
+    archetype's row log when its version moves, and the flat result list is only
+    re-concatenated when some segment actually changed.
+    """
+    __slots__ = ("types", "segments", "synced", "archetype_count", "result")
+
+    def __init__(self, types: Tuple[Type[Any], ...]) -> None:
+        self.types = types
+        self.segments: Dict[Archetype, List[Tuple[EntityId, Any]]] = {}
+        self.synced: Dict[Archetype, int] = {}
+        self.archetype_count: int = -1
+        self.result: List[Tuple[EntityId, Any]] = []
+
+
 # --------------------------
 # World with archetypes + generations + async systems
 # --------------------------
@@ -107,6 +473,7 @@ class World:
       - Archetype storage (dense, cache-friendly)
       - Entity generation counters (stale id protection)
       - Sync and async systems (priority-based), with optional concurrent async stepping
+        or dependency-aware parallel stages (`aupdate_parallel`)
       - Snapshot (`view`) and live (`iter_view`) queries with structural versioning
 
     Entity ids are packed as 64-bit integers: [generation:32][index:32].
@@ -135,11 +502,21 @@ class World:
         self._async_systems: List[AsyncSystem] = []
         self._is_updating: bool = False
         self._async_setup_done: bool = False
+        self._deferred: List[Callable[[], Any]] = []  # structural changes queued during a parallel stage
+        self.commands = CommandBuffer()  # applied at the end of each update / stage
+        self._pool: Optional[ThreadPoolExecutor] = None  # sync systems in `aupdate_parallel`
+        self.max_workers: Optional[int] = None
 
         # caches & versioning
         self._version: int = 0  # bump on structural/content changes
-        self._cache_view_single: Dict[Type[Any], Tuple[int, List[Tuple[EntityId, Any]]]] = {}
-        self._cache_view_multi: Dict[Tuple[Type[Any], ...], Tuple[int, List[Tuple[EntityId, Tuple[Any, ...]]]]] = {}
+        self._cache_view_single: Dict[Type[Any], _ViewCache] = {}
+        self._cache_view_multi: Dict[Tuple[Type[Any], ...], _ViewCache] = {}
+
+        # change detection: `_tick` advances once per update; `_change_log[T]` holds
+        # (tick, entity index) in tick order, trimmed from the front (see `_change_floor`).
+        self._tick: int = 0
+        self._change_log: Dict[Type[Any], List[Tuple[int, int]]] = {}
+        self._change_floor: Dict[Type[Any], int] = {}
 
         # timing
         self.process_times_ms: Dict[str, int] = {}
@@ -193,6 +570,7 @@ class World:
         - If `drop` is provided, omit that component from destination.
         """
         row = self._entity_row[index]
+        ticks = src.row_ticks(row)
         moved_idx, values = src.pop_row_swap(row)
 
         # if a row got swapped in, update its location
@@ -203,16 +581,32 @@ class World:
         if extra is not None:
             ect, eval = extra
             values[ect] = eval
+            ticks.pop(ect, None)  # the added/replaced component is stamped with the current tick
         if drop is not None:
             values.pop(drop, None)
+            ticks.pop(drop, None)
 
-        dst_row = dst.add_row(index, values)
+        dst_row = dst.add_row(index, values, ticks, self._tick)
         self._entity_arch[index] = dst
         self._entity_row[index] = dst_row
 
     def _bump_version(self) -> None:
         self._version += 1
 
+    def _record_change(self, component_type: Type[Any], index: int) -> None:
+        log = self._change_log.get(component_type)
+        if log is None:
+            log = self._change_log[component_type] = []
+        log.append((self._tick, index))
+        self._trim_change_log(component_type, log)
+
+    def _trim_change_log(self, component_type: Type[Any], log: List[Tuple[int, int]]) -> None:
+        if len(log) > max(4096, 2 * len(self._gen)):
+            # Drop the older half; queries reaching behind the floor fall back to a scan.
+            # The cut can land inside a tick, so that tick itself is no longer complete.
+            del log[: len(log) // 2]
+            self._change_floor[component_type] = log[0][0]
+
     # --------------------------
     # Entity management
     # --------------------------
@@ -228,16 +622,17 @@ class World:
 
         # place in target archetype
         if components:
-            sig = frozenset(type(c) for c in components)
-            arch = self._get_or_create_archetype(sig)
-            values = {type(c): c for c in components}
+            values = {_component_type(c): c for c in components}
+            arch = self._get_or_create_archetype(frozenset(values))
         else:
             arch = self._empty
             values = {}
 
-        row = arch.add_row(index, values)
+        row = arch.add_row(index, values, None, self._tick)
         self._entity_arch[index] = arch
         self._entity_row[index] = row
+        for ct in arch.signature:
+            self._record_change(ct, index)
 
         eid = self._pack(index, self._gen[index])
         self._bump_version()
@@ -248,8 +643,66 @@ class World:
         if self._is_updating and not immediate:
             self._pending_kill.add(eid)
             return
+        self._destroy_index(self._assert_live(eid))
+        self._bump_version()
 
-        index = self._assert_live(eid)
+    def destroy_batch(self, eids: Iterable[EntityId], *, immediate: bool = False) -> None:
+        """Destroy many entities with a single version bump. Deferred during update unless `immediate=True`."""
+        if self._is_updating and not immediate:
+            self._pending_kill.update(eids)
+            return
+        indices = [self._assert_live(eid) for eid in dict.fromkeys(eids)]
+        by_arch: Dict[Archetype, List[int]] = {}
+        for index in indices:
+            arch = self._entity_arch[index]; assert arch is not None
+            by_arch.setdefault(arch, []).append(self._entity_row[index])
+            self._entity_arch[index] = None
+            self._entity_row[index] = -1
+            self._gen[index] = (self._gen[index] + 1) & self.GEN_MASK
+        for arch, rows in by_arch.items():
+            for row, moved_idx in _swap_remove_rows(arch, rows):
+                self._entity_row[moved_idx] = row
+        self._free_indices.extend(indices)
+        if indices:
+            self._bump_version()
+
+    def spawn_batch(self, columns: Mapping[Type[Any], Sequence[Any]]) -> List[EntityId]:
+        """
+        Create one entity per row of `columns` ({ComponentType: [instances...]}, equal
+        lengths), appending each column to the target archetype in one pass. A
+        `numeric_component` column may also be a structured array with its dtype.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("spawn_batch() columns must all have the same length.")
+        count = lengths.pop() if lengths else 0
+        if count == 0:
+            return []
+
+        reuse = min(count, len(self._free_indices))
+        indices = [self._free_indices.pop() for _ in range(reuse)]
+        start = len(self._gen)
+        fresh = count - reuse
+        indices.extend(range(start, start + fresh))
+        self._gen.extend([0] * fresh)
+        self._entity_arch.extend([None] * fresh)
+        self._entity_row.extend([-1] * fresh)
+
+        arch = self._get_or_create_archetype(frozenset(columns))
+        first_row = arch.extend_rows(indices, columns, self._tick)
+        entity_arch, entity_row = self._entity_arch, self._entity_row
+        for row, index in enumerate(indices, first_row):
+            entity_arch[index] = arch
+            entity_row[index] = row
+        for ct in arch.signature:
+            log = self._change_log.setdefault(ct, [])
+            log.extend((self._tick, index) for index in indices)
+            self._trim_change_log(ct, log)
+
+        self._bump_version()
+        return [self._pack(index, self._gen[index]) for index in indices]
+
+    def _destroy_index(self, index: int) -> None:
         arch = self._entity_arch[index]
         assert arch is not None
         row = self._entity_row[index]
@@ -262,7 +715,6 @@ class World:
         # bump generation so stale handles are invalid
         self._gen[index] = (self._gen[index] + 1) & self.GEN_MASK
         self._free_indices.append(index)
-        self._bump_version()
 
     def entity_exists(self, eid: EntityId) -> bool:
         return self._is_live(eid)
@@ -276,21 +728,32 @@ class World:
     def add_component(self, eid: EntityId, component: Any) -> None:
         """Attach or replace a component instance on an entity (structural or content change)."""
         index = self._assert_live(eid)
-        ctype = type(component)
+        ctype = _component_type(component)
 
         src = self._entity_arch[index]; assert src is not None
         if ctype in src.signature:  # replace in-place (content change)
             row = self._entity_row[index]
-            src.columns[ctype][row] = component
-            # Invalidate snapshot caches so subsequent view() reflects new objects
+            # Marks the row so cached views patch in the new object on their next call
+            src.set_value(row, ctype, component, self._tick)
+            self._record_change(ctype, index)
             self._bump_version()
             return
 
         dst_sig = frozenset((*src.signature, ctype))
         dst = self._get_or_create_archetype(dst_sig)
         self._move_entity(index, src, dst, extra=(ctype, component))
+        self._record_change(ctype, index)
         self._bump_version()
 
+    def mark_changed(self, eid: EntityId, component_type: Type[Any]) -> None:
+        """Flag an in-place mutation of a component so `changed(...)` reports it."""
+        index = self._assert_live(eid)
+        arch = self._entity_arch[index]; assert arch is not None
+        if component_type not in arch.signature:
+            raise KeyError(f"Entity {eid} does not have component {component_type.__name__}.")
+        arch.ticks[component_type][self._entity_row[index]] = self._tick
+        self._record_change(component_type, index)
+
     def remove_component(self, eid: EntityId, component_type: Type[T]) -> T:
         """Remove component by type and return it. Raises KeyError if missing."""
         index = self._assert_live(eid)
@@ -323,8 +786,7 @@ class World:
         arch = self._entity_arch[index]; assert arch is not None
         if component_type not in arch.signature:
             raise KeyError(f"Entity {eid} does not have component {component_type.__name__}.")
-        row = self._entity_row[index]
-        return arch.columns[component_type][row]  # type: ignore[return-value]
+        return self._component_at(arch, component_type, self._entity_row[index])
 
     def try_component(self, eid: EntityId, component_type: Type[T]) -> Optional[T]:
         """Return component instance or None if the entity doesn't have it."""
@@ -332,15 +794,21 @@ class World:
         arch = self._entity_arch[index]; assert arch is not None
         if component_type not in arch.signature:
             return None
-        row = self._entity_row[index]
-        return arch.columns[component_type][row]  # type: ignore[return-value]
+        return self._component_at(arch, component_type, self._entity_row[index])
 
     def components_for(self, eid: EntityId) -> Tuple[Any, ...]:
         """Return tuple of all component instances for this entity (order unspecified)."""
         index = self._assert_live(eid)
         arch = self._entity_arch[index]; assert arch is not None
         row = self._entity_row[index]
-        return tuple(arch.columns[ct][row] for ct in arch.signature)
+        return tuple(self._component_at(arch, ct, row) for ct in arch.signature)
+
+    def _component_at(self, arch: Archetype, component_type: Type[Any], row: int) -> Any:
+        col = arch.columns[component_type]
+        if isinstance(col, _NumericColumn):
+            idx = arch.entities[row]
+            return component_type.__ecs_ref__(self, self._pack(idx, self._gen[idx]), component_type)
+        return col[row]
 
     def entities(self) -> List[EntityId]:
         """Snapshot of all live entity ids."""
@@ -380,38 +848,132 @@ class World:
         Snapshot query. Returns:
          - For one type: List[(entity, comp)]
          - For >=2:     List[(entity, (c1, c2, ...))]
-        Results are cached until a change occurs (add/remove/replace/destroy/create).
+        Results are cached per query and patched incrementally: only rows written in
+        candidate archetypes since the last call are rebuilt. Each call that sees a
+        change returns a new list, so earlier snapshots are never mutated.
         """
         if not component_types:
             raise ValueError("view() requires at least one component type.")
 
         if len(component_types) == 1:
             ct = component_types[0]
-            cached = self._cache_view_single.get(ct)
-            if cached is not None and cached[0] == self._version:
-                return cached[1]  # type: ignore[return-value]
-            out: List[Tuple[EntityId, Any]] = []
-            for arch in self._archetype_by_type.get(ct, ()):
-                col = arch.columns[ct]
-                for i, idx in enumerate(arch.entities):
-                    eid = self._pack(idx, self._gen[idx])
-                    out.append((eid, col[i]))
-            self._cache_view_single[ct] = (self._version, out)
-            return out  # type: ignore[return-value]
-
-        key = tuple(component_types)
-        cached = self._cache_view_multi.get(key)
-        if cached is not None and cached[0] == self._version:
-            return cached[1]  # type: ignore[return-value]
-
-        out2: List[Tuple[EntityId, Tuple[Any, ...]]] = []
-        for arch in self._candidate_archetypes(key):
-            cols = [arch.columns[ct] for ct in key]
-            for i, idx in enumerate(arch.entities):
-                eid = self._pack(idx, self._gen[idx])
-                out2.append((eid, tuple(col[i] for col in cols)))
-        self._cache_view_multi[key] = (self._version, out2)
-        return out2  # type: ignore[return-value]
+            cache = self._cache_view_single.get(ct)
+            if cache is None:
+                cache = self._cache_view_single[ct] = _ViewCache((ct,))
+        else:
+            key = tuple(component_types)
+            cache = self._cache_view_multi.get(key)
+            if cache is None:
+                cache = self._cache_view_multi[key] = _ViewCache(key)
+        return self._refresh_view(cache)  # type: ignore[return-value]
+
+    def _refresh_view(self, cache: _ViewCache) -> List[Tuple[EntityId, Any]]:
+        changed = False
+        if cache.archetype_count != len(self._archetypes):
+            if len(cache.types) == 1:
+                candidates = list(self._archetype_by_type.get(cache.types[0], ()))
+            else:
+                candidates = self._candidate_archetypes(cache.types)
+            for arch in candidates:
+                if arch not in cache.segments:
+                    cache.segments[arch] = []
+                    cache.synced[arch] = -1
+                    changed = True
+            cache.archetype_count = len(self._archetypes)
+
+        for arch, segment in cache.segments.items():
+            synced = cache.synced[arch]
+            if synced == arch.version:
+                continue
+            changed = True
+            touched = arch.touched_since(synced) if synced >= 0 else None
+            self._patch_segment(cache.types, arch, segment, touched)
+            cache.synced[arch] = arch.version
+
+        if changed:
+            segments = [segment for segment in cache.segments.values() if segment]
+            cache.result = list(segments[0]) if len(segments) == 1 else list(chain.from_iterable(segments))
+        return cache.result
+
+    def _patch_segment(
+        self,
+        types: Tuple[Type[Any], ...],
+        arch: Archetype,
+        segment: List[Tuple[EntityId, Any]],
+        touched: Optional[Set[int]],
+    ) -> None:
+        gen = self._gen
+        shift = self.INDEX_BITS
+        entities = arch.entities
+        if any(isinstance(arch.columns[ct], _NumericColumn) for ct in types):
+            component_at = self._component_at
+            single = types[0] if len(types) == 1 else None
+            def build(row: int) -> Tuple[EntityId, Any]:
+                idx = entities[row]
+                if single is not None:
+                    return (gen[idx] << shift) | idx, component_at(arch, single, row)
+                return (gen[idx] << shift) | idx, tuple(component_at(arch, ct, row) for ct in types)
+        elif len(types) == 1:
+            col = arch.columns[types[0]]
+            def build(row: int) -> Tuple[EntityId, Any]:
+                idx = entities[row]
+                return (gen[idx] << shift) | idx, col[row]
+        else:
+            cols = [arch.columns[ct] for ct in types]
+            def build(row: int) -> Tuple[EntityId, Any]:
+                idx = entities[row]
+                return (gen[idx] << shift) | idx, tuple(col[row] for col in cols)
+
+        size = len(entities)
+        if touched is None:
+            segment[:] = [build(row) for row in range(size)]
+            return
+        keep = min(len(segment), size)
+        del segment[keep:]
+        segment.extend(build(row) for row in range(keep, size))
+        for row in touched:
+            if row < keep:
+                segment[row] = build(row)
+
+    @property
+    def tick(self) -> int:
+        """Current world tick; advanced at the start of every update/aupdate call."""
+        return self._tick
+
+    def advance_tick(self) -> int:
+        self._tick += 1
+        return self._tick
+
+    def changed(self, component_type: Type[T], since_tick: int) -> List[Tuple[EntityId, T]]:
+        """
+        Entities whose `component_type` was added or replaced (or `mark_changed`) after
+        `since_tick`, as [(eid, comp)] in change order. Cost is proportional to the
+        number of changes, unless `since_tick` predates the trimmed change log.
+        """
+        out: List[Tuple[EntityId, Any]] = []
+        if since_tick < self._change_floor.get(component_type, -1):
+            for arch in self._archetype_by_type.get(component_type, ()):
+                for row, stamp in enumerate(arch.ticks[component_type]):
+                    if stamp > since_tick:
+                        idx = arch.entities[row]
+                        out.append((self._pack(idx, self._gen[idx]), self._component_at(arch, component_type, row)))
+            return out
+
+        log = self._change_log.get(component_type)
+        if not log:
+            return out
+        seen: Set[int] = set()
+        for _, idx in log[bisect_right(log, (since_tick, sys.maxsize)):]:
+            if idx in seen:
+                continue
+            seen.add(idx)
+            arch = self._entity_arch[idx]
+            if arch is None or component_type not in arch.signature:
+                continue
+            row = self._entity_row[idx]
+            if arch.ticks[component_type][row] > since_tick:
+                out.append((self._pack(idx, self._gen[idx]), self._component_at(arch, component_type, row)))
+        return out
 
     @overload
     def iter_view(self, c1: Type[T]) -> Iterator[Tuple[EntityId, T]]: ...
@@ -430,16 +992,44 @@ class World:
             ct = key[0]
             for arch in self._archetype_by_type.get(ct, ()):
                 col = arch.columns[ct]
+                numeric = isinstance(col, _NumericColumn)
                 for i, idx in enumerate(arch.entities):
                     eid = self._pack(idx, self._gen[idx])
-                    yield eid, col[i]
+                    yield eid, (ct.__ecs_ref__(self, eid, ct) if numeric else col[i])
             return
         for arch in self._candidate_archetypes(key):
+            if any(isinstance(arch.columns[ct], _NumericColumn) for ct in key):
+                for i, idx in enumerate(arch.entities):
+                    yield self._pack(idx, self._gen[idx]), tuple(self._component_at(arch, ct, i) for ct in key)
+                continue
             cols = [arch.columns[ct] for ct in key]
             for i, idx in enumerate(arch.entities):
                 eid = self._pack(idx, self._gen[idx])
                 yield eid, tuple(col[i] for col in cols)
 
+    @overload
+    def columns(self, c1: Type[Any]) -> List[Any]: ...
+    @overload
+    def columns(self, *component_types: Type[Any]) -> List[Tuple[Any, ...]]: ...
+    def columns(self, *component_types: Type[Any]) -> List[Any]:
+        """
+        Zero-copy NumPy views of `numeric_component` columns, one entry per non-empty
+        matching archetype:
+         - For one type: List[ndarray]  (structured; index fields by name, e.g. `a["x"]`)
+         - For >=2:     List[(ndarray, ndarray, ...)]  (rows aligned across the arrays)
+        Views stay valid until the next structural change (create/destroy/add/remove).
+        Writes through them are not seen by `changed(...)`.
+        """
+        if not component_types:
+            raise ValueError("columns() requires at least one component type.")
+        for ct in component_types:
+            if not _is_numeric(ct):
+                raise TypeError(f"{ct.__name__} is not a numeric_component.")
+        key = tuple(component_types)
+        if len(key) == 1:
+            return [arch.columns[key[0]].array() for arch in self._archetype_by_type.get(key[0], ()) if arch.entities]
+        return [tuple(arch.columns[ct].array() for ct in key) for arch in self._candidate_archetypes(key) if arch.entities]
+
     # --------------------------
     # Systems
     # --------------------------
@@ -473,16 +1063,19 @@ class World:
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Run all **synchronous** systems in priority order."""
+        self.advance_tick()
         self._is_updating = True
         try:
             for sys in self._sync_systems:
                 sys.update(self, *args, **kwargs)
         finally:
             self._is_updating = False
+            self._flush_deferred()
             self._flush_pending_kills()
 
     def timed_update(self, *args: Any, **kwargs: Any) -> None:
         """Like `update`, but records per-system time (ms) in `process_times_ms`."""
+        self.advance_tick()
         self._is_updating = True
         try:
             for sys in self._sync_systems:
@@ -492,6 +1085,7 @@ class World:
                 self.process_times_ms[type(sys).__name__] = ms
         finally:
             self._is_updating = False
+            self._flush_deferred()
             self._flush_pending_kills()
 
     async def setup_async(self) -> None:
@@ -509,6 +1103,7 @@ class World:
         """
         if not self._async_setup_done:
             await self.setup_async()
+        self.advance_tick()
         self._is_updating = True
         try:
             for sys in self._sync_systems:
@@ -520,6 +1115,7 @@ class World:
                 self.process_times_ms[type(sys).__name__] = ms
         finally:
             self._is_updating = False
+            self._flush_deferred()
             self._flush_pending_kills()
 
     async def aupdate_concurrent(self, *args: Any, **kwargs: Any) -> None:
@@ -531,6 +1127,7 @@ class World:
 
         if not self._async_setup_done:
             await self.setup_async()
+        self.advance_tick()
         self._is_updating = True
         try:
             for sys in self._sync_systems:
@@ -550,8 +1147,76 @@ class World:
                 self.process_times_ms[f"AsyncGroup(p={prio})"] = ms
         finally:
             self._is_updating = False
+            self._flush_deferred()
             self._flush_pending_kills()
 
+    def stages(self) -> List[List[System | AsyncSystem]]:
+        """
+        Group systems into stages for `aupdate_parallel`. Systems are taken in priority
+        order (sync before async on ties); each lands one stage after the latest earlier
+        system it conflicts with, so systems within a stage never share a written type.
+        """
+        ordered = sorted([*self._sync_systems, *self._async_systems], key=lambda s: s.priority, reverse=True)
+        levels: List[int] = []
+        stages: List[List[System | AsyncSystem]] = []
+        for i, sys in enumerate(ordered):
+            level = 0
+            for j in range(i):
+                if levels[j] >= level and _systems_conflict(ordered[j], sys):
+                    level = levels[j] + 1
+            levels.append(level)
+            if level == len(stages):
+                stages.append([])
+            stages[level].append(sys)
+        return stages
+
+    async def aupdate_parallel(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Run all systems stage by stage (see `stages()`): within a stage, sync systems run
+        on a thread pool and async systems under `asyncio.gather`. Entity destruction and
+        work queued with `defer(...)` are applied at each stage barrier, so systems in a
+        stage should not create entities or add/remove components directly.
+        Per-system time (ms) goes into `process_times_ms`.
+        """
+        import asyncio
+
+        if not self._async_setup_done:
+            await self.setup_async()
+        self.advance_tick()
+        loop = asyncio.get_running_loop()
+        self._is_updating = True
+        try:
+            for stage in self.stages():
+                inline = len(stage) == 1
+                await asyncio.gather(*(self._run_system_timed(loop, sys, inline, args, kwargs) for sys in stage))
+                self._flush_deferred()
+                self._flush_pending_kills()
+        finally:
+            self._is_updating = False
+            self._flush_deferred()
+            self._flush_pending_kills()
+
+    async def _run_system_timed(
+        self, loop: Any, sys: System | AsyncSystem, inline: bool, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> None:
+        t0 = perf_counter()
+        if isinstance(sys, AsyncSystem):
+            await sys.update(self, *args, **kwargs)  # type: ignore[misc]
+        elif inline:
+            sys.update(self, *args, **kwargs)
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ecs")
+            await loop.run_in_executor(self._pool, partial(sys.update, self, *args, **kwargs))
+        self.process_times_ms[type(sys).__name__] = int((perf_counter() - t0) * 1000)
+
+    def defer(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Run `fn(*args, **kwargs)` at the next stage barrier / end of update; immediately if not updating."""
+        if not self._is_updating:
+            fn(*args, **kwargs)
+            return
+        self._deferred.append(partial(fn, *args, **kwargs))
+
     # --------------------------
     # Utilities
     # --------------------------
@@ -586,7 +1251,11 @@ class World:
         self._empty = self._get_or_create_archetype(frozenset())
         self._cache_view_single.clear()
         self._cache_view_multi.clear()
+        self._change_log.clear()
+        self._change_floor.clear()
         self._pending_kill.clear()
+        self._deferred.clear()
+        self.commands = CommandBuffer()
         self._bump_version()
 
     def reset(self) -> None:
@@ -599,18 +1268,28 @@ class World:
         self.process_times_ms.clear()
         self._async_setup_done = False
         self._version = 0
+        self._tick = 0
         self._is_updating = False
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
     # --------------------------
     # Internals
     # --------------------------
+    def _flush_deferred(self) -> None:
+        while self._deferred or self.commands:
+            pending, self._deferred = self._deferred, []
+            for fn in pending:
+                fn()
+            self.commands.apply(self)
+
     def _flush_pending_kills(self) -> None:
         if not self._pending_kill:
             return
-        for eid in list(self._pending_kill):
-            if self._is_live(eid):
-                self.destroy_entity(eid, immediate=True)
+        pending = [eid for eid in self._pending_kill if self._is_live(eid)]
         self._pending_kill.clear()
+        self.destroy_batch(pending, immediate=True)
 
     def __repr__(self) -> str:
         return f"<World entities={self.entity_count()} archetypes={len(self._archetypes)} sync={len(self._sync_systems)} async={len(self._async_systems)}>"
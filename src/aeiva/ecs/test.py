@@ -6,7 +6,7 @@ Run with:  python test.py   or   pytest -q
 
 from dataclasses import dataclass
 import asyncio, time
-from ecs import World, System, AsyncSystem
+from ecs import World, System, AsyncSystem, CommandBuffer, numeric_component
 
 # ---------------- Components ----------------
 @dataclass
@@ -23,6 +23,18 @@ class Velocity:
 class Health:
     hp: int
 
+@numeric_component
+@dataclass
+class Body:
+    x: float
+    vx: float
+    alive: bool = True
+
+@numeric_component(dtype={"xyz": ("f4", (3,))})
+@dataclass
+class Pose:
+    xyz: tuple
+
 
 # ---------------- Systems ----------------
 class Physics(System):
@@ -203,6 +215,191 @@ def test_async_update_pipeline():
         assert h.hp == 11
     asyncio.run(run())
 
+def test_incremental_view_patches_only_touched_rows():
+    w = World()
+    es = [w.create_entity(Position(i, 0), Velocity(1, 0)) for i in range(10)]
+    w.create_entity(Position(99, 0))
+    before = w.view(Position, Velocity)
+    assert w.view(Position, Velocity) is before  # unchanged -> same cached snapshot
+
+    w.add_component(es[3], Position(-3, 0))       # in-place replace
+    w.remove_component(es[5], Velocity)           # swap-remove out of the archetype
+    w.destroy_entity(es[0])
+    extra = w.create_entity(Position(7, 7), Velocity(0, 1))
+    after = w.view(Position, Velocity)
+
+    assert after is not before and len(before) == 10  # old snapshot untouched
+    expected = {e: (w.get_component(e, Position), w.get_component(e, Velocity))
+                for e in es if w.entity_exists(e) and w.has_component(e, Velocity)}
+    expected[extra] = (w.get_component(extra, Position), w.get_component(extra, Velocity))
+    assert dict(after) == expected
+    assert len(w.view(Position)) == 11
+
+def test_changed_since_tick():
+    w = World()
+    a = w.create_entity(Position(0, 0), Health(10))
+    b = w.create_entity(Position(1, 1))
+    w.update(0.0)
+    mark = w.tick
+    assert w.changed(Position, mark) == []
+
+    w.update(0.0)
+    w.add_component(b, Position(5, 5))
+    w.add_component(b, Health(1))   # archetype move keeps Position's tick
+    w.get_component(a, Health).hp -= 1
+    w.mark_changed(a, Health)
+
+    assert w.changed(Position, mark) == [(b, Position(5, 5))]
+    assert {e for e, _ in w.changed(Health, mark)} == {a, b}
+    assert w.changed(Health, w.tick) == []
+    w.destroy_entity(b)
+    assert [e for e, _ in w.changed(Health, mark)] == [a]
+    assert len(w.changed(Position, -1)) == 1
+
+    for i in range(5000):  # overflow the change log; old ticks fall back to a scan
+        w.update(0.0)
+        w.add_component(a, Position(i, i))
+    assert w.changed(Position, mark) == [(a, Position(4999, 4999))]
+    assert w.changed(Position, w.tick - 1) == [(a, Position(4999, 4999))]
+
+def test_changed_after_trim_inside_one_tick():
+    w = World()
+    mark = w.tick
+    w.update(0.0)
+    es = w.spawn_batch({Position: [Position(i, 0) for i in range(3000)]})
+    for i in range(3001):  # the trim cuts through this tick's entries
+        w.add_component(es[0], Position(-1, i))
+    assert {e for e, _ in w.changed(Position, mark)} == set(es)
+
+def test_numeric_component_columns_and_swap_remove():
+    w = World()
+    es = [w.create_entity(Body(float(i), 1.0), Health(i)) for i in range(20)]
+    w.destroy_entity(es[0])                 # swap-remove moves the last row into row 0
+    w.remove_component(es[1], Health)       # moves to another archetype, keeps values
+    assert w.get_component(es[19], Body) == Body(19.0, 1.0)
+    assert w.get_component(es[1], Body) == Body(1.0, 1.0)
+
+    for arr in w.columns(Body):             # zero-copy vectorized update
+        arr["x"] += arr["vx"] * 2
+    b = w.get_component(es[5], Body)
+    assert b.x == 7.0 and isinstance(b, Body)
+    w.update()
+    b.x += 1                                 # live ref writes through and marks a change
+    assert sum(arr["x"].sum() for arr in w.columns(Body)) == sum(i + 2.0 for i in range(1, 20)) + 1
+    assert [e for e, _ in w.changed(Body, w.tick - 1)] == [es[5]]
+
+    w.add_component(es[5], Pose((1, 2, 3)))  # ref follows the entity to its new archetype
+    assert b.x == 8.0 and list(w.get_component(es[5], Pose).xyz) == [1, 2, 3]
+    w.add_component(es[5], Body(0.0, 0.0))   # replace in place
+    assert b == Body(0.0, 0.0) and dict(w.view(Body))[es[5]].x == 0.0
+    assert w.remove_component(es[5], Body) == Body(0.0, 0.0)
+    assert len(w.view(Body, Health)) == 17
+
+    try:
+        w.columns(Health)
+        assert False, "object components have no arrays"
+    except TypeError:
+        pass
+
+class SleepyMover(System):
+    priority = 10
+    reads = (Velocity,)
+    writes = (Position,)
+    def update(self, world, **_):
+        time.sleep(0.05)
+        for eid, (p, v) in world.iter_view(Position, Velocity):
+            p.x += v.vx
+
+class SleepyHealer(System):
+    priority = 10
+    writes = (Health,)
+    def update(self, world, **_):
+        time.sleep(0.05)
+        for eid, h in world.iter_view(Health):
+            if h.hp <= 0:
+                world.destroy_entity(eid)
+            world.defer(world.add_component, eid, Velocity(0, 0))
+
+class AsyncReader(AsyncSystem):
+    priority = 5
+    reads = (Position,)
+    seen = None
+    async def update(self, world, **_):
+        await asyncio.sleep(0.05)
+        AsyncReader.seen = sorted(p.x for _, p in world.view(Position))
+
+class Untyped(System):  # no declarations -> runs alone
+    priority = 1
+    def update(self, world, **_):
+        pass
+
+def test_parallel_stages_and_barrier_flush():
+    async def run():
+        w = World()
+        mover, healer, reader, untyped = SleepyMover(), SleepyHealer(), AsyncReader(), Untyped()
+        for sys in (untyped, reader, healer, mover):
+            w.add_system(sys)
+        assert w.stages() == [[healer, mover], [reader], [untyped]]
+
+        a = w.create_entity(Position(0, 0), Velocity(1, 0))
+        b = w.create_entity(Health(0))
+        t0 = time.perf_counter()
+        await w.aupdate_parallel()
+        elapsed = time.perf_counter() - t0
+        # mover and healer sleep concurrently on the pool (~0.05), then the reader (~0.05)
+        assert elapsed < 0.14, f"elapsed too long: {elapsed:.3f}s"
+        assert AsyncReader.seen == [1.0]        # stage 1 sees stage 0's writes
+        assert not w.entity_exists(b)           # deferred work, then kills, flushed at the barrier
+        assert w.get_component(a, Position).x == 1.0
+        assert {"SleepyMover", "SleepyHealer", "AsyncReader", "Untyped"} <= set(w.process_times_ms)
+    asyncio.run(run())
+
+def test_spawn_and_destroy_batch():
+    w = World()
+    w.destroy_entity(w.create_entity(Health(1)))  # leave a free index to recycle
+    pos = w.view(Position)
+    es = w.spawn_batch({Position: [Position(i, 0) for i in range(5)], Velocity: [Velocity(1, 0)] * 5})
+    bodies = w.spawn_batch({Body: [Body(float(i), 2.0) for i in range(3)]})
+    assert len(es) == 5 and len(set(es)) == 5 and all(w.entity_exists(e) for e in es)
+    assert [w.get_component(e, Position).x for e in es] == [0, 1, 2, 3, 4]
+    assert sum(arr["vx"].sum() for arr in w.columns(Body)) == 6.0 and len(bodies) == 3
+    assert len(pos) == 0 and len(w.view(Position)) == 5
+    assert {e for e, _ in w.changed(Position, -1)} == set(es)
+
+    w.destroy_batch([es[0], es[2], es[0]])
+    assert w.entity_count() == 6 and sorted(p.x for _, p in w.view(Position)) == [1, 3, 4]
+    try:
+        w.spawn_batch({Position: [Position(0, 0)], Velocity: []})
+        assert False, "mismatched column lengths"
+    except ValueError:
+        pass
+
+class Spawner(System):
+    def update(self, world, **_):
+        for eid, h in world.view(Health):
+            if h.hp <= 0:
+                world.commands.destroy(eid)
+                world.commands.spawn(Health(10), Position(0, 0))
+                world.commands.spawn(Health(10), Position(1, 1))
+            else:
+                world.commands.add_component(eid, Velocity(0, 0))
+
+def test_command_buffer_applied_after_update():
+    w = World()
+    w.add_system(Spawner())
+    dead = w.create_entity(Health(0))
+    alive = w.create_entity(Health(5))
+    w.update()
+    assert len(w.commands) == 0
+    assert not w.entity_exists(dead) and w.has_component(alive, Velocity)
+    assert sorted(p.x for _, (h, p) in w.view(Health, Position)) == [0, 1]
+
+    buf = CommandBuffer()
+    buf.destroy(alive)
+    buf.add_component(alive, Position(9, 9))  # entity is gone by then -> skipped
+    buf.apply(w)
+    assert not w.entity_exists(alive) and len(buf) == 0
+
 if __name__ == "__main__":
     # Run all tests manually when executed as a script
     test_sync_update()
@@ -218,4 +415,11 @@ if __name__ == "__main__":
     test_async_update_and_setup_autocall()
     test_async_concurrent_speedup()
     test_async_update_pipeline()
+    test_incremental_view_patches_only_touched_rows()
+    test_changed_since_tick()
+    test_changed_after_trim_inside_one_tick()
+    test_numeric_component_columns_and_swap_remove()
+    test_parallel_stages_and_barrier_flush()
+    test_spawn_and_destroy_batch()
+    test_command_buffer_applied_after_update()
     print("All tests passed.")
@@ -11,6 +11,8 @@ class HostEndpointConfig:
     tools: List[str] = field(default_factory=list)
     token: Optional[str] = None
     timeout: float = 30.0
+    weight: float = 1.0
+    max_concurrency: int = 0
 
 
 @dataclass
@@ -22,6 +24,18 @@ class HostConfig:
     timeout: float = 30.0
     exec_policy: ShellCommandPolicy = field(default_factory=ShellCommandPolicy)
     approval_policy: Dict[str, Any] = field(default_factory=dict)
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    health_interval: float = 0.0
+    eject_after: int = 3
+    eject_seconds: float = 30.0
+    hedge_tools: List[str] = field(default_factory=list)
+    hedge_delay_ms: float = 250.0
+    stream_tools: List[str] = field(default_factory=lambda: ["shell", "filesystem"])
+    stream_max_chars: int = 8000
+    stream_kill_on_budget: bool = False
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HostConfig":
@@ -33,6 +47,21 @@ class HostConfig:
         route = dict(data.get("route") or {})
         exec_policy = ShellCommandPolicy.from_dict(data.get("exec_policy"))
         approval_policy = data.get("approval_policy") or {}
+        max_connections = int(data.get("max_connections", 20))
+        max_keepalive_connections = int(data.get("max_keepalive_connections", 10))
+        keepalive_expiry = float(data.get("keepalive_expiry", 30.0))
+        http2 = bool(data.get("http2", False))
+        health_interval = float(data.get("health_interval", 0.0))
+        eject_after = max(1, int(data.get("eject_after", 3)))
+        eject_seconds = float(data.get("eject_seconds", 30.0))
+        hedge_tools = [str(t) for t in data.get("hedge_tools") or []]
+        hedge_delay_ms = float(data.get("hedge_delay_ms", 250.0))
+        raw_stream_tools = data.get("stream_tools")
+        stream_tools = (
+            ["shell", "filesystem"] if raw_stream_tools is None else [str(t) for t in raw_stream_tools]
+        )
+        stream_max_chars = max(0, int(data.get("stream_max_chars", 8000)))
+        stream_kill_on_budget = bool(data.get("stream_kill_on_budget", False))
 
         hosts: Dict[str, HostEndpointConfig] = {}
         raw_hosts = data.get("hosts") or {}
@@ -46,11 +75,15 @@ class HostConfig:
                 tools = list(cfg.get("tools") or [])
                 token = cfg.get("token")
                 host_timeout = float(cfg.get("timeout", timeout))
+                weight = float(cfg.get("weight", 1.0))
+                max_concurrency = int(cfg.get("max_concurrency", 0))
                 hosts[name] = HostEndpointConfig(
                     url=str(url),
                     tools=[str(t) for t in tools],
                     token=token,
                     timeout=host_timeout,
+                    weight=weight if weight > 0 else 1.0,
+                    max_concurrency=max(0, max_concurrency),
                 )
 
         return cls(
@@ -61,4 +94,16 @@ class HostConfig:
             timeout=timeout,
             exec_policy=exec_policy,
             approval_policy=approval_policy,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            health_interval=health_interval,
+            eject_after=eject_after,
+            eject_seconds=eject_seconds,
+            hedge_tools=hedge_tools,
+            hedge_delay_ms=hedge_delay_ms,
+            stream_tools=stream_tools,
+            stream_max_chars=stream_max_chars,
+            stream_kill_on_budget=stream_kill_on_budget,
         )
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import secrets
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from aeiva.host.host_runner import HostRunner
@@ -25,6 +28,16 @@ class InvokeResponse(BaseModel):
     id: Optional[str] = None
     result: Optional[Any] = None
     error: Optional[str] = None
+    code: Optional[str] = None
+
+
+class InvokeBatchRequest(BaseModel):
+    calls: List[InvokeRequest]
+
+
+class InvokeBatchResponse(BaseModel):
+    ok: bool
+    results: List[InvokeResponse]
 
 
 def _resolve_auth_token(auth_token: Optional[str], auth_token_env_var: Optional[str]) -> Optional[str]:
@@ -76,20 +89,24 @@ def build_app(
             "auth_required": require_auth,
         }
 
+    def _check_auth(authorization: Optional[str]) -> None:
+        if not require_auth:
+            return
+        presented_token = _extract_bearer_token(authorization)
+        expected_token = resolved_auth_token or ""
+        if not presented_token or not secrets.compare_digest(presented_token, expected_token):
+            raise HTTPException(
+                status_code=401,
+                detail="Unauthorized",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
     @app.post("/invoke", response_model=InvokeResponse)
     async def invoke(
         req: InvokeRequest,
         authorization: Optional[str] = Header(default=None, alias="Authorization"),
     ) -> InvokeResponse:
-        if require_auth:
-            presented_token = _extract_bearer_token(authorization)
-            expected_token = resolved_auth_token or ""
-            if not presented_token or not secrets.compare_digest(presented_token, expected_token):
-                raise HTTPException(
-                    status_code=401,
-                    detail="Unauthorized",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+        _check_auth(authorization)
         try:
             result = await runner.execute(req.tool, req.args or {})
             return InvokeResponse(ok=True, id=req.id, result=result)
@@ -98,4 +115,46 @@ def build_app(
         except Exception as exc:
             return InvokeResponse(ok=False, id=req.id, error=str(exc))
 
+    @app.post("/invoke_batch", response_model=InvokeBatchResponse)
+    async def invoke_batch(
+        req: InvokeBatchRequest,
+        authorization: Optional[str] = Header(default=None, alias="Authorization"),
+    ) -> InvokeBatchResponse:
+        _check_auth(authorization)
+
+        async def run_one(call: InvokeRequest) -> InvokeResponse:
+            try:
+                result = await runner.execute(call.tool, call.args or {})
+                return InvokeResponse(ok=True, id=call.id, result=result)
+            except PermissionError as exc:
+                return InvokeResponse(ok=False, id=call.id, error=str(exc), code="forbidden")
+            except Exception as exc:
+                return InvokeResponse(ok=False, id=call.id, error=str(exc))
+
+        results = await asyncio.gather(*(run_one(call) for call in req.calls))
+        return InvokeBatchResponse(ok=True, results=list(results))
+
+    @app.post("/invoke_stream")
+    async def invoke_stream(
+        req: InvokeRequest,
+        authorization: Optional[str] = Header(default=None, alias="Authorization"),
+    ) -> StreamingResponse:
+        _check_auth(authorization)
+        args = req.args or {}
+        try:
+            runner.check(req.tool, args)
+        except PermissionError as exc:
+            raise HTTPException(status_code=403, detail=str(exc))
+
+        async def frames():
+            try:
+                async for frame in runner.stream(req.tool, args):
+                    if frame.get("type") != "chunk":
+                        frame = {**frame, "id": req.id}
+                    yield json.dumps(frame, ensure_ascii=False, default=str) + "\n"
+            except Exception as exc:
+                yield json.dumps({"type": "error", "ok": False, "id": req.id, "error": str(exc)}) + "\n"
+
+        return StreamingResponse(frames(), media_type="application/x-ndjson")
+
     return app
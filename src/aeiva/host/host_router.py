@@ -1,15 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
+import logging
 import os
+import threading
+import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Deque, Dict, List, Optional, Sequence
 
 import httpx
 
 from aeiva.host.host_config import HostConfig, HostEndpointConfig
 from aeiva.host.approval_policy import ApprovalPolicy
 
+logger = logging.getLogger(__name__)
+
+# httpcore trace events emitted only when a new connection is dialled.
+_CONNECT_EVENTS = frozenset(
+    {"connection.connect_tcp.complete", "connection.connect_unix_socket.complete"}
+)
+
+
+@dataclass(eq=False)
+class _CapacityWaiter:
+    """A caller queued for a concurrency slot; sync callers wait on `event`."""
+
+    event: Optional[threading.Event] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    future: Optional[asyncio.Future] = None
+    granted: bool = False
+
+    def wake(self) -> bool:
+        """Hand the slot over; False when the waiter's loop is gone."""
+        if self.event is not None:
+            self.granted = True
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve_waiter, self.future)
+        except RuntimeError:  # loop closed
+            return False
+        self.granted = True
+        return True
+
+
+def _resolve_waiter(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 @dataclass
 class HostEndpoint:
@@ -18,6 +60,21 @@ class HostEndpoint:
     tools: set[str]
     token: Optional[str]
     timeout: float
+    weight: float = 1.0
+    max_concurrency: int = 0
+    # Runtime load and circuit-breaker state, guarded by HostRouter._lock.
+    inflight: int = field(default=0, compare=False)
+    failures: int = field(default=0, compare=False)
+    ejections: int = field(default=0, compare=False)
+    ejected_until: float = field(default=0.0, compare=False)
+    # Callers waiting for a slot under max_concurrency, first come first served.
+    waiters: Deque[_CapacityWaiter] = field(default_factory=deque, compare=False, repr=False)
+
+    def is_ejected(self, now: Optional[float] = None) -> bool:
+        return self.ejected_until > (time.monotonic() if now is None else now)
+
+    def has_capacity(self) -> bool:
+        return not self.max_concurrency or self.inflight < self.max_concurrency
 
     def build_headers(self) -> Dict[str, str]:
         if not self.token:
@@ -25,11 +82,148 @@ class HostEndpoint:
         return {"Authorization": f"Bearer {self.token}"}
 
 
+@dataclass
+class HostClientStats:
+    """Request, connection-reuse and latency counters for one host."""
+
+    requests: int = 0
+    calls: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    ejections: int = 0
+    failovers: int = 0
+    hedges: int = 0
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+
+    def record(self, calls: int, latency_ms: float) -> None:
+        self.requests += 1
+        self.calls += calls
+        self.latency_ms_total += latency_ms
+        self.latency_ms_max = max(self.latency_ms_max, latency_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "calls": self.calls,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connections_reused": max(0, self.requests - self.errors - self.connections_opened),
+            "ejections": self.ejections,
+            "failovers": self.failovers,
+            "hedges": self.hedges,
+            "latency_ms_avg": round(self.latency_ms_total / self.requests, 3) if self.requests else 0.0,
+            "latency_ms_max": round(self.latency_ms_max, 3),
+        }
+
+
+class _StreamAccumulator:
+    """
+    Reassembles `/invoke_stream` NDJSON frames under a character budget.
+
+    Output past the budget is discarded but the stream is still read to its
+    result frame, so the command runs to completion and its return code and
+    `success` survive. With `kill_on_budget` reading stops at the budget
+    instead, which closes the stream and cancels the command on the host.
+    """
+
+    def __init__(
+        self,
+        max_chars: int,
+        on_chunk: Optional[Callable[[str, str], Any]] = None,
+        kill_on_budget: bool = False,
+    ):
+        self.max_chars = max_chars
+        self.on_chunk = on_chunk
+        self.kill_on_budget = kill_on_budget
+        self.fields: Dict[str, List[str]] = {}
+        self.size = 0
+        self.truncated = False
+        self.final: Optional[Dict[str, Any]] = None
+
+    def feed(self, line: str) -> bool:
+        """Consume one frame; True means stop reading."""
+        frame = json.loads(line)
+        if frame.get("type") != "chunk":
+            self.final = frame
+            return True
+        field_name = str(frame.get("field") or "output")
+        data = str(frame.get("data") or "")
+        if self.max_chars and self.size + len(data) > self.max_chars:
+            data = data[: self.max_chars - self.size]
+            self.truncated = True
+        if data:
+            self.fields.setdefault(field_name, []).append(data)
+            self.size += len(data)
+            if self.on_chunk is not None:
+                self.on_chunk(field_name, data)
+        return self.truncated and self.kill_on_budget
+
+    def result(self, host_url: str) -> Any:
+        final = self.final or {}
+        if final and not final.get("ok"):
+            return {
+                "success": False,
+                "error": final.get("code") or "host_execution_failed",
+                "message": final.get("error") or "host execution failed",
+                "host": host_url,
+            }
+        result = final.get("result")
+        if not self.fields:
+            return result
+        merged: Dict[str, Any] = dict(result) if isinstance(result, dict) else {}
+        for field_name, parts in self.fields.items():
+            merged[field_name] = "".join(parts) + (merged.get(field_name) or "")
+        if self.truncated:
+            merged["truncated"] = True
+            if self.final is None:
+                merged["message"] = f"Output exceeded {self.max_chars} chars; stopped reading and cancelled the command."
+            else:
+                merged["message"] = f"Output exceeded {self.max_chars} chars; the rest was discarded."
+        return merged
+
+
 class HostRouter:
-    """Routes tool execution to a configured host endpoint."""
+    """
+    Routes tool execution to a configured host endpoint.
+
+    When several hosts serve a tool, calls go to the host with the fewest
+    in-flight requests per unit of weight. Hosts that fail `eject_after`
+    times in a row (requests or `/info` health probes) are ejected for a
+    backoff period and re-admitted on the next success; tools listed in
+    `hedge_tools` are idempotent and get a backup request to a second host
+    when the first has not answered within `hedge_delay_ms`.
+
+    Tools in `stream_tools` use `/invoke_stream`: output is reassembled from
+    NDJSON chunks and output past `stream_max_chars` is discarded while the
+    command runs to completion. With `stream_kill_on_budget` reading stops at
+    the budget instead, which also cancels the command on the host.
 
-    def __init__(self, config: HostConfig):
+    Each host gets one long-lived keep-alive client (per event loop for the
+    async path) instead of a client per call. `transport`/`async_transport`
+    override the httpx transports, e.g. for unix sockets or in-process apps.
+    """
+
+    def __init__(
+        self,
+        config: HostConfig,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.config = config
+        self._transport = transport
+        self._async_transport = async_transport
+        self._http2 = bool(config.http2)
+        if self._http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("host_config.http2 requested but the `h2` package is missing; using HTTP/1.1.")
+            self._http2 = False
+        self._clients: Dict[str, httpx.Client] = {}
+        # AsyncClient pools are bound to the loop that opened them, so async
+        # clients are kept per loop and closed when that loop shuts down.
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]] = {}
+        self._loop_guards: Dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = {}
+        self._lock = threading.Lock()
         self._approval_policy = ApprovalPolicy.from_dict(config.approval_policy)
         self._hosts: Dict[str, HostEndpoint] = {}
         for name, host_cfg in config.hosts.items():
@@ -39,32 +233,51 @@ class HostRouter:
                 tools=set(host_cfg.tools),
                 token=host_cfg.token,
                 timeout=host_cfg.timeout or config.timeout,
+                weight=host_cfg.weight,
+                max_concurrency=host_cfg.max_concurrency,
             )
+        self._stats: Dict[str, HostClientStats] = {name: HostClientStats() for name in self._hosts}
+        self._hedge_tools = set(config.hedge_tools)
+        self._stream_tools = set(config.stream_tools)
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
 
     def is_enabled(self) -> bool:
         return self.config.enabled and bool(self._hosts)
 
-    def _pick_host(self, tool: str) -> Optional[HostEndpoint]:
-        if not self.is_enabled():
-            return None
-
+    def _candidates(self, tool: str) -> List[HostEndpoint]:
         if tool in self.config.route:
             host_id = self.config.route.get(tool)
             host = self._hosts.get(host_id)
             if host and (not host.tools or tool in host.tools):
-                return host
+                return [host]
 
-        # Pick any host that declares the tool
-        for host in self._hosts.values():
-            if not host.tools or tool in host.tools:
-                return host
+        # Every host that declares the tool shares the load
+        hosts = [host for host in self._hosts.values() if not host.tools or tool in host.tools]
+        if hosts:
+            return hosts
 
         # Fallback to default host if provided
         if self.config.default_host:
             host = self._hosts.get(self.config.default_host)
             if host:
-                return host
-        return None
+                return [host]
+        return []
+
+    def _pick_host(self, tool: str, exclude: Sequence[str] = ()) -> Optional[HostEndpoint]:
+        if not self.is_enabled():
+            return None
+        hosts = [host for host in self._candidates(tool) if host.name not in exclude]
+        if not hosts:
+            return None
+        now = time.monotonic()
+        live = [host for host in hosts if not host.is_ejected(now)]
+        if not live:
+            # Everything is ejected: try the host that comes back soonest
+            # rather than silently running a host-only tool locally.
+            return min(hosts, key=lambda host: host.ejected_until)
+        pool = [host for host in live if host.has_capacity()] or live
+        return min(pool, key=lambda host: (host.inflight + 1) / host.weight)
 
     def _prepare_execution(
         self, tool: str, args: Dict[str, Any]
@@ -85,6 +298,269 @@ class HostRouter:
             }
         return host, args_clean, None
 
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Connection-reuse, latency and health counters per host endpoint."""
+        now = time.monotonic()
+        return {
+            name: {
+                **stats.to_dict(),
+                "healthy": not self._hosts[name].is_ejected(now),
+                "inflight": self._hosts[name].inflight,
+            }
+            for name, stats in self._stats.items()
+        }
+
+    def _record_outcome(self, host: HostEndpoint, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                if host.ejections:
+                    logger.info("Host %s recovered.", host.name)
+                host.failures = 0
+                host.ejections = 0
+                host.ejected_until = 0.0
+                return
+            host.failures += 1
+            if host.failures >= self.config.eject_after:
+                backoff = self.config.eject_seconds * (2 ** min(host.ejections, 5))
+                host.ejected_until = time.monotonic() + backoff
+                host.ejections += 1
+                host.failures = 0
+                self._stats[host.name].ejections += 1
+                logger.warning("Ejecting host %s for %.1fs after repeated failures.", host.name, backoff)
+
+    def _take_slot(self, host: HostEndpoint, waiter: _CapacityWaiter) -> bool:
+        # Called with self._lock held. Queued waiters go first, so a new caller
+        # cannot overtake them when a slot frees up.
+        if host.has_capacity() and not host.waiters:
+            host.inflight += 1
+            return True
+        host.waiters.append(waiter)
+        return False
+
+    def _leave_queue(self, host: HostEndpoint, waiter: _CapacityWaiter) -> bool:
+        """Withdraw a waiter that stopped waiting; True if it got the slot anyway."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            host.waiters.remove(waiter)
+            return False
+
+    def _wait_for_capacity_sync(self, host: HostEndpoint) -> None:
+        waiter = _CapacityWaiter(event=threading.Event())
+        with self._lock:
+            if self._take_slot(host, waiter):
+                return
+        if waiter.event.wait(host.timeout) or self._leave_queue(host, waiter):
+            return
+        raise httpx.PoolTimeout(f"Host {host.name} is at its concurrency limit")
+
+    async def _wait_for_capacity(self, host: HostEndpoint) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = _CapacityWaiter(loop=loop, future=loop.create_future())
+        with self._lock:
+            if self._take_slot(host, waiter):
+                return
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), host.timeout)
+        except asyncio.TimeoutError:
+            if self._leave_queue(host, waiter):
+                return
+            raise httpx.PoolTimeout(f"Host {host.name} is at its concurrency limit") from None
+        except asyncio.CancelledError:
+            if self._leave_queue(host, waiter):
+                self._release(host, None)
+            raise
+
+    def _release(self, host: HostEndpoint, ok: Optional[bool]) -> None:
+        with self._lock:
+            # Hand the slot straight to the next waiter; inflight stays put.
+            while host.waiters:
+                if host.waiters.popleft().wake():
+                    break
+            else:
+                host.inflight -= 1
+        if ok is not None:
+            self._record_outcome(host, ok)
+
+    def probe_hosts(self) -> Dict[str, bool]:
+        """Probe every host's `/info` once and update its health state."""
+        results: Dict[str, bool] = {}
+        for host in self._hosts.values():
+            try:
+                resp = self._client(host).get(
+                    f"{host.url}/info",
+                    headers=host.build_headers(),
+                    timeout=min(host.timeout, 5.0),
+                )
+                ok = resp.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            self._record_outcome(host, ok)
+            results[host.name] = ok
+        return results
+
+    def start_health_checks(self, interval: Optional[float] = None) -> None:
+        """Probe hosts from a daemon thread every `interval` seconds."""
+        interval = interval or self.config.health_interval
+        if interval <= 0 or self._health_thread is not None:
+            return
+        self._health_stop.clear()
+
+        def loop() -> None:
+            while not self._health_stop.is_set():
+                self.probe_hosts()
+                self._health_stop.wait(interval)
+
+        self._health_thread = threading.Thread(target=loop, name="aeiva-host-health", daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._health_stop.set()
+        thread, self._health_thread = self._health_thread, None
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _client(self, host: HostEndpoint) -> httpx.Client:
+        client = self._clients.get(host.name)
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._clients.get(host.name)
+                if client is None or client.is_closed:
+                    client = httpx.Client(
+                        timeout=host.timeout,
+                        limits=self._limits(),
+                        http2=self._http2,
+                        transport=self._transport,
+                    )
+                    self._clients[host.name] = client
+        return client
+
+    def _async_client(self, host: HostEndpoint) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            self._forget_closed_loops()
+            clients = self._async_clients[loop] = {}
+            self._close_clients_with_loop(loop)
+        client = clients.get(host.name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=host.timeout,
+                limits=self._limits(),
+                http2=self._http2,
+                transport=self._async_transport,
+            )
+            clients[host.name] = client
+        return client
+
+    def _close_clients_with_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Start an async generator and leave it suspended at its yield. Its
+        # first iteration registers it with the running loop, and
+        # loop.shutdown_asyncgens() (run by asyncio.run) closes it before the
+        # loop closes, which acloses this loop's clients on the loop itself.
+        guard = self._loop_shutdown_guard()
+        try:
+            guard.__anext__().send(None)
+        except StopIteration:
+            pass
+        self._loop_guards[loop] = guard
+
+    async def _loop_shutdown_guard(self) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            loop = asyncio.get_running_loop()
+            self._loop_guards.pop(loop, None)
+            for client in self._async_clients.pop(loop, {}).values():
+                await client.aclose()
+
+    def _forget_closed_loops(self) -> None:
+        # A loop closed without shutdown_asyncgens() cannot run aclose any
+        # more; drop its clients so their sockets are released on collection.
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            self._async_clients.pop(loop, None)
+            self._loop_guards.pop(loop, None)
+
+    def close(self) -> None:
+        self.stop_health_checks()
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+    async def aclose(self) -> None:
+        guard = self._loop_guards.pop(asyncio.get_running_loop(), None)
+        if guard is not None:
+            await guard.aclose()
+        self.close()
+
+    @staticmethod
+    def _trace(stats: HostClientStats) -> Callable[[str, Dict[str, Any]], None]:
+        def trace(event: str, info: Dict[str, Any]) -> None:
+            if event in _CONNECT_EVENTS:
+                stats.connections_opened += 1
+
+        return trace
+
+    @staticmethod
+    def _async_trace(stats: HostClientStats) -> Callable[[str, Dict[str, Any]], Any]:
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            if event in _CONNECT_EVENTS:
+                stats.connections_opened += 1
+
+        return trace
+
+    def _post_sync(self, host: HostEndpoint, path: str, payload: Dict[str, Any], calls: int) -> httpx.Response:
+        stats = self._stats[host.name]
+        self._wait_for_capacity_sync(host)
+        ok = False
+        started = time.perf_counter()
+        try:
+            resp = self._client(host).post(
+                f"{host.url}{path}",
+                json=payload,
+                headers=host.build_headers(),
+                extensions={"trace": self._trace(stats)},
+            )
+            ok = resp.status_code < 500
+            return resp
+        except httpx.HTTPError:
+            stats.errors += 1
+            raise
+        finally:
+            self._release(host, ok)
+            stats.record(calls, (time.perf_counter() - started) * 1000.0)
+
+    async def _post(self, host: HostEndpoint, path: str, payload: Dict[str, Any], calls: int) -> httpx.Response:
+        stats = self._stats[host.name]
+        await self._wait_for_capacity(host)
+        ok: Optional[bool] = False
+        started = time.perf_counter()
+        try:
+            resp = await self._async_client(host).post(
+                f"{host.url}{path}",
+                json=payload,
+                headers=host.build_headers(),
+                extensions={"trace": self._async_trace(stats)},
+            )
+            ok = resp.status_code < 500
+            return resp
+        except asyncio.CancelledError:
+            ok = None  # a losing hedge is not a host failure
+            raise
+        except httpx.HTTPError:
+            stats.errors += 1
+            raise
+        finally:
+            self._release(host, ok)
+            stats.record(calls, (time.perf_counter() - started) * 1000.0)
+
     async def execute(self, tool: str, args: Dict[str, Any]) -> Any:
         host, args_clean, block = self._prepare_execution(tool, args)
         if host is None:
@@ -92,67 +568,321 @@ class HostRouter:
         if block is not None:
             return block
         payload = {"tool": tool, "args": args_clean, "id": str(uuid.uuid4())}
-        try:
-            async with httpx.AsyncClient(timeout=host.timeout) as client:
-                resp = await client.post(
-                    f"{host.url}/invoke",
-                    json=payload,
-                    headers=host.build_headers(),
-                )
-        except httpx.HTTPError as exc:
-            return {
-                "success": False,
-                "error": "connection_error",
-                "message": str(exc),
-                "host": host.url,
-            }
+        if tool in self._stream_tools:
+            return await self._invoke_stream(host, payload, self.config.stream_max_chars)
+        if tool in self._hedge_tools:
+            return await self._invoke_hedged(host, payload)
+        return await self._invoke(host, payload)
 
-        if resp.status_code >= 400:
-            return self._http_error_result(resp, host.url)
+    def execute_sync(self, tool: str, args: Dict[str, Any]) -> Any:
+        host, args_clean, block = self._prepare_execution(tool, args)
+        if host is None:
+            return None
+        if block is not None:
+            return block
+        payload = {"tool": tool, "args": args_clean, "id": str(uuid.uuid4())}
+        if tool in self._stream_tools:
+            return self._invoke_stream_sync(host, payload, self.config.stream_max_chars)
+        return self._invoke_sync(host, payload)
 
-        data = resp.json()
-        if data.get("ok"):
-            return data.get("result")
-        return {
-            "success": False,
-            "error": "host_execution_failed",
-            "message": data.get("error") or "host execution failed",
-            "host": host.url,
-        }
+    async def execute_stream(
+        self,
+        tool: str,
+        args: Dict[str, Any],
+        *,
+        max_chars: Optional[int] = None,
+        on_chunk: Optional[Callable[[str, str], Any]] = None,
+        kill_on_budget: Optional[bool] = None,
+    ) -> Any:
+        """
+        Execute a tool through `/invoke_stream`, calling `on_chunk(field, text)`
+        for each piece of output as it arrives.
 
-    def execute_sync(self, tool: str, args: Dict[str, Any]) -> Any:
+        `max_chars` and `kill_on_budget` override `stream_max_chars` and
+        `stream_kill_on_budget` for this call.
+        """
         host, args_clean, block = self._prepare_execution(tool, args)
         if host is None:
             return None
         if block is not None:
             return block
         payload = {"tool": tool, "args": args_clean, "id": str(uuid.uuid4())}
-        try:
-            with httpx.Client(timeout=host.timeout) as client:
-                resp = client.post(
-                    f"{host.url}/invoke",
+        budget = self.config.stream_max_chars if max_chars is None else max_chars
+        return await self._invoke_stream(host, payload, budget, on_chunk, kill_on_budget)
+
+    async def _invoke_stream(
+        self,
+        host: HostEndpoint,
+        payload: Dict[str, Any],
+        max_chars: int,
+        on_chunk: Optional[Callable[[str, str], Any]] = None,
+        kill_on_budget: Optional[bool] = None,
+    ) -> Any:
+        if kill_on_budget is None:
+            kill_on_budget = self.config.stream_kill_on_budget
+        tried: List[str] = []
+        while True:
+            accumulator = _StreamAccumulator(max_chars, on_chunk, kill_on_budget)
+            stats = self._stats[host.name]
+            await self._wait_for_capacity(host)
+            ok: Optional[bool] = False
+            started = time.perf_counter()
+            try:
+                async with self._async_client(host).stream(
+                    "POST",
+                    f"{host.url}/invoke_stream",
                     json=payload,
                     headers=host.build_headers(),
-                )
-        except httpx.HTTPError as exc:
-            return {
-                "success": False,
-                "error": "connection_error",
-                "message": str(exc),
-                "host": host.url,
-            }
+                    extensions={"trace": self._async_trace(stats)},
+                ) as resp:
+                    ok = resp.status_code < 500
+                    if resp.status_code >= 400:
+                        await resp.aread()
+                    else:
+                        async for line in resp.aiter_lines():
+                            if line and accumulator.feed(line):
+                                break
+            except asyncio.CancelledError:
+                ok = None
+                raise
+            except httpx.ConnectError as exc:
+                stats.errors += 1
+                tried.append(host.name)
+                next_host = self._pick_host(payload["tool"], exclude=tried)
+                if next_host is None:
+                    return self._connection_error_result(exc, host.url)
+                stats.failovers += 1
+                host = next_host
+                continue
+            except httpx.HTTPError as exc:
+                stats.errors += 1
+                return self._connection_error_result(exc, host.url)
+            finally:
+                self._release(host, ok)
+                stats.record(1, (time.perf_counter() - started) * 1000.0)
+            if resp.status_code in (404, 405):
+                # Older daemon without /invoke_stream.
+                return await self._invoke(host, payload)
+            if resp.status_code >= 400:
+                return self._http_error_result(resp, host.url)
+            return accumulator.result(host.url)
+
+    def _invoke_stream_sync(self, host: HostEndpoint, payload: Dict[str, Any], max_chars: int) -> Any:
+        tried: List[str] = []
+        while True:
+            accumulator = _StreamAccumulator(max_chars, kill_on_budget=self.config.stream_kill_on_budget)
+            stats = self._stats[host.name]
+            self._wait_for_capacity_sync(host)
+            ok = False
+            started = time.perf_counter()
+            try:
+                with self._client(host).stream(
+                    "POST",
+                    f"{host.url}/invoke_stream",
+                    json=payload,
+                    headers=host.build_headers(),
+                    extensions={"trace": self._trace(stats)},
+                ) as resp:
+                    ok = resp.status_code < 500
+                    if resp.status_code >= 400:
+                        resp.read()
+                    else:
+                        for line in resp.iter_lines():
+                            if line and accumulator.feed(line):
+                                break
+            except httpx.ConnectError as exc:
+                stats.errors += 1
+                tried.append(host.name)
+                next_host = self._pick_host(payload["tool"], exclude=tried)
+                if next_host is None:
+                    return self._connection_error_result(exc, host.url)
+                stats.failovers += 1
+                host = next_host
+                continue
+            except httpx.HTTPError as exc:
+                stats.errors += 1
+                return self._connection_error_result(exc, host.url)
+            finally:
+                self._release(host, ok)
+                stats.record(1, (time.perf_counter() - started) * 1000.0)
+            if resp.status_code in (404, 405):
+                return self._invoke_sync(host, payload)
+            if resp.status_code >= 400:
+                return self._http_error_result(resp, host.url)
+            return accumulator.result(host.url)
+
+    async def _invoke(self, host: HostEndpoint, payload: Dict[str, Any]) -> Any:
+        tried: List[str] = []
+        while True:
+            try:
+                resp = await self._post(host, "/invoke", payload, 1)
+            except httpx.ConnectError as exc:
+                # Nothing reached the host, so any tool may move on to the next one.
+                tried.append(host.name)
+                next_host = self._pick_host(payload["tool"], exclude=tried)
+                if next_host is None:
+                    return self._connection_error_result(exc, host.url)
+                self._stats[host.name].failovers += 1
+                host = next_host
+                continue
+            except httpx.HTTPError as exc:
+                return self._connection_error_result(exc, host.url)
+            return self._invoke_result(resp, host.url)
+
+    def _invoke_sync(self, host: HostEndpoint, payload: Dict[str, Any]) -> Any:
+        tried: List[str] = []
+        while True:
+            try:
+                resp = self._post_sync(host, "/invoke", payload, 1)
+            except httpx.ConnectError as exc:
+                tried.append(host.name)
+                next_host = self._pick_host(payload["tool"], exclude=tried)
+                if next_host is None:
+                    return self._connection_error_result(exc, host.url)
+                self._stats[host.name].failovers += 1
+                host = next_host
+                continue
+            except httpx.HTTPError as exc:
+                return self._connection_error_result(exc, host.url)
+            return self._invoke_result(resp, host.url)
+
+    async def _invoke_hedged(self, host: HostEndpoint, payload: Dict[str, Any]) -> Any:
+        primary = asyncio.create_task(self._invoke(host, payload))
+        done, _ = await asyncio.wait({primary}, timeout=self.config.hedge_delay_ms / 1000.0)
+        backup_host = None if done else self._pick_host(payload["tool"], exclude=[host.name])
+        if backup_host is None:
+            return await primary
+        self._stats[host.name].hedges += 1
+        backup = asyncio.create_task(self._invoke(backup_host, {**payload, "id": str(uuid.uuid4())}))
+        pending = {primary, backup}
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    failed = isinstance(result, dict) and result.get("error") == "connection_error"
+                    if not failed or not pending:
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _prepare_batch(
+        self, calls: Sequence[tuple[str, Dict[str, Any]]]
+    ) -> tuple[List[Any], Dict[str, tuple[HostEndpoint, List[tuple[int, Dict[str, Any]]]]]]:
+        results: List[Any] = [None] * len(calls)
+        groups: Dict[str, tuple[HostEndpoint, List[tuple[int, Dict[str, Any]]]]] = {}
+        for index, (tool, args) in enumerate(calls):
+            host, args_clean, block = self._prepare_execution(tool, args)
+            if host is None:
+                continue
+            if block is not None:
+                results[index] = block
+                continue
+            payload = {"tool": tool, "args": args_clean, "id": str(uuid.uuid4())}
+            groups.setdefault(host.name, (host, []))[1].append((index, payload))
+        return results, groups
 
+    async def execute_batch(self, calls: Sequence[tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Execute several `(tool, args)` calls, one `/invoke_batch` request per host.
+
+        Results come back in call order; an entry is None when no host
+        handles that tool, so the caller can run it locally.
+        """
+        results, groups = self._prepare_batch(calls)
+
+        async def run_group(host: HostEndpoint, items: List[tuple[int, Dict[str, Any]]]) -> None:
+            if len(items) == 1:
+                index, payload = items[0]
+                results[index] = await self._invoke(host, payload)
+                return
+            try:
+                resp = await self._post(host, "/invoke_batch", {"calls": [p for _, p in items]}, len(items))
+            except httpx.HTTPError as exc:
+                for index, _ in items:
+                    results[index] = self._connection_error_result(exc, host.url)
+                return
+            if resp.status_code in (404, 405):
+                # Older daemon without /invoke_batch: fall back to single calls.
+                for index, payload in items:
+                    results[index] = await self._invoke(host, payload)
+                return
+            self._fill_batch_results(results, items, resp, host.url)
+
+        await asyncio.gather(*(run_group(host, items) for host, items in groups.values()))
+        return results
+
+    def execute_batch_sync(self, calls: Sequence[tuple[str, Dict[str, Any]]]) -> List[Any]:
+        results, groups = self._prepare_batch(calls)
+        for host, items in groups.values():
+            if len(items) > 1:
+                try:
+                    resp = self._post_sync(host, "/invoke_batch", {"calls": [p for _, p in items]}, len(items))
+                except httpx.HTTPError as exc:
+                    for index, _ in items:
+                        results[index] = self._connection_error_result(exc, host.url)
+                    continue
+                if resp.status_code not in (404, 405):
+                    self._fill_batch_results(results, items, resp, host.url)
+                    continue
+            for index, payload in items:
+                results[index] = self._invoke_sync(host, payload)
+        return results
+
+    def _fill_batch_results(
+        self,
+        results: List[Any],
+        items: List[tuple[int, Dict[str, Any]]],
+        resp: httpx.Response,
+        host_url: str,
+    ) -> None:
+        if resp.status_code >= 400:
+            error = self._http_error_result(resp, host_url)
+            for index, _ in items:
+                results[index] = error
+            return
+        by_id = {
+            entry.get("id"): entry
+            for entry in resp.json().get("results") or []
+            if isinstance(entry, dict)
+        }
+        for index, payload in items:
+            entry = by_id.get(payload["id"])
+            if entry is None:
+                results[index] = {
+                    "success": False,
+                    "error": "host_execution_failed",
+                    "message": "missing result in batch response",
+                    "host": host_url,
+                }
+            else:
+                results[index] = self._entry_result(entry, host_url)
+
+    def _invoke_result(self, resp: httpx.Response, host_url: str) -> Any:
         if resp.status_code >= 400:
-            return self._http_error_result(resp, host.url)
+            return self._http_error_result(resp, host_url)
+        return self._entry_result(resp.json(), host_url)
 
-        data = resp.json()
+    @staticmethod
+    def _entry_result(data: Dict[str, Any], host_url: str) -> Any:
         if data.get("ok"):
             return data.get("result")
         return {
             "success": False,
-            "error": "host_execution_failed",
+            "error": data.get("code") or "host_execution_failed",
             "message": data.get("error") or "host execution failed",
-            "host": host.url,
+            "host": host_url,
+        }
+
+    @staticmethod
+    def _connection_error_result(exc: Exception, host_url: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "connection_error",
+            "message": str(exc),
+            "host": host_url,
         }
 
     @staticmethod
@@ -213,10 +943,18 @@ class HostRouter:
 
 
 def configure_host_router(config_dict: Dict[str, Any]) -> Optional[HostRouter]:
-    host_cfg = HostConfig.from_dict(config_dict.get("host_config") or {})
+    raw_host_cfg = config_dict.get("host_config") or {}
+    llm_cfg = config_dict.get("llm_gateway_config") or {}
+    if isinstance(raw_host_cfg, dict) and "stream_max_chars" not in raw_host_cfg:
+        # Keep streamed output to what the tool loop would keep anyway.
+        max_chars = llm_cfg.get("llm_tool_result_max_chars") if isinstance(llm_cfg, dict) else None
+        if max_chars:
+            raw_host_cfg = {**raw_host_cfg, "stream_max_chars": max_chars}
+    host_cfg = HostConfig.from_dict(raw_host_cfg)
     if not host_cfg.enabled:
         return None
     router = HostRouter(host_cfg)
     if not router.is_enabled():
         return None
+    router.start_health_checks()
     return router
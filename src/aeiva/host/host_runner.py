@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional, Set
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
 
 from aeiva.tool.registry import ToolRegistry
 from aeiva.host.command_policy import ShellCommandPolicy
@@ -26,20 +26,41 @@ class HostRunner:
             return True
         return tool_name in self._allowed
 
-    async def execute(self, tool: str, args: Dict[str, Any]) -> Any:
+    def check(self, tool: str, args: Dict[str, Any]) -> None:
         if not self._is_allowed(tool):
             raise PermissionError(f"Tool not allowed on host: {tool}")
         if tool == "shell":
             ok, reason = self._command_policy.check(args.get("command"))
             if not ok:
                 raise PermissionError(reason)
+
+    async def execute(self, tool: str, args: Dict[str, Any]) -> Any:
+        self.check(tool, args)
         return await self._registry.execute(tool, **args)
 
     def execute_sync(self, tool: str, args: Dict[str, Any]) -> Any:
-        if not self._is_allowed(tool):
-            raise PermissionError(f"Tool not allowed on host: {tool}")
-        if tool == "shell":
-            ok, reason = self._command_policy.check(args.get("command"))
-            if not ok:
-                raise PermissionError(reason)
+        self.check(tool, args)
         return self._registry.execute_sync(tool, **args)
+
+    async def stream(self, tool: str, args: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield NDJSON frames for a tool call.
+
+        Shell commands and file reads stream `chunk` frames as output is
+        produced; other tools yield a single `result` frame. Callers run
+        `check()` first so permission errors surface before streaming starts.
+        """
+        if tool == "shell":
+            from aeiva.tool.meta.shell import stream_shell
+
+            async for frame in stream_shell(**args):
+                yield frame
+            return
+        if tool == "filesystem" and args.get("operation") == "read":
+            from aeiva.tool.meta.filesystem import stream_read
+
+            async for frame in stream_read(**args):
+                yield frame
+            return
+        result = await self._registry.execute(tool, **args)
+        yield {"type": "result", "ok": True, "result": result}
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 
 from aeiva.llm.api_handlers import ChatAPIHandler, ResponsesAPIHandler, LLMHandler
 from aeiva.llm.llm_gateway_config import LLMGatewayConfig
+from aeiva.llm.rate_limiter import RequestGovernor, extract_headers, get_governor, is_rate_limit_error
 from aeiva.llm.tool_types import ToolCall
 
 MODEL_API_REGISTRY: Dict[str, str] = {
@@ -41,6 +42,13 @@ class LLMBackend:
     def __init__(self, config: LLMGatewayConfig, handler: Optional[LLMHandler] = None):
         self.config = config
         self._handler = handler
+        self.governor: Optional[RequestGovernor] = None
+        if getattr(config, "llm_rate_limiter_enabled", False):
+            self.governor = get_governor(
+                config.llm_model_name,
+                max_concurrent=config.llm_max_concurrent_requests or 8,
+                requests_per_minute=config.llm_requests_per_minute,
+            )
 
     def uses_responses_api(self) -> bool:
         mode = (self.config.llm_api_mode or "auto").lower()
@@ -68,10 +76,55 @@ class LLMBackend:
         return self._get_handler().build_params(messages, tools, **kwargs)
 
     async def execute(self, params, stream: bool):
-        return await self._get_handler().execute(params, stream=stream)
+        if self.governor is None:
+            return await self._get_handler().execute(params, stream=stream)
+        if stream:
+            await self.governor.acquire()
+            try:
+                response = await self._get_handler().execute(params, stream=True)
+            except BaseException as exc:
+                self.governor.release()
+                if isinstance(exc, Exception):
+                    self._observe_error(exc)
+                raise
+            return self._hold_slot(response)
+        async with self.governor.slot():
+            try:
+                response = await self._get_handler().execute(params, stream=stream)
+            except Exception as exc:
+                self._observe_error(exc)
+                raise
+        self.governor.observe_success(extract_headers(response))
+        return response
+
+    async def _hold_slot(self, response_stream):
+        """Yield from a provider stream, keeping the governor slot until it ends."""
+        try:
+            async for chunk in response_stream:
+                yield chunk
+        except Exception as exc:
+            self._observe_error(exc)
+            raise
+        else:
+            self.governor.observe_success(extract_headers(response_stream))
+        finally:
+            self.governor.release()
 
     def execute_sync(self, params):
-        return self._get_handler().execute_sync(params)
+        if self.governor is None:
+            return self._get_handler().execute_sync(params)
+        with self.governor.slot_sync():
+            try:
+                response = self._get_handler().execute_sync(params)
+            except Exception as exc:
+                self._observe_error(exc)
+                raise
+        self.governor.observe_success(extract_headers(response))
+        return response
+
+    def _observe_error(self, exc: Exception) -> None:
+        if is_rate_limit_error(exc):
+            self.governor.observe_rate_limited(extract_headers(exc))
 
     def parse_response(self, response) -> LLMResponse:
         _, tool_calls, content = self._get_handler().parse_response(response)
@@ -4,6 +4,19 @@ import time
 from functools import wraps
 from typing import Callable, Union
 
+from aeiva.llm.rate_limiter import extract_headers, jittered_backoff, parse_retry_after
+
+
+MAX_RETRY_DELAY = 60.0
+
+
+def retry_delay(exc: BaseException, attempt: int, backoff_factor: float) -> float:
+    """Honour a provider Retry-After when present, else full-jitter exponential backoff."""
+    retry_after = parse_retry_after(extract_headers(exc))
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_DELAY)
+    return jittered_backoff(attempt, backoff_factor, cap=MAX_RETRY_DELAY)
+
 
 def retry_sync(max_attempts: Union[int, Callable], backoff_factor: Union[float, Callable], exceptions: tuple):
     def decorator(func: Callable):
@@ -12,16 +25,14 @@ def retry_sync(max_attempts: Union[int, Callable], backoff_factor: Union[float,
             attempts = 0
             max_attempts_val = max_attempts(self) if callable(max_attempts) else max_attempts
             backoff_factor_val = backoff_factor(self) if callable(backoff_factor) else backoff_factor
-            wait_time = backoff_factor_val
             while attempts < max_attempts_val:
                 try:
                     return func(self, *args, **kwargs)
                 except exceptions as e:
                     attempts += 1
-                    if attempts == max_attempts_val:
+                    if attempts == max_attempts_val or getattr(e, "retryable", True) is False:
                         raise e
-                    time.sleep(wait_time)
-                    wait_time *= 2
+                    time.sleep(retry_delay(e, attempts - 1, backoff_factor_val))
         return wrapper
     return decorator
 
@@ -33,15 +44,13 @@ def retry_async(max_attempts: Union[int, Callable], backoff_factor: Union[float,
             attempts = 0
             max_attempts_val = max_attempts(self) if callable(max_attempts) else max_attempts
             backoff_factor_val = backoff_factor(self) if callable(backoff_factor) else backoff_factor
-            wait_time = backoff_factor_val
             while attempts < max_attempts_val:
                 try:
                     return await func(self, *args, **kwargs)
                 except exceptions as e:
                     attempts += 1
-                    if attempts == max_attempts_val:
+                    if attempts == max_attempts_val or getattr(e, "retryable", True) is False:
                         raise e
-                    await asyncio.sleep(wait_time)
-                    wait_time *= 2
+                    await asyncio.sleep(retry_delay(e, attempts - 1, backoff_factor_val))
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -15,6 +15,8 @@ from aeiva.llm.llm_gateway_config import LLMGatewayConfig
 from aeiva.llm.llm_gateway_exceptions import LLMGatewayError, llm_gateway_exception
 from aeiva.llm.llm_usage_metrics import LLMUsageMetrics
 from aeiva.llm.patches import apply_all_patches
+from aeiva.llm.response_cache import LLMResponseCache, get_shared_response_cache, make_cache_key
+from aeiva.llm.token_counter import get_token_counter
 from aeiva.llm.tool_loop import ToolLoopEngine, ToolLoopResult
 
 
@@ -41,11 +43,21 @@ class LLMClient:
         self._configure_litellm()
 
         self.backend = LLMBackend(self.config)
+        self.response_cache: Optional[LLMResponseCache] = None
+        if getattr(self.config, "llm_cache_enabled", False):
+            self.response_cache = get_shared_response_cache(
+                path=self.config.llm_cache_path,
+                max_entries=self.config.llm_cache_max_entries or 1024,
+                ttl_seconds=self.config.llm_cache_ttl_seconds,
+                max_disk_entries=self.config.llm_cache_max_disk_entries or 10000,
+            )
         self.engine = ToolLoopEngine(
             backend=self.backend,
             metrics=self.metrics,
             max_tool_loops=self.max_tool_loops,
             tool_result_max_chars=self.tool_result_max_chars,
+            token_counter=self.token_counter,
+            max_input_tokens=self.config.llm_max_input_tokens if self.token_counter else None,
         )
 
     @property
@@ -70,6 +82,22 @@ class LLMClient:
             return self.DEFAULT_TOOL_RESULT_MAX_CHARS
         return max(1000, min(parsed, 60000))
 
+    @property
+    def token_counter(self):
+        """Shared token counter, or None when input-token pre-flight is off."""
+        if not getattr(self.config, "llm_preflight_input_tokens", False):
+            return None
+        return get_token_counter(self.config.llm_model_name)
+
+    def count_tokens(self, messages: List[Any], tools: List[Dict[str, Any]] = None) -> int:
+        """Estimate prompt tokens for messages (and tool schemas) with this model's tokenizer."""
+        return get_token_counter(self.config.llm_model_name).count_messages(messages, tools)
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Queue depth, concurrency and wait-time metrics of this model's governor."""
+        governor = self.backend.governor
+        return governor.stats() if governor is not None else {}
+
     @property
     def last_response_id(self) -> Optional[str]:
         return self.engine.last_response_id
@@ -90,16 +118,78 @@ class LLMClient:
     def call_tool_sync(self, tool_name: str, params: Dict[str, Any]) -> Any:
         return self.engine.registry.execute_sync(tool_name, **params)
 
+    # ---------------------------------------------------------------------
+    # Response cache
+    # ---------------------------------------------------------------------
+
+    def _cache_key(
+        self, messages: List[Any], tools: Optional[List[Dict[str, Any]]], kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Return a cache key, or None when the request must go to the provider."""
+        if self.response_cache is None or tools or kwargs.get("stream"):
+            return None
+        temperature = kwargs.get("temperature", self.config.llm_temperature)
+        max_temperature = self.config.llm_cache_max_temperature or 0.0
+        if temperature is None or float(temperature) > max_temperature:
+            return None
+        return make_cache_key({
+            "model": self.config.llm_model_name,
+            "api_mode": self.config.llm_api_mode,
+            "base_url": self.config.llm_base_url,
+            "messages": messages,
+            "temperature": temperature,
+            "top_p": kwargs.get("top_p", self.config.llm_top_p),
+            "max_output_tokens": self.config.llm_max_output_tokens,
+            "tool_choice": self.config.llm_tool_choice,
+            "additional_params": self.config.llm_additional_params,
+            "kwargs": {k: v for k, v in kwargs.items() if k != "stream"},
+        })
+
+    def _cached_result(self, messages: List[Any], value: Dict[str, Any], hit: bool) -> ToolLoopResult:
+        self.metrics.record_cache(hit, value.get("usage"))
+        if hit:
+            # Mirror the engine, which appends the assistant reply to the history.
+            messages.append({"role": "assistant", "content": value.get("text", "")})
+        return ToolLoopResult(value.get("text", ""), value.get("usage") or {}, value.get("response_id"), None)
+
+    @staticmethod
+    def _cache_value(result: ToolLoopResult) -> Dict[str, Any]:
+        return {"text": result.text, "usage": result.usage or {}, "response_id": result.response_id}
+
     # ---------------------------------------------------------------------
     # Public API (preferred)
     # ---------------------------------------------------------------------
 
+    def run(
+        self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs
+    ) -> ToolLoopResult:
+        key = self._cache_key(messages, tools, kwargs)
+        if key is None:
+            return self._run_uncached(messages, tools=tools, **kwargs)
+        value, hit = self.response_cache.get_or_compute(
+            key, lambda: self._cache_value(self._run_uncached(messages, tools=tools, **kwargs)),
+        )
+        return self._cached_result(messages, value, hit)
+
+    async def arun(
+        self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs
+    ) -> ToolLoopResult:
+        key = self._cache_key(messages, tools, kwargs)
+        if key is None:
+            return await self._arun_uncached(messages, tools=tools, **kwargs)
+
+        async def compute() -> Dict[str, Any]:
+            return self._cache_value(await self._arun_uncached(messages, tools=tools, **kwargs))
+
+        value, hit = await self.response_cache.aget_or_compute(key, compute)
+        return self._cached_result(messages, value, hit)
+
     @retry_sync(
         max_attempts=lambda self: self.config.llm_num_retries,
         backoff_factor=lambda self: self.config.llm_retry_backoff_factor,
         exceptions=(LLMGatewayError,),
     )
-    def run(
+    def _run_uncached(
         self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs
     ) -> ToolLoopResult:
         try:
@@ -113,7 +203,7 @@ class LLMClient:
         backoff_factor=lambda self: self.config.llm_retry_backoff_factor,
         exceptions=(LLMGatewayError,),
     )
-    async def arun(
+    async def _arun_uncached(
         self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs
     ) -> ToolLoopResult:
         try:
@@ -42,6 +42,10 @@ class LLMGatewayConfig(BaseConfig):
         default=4096,
         metadata={"help": "The maximum number of input tokens allowed in a request."}
     )
+    llm_preflight_input_tokens: Optional[bool] = field(
+        default=False,
+        metadata={"help": "Count prompt tokens locally and reject requests over llm_max_input_tokens before sending."}
+    )
     llm_max_output_tokens: Optional[int] = field(
         default=1024,
         metadata={"help": "The maximum number of output tokens generated by the LLM."}
@@ -74,6 +78,18 @@ class LLMGatewayConfig(BaseConfig):
         default=(429, 500, 502, 503, 504),
         metadata={"help": "HTTP status codes that should trigger a retry."}
     )
+    llm_rate_limiter_enabled: Optional[bool] = field(
+        default=True,
+        metadata={"help": "Route requests through the shared per-model concurrency and rate governor."}
+    )
+    llm_max_concurrent_requests: Optional[int] = field(
+        default=8,
+        metadata={"help": "Upper bound on in-flight requests per model; shrinks on 429s and recovers on success."}
+    )
+    llm_requests_per_minute: Optional[float] = field(
+        default=None,
+        metadata={"help": "Token-bucket request budget per model (unset: learn from provider headers)."}
+    )
     llm_use_async: Optional[bool] = field(
         default=False,
         metadata={"help": "Whether to use asynchronous API calls."}
@@ -90,6 +106,30 @@ class LLMGatewayConfig(BaseConfig):
         default=None,
         metadata={"help": "Tool choice policy: auto|none|required|{type:function,...} or tool name."}
     )
+    llm_cache_enabled: Optional[bool] = field(
+        default=False,
+        metadata={"help": "Cache responses of deterministic, tool-free requests (see llm_cache_max_temperature)."}
+    )
+    llm_cache_path: Optional[str] = field(
+        default=None,
+        metadata={"help": "SQLite file for the on-disk response cache tier (memory-only when unset)."}
+    )
+    llm_cache_ttl_seconds: Optional[float] = field(
+        default=86400,
+        metadata={"help": "Time-to-live for cached responses in seconds (0 disables expiry)."}
+    )
+    llm_cache_max_entries: Optional[int] = field(
+        default=1024,
+        metadata={"help": "Maximum responses kept in the in-memory cache tier."}
+    )
+    llm_cache_max_disk_entries: Optional[int] = field(
+        default=10000,
+        metadata={"help": "Maximum responses kept in the on-disk cache tier."}
+    )
+    llm_cache_max_temperature: Optional[float] = field(
+        default=0.0,
+        metadata={"help": "Only requests at or below this temperature are cached."}
+    )
     llm_logging_level: Optional[str] = field(
         default='INFO',
         metadata={"help": "Logging level for the LLM module (e.g., 'DEBUG', 'INFO')."}
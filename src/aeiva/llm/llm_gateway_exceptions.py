@@ -29,6 +29,18 @@ class LLMGatewayError(Exception):
         super().__init__(message)
         self.original_exception = original_exception
 
+
+class LLMInputTooLargeError(LLMGatewayError):
+    """Raised locally when a request exceeds llm_max_input_tokens; never retried."""
+
+    retryable = False
+
+    def __init__(self, message: str, token_count: int, max_tokens: int):
+        super().__init__(message)
+        self.token_count = token_count
+        self.max_tokens = max_tokens
+
+
 # Mapping litellm exceptions to LLMGatewayError
 LITELLM_EXCEPTION_MAP = {
     APIConnectionError: LLMGatewayError,
@@ -54,6 +66,8 @@ LITELLM_EXCEPTION_MAP = {
 
 def llm_gateway_exception(e: Exception) -> LLMGatewayError:
     """Converts a litellm exception to a unified LLMGatewayError."""
+    if isinstance(e, LLMGatewayError):
+        return e
     exception_type = type(e)
     mapped_exception = LITELLM_EXCEPTION_MAP.get(exception_type, LLMGatewayError)
     return mapped_exception(str(e), original_exception=e)
\ No newline at end of file
@@ -1,13 +1,15 @@
-
 class LLMUsageMetrics:
     """
-    Tracks metrics such as token usage and cost.
+    Tracks metrics such as token usage, cost and response-cache activity.
     """
     def __init__(self):
         self.total_tokens = 0
         self.prompt_tokens = 0
         self.completion_tokens = 0
         self.total_cost = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_saved_tokens = 0
 
     def add_tokens(self, prompt_tokens: int, completion_tokens: int):
         self.prompt_tokens += prompt_tokens
@@ -15,4 +17,17 @@ class LLMUsageMetrics:
         self.total_tokens += prompt_tokens + completion_tokens
 
     def add_cost(self, cost: float):
-        self.total_cost += cost
\ No newline at end of file
+        self.total_cost += cost
+
+    def record_cache(self, hit: bool, usage: dict = None):
+        """Record a response-cache lookup; hits count the tokens they avoided."""
+        if not hit:
+            self.cache_misses += 1
+            return
+        self.cache_hits += 1
+        usage = usage or {}
+        self.cache_saved_tokens += int(
+            usage.get("total_tokens")
+            or (usage.get("prompt_tokens", 0) or usage.get("input_tokens", 0) or 0)
+            + (usage.get("completion_tokens", 0) or usage.get("output_tokens", 0) or 0)
+        )
@@ -0,0 +1,467 @@
+"""
+Adaptive rate limiting and concurrency control for LLM requests.
+
+One RequestGovernor is shared per model. It combines:
+    - a concurrency limit that halves on 429s and grows back on success (AIMD)
+    - an optional requests-per-minute token bucket
+    - provider rate-limit headers and Retry-After, which pause dispatch
+    - a priority queue, so interactive turns go before background work
+
+Callers mark background work with ``llm_priority("background")``; the
+priority travels with the asyncio context into the backend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Union
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+_PRIORITY_NAMES = {"interactive": PRIORITY_INTERACTIVE, "background": PRIORITY_BACKGROUND}
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "aeiva_llm_priority", default=PRIORITY_INTERACTIVE,
+)
+
+
+def _priority_value(priority: Union[int, str, None]) -> int:
+    if priority is None:
+        return _current_priority.get()
+    if isinstance(priority, str):
+        return _PRIORITY_NAMES[priority.lower()]
+    return int(priority)
+
+
+@contextmanager
+def llm_priority(priority: Union[int, str]) -> Iterator[None]:
+    """Run LLM requests issued in this context at the given priority."""
+    token = _current_priority.set(_priority_value(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Header parsing
+# ---------------------------------------------------------------------------
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """Parse '20', '1.5s', '6m0s' or '250ms' into seconds."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """Return the Retry-After delay in seconds, if the headers carry one."""
+    millis = headers.get("retry-after-ms")
+    if millis is not None:
+        try:
+            return max(0.0, float(millis) / 1000.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    seconds = parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_headers(source: Any) -> Dict[str, str]:
+    """Collect lower-cased response headers from a provider response or error."""
+    candidates: List[Any] = []
+    if isinstance(source, Mapping):
+        candidates.append(source)
+    hidden = getattr(source, "_hidden_params", None)
+    if isinstance(hidden, Mapping):
+        candidates.append(hidden.get("additional_headers"))
+    candidates.append(getattr(source, "litellm_response_headers", None))
+    candidates.append(getattr(getattr(source, "response", None), "headers", None))
+    candidates.append(getattr(source, "headers", None))
+    original = getattr(source, "original_exception", None)
+    if original is not None and original is not source:
+        candidates.append(extract_headers(original))
+
+    headers: Dict[str, str] = {}
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            items = candidate.items()
+        except AttributeError:
+            continue
+        for key, value in items:
+            name = str(key).lower()
+            # litellm prefixes forwarded provider headers with "llm_provider-".
+            if name.startswith("llm_provider-"):
+                name = name[len("llm_provider-"):]
+            headers.setdefault(name, str(value))
+    return headers
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    for candidate in (exc, getattr(exc, "original_exception", None)):
+        if candidate is None:
+            continue
+        if getattr(candidate, "status_code", None) == 429 or type(candidate).__name__ == "RateLimitError":
+            return True
+    return False
+
+
+def jittered_backoff(attempt: int, base: float, cap: float = 60.0) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0.0, min(cap, max(0.0, base) * (2 ** max(0, attempt))))
+
+
+# ---------------------------------------------------------------------------
+# Governor
+# ---------------------------------------------------------------------------
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "granted", "cancelled", "_event", "_future", "_loop")
+
+    def __init__(self, priority: int, seq: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.priority = priority
+        self.seq = seq
+        self.granted = False
+        self.cancelled = False
+        self._loop = loop
+        self._future = loop.create_future() if loop is not None else None
+        self._event = None if loop is not None else threading.Event()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def grant(self) -> None:
+        self.granted = True
+        if self._future is not None:
+            self._loop.call_soon_threadsafe(self._resolve)
+        else:
+            self._event.set()
+
+    def _resolve(self) -> None:
+        if not self._future.done():
+            self._future.set_result(None)
+
+    async def wait_async(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(asyncio.shield(self._future), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def wait_sync(self, timeout: Optional[float]) -> None:
+        self._event.wait(timeout)
+
+
+class RequestGovernor:
+    """Concurrency limit + token bucket + provider back-pressure for one model."""
+
+    def __init__(
+        self,
+        name: str = "default",
+        max_concurrent: int = 8,
+        requests_per_minute: Optional[float] = None,
+        min_concurrent: int = 1,
+        recovery_successes: int = 5,
+        wait_samples: int = 256,
+    ):
+        self.name = name
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.min_concurrent = max(1, min(int(min_concurrent), self.max_concurrent))
+        self.limit = self.max_concurrent
+        self.rate = float(requests_per_minute) / 60.0 if requests_per_minute else None
+        self.capacity = max(1.0, float(requests_per_minute)) if requests_per_minute else None
+        self._tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._recovery_successes = max(1, int(recovery_successes))
+        self._success_streak = 0
+
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_deadline = 0.0
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self.in_flight = 0
+
+        self.acquired = 0
+        self.throttled = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self._waits: Deque[float] = deque(maxlen=max(1, int(wait_samples)))
+
+    # ---- acquisition ----
+
+    @asynccontextmanager
+    async def slot(self, priority: Union[int, str, None] = None):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def slot_sync(self, priority: Union[int, str, None] = None):
+        self.acquire_sync(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: Union[int, str, None] = None) -> float:
+        """Wait for a slot; returns the time spent waiting in seconds."""
+        waiter = _Waiter(_priority_value(priority), next(self._seq), asyncio.get_running_loop())
+        started = time.monotonic()
+        self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                await waiter.wait_async(self._next_wakeup())
+                self._dispatch()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._record_wait(started)
+
+    def acquire_sync(self, priority: Union[int, str, None] = None) -> float:
+        waiter = _Waiter(_priority_value(priority), next(self._seq))
+        started = time.monotonic()
+        self._enqueue(waiter)
+        try:
+            while not waiter.granted:
+                waiter.wait_sync(self._next_wakeup())
+                self._dispatch()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        return self._record_wait(started)
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._dispatch_locked()
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+            self._dispatch_locked()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                self.in_flight = max(0, self.in_flight - 1)
+            waiter.cancelled = True
+            self._dispatch_locked()
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            self._dispatch_locked()
+
+    def _dispatch_locked(self) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            head = self._waiters[0]
+            if head.cancelled or head.granted:
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self.limit:
+                break
+            if now < self._blocked_until or (self._tokens is not None and self._tokens < 1.0):
+                # No release may ever come, so time-based blocks must arm
+                # their own wake-up or queued waiters could sleep forever.
+                self._arm_timer_locked(now)
+                break
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            if self._tokens is not None:
+                self._tokens -= 1.0
+            head.grant()
+
+    def _arm_timer_locked(self, now: float) -> None:
+        delay = max(0.0, self._blocked_until - now)
+        if self._tokens is not None and self._tokens < 1.0 and self.rate:
+            delay = max(delay, (1.0 - self._tokens) / self.rate)
+        deadline = now + max(0.005, delay)
+        if self._timer is not None and self._timer_deadline <= deadline:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(deadline - now, self._on_timer)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._dispatch_locked()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            return
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until time-based capacity returns, or None to wait for a release."""
+        with self._lock:
+            now = time.monotonic()
+            delays = []
+            if now < self._blocked_until:
+                delays.append(self._blocked_until - now)
+            if self._tokens is not None and self._tokens < 1.0 and self.rate:
+                delays.append((1.0 - self._tokens) / self.rate)
+            return max(0.005, max(delays)) if delays else None
+
+    def _record_wait(self, started: float) -> float:
+        waited = time.monotonic() - started
+        with self._lock:
+            self.acquired += 1
+            self.total_wait_seconds += waited
+            self._waits.append(waited)
+        return waited
+
+    # ---- feedback ----
+
+    def observe_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        with self._lock:
+            self._success_streak += 1
+            if self.limit < self.max_concurrent and self._success_streak >= self._recovery_successes:
+                self.limit += 1
+                self._success_streak = 0
+            if headers:
+                self._apply_headers_locked(headers)
+            self._dispatch_locked()
+
+    def observe_rate_limited(self, headers: Optional[Mapping[str, str]] = None, attempt: int = 0) -> float:
+        """Back off after a 429; returns the pause applied in seconds."""
+        headers = headers or {}
+        delay = parse_retry_after(headers)
+        if delay is None:
+            delay = jittered_backoff(attempt, base=1.0)
+        with self._lock:
+            self.throttled += 1
+            self._success_streak = 0
+            self.limit = max(self.min_concurrent, self.limit // 2)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self._apply_headers_locked(headers)
+        return delay
+
+    def _apply_headers_locked(self, headers: Mapping[str, str]) -> None:
+        now = time.monotonic()
+        for kind in ("requests", "tokens"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining is None:
+                continue
+            try:
+                exhausted = float(remaining) <= 0
+            except ValueError:
+                continue
+            if exhausted:
+                reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}")) or 1.0
+                self._blocked_until = max(self._blocked_until, now + reset)
+        limit = headers.get("x-ratelimit-limit-requests")
+        if limit and self.rate is None:
+            try:
+                # Adopt the provider's per-minute request budget.
+                rpm = float(limit)
+            except ValueError:
+                rpm = 0.0
+            if rpm > 0:
+                self.rate = rpm / 60.0
+                self.capacity = max(1.0, rpm)
+                self._tokens = self.capacity
+                self._refilled_at = now
+
+    # ---- metrics ----
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            queued = sum(1 for w in self._waiters if not (w.cancelled or w.granted))
+            blocked_for = max(0.0, self._blocked_until - time.monotonic())
+
+        def pct(q: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(q * len(waits)))] * 1000.0, 3)
+
+        return {
+            "model": self.name,
+            "in_flight": self.in_flight,
+            "queued": queued,
+            "max_queue_depth": self.max_queue_depth,
+            "concurrency_limit": self.limit,
+            "max_concurrent": self.max_concurrent,
+            "requests_per_minute": round(self.rate * 60.0, 3) if self.rate else None,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "blocked_for_s": round(blocked_for, 3),
+            "wait_ms_p50": pct(0.50),
+            "wait_ms_p95": pct(0.95),
+            "wait_s_total": round(self.total_wait_seconds, 3),
+        }
+
+
+_GOVERNORS: Dict[str, RequestGovernor] = {}
+_GOVERNORS_LOCK = threading.Lock()
+
+
+def get_governor(
+    model_name: Optional[str],
+    max_concurrent: int = 8,
+    requests_per_minute: Optional[float] = None,
+) -> RequestGovernor:
+    """Return the process-wide governor for ``model_name`` (created on first use)."""
+    key = (model_name or "default").lower()
+    with _GOVERNORS_LOCK:
+        governor = _GOVERNORS.get(key)
+        if governor is None:
+            governor = RequestGovernor(
+                name=key,
+                max_concurrent=max_concurrent,
+                requests_per_minute=requests_per_minute,
+            )
+            _GOVERNORS[key] = governor
+        return governor
+
+
+def governor_stats() -> Dict[str, Dict[str, Any]]:
+    """Metrics for every governor created in this process."""
+    with _GOVERNORS_LOCK:
+        governors = list(_GOVERNORS.values())
+    return {governor.name: governor.stats() for governor in governors}
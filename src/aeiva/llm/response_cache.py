@@ -0,0 +1,298 @@
+"""
+Response cache for deterministic LLM requests.
+
+Requests are keyed on a canonical hash of model, messages, tools and
+sampling parameters. Entries live in an in-memory LRU and, optionally, in a
+SQLite file shared across runs. Both tiers honour a TTL and a size cap.
+Concurrent identical requests are collapsed into a single provider call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CachedValue = Dict[str, Any]
+
+
+class _ComputeCancelled(Exception):
+    """Set on a shared in-flight future when the caller computing it is cancelled."""
+
+
+def make_cache_key(payload: Dict[str, Any]) -> str:
+    """Return a stable SHA-256 key for a JSON-like request payload."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _SQLiteTier:
+    """Disk tier: one table keyed by request hash, evicted by last access."""
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_responses_accessed ON llm_responses(accessed)")
+        self._conn.commit()
+
+    def get(self, key: str, ttl: Optional[float]) -> Optional[CachedValue]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if ttl and now - created > ttl:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
+    def put(self, key: str, value: CachedValue) -> None:
+        now = time.time()
+        encoded = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY accessed ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """
+    Two-tier (memory + optional SQLite) cache with single-flight lookups.
+
+    Values are plain JSON-serializable dicts so they survive the disk tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 24 * 3600,
+        path: Optional[str] = None,
+        max_disk_entries: int = 10_000,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds) if ttl_seconds else None
+        self._memory: "OrderedDict[str, Tuple[float, CachedValue]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = _SQLiteTier(path, max_disk_entries) if path else None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._inflight_sync: Dict[str, threading.Event] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.collapsed = 0
+
+    # ---- tiers ----
+
+    def get(self, key: str) -> Optional[CachedValue]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, value = entry
+                if self.ttl_seconds is None or now - created <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+        if self._disk is None:
+            return None
+        try:
+            value = self._disk.get(key, self.ttl_seconds)
+        except sqlite3.Error as exc:
+            logger.warning("LLM response cache read failed: %s", exc)
+            return None
+        if value is not None:
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: CachedValue) -> None:
+        self._remember(key, value)
+        if self._disk is None:
+            return
+        try:
+            self._disk.put(key, value)
+        except sqlite3.Error as exc:
+            logger.warning("LLM response cache write failed: %s", exc)
+
+    def _remember(self, key: str, value: CachedValue) -> None:
+        with self._lock:
+            self._memory[key] = (time.time(), value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # ---- single-flight ----
+
+    async def aget_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[CachedValue]],
+    ) -> Tuple[CachedValue, bool]:
+        """Return ``(value, hit)``; concurrent callers for one key share a call."""
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                cached = await asyncio.to_thread(self.get, key) if self._disk else self.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return cached, True
+                pending = self._inflight.get(key)
+                if pending is None:
+                    break
+            try:
+                value = await asyncio.shield(pending)
+            except _ComputeCancelled:
+                # Only the computing caller was cancelled; retry for this one.
+                continue
+            self.collapsed += 1
+            self.hits += 1
+            return value, True
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            # Not future.cancel(): waiters would see a CancelledError of their own.
+            if not future.done():
+                future.set_exception(_ComputeCancelled())
+                future.exception()
+            raise
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if not future.done():
+            future.set_result(value)
+        if self._disk is not None:
+            await asyncio.to_thread(self.put, key, value)
+        else:
+            self.put(key, value)
+        return value, False
+
+    def get_or_compute(self, key: str, compute: Callable[[], CachedValue]) -> Tuple[CachedValue, bool]:
+        """Sync variant of aget_or_compute for thread-based callers."""
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached, True
+            with self._lock:
+                event = self._inflight_sync.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight_sync[key] = event
+                    owner = True
+                else:
+                    owner = False
+            if owner:
+                break
+            self.collapsed += 1
+            event.wait()
+            if self.get(key) is None:
+                # The owner failed; retry as a fresh request.
+                continue
+
+        self.misses += 1
+        try:
+            value = compute()
+            self.put(key, value)
+            return value, False
+        finally:
+            with self._lock:
+                self._inflight_sync.pop(key, None)
+            event.set()
+
+    # ---- maintenance ----
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "collapsed": self.collapsed,
+            "memory_entries": len(self._memory),
+        }
+
+
+_SHARED_CACHES: Dict[Optional[str], LLMResponseCache] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_shared_response_cache(
+    path: Optional[str] = None,
+    max_entries: int = 1024,
+    ttl_seconds: Optional[float] = 24 * 3600,
+    max_disk_entries: int = 10_000,
+) -> LLMResponseCache:
+    """Return the process-wide cache for ``path`` so clients share hits."""
+    key = str(Path(path).expanduser().resolve()) if path else None
+    with _SHARED_LOCK:
+        cache = _SHARED_CACHES.get(key)
+        if cache is None:
+            cache = LLMResponseCache(
+                max_entries=max_entries,
+                ttl_seconds=ttl_seconds,
+                path=key,
+                max_disk_entries=max_disk_entries,
+            )
+            _SHARED_CACHES[key] = cache
+        return cache
@@ -0,0 +1,262 @@
+"""
+Token counting for LLM requests.
+
+Counts prompt tokens locally so oversized requests can be rejected before a
+provider round-trip. Tokenizers are imported lazily and cached per model
+family; when no tokenizer is available (or it fails to load) a cheap
+byte-length heuristic is used instead.
+
+Custom families can be plugged in with ``register_tokenizer``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Per-message and per-reply framing overhead used by chat-style APIs.
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+IMAGE_PART_TOKENS = 85
+
+# Ordered (substring, family) rules; longest-match wins.
+MODEL_FAMILY_RULES: Dict[str, str] = {
+    "gpt-4o": "o200k",
+    "gpt-4.1": "o200k",
+    "gpt-4.5": "o200k",
+    "gpt-5": "o200k",
+    "chatgpt": "o200k",
+    "codex": "o200k",
+    "o1": "o200k",
+    "o3": "o200k",
+    "o4": "o200k",
+    "gpt-4": "cl100k",
+    "gpt-3.5": "cl100k",
+    "text-embedding": "cl100k",
+}
+
+TokenizeFn = Callable[[List[str]], List[int]]
+_TOKENIZER_FACTORIES: Dict[str, Callable[[], TokenizeFn]] = {}
+_FAMILY_TOKENIZERS: Dict[str, Optional[TokenizeFn]] = {}
+_FAMILY_LOCK = threading.Lock()
+
+
+def heuristic_count(text: str) -> int:
+    """Roughly four UTF-8 bytes per token; overestimates CJK slightly."""
+    if not text:
+        return 0
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def _tiktoken_factory(encoding_name: str) -> Callable[[], TokenizeFn]:
+    def build() -> TokenizeFn:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding(encoding_name)
+
+        def count(texts: List[str]) -> List[int]:
+            return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+        return count
+
+    return build
+
+
+def register_tokenizer(family: str, factory: Callable[[], TokenizeFn]) -> None:
+    """
+    Register a tokenizer factory for a model family.
+
+    The factory is called once, on first use, and must return a function
+    mapping a list of strings to a list of token counts.
+    """
+    _TOKENIZER_FACTORIES[family] = factory
+    _FAMILY_TOKENIZERS.pop(family, None)
+
+
+register_tokenizer("o200k", _tiktoken_factory("o200k_base"))
+register_tokenizer("cl100k", _tiktoken_factory("cl100k_base"))
+
+
+def model_family(model_name: Optional[str]) -> str:
+    """Map a model name (optionally provider-prefixed) to a tokenizer family."""
+    lower = (model_name or "").lower().rsplit("/", 1)[-1]
+    for pattern, family in sorted(MODEL_FAMILY_RULES.items(), key=lambda item: -len(item[0])):
+        if pattern in lower:
+            return family
+    return "heuristic"
+
+
+def _family_tokenizer(family: str) -> Optional[TokenizeFn]:
+    if family in _FAMILY_TOKENIZERS:
+        return _FAMILY_TOKENIZERS[family]
+    with _FAMILY_LOCK:
+        if family in _FAMILY_TOKENIZERS:
+            return _FAMILY_TOKENIZERS[family]
+        tokenizer: Optional[TokenizeFn] = None
+        factory = _TOKENIZER_FACTORIES.get(family)
+        if factory is not None:
+            try:
+                tokenizer = factory()
+            except Exception as exc:
+                logger.info("Tokenizer for family '%s' unavailable, using heuristic: %s", family, exc)
+        _FAMILY_TOKENIZERS[family] = tokenizer
+        return tokenizer
+
+
+class TokenCounter:
+    """
+    Counts tokens for one model family, memoizing per-message results.
+
+    Message counts are cached by content, so re-counting a growing
+    conversation only tokenizes the new messages.
+    """
+
+    def __init__(self, model_name: Optional[str] = None, family: Optional[str] = None, cache_size: int = 4096):
+        self.model_name = model_name
+        self.family = family or model_family(model_name)
+        self._cache: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._cache_size = max(0, int(cache_size))
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def exact(self) -> bool:
+        """True when a real tokenizer (not the heuristic) backs this counter."""
+        return _family_tokenizer(self.family) is not None
+
+    # ---- text ----
+
+    def count_text(self, text: str) -> int:
+        return self.count_texts([text])[0]
+
+    def count_texts(self, texts: Sequence[str]) -> List[int]:
+        """Count a batch of strings in one tokenizer call."""
+        items = [text or "" for text in texts]
+        tokenizer = _family_tokenizer(self.family)
+        if tokenizer is not None:
+            try:
+                return tokenizer(items)
+            except Exception as exc:
+                logger.debug("Tokenizer failed for family '%s', using heuristic: %s", self.family, exc)
+        return [heuristic_count(text) for text in items]
+
+    # ---- messages ----
+
+    def count_messages(self, messages: Sequence[Any], tools: Optional[Sequence[Dict[str, Any]]] = None) -> int:
+        """Estimate prompt tokens for a chat request (messages plus tool schemas)."""
+        counts: List[Optional[int]] = []
+        misses: List[Tuple[int, Hashable, List[str], int]] = []
+        for message in messages:
+            key = self._message_key(message)
+            cached = self._cache_get(key) if key is not None else None
+            if cached is not None:
+                counts.append(cached)
+                continue
+            texts, extra = self._message_parts(message)
+            misses.append((len(counts), key, texts, extra))
+            counts.append(None)
+
+        if misses:
+            flat = [text for _, _, texts, _ in misses for text in texts]
+            flat_counts = iter(self.count_texts(flat))
+            for index, key, texts, extra in misses:
+                total = MESSAGE_OVERHEAD_TOKENS + extra + sum(next(flat_counts) for _ in texts)
+                counts[index] = total
+                if key is not None:
+                    self._cache_put(key, total)
+
+        total = sum(count or 0 for count in counts) + REPLY_OVERHEAD_TOKENS
+        if tools:
+            total += self.count_tools(tools)
+        return total
+
+    def count_tools(self, tools: Sequence[Dict[str, Any]]) -> int:
+        """Count tokens for tool schemas (memoized, since they rarely change)."""
+        dumped = json.dumps(list(tools), ensure_ascii=False, sort_keys=True, default=str)
+        key = ("__tools__", dumped)
+        cached = self._cache_get(key)
+        if cached is None:
+            cached = self.count_text(dumped)
+            self._cache_put(key, cached)
+        return cached
+
+    @staticmethod
+    def _message_key(message: Any) -> Optional[Hashable]:
+        if not isinstance(message, dict):
+            return None
+        content = message.get("content")
+        if isinstance(content, str) and not message.get("tool_calls"):
+            # Strings cache their hash, so this key is cheap to build.
+            return (message.get("role"), message.get("name"), message.get("tool_call_id"), content)
+        try:
+            return json.dumps(message, sort_keys=True, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _message_parts(message: Any) -> Tuple[List[str], int]:
+        if not isinstance(message, dict):
+            return [str(message)], 0
+        texts: List[str] = []
+        extra = 0
+        for field_name in ("role", "name"):
+            value = message.get(field_name)
+            if value:
+                texts.append(str(value))
+        content = message.get("content")
+        if isinstance(content, str):
+            texts.append(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict):
+                    part_type = str(part.get("type") or "")
+                    if "image" in part_type or "audio" in part_type or "file" in part_type:
+                        extra += IMAGE_PART_TOKENS
+                        continue
+                    text = part.get("text")
+                    texts.append(text if isinstance(text, str) else json.dumps(part, ensure_ascii=False, default=str))
+                else:
+                    texts.append(str(part))
+        elif content is not None:
+            texts.append(json.dumps(content, ensure_ascii=False, default=str))
+        tool_calls = message.get("tool_calls")
+        if tool_calls:
+            texts.append(json.dumps(tool_calls, ensure_ascii=False, default=str))
+        return texts, extra
+
+    def _cache_get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return value
+
+    def _cache_put(self, key: Hashable, value: int) -> None:
+        if not self._cache_size:
+            return
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+_COUNTERS: Dict[str, TokenCounter] = {}
+
+
+def get_token_counter(model_name: Optional[str]) -> TokenCounter:
+    """Return the shared TokenCounter for a model's tokenizer family."""
+    family = model_family(model_name)
+    counter = _COUNTERS.get(family)
+    if counter is None:
+        counter = _COUNTERS.setdefault(family, TokenCounter(model_name, family=family))
+    return counter
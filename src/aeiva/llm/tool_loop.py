@@ -5,7 +5,9 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 from uuid import uuid4
 
 from aeiva.llm.backend import LLMBackend, LLMResponse
+from aeiva.llm.llm_gateway_exceptions import LLMInputTooLargeError
 from aeiva.llm.llm_usage_metrics import LLMUsageMetrics
+from aeiva.llm.token_counter import TokenCounter
 from aeiva.llm.tool_types import ToolCall, ToolCallDelta
 from aeiva.tool.registry import get_registry
 
@@ -41,6 +43,8 @@ class ToolLoopEngine:
         max_tool_loops: int = 10,
         registry=None,
         tool_result_max_chars: int = DEFAULT_TOOL_RESULT_MAX_CHARS,
+        token_counter: Optional[TokenCounter] = None,
+        max_input_tokens: Optional[int] = None,
     ) -> None:
         self.backend = backend
         self.metrics = metrics
@@ -48,10 +52,13 @@ class ToolLoopEngine:
         self.registry = registry or get_registry()
         self.last_response_id: Optional[str] = None
         self.tool_result_max_chars = self._normalize_tool_result_max_chars(tool_result_max_chars)
+        self.token_counter = token_counter
+        self.max_input_tokens = max_input_tokens
 
     def run(self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs) -> ToolLoopResult:
         for _ in range(self.max_tool_loops):
             self._sanitize_tool_history(messages)
+            self._preflight(messages, tools)
             params = self.backend.build_params(messages, tools, **kwargs)
             response = self.backend.execute_sync(params)
             parsed = self.backend.parse_response(response)
@@ -70,6 +77,7 @@ class ToolLoopEngine:
     async def arun(self, messages: List[Any], tools: List[Dict[str, Any]] = None, **kwargs) -> ToolLoopResult:
         for _ in range(self.max_tool_loops):
             self._sanitize_tool_history(messages)
+            self._preflight(messages, tools)
             params = self.backend.build_params(messages, tools, **kwargs)
             response = await self.backend.execute(params, stream=False)
             parsed = self.backend.parse_response(response)
@@ -110,6 +118,7 @@ class ToolLoopEngine:
         tools: Optional[List[Dict[str, Any]]],
         **kwargs,
     ) -> ToolLoopStreamResult:
+        self._preflight(messages, tools)
         params = self.backend.build_params(messages, tools, **kwargs)
         response_stream = await self.backend.execute(params, stream=True)
 
@@ -180,6 +189,18 @@ class ToolLoopEngine:
             completed_response=completed_response,
         )
 
+    def _preflight(self, messages: List[Any], tools: Optional[List[Dict[str, Any]]]) -> None:
+        """Reject requests that would exceed max_input_tokens before sending them."""
+        if self.token_counter is None or not self.max_input_tokens:
+            return
+        count = self.token_counter.count_messages(messages, tools)
+        if count > self.max_input_tokens:
+            raise LLMInputTooLargeError(
+                f"Request has ~{count} input tokens, over the limit of {self.max_input_tokens}.",
+                token_count=count,
+                max_tokens=self.max_input_tokens,
+            )
+
     def _merge_chunks(self, chunks: List[str]) -> str:
         if not chunks:
             return ""
@@ -1,5 +1,5 @@
 """Multi-agent system utilities."""
 
-from aeiva.mas.mas import MultiAgentSystem, EventBridge
+from aeiva.mas.mas import MultiAgentSystem, EventBridge, EventBatch
 
-__all__ = ["MultiAgentSystem", "EventBridge"]
+__all__ = ["MultiAgentSystem", "EventBridge", "EventBatch"]
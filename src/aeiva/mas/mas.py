@@ -5,21 +5,32 @@ Design goals:
 - Agent is the unit of composition; MAS depends on agent/, not vice versa.
 - Fully async, event-driven, minimal coupling.
 - Safe forwarding with Signal lineage (hop_count increments).
+- Optional process-per-agent execution (`mas_config.execution: process`, see
+  process_runtime.py) so CPU-heavy agents do not stall each other.
 """
 
 from __future__ import annotations
 
 import asyncio
 import copy
+import importlib
+import logging
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from aeiva.agent.agent import Agent
 from aeiva.event.event import Event
 from aeiva.event.event_names import EventNames
 from aeiva.neuron import Signal
 
+if TYPE_CHECKING:
+    from aeiva.agent.agent import Agent
+
+logger = logging.getLogger(__name__)
+
 DEFAULT_MAIN_AGENT = "main"
+EXECUTION_MODES = ("inline", "process")
 
 ROLE_DEFAULT_MODULES: Dict[str, Dict[str, bool]] = {
     "main": {
@@ -118,8 +129,88 @@ class BridgeSpec:
     events: List[str]
 
 
+@dataclass
+class EventBatch:
+    """
+    Forwarded payloads of one event name, in order, carried as one bridge delivery.
+
+    Batches only exist in transit: `emit_bridged` replays them on the target bus
+    as individual events, so target handlers never see an `EventBatch`.
+    """
+
+    name: str
+    payloads: List[Any]
+    # Per-payload event priorities; empty means the delivery priority for all.
+    priorities: List[int] = field(default_factory=list)
+
+
+@dataclass
+class BridgeStats:
+    """Forwarded-volume and lag counters for one EventBridge."""
+
+    received: int = 0
+    filtered: int = 0
+    rate_limited: int = 0
+    forwarded: int = 0
+    emissions: int = 0
+    batches: int = 0
+    lag_ms_total: float = 0.0
+    lag_ms_max: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "filtered": self.filtered,
+            "rate_limited": self.rate_limited,
+            "forwarded": self.forwarded,
+            "emissions": self.emissions,
+            "batches": self.batches,
+            "lag_ms_avg": round(self.lag_ms_total / self.forwarded, 3) if self.forwarded else 0.0,
+            "lag_ms_max": round(self.lag_ms_max, 3),
+        }
+
+
+async def emit_bridged(bus: Any, name: str, payload: Any, priority: int) -> None:
+    """Emit a bridged payload on the target bus, unpacking an `EventBatch` into its events."""
+    if isinstance(payload, EventBatch):
+        priorities = payload.priorities or [priority] * len(payload.payloads)
+        for item, item_priority in zip(payload.payloads, priorities):
+            await bus.emit(name, payload=item, priority=item_priority)
+        return
+    await bus.emit(name, payload=payload, priority=priority)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
 class EventBridge:
-    """Forward matching events from one agent to another."""
+    """
+    Forward matching events from one agent to another.
+
+    Optional shaping, applied in order:
+    - `predicate(event) -> bool`: drop events it rejects.
+    - `rate_limits`: {pattern: events per second}; excess events are dropped.
+    - `batch_windows`: {pattern: seconds}; events are buffered per event name and
+      delivered together (flushed when the window closes or `batch_max` events
+      are buffered). Target handlers still get one event per forwarded payload,
+      under the original name; batching only delays and coalesces the transport
+      (one pipe frame per batch for cross-process links).
+    Counters live in `stats` (see `BridgeStats`).
+    """
 
     def __init__(
         self,
@@ -127,15 +218,27 @@ class EventBridge:
         source: Agent,
         target: Agent,
         patterns: Iterable[str],
+        *,
+        predicate: Optional[Callable[[Event], bool]] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        batch_windows: Optional[Dict[str, float]] = None,
+        batch_max: int = 100,
     ) -> None:
         self.name = name
         self.source = source
         self.target = target
         self.patterns = list(patterns)
+        self.predicate = predicate
+        self.batch_max = max(1, int(batch_max))
+        self.stats = BridgeStats()
         self._callbacks: List[Any] = []
+        self._buckets = {p: _TokenBucket(float(r)) for p, r in (rate_limits or {}).items() if r and r > 0}
+        self._batch_windows = {p: float(w) for p, w in (batch_windows or {}).items() if w and w > 0}
+        self._pending: Dict[str, List[Tuple[Event, Any]]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
 
     def bind(self) -> None:
-        if not self.source.event_bus or not self.target.event_bus:
+        if not self.source.event_bus or not self._has_target():
             return
         for pattern in self.patterns:
             async def _forward(event: Event, *, _pattern: str = pattern) -> None:
@@ -146,6 +249,11 @@ class EventBridge:
             self._callbacks.append(_forward)
 
     def unbind(self) -> None:
+        """Unsubscribe; pending batches are dropped (`await flush()` first to deliver them)."""
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        self._pending.clear()
         if not self.source.event_bus:
             return
         for callback in self._callbacks:
@@ -153,12 +261,76 @@ class EventBridge:
         self._callbacks.clear()
 
     async def forward(self, event: Event, pattern: str) -> None:
-        if not self.target.event_bus:
+        if not self._has_target():
+            return
+        self.stats.received += 1
+        if self.predicate is not None and not self.predicate(event):
+            self.stats.filtered += 1
+            return
+        bucket = self._buckets.get(pattern)
+        if bucket is not None and not bucket.take():
+            self.stats.rate_limited += 1
             return
         payload = event.payload
         if isinstance(payload, Signal):
             payload = payload.child(source=payload.source, data=payload.data)
-        await self.target.event_bus.emit(event.name, payload=payload, priority=event.priority)
+        window = self._batch_windows.get(pattern)
+        if window is None:
+            await self._deliver(event.name, payload, event.priority)
+            self._record([event])
+            return
+
+        items = self._pending.setdefault(event.name, [])
+        items.append((event, payload))
+        if len(items) >= self.batch_max:
+            task = self._flush_tasks.pop(event.name, None)
+            if task is not None:
+                task.cancel()
+            await self._flush_name(event.name)
+        elif event.name not in self._flush_tasks:
+            self._flush_tasks[event.name] = asyncio.create_task(self._flush_later(event.name, window))
+
+    async def flush(self) -> None:
+        """Deliver every pending batch now."""
+        for task in self._flush_tasks.values():
+            task.cancel()
+        self._flush_tasks.clear()
+        for name in list(self._pending):
+            await self._flush_name(name)
+
+    async def _flush_later(self, name: str, window: float) -> None:
+        await asyncio.sleep(window)
+        self._flush_tasks.pop(name, None)
+        await self._flush_name(name)
+
+    async def _flush_name(self, name: str) -> None:
+        items = self._pending.pop(name, None)
+        if not items:
+            return
+        priority = max(event.priority for event, _ in items)
+        batch = EventBatch(
+            name=name,
+            payloads=[payload for _, payload in items],
+            priorities=[event.priority for event, _ in items],
+        )
+        await self._deliver(name, batch, priority)
+        self.stats.batches += 1
+        self._record([event for event, _ in items])
+
+    def _record(self, events: List[Event]) -> None:
+        now = datetime.utcnow()
+        self.stats.emissions += 1
+        self.stats.forwarded += len(events)
+        for event in events:
+            lag_ms = max(0.0, (now - event.timestamp).total_seconds() * 1000)
+            self.stats.lag_ms_total += lag_ms
+            self.stats.lag_ms_max = max(self.stats.lag_ms_max, lag_ms)
+
+    def _has_target(self) -> bool:
+        return bool(self.target.event_bus)
+
+    async def _deliver(self, name: str, payload: Any, priority: int) -> None:
+        await emit_bridged(self.target.event_bus, name, payload, priority)
 
 
 class MultiAgentSystem:
@@ -167,39 +339,78 @@ class MultiAgentSystem:
 
     - Agents run independently on their own EventBus.
     - Bridges forward events between agents (event-driven coupling).
+    - With `execution: process`, non-main agent groups run in worker processes;
+      `agents` then only holds the agents living in this process.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        *,
+        agent_names: Optional[Iterable[str]] = None,
+        agent_factory: Optional[Callable[[Dict[str, Any]], Agent]] = None,
+    ):
         self.config = config
         self.mas_config = config.get("mas_config", {}) or {}
         self.main_agent_name = self.mas_config.get("main_agent", DEFAULT_MAIN_AGENT)
+        self.agent_factory = agent_factory or _default_agent_factory
+        # `agent_names` restricts this instance to a subset (used inside worker processes).
+        self._only_agents = set(agent_names) if agent_names is not None else None
+        execution = str(self.mas_config.get("execution") or "inline").lower()
+        if execution not in EXECUTION_MODES:
+            raise ValueError(f"mas_config.execution must be one of {EXECUTION_MODES}, got {execution!r}")
+        self.execution = "inline" if self._only_agents is not None else execution
         self.agents: Dict[str, Agent] = {}
         self.bridges: List[EventBridge] = []
         self._stop_callbacks: List[Any] = []
         self._stop_requested = False
+        self._stop_flush: Optional[asyncio.Task] = None
+        self._process_runtime: Optional[Any] = None
 
     @property
     def main_agent(self) -> Agent:
         return self.agents[self.main_agent_name]
 
+    def bridge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-bridge forwarded-volume and lag metrics (bridges owned by this process)."""
+        return {bridge.name: bridge.stats.to_dict() for bridge in self.bridges}
+
     def request_stop(self) -> None:
         self._stop_requested = True
+        if self._stop_flush is None and self.bridges:
+            # Deliver batched events while the targets are still draining their buses.
+            try:
+                self._stop_flush = asyncio.get_running_loop().create_task(self._flush_bridges())
+            except RuntimeError:
+                pass
         for agent in self.agents.values():
             agent.request_stop()
+        if self._process_runtime is not None:
+            self._process_runtime.broadcast_stop()
 
     def setup(self) -> None:
         self._build_agents()
-        for agent in self.agents.values():
-            agent.setup()
-        self._build_bridges()
-        self._bind_stop_listeners()
+        self._start_workers()
+        try:
+            for agent in self.agents.values():
+                agent.setup()
+            self._finish_setup()
+        except BaseException:
+            self._abort_workers()
+            raise
 
     async def setup_async(self) -> None:
         self._build_agents()
-        for agent in self.agents.values():
-            await agent.setup_async()
-        self._build_bridges()
-        self._bind_stop_listeners()
+        self._start_workers()
+        pending = [agent.setup_async() for agent in self.agents.values()]
+        if self._process_runtime is not None:
+            pending.append(asyncio.to_thread(self._process_runtime.wait_ready))
+        try:
+            await asyncio.gather(*pending)
+            self._finish_setup(wait_workers=False)
+        except BaseException:
+            self._abort_workers()
+            raise
 
     async def run(self, raw_memory_session: Optional[Dict[str, Any]] = None) -> None:
         tasks = []
@@ -211,12 +422,36 @@ class MultiAgentSystem:
             else:
                 session = None
             tasks.append(asyncio.create_task(agent.run(raw_memory_session=session)))
+        if self._process_runtime is not None:
+            tasks.append(
+                asyncio.create_task(
+                    self._process_runtime.run(self.agents, raw_memory_session, on_stop=self.request_stop)
+                )
+            )
         try:
             await asyncio.gather(*tasks)
         finally:
             for task in tasks:
                 if not task.done():
                     task.cancel()
+            await self.close_bridges()
+            if self._process_runtime is not None:
+                await asyncio.to_thread(self._process_runtime.close)
+
+    async def close_bridges(self) -> None:
+        """Deliver pending batches on every bridge, then unbind them."""
+        if self._stop_flush is not None:
+            await asyncio.gather(self._stop_flush, return_exceptions=True)
+        await self._flush_bridges()
+        for bridge in self.bridges:
+            bridge.unbind()
+
+    async def _flush_bridges(self) -> None:
+        for bridge in self.bridges:
+            try:
+                await bridge.flush()
+            except Exception as exc:
+                logger.warning("MAS bridge %s failed to flush: %s", bridge.name, exc)
 
     # ------------------------------------------------
     # Build helpers
@@ -224,9 +459,56 @@ class MultiAgentSystem:
 
     def _build_agents(self) -> None:
         specs = self._resolve_agent_specs()
+        local = self._only_agents
+        if self.execution == "process":
+            from aeiva.mas.process_runtime import ProcessAgentRuntime, resolve_process_groups
+
+            local_names, groups = resolve_process_groups(
+                [spec.name for spec in specs],
+                self.main_agent_name,
+                self.mas_config.get("process_groups"),
+            )
+            local = set(local_names)
+            if groups:
+                self._process_runtime = ProcessAgentRuntime(
+                    config=self.config,
+                    groups=groups,
+                    links=self._links(),
+                    agent_factory=self.agent_factory,
+                    setup_timeout=float(self.mas_config.get("process_setup_timeout", 120.0)),
+                    shutdown_timeout=float(self.mas_config.get("process_shutdown_timeout", 15.0)),
+                )
         for spec in specs:
+            if local is not None and spec.name not in local:
+                continue
             agent_config = self._build_agent_config(spec)
-            self.agents[spec.name] = Agent(agent_config)
+            self.agents[spec.name] = self.agent_factory(agent_config)
+
+    def _start_workers(self) -> None:
+        # Workers set themselves up while local agents do the same.
+        if self._process_runtime is not None:
+            self._process_runtime.start()
+
+    def _abort_workers(self) -> None:
+        # Setup failed part-way: workers may still be setting up or waiting for `run`.
+        if self._process_runtime is not None:
+            self._process_runtime.abort()
+
+    def _finish_setup(self, wait_workers: bool = True) -> None:
+        self._build_bridges()
+        runtime = self._process_runtime
+        if runtime is not None:
+            from aeiva.mas.process_runtime import bind_remote_bridges
+
+            if wait_workers:
+                runtime.wait_ready()
+            self.bridges.extend(
+                bind_remote_bridges(self.agents, self._links(), runtime.is_remote, runtime.channel_for)
+            )
+        self._bind_stop_listeners()
+
+    def _links(self) -> List[Dict[str, Any]]:
+        return list(self.mas_config.get("links") or DEFAULT_LINKS)
 
     def _resolve_agent_specs(self) -> List[AgentSpec]:
         agents = self.mas_config.get("agents")
@@ -295,8 +577,7 @@ class MultiAgentSystem:
             cfg[key] = block
 
     def _build_bridges(self) -> None:
-        links = self.mas_config.get("links") or DEFAULT_LINKS
-        for link in links:
+        for link in self._links():
             spec = BridgeSpec(
                 source=link.get("source", ""),
                 target=link.get("target", ""),
@@ -311,6 +592,7 @@ class MultiAgentSystem:
                 source=self.agents[spec.source],
                 target=self.agents[spec.target],
                 patterns=spec.events,
+                **bridge_options(link),
             )
             bridge.bind()
             self.bridges.append(bridge)
@@ -328,6 +610,45 @@ class MultiAgentSystem:
             self._stop_callbacks.append(_on_stop)
 
 
+def bridge_options(link: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    EventBridge shaping options from a link config:
+    - `filter`: predicate callable or dotted path to one (`pkg.module.func`).
+    - `rate_limit`: events/sec for every pattern, or {pattern: events/sec}.
+    - `batch_window_ms`: window for every pattern, or {pattern: ms}. Handlers on
+      the target still receive each event (e.g. its `Signal`) on its own, under the
+      original name and priority.
+    - `batch_max`: flush a batch early once it holds this many events.
+    """
+    events = list(link.get("events", []))
+    options: Dict[str, Any] = {}
+    predicate = link.get("filter")
+    if isinstance(predicate, str):
+        module_path, attr = predicate.rsplit(".", 1)
+        predicate = getattr(importlib.import_module(module_path), attr)
+    if predicate is not None:
+        options["predicate"] = predicate
+    rate_limit = link.get("rate_limit")
+    if rate_limit is not None:
+        options["rate_limits"] = (
+            dict(rate_limit) if isinstance(rate_limit, dict) else {p: float(rate_limit) for p in events}
+        )
+    window_ms = link.get("batch_window_ms")
+    if window_ms is not None:
+        windows = dict(window_ms) if isinstance(window_ms, dict) else {p: window_ms for p in events}
+        options["batch_windows"] = {p: float(ms) / 1000.0 for p, ms in windows.items()}
+    if link.get("batch_max") is not None:
+        options["batch_max"] = int(link["batch_max"])
+    return options
+
+
+def _default_agent_factory(config: Dict[str, Any]) -> Agent:
+    # Imported lazily: worker processes with a custom factory skip the agent stack.
+    from aeiva.agent.agent import Agent
+
+    return Agent(config)
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     result = copy.deepcopy(base)
     for key, value in override.items():
@@ -0,0 +1,585 @@
+"""
+Process-per-agent execution for MultiAgentSystem.
+
+With `mas_config.execution: process`, the main agent (and anything grouped with
+it) keeps running in the calling process so callers can still drive
+`runtime.main_agent`; every other agent group runs in its own worker process.
+
+- Groups come from `mas_config.process_groups` (lists of agent names); agents
+  not listed get a worker each.
+- Workers are spawned together and set up concurrently; the parent waits for
+  all of them to report ready.
+- Bridge traffic crossing a process boundary travels as length-prefixed frames
+  over a multiprocessing pipe. The parent routes frames by target agent and
+  relays worker-to-worker frames without unpickling the payload. Writes go
+  through a per-channel writer thread, so a full pipe never stalls a loop.
+- `Signal` payloads are packed as plain field tuples rather than pickled objects.
+- An `agent.stop` anywhere is broadcast to every process; workers shut their
+  agents down gracefully and exit, stragglers are terminated after a timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from aeiva.event.event_names import EventNames
+from aeiva.mas.mas import EventBridge, bridge_options, emit_bridged
+from aeiva.neuron import Signal
+
+logger = logging.getLogger(__name__)
+
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Frame kinds: (kind, agent name, body bytes)
+FRAME_READY = "ready"
+FRAME_ERROR = "error"
+FRAME_RUN = "run"
+FRAME_EVENT = "event"
+FRAME_STOP = "stop"
+FRAME_DONE = "done"
+
+
+# ------------------------------------------------
+# Serialization
+# ------------------------------------------------
+
+
+def encode_event(name: str, payload: Any, priority: int = 0) -> bytes:
+    """Serialize one bridged event. `Signal` payloads are flattened to a field tuple."""
+    if isinstance(payload, Signal):
+        packed: Tuple[Any, ...] = (
+            "signal",
+            payload.source,
+            payload.data,
+            payload.timestamp,
+            payload.trace_id,
+            payload.parent_id,
+            payload.hop_count,
+            payload.priority,
+            payload.version,
+        )
+    else:
+        packed = ("raw", payload)
+    return pickle.dumps((name, priority, packed), protocol=_PICKLE_PROTOCOL)
+
+
+def decode_event(body: bytes) -> Tuple[str, Any, int]:
+    """Inverse of `encode_event`; returns (name, payload, priority)."""
+    name, priority, packed = pickle.loads(body)
+    if packed[0] == "signal":
+        _, source, data, timestamp, trace_id, parent_id, hop_count, signal_priority, version = packed
+        payload: Any = Signal(
+            source=source,
+            data=data,
+            timestamp=timestamp,
+            trace_id=trace_id,
+            parent_id=parent_id,
+            hop_count=hop_count,
+            priority=signal_priority,
+            version=version,
+        )
+    else:
+        payload = packed[1]
+    return name, payload, priority
+
+
+def _frame(kind: str, agent: str = "", body: bytes = b"") -> bytes:
+    return pickle.dumps((kind, agent, body), protocol=_PICKLE_PROTOCOL)
+
+
+# ------------------------------------------------
+# Pipe channel
+# ------------------------------------------------
+
+
+class _FrameChannel:
+    """
+    Non-blocking frame reader/writer over a multiprocessing Connection.
+
+    Reads are driven by the event loop; writes are queued to a writer thread
+    (started on first send) so `send_bytes` on a full pipe never blocks the
+    loop while the other side is itself blocked writing to us.
+    """
+
+    def __init__(self, conn: Connection, name: str) -> None:
+        self.conn = conn
+        self.name = name
+        self.closed = False
+        self._send_lock = threading.Lock()
+        self._outgoing: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def send(self, kind: str, agent: str = "", body: bytes = b"") -> bool:
+        return self.send_raw(_frame(kind, agent, body))
+
+    def send_raw(self, frame: bytes) -> bool:
+        """Queue `frame` for the writer thread; False once the channel is closed."""
+        if self.closed:
+            return False
+        with self._send_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_frames, name=f"mas-pipe-writer-{self.name}", daemon=True
+                )
+                self._writer.start()
+        self._outgoing.put(frame)
+        return True
+
+    def _write_frames(self) -> None:
+        while True:
+            frame = self._outgoing.get()
+            if frame is None:
+                return
+            try:
+                self.conn.send_bytes(frame)
+            except (OSError, EOFError, ValueError):
+                self.closed = True
+                return
+
+    def start_reading(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_frame: Callable[["_FrameChannel", str, str, bytes, bytes], None],
+        on_closed: Callable[["_FrameChannel"], None],
+    ) -> None:
+        """Deliver frames on `loop` as they arrive; `on_closed` fires once on EOF."""
+
+        def drain() -> None:
+            try:
+                while not self.closed and self.conn.poll():
+                    raw = self.conn.recv_bytes()
+                    kind, agent, body = pickle.loads(raw)
+                    on_frame(self, kind, agent, body, raw)
+            except (EOFError, OSError):
+                self._close_reader(on_closed)
+
+        try:
+            loop.add_reader(self.conn.fileno(), drain)
+            self._reader_loop = loop
+        except (NotImplementedError, AttributeError):
+            # Proactor loops cannot watch pipe handles; poll from a thread instead.
+            def pump() -> None:
+                while not self.closed:
+                    try:
+                        if self.conn.poll(0.2):
+                            loop.call_soon_threadsafe(drain)
+                    except (EOFError, OSError):
+                        loop.call_soon_threadsafe(self._close_reader, on_closed)
+                        return
+
+            threading.Thread(target=pump, name=f"mas-pipe-{self.name}", daemon=True).start()
+
+    def _close_reader(self, on_closed: Callable[["_FrameChannel"], None]) -> None:
+        if self.closed and self._reader_loop is None:
+            return
+        self.stop_reading()
+        self.closed = True
+        on_closed(self)
+
+    def stop_reading(self) -> None:
+        if self._reader_loop is not None:
+            try:
+                self._reader_loop.remove_reader(self.conn.fileno())
+            except (ValueError, OSError):
+                pass
+            self._reader_loop = None
+
+    def close(self, flush_timeout: float = 5.0) -> None:
+        """Stop reading, let the writer flush queued frames, then close the pipe."""
+        self.stop_reading()
+        writer = self._writer
+        if writer is not None:
+            self._outgoing.put(None)
+            writer.join(flush_timeout)
+        self.closed = True
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+
+# ------------------------------------------------
+# Bridges across processes
+# ------------------------------------------------
+
+
+class RemoteEventBridge(EventBridge):
+    """EventBridge whose target agent lives in another process."""
+
+    def __init__(
+        self,
+        name: str,
+        source: Any,
+        target_name: str,
+        patterns: Iterable[str],
+        channel: _FrameChannel,
+        **options: Any,
+    ) -> None:
+        super().__init__(name=name, source=source, target=None, patterns=patterns, **options)  # type: ignore[arg-type]
+        self.target_name = target_name
+        self.channel = channel
+
+    def _has_target(self) -> bool:
+        return not self.channel.closed
+
+    async def _deliver(self, name: str, payload: Any, priority: int) -> None:
+        try:
+            body = encode_event(name, payload, priority)
+        except Exception as exc:  # unpicklable payloads stay in-process
+            logger.warning("MAS bridge %s dropped '%s': payload not serializable (%s)", self.name, name, exc)
+            return
+        self.channel.send(FRAME_EVENT, self.target_name, body)
+
+
+def bind_remote_bridges(
+    agents: Dict[str, Any],
+    links: Sequence[Dict[str, Any]],
+    is_remote: Callable[[str], bool],
+    channel_for: Callable[[str], Optional[_FrameChannel]],
+) -> List[RemoteEventBridge]:
+    """Bind a RemoteEventBridge for every link from a local agent to a remote one."""
+    bridges: List[RemoteEventBridge] = []
+    for link in links:
+        source, target = link.get("source", ""), link.get("target", "")
+        events = list(link.get("events", []))
+        if not events or source not in agents or not is_remote(target):
+            continue
+        channel = channel_for(target)
+        if channel is None:
+            continue
+        bridge = RemoteEventBridge(
+            name=f"{source}_to_{target}",
+            source=agents[source],
+            target_name=target,
+            patterns=events,
+            channel=channel,
+            **bridge_options(link),
+        )
+        bridge.bind()
+        bridges.append(bridge)
+    return bridges
+
+
+async def emit_frame(agents: Dict[str, Any], target: str, body: bytes) -> None:
+    agent = agents.get(target)
+    if agent is None or not agent.event_bus:
+        logger.warning("MAS frame for unknown agent '%s' dropped", target)
+        return
+    name, payload, priority = decode_event(body)
+    await emit_bridged(agent.event_bus, name, payload, priority)
+
+
+class _FrameEmitter:
+    """Runs `emit_frame` tasks for incoming frames, keeping them referenced and logging failures."""
+
+    def __init__(self, agents: Dict[str, Any]) -> None:
+        self.agents = agents
+        self._tasks: Set[asyncio.Task] = set()
+
+    def emit(self, target: str, body: bytes) -> None:
+        task = asyncio.create_task(emit_frame(self.agents, target, body))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._finished(target, done))
+
+    def _finished(self, target: str, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("MAS frame for agent '%s' failed: %s", target, exc, exc_info=exc)
+
+    async def drain(self) -> None:
+        """Wait for frames already received to reach their agents."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+# ------------------------------------------------
+# Parent side
+# ------------------------------------------------
+
+
+@dataclass
+class _Worker:
+    group: Tuple[str, ...]
+    process: Any
+    channel: _FrameChannel
+    ready: bool = False
+    done: bool = False
+
+
+class ProcessAgentRuntime:
+    """Spawns and routes between worker processes for the non-local agent groups."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        groups: List[Tuple[str, ...]],
+        links: List[Dict[str, Any]],
+        agent_factory: Callable[[Dict[str, Any]], Any],
+        *,
+        setup_timeout: float = 120.0,
+        shutdown_timeout: float = 15.0,
+    ) -> None:
+        self.config = config
+        self.groups = groups
+        self.links = links
+        self.agent_factory = agent_factory
+        self.setup_timeout = setup_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.workers: List[_Worker] = []
+        self.owner: Dict[str, _Worker] = {}
+        self._emitter = _FrameEmitter({})
+        self._on_stop: Optional[Callable[[], None]] = None
+        self._all_done: Optional[asyncio.Event] = None
+        self._stop_sent = False
+
+    def start(self) -> None:
+        """Spawn one worker per group; they build and set up their agents concurrently."""
+        ctx = multiprocessing.get_context("spawn")
+        for group in self.groups:
+            parent_conn, child_conn = ctx.Pipe(duplex=True)
+            process = ctx.Process(
+                target=_worker_entry,
+                args=(self.config, list(group), self.links, self.agent_factory, child_conn),
+                name=f"aeiva-mas-{'-'.join(group)}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            worker = _Worker(group=group, process=process, channel=_FrameChannel(parent_conn, group[0]))
+            self.workers.append(worker)
+            for name in group:
+                self.owner[name] = worker
+
+    def wait_ready(self) -> None:
+        """Block until every worker reports ready; raise if one fails or times out."""
+        for worker in self.workers:
+            conn = worker.channel.conn
+            try:
+                if not conn.poll(self.setup_timeout):
+                    raise TimeoutError(f"MAS worker {list(worker.group)} not ready after {self.setup_timeout}s")
+                kind, _agent, body = pickle.loads(conn.recv_bytes())
+            except (EOFError, OSError) as exc:
+                raise RuntimeError(f"MAS worker {list(worker.group)} exited during setup") from exc
+            if kind == FRAME_ERROR:
+                raise RuntimeError(f"MAS worker {list(worker.group)} failed to set up:\n{body.decode('utf-8', 'replace')}")
+            worker.ready = True
+
+    def is_remote(self, name: str) -> bool:
+        return name in self.owner
+
+    def channel_for(self, name: str) -> Optional[_FrameChannel]:
+        worker = self.owner.get(name)
+        return worker.channel if worker else None
+
+    async def run(
+        self,
+        local_agents: Dict[str, Any],
+        raw_memory_session: Optional[Dict[str, Any]],
+        on_stop: Callable[[], None],
+    ) -> None:
+        """Route frames until every worker has finished."""
+        loop = asyncio.get_running_loop()
+        self._emitter = _FrameEmitter(local_agents)
+        self._on_stop = on_stop
+        self._all_done = asyncio.Event()
+        session_body = pickle.dumps(raw_memory_session, protocol=_PICKLE_PROTOCOL)
+        for worker in self.workers:
+            worker.channel.start_reading(loop, self._on_frame, self._on_closed)
+            worker.channel.send(FRAME_RUN, body=session_body)
+        if self._stop_sent:
+            self.broadcast_stop()
+        self._check_done()
+        await self._all_done.wait()
+        await self._emitter.drain()
+
+    def broadcast_stop(self) -> None:
+        self._stop_sent = True
+        for worker in self.workers:
+            if not worker.done:
+                worker.channel.send(FRAME_STOP)
+
+    def close(self) -> None:
+        """Join workers (terminating stragglers) and close pipes."""
+        for worker in self.workers:
+            worker.process.join(self.shutdown_timeout)
+            if worker.process.is_alive():
+                logger.warning("MAS worker %s did not exit; terminating", list(worker.group))
+                worker.process.terminate()
+                worker.process.join(1.0)
+            worker.channel.close()
+
+    def abort(self) -> None:
+        """Terminate every worker and close its pipe; used when setup fails."""
+        for worker in self.workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for worker in self.workers:
+            worker.process.join(1.0)
+            worker.channel.close(flush_timeout=0.0)
+            worker.done = True
+
+    def _on_frame(self, channel: _FrameChannel, kind: str, agent: str, body: bytes, raw: bytes) -> None:
+        if kind == FRAME_EVENT:
+            target = self.owner.get(agent)
+            if target is not None:
+                target.channel.send_raw(raw)  # worker -> worker: relay without decoding
+            else:
+                self._emitter.emit(agent, body)
+        elif kind == FRAME_STOP:
+            if self._on_stop is not None:
+                self._on_stop()
+        elif kind == FRAME_DONE:
+            self._worker_for(channel).done = True
+            self._check_done()
+
+    def _on_closed(self, channel: _FrameChannel) -> None:
+        worker = self._worker_for(channel)
+        if not worker.done:
+            logger.warning("MAS worker %s exited unexpectedly", list(worker.group))
+            worker.done = True
+        self._check_done()
+
+    def _worker_for(self, channel: _FrameChannel) -> _Worker:
+        return next(worker for worker in self.workers if worker.channel is channel)
+
+    def _check_done(self) -> None:
+        if self._all_done is not None and all(worker.done for worker in self.workers):
+            self._all_done.set()
+
+
+def resolve_process_groups(
+    agent_names: Sequence[str],
+    main_agent: str,
+    configured: Optional[Iterable[Iterable[str]]],
+) -> Tuple[List[str], List[Tuple[str, ...]]]:
+    """Split agents into (local names, worker groups); the main agent's group stays local."""
+    known = set(agent_names)
+    groups: List[Tuple[str, ...]] = []
+    assigned: set = set()
+    for group in configured or []:
+        names = tuple(name for name in group if name in known and name not in assigned)
+        if names:
+            groups.append(names)
+            assigned.update(names)
+    local: List[str] = [main_agent] if main_agent in known else []
+    remote: List[Tuple[str, ...]] = []
+    for group in groups:
+        if main_agent in group:
+            local.extend(name for name in group if name != main_agent)
+        else:
+            remote.append(group)
+    for name in agent_names:
+        if name not in assigned and name != main_agent:
+            remote.append((name,))
+    return local, remote
+
+
+# ------------------------------------------------
+# Worker side
+# ------------------------------------------------
+
+
+def _worker_entry(
+    config: Dict[str, Any],
+    group: List[str],
+    links: List[Dict[str, Any]],
+    agent_factory: Callable[[Dict[str, Any]], Any],
+    conn: Connection,
+) -> None:
+    asyncio.run(_worker_main(config, group, links, agent_factory, conn))
+
+
+async def _worker_main(
+    config: Dict[str, Any],
+    group: List[str],
+    links: List[Dict[str, Any]],
+    agent_factory: Callable[[Dict[str, Any]], Any],
+    conn: Connection,
+) -> None:
+    channel = _FrameChannel(conn, "parent")
+    try:
+        await _worker_serve(config, group, links, agent_factory, channel)
+    finally:
+        # Flush DONE/ERROR frames before the pipe closes.
+        await asyncio.to_thread(channel.close)
+
+
+async def _worker_serve(
+    config: Dict[str, Any],
+    group: List[str],
+    links: List[Dict[str, Any]],
+    agent_factory: Callable[[Dict[str, Any]], Any],
+    channel: _FrameChannel,
+) -> None:
+    from aeiva.mas.mas import MultiAgentSystem
+
+    mas = MultiAgentSystem(config, agent_names=group, agent_factory=agent_factory)
+    try:
+        await mas.setup_async()
+    except Exception:
+        channel.send(FRAME_ERROR, body=traceback.format_exc().encode("utf-8"))
+        return
+
+    members = set(group)
+    remote_bridges = bind_remote_bridges(
+        mas.agents,
+        links,
+        is_remote=lambda name: name not in members,
+        channel_for=lambda name: channel,
+    )
+    for agent in mas.agents.values():
+        if agent.event_bus:
+            async def _report_stop(event: Any) -> None:
+                channel.send(FRAME_STOP)
+
+            _report_stop.__name__ = "mas_worker_report_stop"
+            agent.event_bus.subscribe(EventNames.AGENT_STOP, _report_stop)
+
+    loop = asyncio.get_running_loop()
+    start_run: asyncio.Future = loop.create_future()
+    parent_gone = asyncio.Event()
+    emitter = _FrameEmitter(mas.agents)
+
+    def on_frame(_channel: _FrameChannel, kind: str, agent: str, body: bytes, _raw: bytes) -> None:
+        if kind == FRAME_EVENT:
+            emitter.emit(agent, body)
+        elif kind == FRAME_RUN and not start_run.done():
+            start_run.set_result(pickle.loads(body))
+        elif kind == FRAME_STOP:
+            mas.request_stop()
+            if not start_run.done():
+                start_run.set_result(None)
+
+    def on_closed(_channel: _FrameChannel) -> None:
+        parent_gone.set()
+        mas.request_stop()
+        if not start_run.done():
+            start_run.set_result(None)
+
+    channel.start_reading(loop, on_frame, on_closed)
+    channel.send(FRAME_READY, group[0])
+    try:
+        session = await start_run
+        if not mas._stop_requested:
+            await mas.run(raw_memory_session=session)
+    finally:
+        channel.stop_reading()
+        await emitter.drain()
+        for bridge in remote_bridges:
+            await bridge.flush()  # batched frames go out before DONE
+            bridge.unbind()
+        if not parent_gone.is_set():
+            channel.send(FRAME_DONE)
@@ -60,7 +60,9 @@
       ];
       const SUPPORTED_FEATURES = [
         "a2ui_stream_v1",
+        "a2ui_batch_v1",
         "json_pointer_bindings_v1",
+        "surface_delta_v1",
       ];
 
       function setStatus(text) {
@@ -262,15 +262,10 @@
         _pruneSurfaceStores();
       }
 
-      function applySurfaceUpdateMessage(message) {
-        const surfaceId = String(message.surfaceId || "").trim();
-        if (!surfaceId) {
-          return { success: false, error: "updateComponents.surfaceId is required." };
-        }
-        const nextComponentById = {};
+      function normalizeSurfaceComponentItems(items) {
+        const componentById = {};
         let firstComponentId = "";
-        let firstError = null;
-        for (const item of (message.components || [])) {
+        for (const item of (items || [])) {
           const componentId = String(item && item.id ? item.id : "").trim();
           if (!componentId) continue;
           if (!firstComponentId) {
@@ -286,16 +281,31 @@
               payload.props && typeof payload.props === "object"
                 ? payload.props
                 : {};
-            nextComponentById[componentId] = normalizeComponent({
+            componentById[componentId] = normalizeComponent({
               id: componentId,
               type: componentType,
               props: componentProps,
             });
           } catch (err) {
-            firstError = String(err && err.message ? err.message : err);
-            break;
+            return {
+              componentById,
+              firstComponentId,
+              error: String(err && err.message ? err.message : err),
+            };
           }
         }
+        return { componentById, firstComponentId, error: null };
+      }
+
+      function applySurfaceUpdateMessage(message) {
+        const surfaceId = String(message.surfaceId || "").trim();
+        if (!surfaceId) {
+          return { success: false, error: "updateComponents.surfaceId is required." };
+        }
+        const normalized = normalizeSurfaceComponentItems(message.components);
+        const nextComponentById = normalized.componentById;
+        const firstComponentId = normalized.firstComponentId;
+        const firstError = normalized.error;
         if (firstError) {
           showToast("updateComponents rejected invalid component: " + firstError, "error");
           return { success: false, error: firstError };
@@ -321,9 +331,48 @@
 
         appState.surfaceStore[surfaceId] = { componentById: nextComponentById };
         const previousMeta = appState.surfaceMeta[surfaceId] || {};
-        appState.surfaceMeta[surfaceId] = mergeObjects(previousMeta, {
-          rootId: String(rootCandidate).trim(),
-        });
+        const nextMeta = { rootId: String(rootCandidate).trim() };
+        if (message.revision !== undefined) {
+          nextMeta.revision = Number(message.revision);
+        }
+        appState.surfaceMeta[surfaceId] = mergeObjects(previousMeta, nextMeta);
+        _touchSurface(surfaceId);
+        return { success: true, error: null };
+      }
+
+      function requestSurfaceResync(surfaceId) {
+        if (!appState.ws || appState.ws.readyState !== WebSocket.OPEN) return;
+        try {
+          appState.ws.send(JSON.stringify({ type: "resync", surface_id: surfaceId }));
+        } catch (_error) {
+          // The replay on reconnect renders the surface in full anyway.
+        }
+      }
+
+      function applySurfacePatchMessage(message) {
+        const surfaceId = String(message.surfaceId || "").trim();
+        if (!surfaceId) {
+          return { success: false, error: "patchSurface.surfaceId is required." };
+        }
+        const meta = appState.surfaceMeta[surfaceId];
+        const current = appState.surfaceStore[surfaceId];
+        if (!meta || !current || Number(meta.revision) !== Number(message.baseRevision)) {
+          // Stale or missing base: ask the server for a full updateComponents.
+          requestSurfaceResync(surfaceId);
+          return { success: true, error: null, resync: true };
+        }
+        const normalized = normalizeSurfaceComponentItems(message.upsert);
+        if (normalized.error) {
+          requestSurfaceResync(surfaceId);
+          return { success: false, error: normalized.error };
+        }
+        const nextComponentById = Object.assign({}, current.componentById || {});
+        for (const componentId of (message.remove || [])) {
+          delete nextComponentById[String(componentId || "").trim()];
+        }
+        Object.assign(nextComponentById, normalized.componentById);
+        appState.surfaceStore[surfaceId] = { componentById: nextComponentById };
+        appState.surfaceMeta[surfaceId] = mergeObjects(meta, { revision: Number(message.revision) });
         _touchSurface(surfaceId);
         return { success: true, error: null };
       }
@@ -497,6 +546,18 @@
             error: result && result.error,
           };
         }
+        if (msg.patchSurface) {
+          const result = applySurfacePatchMessage(msg.patchSurface);
+          if (result && result.success && !result.resync) {
+            const surfaceId = String(msg.patchSurface.surfaceId || "").trim();
+            const meta = appState.surfaceMeta[surfaceId];
+            const renderResult = tryRenderSurface(surfaceId, meta ? String(meta.rootId || "").trim() : "");
+            if (!renderResult || !renderResult.success) {
+              requestSurfaceResync(surfaceId);
+            }
+          }
+          return { matched: true, success: Boolean(result && result.success), error: result && result.error };
+        }
         if (msg.updateDataModel) {
           const result = applyDataModelUpdateMessage(msg.updateDataModel);
           return { matched: true, success: Boolean(result && result.success), error: result && result.error };
@@ -602,6 +663,13 @@
             flushPendingEvents();
             return;
           }
+          if (Array.isArray(msg)) {
+            // a2ui_batch_v1: several lifecycle messages coalesced into one frame.
+            for (const item of msg) {
+              if (item && typeof item === "object") handleCommand(item);
+            }
+            return;
+          }
           handleCommand(msg);
         };
         ws.onclose = () => {
@@ -7,7 +7,9 @@ from typing import Any, Dict, Iterable, Tuple
 SUPPORTED_PROTOCOL_VERSIONS: Tuple[str, ...] = ("v0.10",)
 SUPPORTED_FEATURES: Tuple[str, ...] = (
     "a2ui_stream_v1",
+    "a2ui_batch_v1",
     "json_pointer_bindings_v1",
+    "surface_delta_v1",
 )
 A2UI_STANDARD_CATALOG_ID = "https://a2ui.org/specification/v0_10/standard_catalog.json"
 
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+SLOW_CLIENT_POLICIES = ("close", "drop")
+
+
+class OutboxClosedError(RuntimeError):
+    """Raised for frames offered to, or pending in, a closed outbox."""
+
+
+@dataclass
+class OutboxStats:
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    closed_slow: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "closed_slow": self.closed_slow,
+        }
+
+
+class ClientOutbox:
+    """
+    Bounded send queue with a dedicated writer task for one websocket client.
+
+    Frames are pre-encoded strings and are written in order. When the queue is
+    full the slow-client policy applies: `close` shuts the socket (the client
+    reconnects and gets a replay), `drop` rejects the frame and keeps the client.
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        *,
+        max_frames: int = 64,
+        send_timeout_seconds: float = 2.5,
+        slow_client_policy: str = "close",
+    ) -> None:
+        self.websocket = websocket
+        self.send_timeout_seconds = float(send_timeout_seconds)
+        self.slow_client_policy = slow_client_policy if slow_client_policy in SLOW_CLIENT_POLICIES else "close"
+        self.stats = OutboxStats()
+        self._queue: asyncio.Queue[tuple[str, Optional[asyncio.Future[None]]]] = asyncio.Queue(maxsize=max(1, int(max_frames)))
+        self._writer: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def offer(self, frames: Sequence[str]) -> Optional[asyncio.Future[None]]:
+        """
+        Queue frames as one unit and return a future resolved once all are written.
+
+        Returns None when the frames were rejected because the queue is full;
+        a batch is never split, so the client sees all of it or none of it.
+        """
+        if self._closed:
+            raise OutboxClosedError("client outbox is closed")
+        if not frames:
+            raise ValueError("offer() needs at least one frame")
+        if self._queue.maxsize - self._queue.qsize() < len(frames):
+            self.stats.frames_dropped += len(frames)
+            if self.slow_client_policy == "close":
+                self.stats.closed_slow = True
+                self._close_nowait(
+                    OutboxClosedError("client send queue overflowed"),
+                    close_reason="client too slow",
+                )
+            return None
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        for frame in frames[:-1]:
+            self._queue.put_nowait((frame, None))
+        self._queue.put_nowait((frames[-1], future))
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run())
+        # Frames are written in order and a failure fails everything queued
+        # after it, so the last frame's future covers the whole batch.
+        return future
+
+    async def _run(self) -> None:
+        while True:
+            frame, future = await self._queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send(frame), timeout=self.send_timeout_seconds)
+            except asyncio.CancelledError:
+                _fail(future, OutboxClosedError("client outbox is closed"))
+                raise
+            except Exception as exc:
+                _fail(future, exc)
+                self._close_nowait(exc, close_reason="send failed")
+                return
+            self.stats.frames_sent += 1
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _close_nowait(self, exc: BaseException, *, close_reason: Optional[str] = None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            _fail(future, exc)
+        close = getattr(self.websocket, "close", None)
+        if close_reason and callable(close):
+            task = asyncio.ensure_future(_close_socket(close, close_reason))
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def aclose(self) -> None:
+        self._close_nowait(OutboxClosedError("client outbox is closed"))
+        writer, self._writer = self._writer, None
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+
+
+def _fail(future: Optional[asyncio.Future[None]], exc: BaseException) -> None:
+    if future is not None and not future.done():
+        future.set_exception(exc)
+
+
+async def _close_socket(close: Any, reason: str) -> None:
+    try:
+        result = close(code=1013, reason=reason)
+        if asyncio.iscoroutine(result):
+            await result
+    except Exception as exc:  # pragma: no cover - transport edge
+        logger.debug("MetaUI client close failed: %s", exc)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+from bisect import bisect_right
 from collections import deque
-from dataclasses import dataclass
-from typing import Deque, Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from .protocol import MetaUIEvent
 
 
+_IndexKey = tuple
+
+
 @dataclass(frozen=True)
 class EventStoreHealth:
     size: int
@@ -19,6 +25,8 @@ class EventStoreHealth:
     queried_events: int
     consumed_events: int
     max_observed_size: int
+    partitions: int = 0
+    waiters: int = 0
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -32,13 +40,61 @@ class EventStoreHealth:
             "queried_events": self.queried_events,
             "consumed_events": self.consumed_events,
             "max_observed_size": self.max_observed_size,
+            "partitions": self.partitions,
+            "waiters": self.waiters,
         }
 
 
+@dataclass(eq=False)
+class EventWaiter:
+    """A pending `wait_event` call; woken only by events matching its filter."""
+
+    ui_id: Optional[str]
+    session_id: Optional[str]
+    event_types: frozenset[str]
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def matches(self, event: MetaUIEvent) -> bool:
+        if self.ui_id and event.ui_id != self.ui_id:
+            return False
+        if self.session_id and event.session_id != self.session_id:
+            return False
+        return not self.event_types or event.event_type in self.event_types
+
+
+def _tail(index: List[int], after_seq: int) -> Iterator[int]:
+    # Lazy, so a limit=1 query does not copy the rest of the index.
+    for position in range(bisect_right(index, after_seq), len(index)):
+        yield index[position]
+
+
+def _type_set(event_types: Optional[Sequence[str]]) -> frozenset[str]:
+    return frozenset(
+        item
+        for item in (event_types or [])
+        if isinstance(item, str) and item.strip()
+    )
+
+
 class MetaUIEventStore:
+    """
+    Bounded event history indexed by ui_id, session_id, (ui_id, session_id)
+    and event_type.
+
+    Every event gets a monotonic sequence number. Indexes are ascending seq
+    lists, so a query bisects to its cursor and walks only the smallest index
+    that applies. Removed events are dropped from the indexes lazily and each
+    list is compacted once most of it is dead.
+    """
+
     def __init__(self, *, limit: int) -> None:
         maxlen = max(64, int(limit))
-        self._events: Deque[MetaUIEvent] = deque(maxlen=maxlen)
+        self._capacity = maxlen
+        self._entries: Dict[int, MetaUIEvent] = {}
+        self._indexes: Dict[_IndexKey, List[int]] = {}
+        self._live_counts: Dict[_IndexKey, int] = {}
+        self._next_seq = 1
+        self._waiters: Dict[Optional[str], set[EventWaiter]] = {}
         self._recent_ids: Deque[str] = deque(maxlen=maxlen)
         self._recent_id_set: set[str] = set()
         self._dropped_events = 0
@@ -50,14 +106,21 @@ class MetaUIEventStore:
 
     @property
     def size(self) -> int:
-        return len(self._events)
+        return len(self._entries)
 
     @property
     def capacity(self) -> int:
-        return int(self._events.maxlen or 0)
+        return self._capacity
+
+    @property
+    def last_seq(self) -> int:
+        return self._next_seq - 1
 
     def clear(self) -> None:
-        self._events.clear()
+        # Sequence numbers keep counting so cursors handed out earlier stay valid.
+        self._entries.clear()
+        self._indexes.clear()
+        self._live_counts.clear()
         self._recent_ids.clear()
         self._recent_id_set.clear()
         self._dropped_events = 0
@@ -81,11 +144,67 @@ class MetaUIEventStore:
         self._accepted_event_ids += 1
         return True
 
-    def append(self, event: MetaUIEvent) -> None:
-        if len(self._events) == self.capacity and self.capacity > 0:
+    @staticmethod
+    def _index_keys(event: MetaUIEvent) -> Iterator[_IndexKey]:
+        yield ("all",)
+        yield ("ui", event.ui_id)
+        yield ("partition", event.ui_id, event.session_id)
+        yield ("type", event.event_type)
+        if event.session_id:
+            yield ("session", event.session_id)
+
+    def append(self, event: MetaUIEvent) -> int:
+        if len(self._entries) >= self._capacity:
+            self._remove(next(iter(self._entries)))
             self._dropped_events += 1
-        self._events.append(event)
-        self._max_observed_size = max(self._max_observed_size, len(self._events))
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = event
+        for key in self._index_keys(event):
+            self._indexes.setdefault(key, []).append(seq)
+            self._live_counts[key] = self._live_counts.get(key, 0) + 1
+        self._max_observed_size = max(self._max_observed_size, len(self._entries))
+        self._notify(event)
+        return seq
+
+    def _remove(self, seq: int) -> None:
+        event = self._entries.pop(seq, None)
+        if event is None:
+            return
+        for key in self._index_keys(event):
+            live = self._live_counts.get(key, 0) - 1
+            if live <= 0:
+                self._live_counts.pop(key, None)
+                self._indexes.pop(key, None)
+                continue
+            self._live_counts[key] = live
+            index = self._indexes[key]
+            if len(index) > 2 * live + 32:
+                self._indexes[key] = [item for item in index if item in self._entries]
+
+    def _candidate_seqs(
+        self,
+        *,
+        ui_id: Optional[str],
+        session_id: Optional[str],
+        type_set: frozenset[str],
+        after_seq: int,
+    ) -> Iterable[int]:
+        if ui_id and session_id:
+            scoped: Optional[List[int]] = self._indexes.get(("partition", ui_id, session_id), [])
+        elif ui_id:
+            scoped = self._indexes.get(("ui", ui_id), [])
+        elif session_id:
+            scoped = self._indexes.get(("session", session_id), [])
+        else:
+            scoped = None
+        if type_set:
+            typed = [self._indexes.get(("type", item), []) for item in type_set]
+            if scoped is None or sum(len(index) for index in typed) < len(scoped):
+                return heapq.merge(*(_tail(index, after_seq) for index in typed))
+        if scoped is None:
+            scoped = self._indexes.get(("all",), [])
+        return _tail(scoped, after_seq)
 
     def query(
         self,
@@ -96,39 +215,68 @@ class MetaUIEventStore:
         since_ts: Optional[float],
         limit: int,
         consume: bool,
-    ) -> tuple[list[MetaUIEvent], bool]:
+        after_seq: Optional[int] = None,
+    ) -> tuple[list[MetaUIEvent], bool, int]:
+        """
+        Return `(events, consumed, cursor)` for events matching every filter.
+
+        `cursor` is the seq of the last returned event, or the newest seq when
+        nothing matched; passing it back as `after_seq` resumes after it.
+        """
         normalized_limit = max(1, min(int(limit), 500))
-        type_set = {
-            item
-            for item in (event_types or [])
-            if isinstance(item, str) and item.strip()
-        }
+        type_set = _type_set(event_types)
+        start = max(0, int(after_seq or 0))
 
-        selected: list[MetaUIEvent] = []
-        kept: Deque[MetaUIEvent] = deque(maxlen=self._events.maxlen)
-        for event in self._events:
+        selected: list[tuple[int, MetaUIEvent]] = []
+        for seq in self._candidate_seqs(ui_id=ui_id, session_id=session_id, type_set=type_set, after_seq=start):
+            event = self._entries.get(seq)
+            if event is None:
+                continue
             if ui_id and event.ui_id != ui_id:
-                kept.append(event)
                 continue
             if session_id and event.session_id != session_id:
-                kept.append(event)
-                continue
-            if since_ts is not None and event.ts <= since_ts:
-                kept.append(event)
                 continue
             if type_set and event.event_type not in type_set:
-                kept.append(event)
                 continue
-            if len(selected) < normalized_limit:
-                selected.append(event)
-            else:
-                kept.append(event)
+            if since_ts is not None and event.ts <= since_ts:
+                continue
+            selected.append((seq, event))
+            if len(selected) >= normalized_limit:
+                break
+
         consumed = bool(consume and selected)
         if consumed:
-            self._events = kept
+            for seq, _ in selected:
+                self._remove(seq)
             self._consumed_events += len(selected)
         self._queried_events += len(selected)
-        return selected, consumed
+        cursor = selected[-1][0] if selected else max(start, self.last_seq)
+        return [event for _, event in selected], consumed, cursor
+
+    def add_waiter(
+        self,
+        *,
+        ui_id: Optional[str],
+        session_id: Optional[str],
+        event_types: Optional[Sequence[str]],
+    ) -> EventWaiter:
+        waiter = EventWaiter(ui_id=ui_id or None, session_id=session_id or None, event_types=_type_set(event_types))
+        self._waiters.setdefault(waiter.ui_id, set()).add(waiter)
+        return waiter
+
+    def remove_waiter(self, waiter: EventWaiter) -> None:
+        bucket = self._waiters.get(waiter.ui_id)
+        if bucket is None:
+            return
+        bucket.discard(waiter)
+        if not bucket:
+            self._waiters.pop(waiter.ui_id, None)
+
+    def _notify(self, event: MetaUIEvent) -> None:
+        for key in (event.ui_id, None):
+            for waiter in self._waiters.get(key, ()):
+                if waiter.matches(event):
+                    waiter.wakeup.set()
 
     def health_snapshot(self) -> EventStoreHealth:
         capacity = self.capacity
@@ -151,4 +299,6 @@ class MetaUIEventStore:
             queried_events=self._queried_events,
             consumed_events=self._consumed_events,
             max_observed_size=self._max_observed_size,
+            partitions=sum(1 for key in self._live_counts if key[0] == "partition"),
+            waiters=sum(len(bucket) for bucket in self._waiters.values()),
         )
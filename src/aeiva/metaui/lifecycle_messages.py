@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from .capabilities import build_catalog_snapshot
 from .component_catalog import get_component_catalog
@@ -87,12 +87,44 @@ def build_create_surface_message(spec: MetaUISpec, *, catalog_id: Optional[str]
     return _with_version(payload)
 
 
-def build_surface_update_message(spec: MetaUISpec) -> Dict[str, Any]:
+def build_surface_update_message(spec: MetaUISpec, *, revision: Optional[int] = None) -> Dict[str, Any]:
+    message: Dict[str, Any] = {
+        "surfaceId": spec.ui_id,
+        "components": _component_payloads_for_update(spec),
+    }
+    if revision is not None:
+        message["revision"] = int(revision)
+    return _with_version({"updateComponents": message})
+
+
+def build_surface_patch_message(
+    spec: MetaUISpec,
+    *,
+    upserted: Sequence[str],
+    removed: Sequence[str],
+    base_revision: int,
+    revision: int,
+) -> Dict[str, Any]:
+    """
+    Delta for clients that negotiated `surface_delta_v1` and hold `base_revision`.
+
+    Only valid when the patch left `spec.root` unchanged, since the synthetic
+    root wrapper is not part of the delta; `apply_incremental_patch` guarantees this.
+    """
+    wanted = set(upserted)
+    components = [
+        _to_surface_component(component.model_dump(mode="json"))
+        for component in spec.components
+        if component.id in wanted
+    ]
     return _with_version(
         {
-            "updateComponents": {
+            "patchSurface": {
                 "surfaceId": spec.ui_id,
-                "components": _component_payloads_for_update(spec),
+                "baseRevision": int(base_revision),
+                "revision": int(revision),
+                "upsert": components,
+                "remove": [str(item) for item in removed],
             }
         }
     )
@@ -124,9 +156,10 @@ def build_ui_render_sequence(
     spec: MetaUISpec,
     state: Optional[Mapping[str, Any]] = None,
     catalog_id: Optional[str] = None,
+    revision: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     sequence: List[Dict[str, Any]] = [build_create_surface_message(spec, catalog_id=catalog_id)]
-    sequence.append(build_surface_update_message(spec))
+    sequence.append(build_surface_update_message(spec, revision=revision))
     if state:
         sequence.append(
             build_data_model_update_message(
@@ -4,8 +4,9 @@ import asyncio
 import json
 import logging
 import os
+import time
 from copy import deepcopy
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, Sequence
 from uuid import uuid4
@@ -15,7 +16,7 @@ from .spec_normalizer import (
     normalize_metaui_patch,
     normalize_metaui_spec,
 )
-from .update_strategy import apply_structural_patch_to_spec
+from .update_strategy import apply_incremental_patch, apply_structural_patch_to_spec
 from .protocol import MetaUICommand, MetaUIEvent, MetaUISpec, new_command_id
 from .session import MetaUIPhase, MetaUISession
 from .upload_store import UploadStore, UploadStoreConfig
@@ -39,10 +40,12 @@ from .data_model import merge_nested_dicts
 from .lifecycle_messages import (
     build_data_model_update_message,
     build_delete_surface_message,
+    build_surface_patch_message,
     build_ui_render_sequence,
 )
 from .error_codes import ERROR_ACK_TIMEOUT, ERROR_NO_CONNECTED_CLIENTS
 from .event_store import MetaUIEventStore
+from .client_outbox import ClientOutbox, OutboxClosedError
 from .session_store import list_sessions_sorted, phase_counts, snapshot_session
 
 logger = logging.getLogger(__name__)
@@ -93,6 +96,8 @@ class MetaUIRuntimeSettings:
     start_timeout_seconds: float = 5.0
     send_timeout_seconds: float = 1.0
     wait_ack_seconds: float = 0.3
+    send_queue_frames: int = 64
+    slow_client_policy: str = "close"
     event_history_limit: int = 4096
     strict_component_types: bool = True
 
@@ -104,6 +109,7 @@ __all__ = [
     "MetaUIEndpoint",
     "MetaUIOrchestrator",
     "MetaUIRuntimeSettings",
+    "MetaUIWireStats",
     "configure_metaui_runtime",
     "get_metaui_orchestrator",
     "get_metaui_runtime_settings",
@@ -118,11 +124,64 @@ except Exception:  # pragma: no cover - compatibility fallback
         serve = None
 
 
+_SURFACE_DELTA_FEATURE = "surface_delta_v1"
+_BATCH_FRAME_FEATURE = "a2ui_batch_v1"
+
+
 @dataclass
 class _ClientConnection:
     websocket: Any
     capabilities: MetaUIClientCapabilities
     connected_at: float
+    # Last spec revision delivered per ui_id; a patch goes out as a delta
+    # only when this matches the patch's base revision.
+    surface_revisions: Dict[str, int] = field(default_factory=dict)
+    outbox: Optional[ClientOutbox] = None
+
+
+@dataclass
+class MetaUIWireStats:
+    """Bytes on the wire per A2UI message kind and patch apply latency."""
+
+    messages_by_kind: Dict[str, int] = field(default_factory=dict)
+    bytes_by_kind: Dict[str, int] = field(default_factory=dict)
+    patches: int = 0
+    delta_deliveries: int = 0
+    full_deliveries: int = 0
+    resyncs: int = 0
+    frames: int = 0
+    coalesced_frames: int = 0
+    dropped_batches: int = 0
+    slow_client_closes: int = 0
+    apply_ms_total: float = 0.0
+    apply_ms_max: float = 0.0
+
+    def record_message(self, payload: Mapping[str, Any], size: int) -> None:
+        kind = next((str(key) for key in payload if key != "version"), "unknown")
+        self.messages_by_kind[kind] = self.messages_by_kind.get(kind, 0) + 1
+        self.bytes_by_kind[kind] = self.bytes_by_kind.get(kind, 0) + size
+
+    def record_apply(self, elapsed_ms: float) -> None:
+        self.patches += 1
+        self.apply_ms_total += elapsed_ms
+        self.apply_ms_max = max(self.apply_ms_max, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "messages_by_kind": dict(self.messages_by_kind),
+            "bytes_by_kind": dict(self.bytes_by_kind),
+            "bytes_total": sum(self.bytes_by_kind.values()),
+            "patches": self.patches,
+            "delta_deliveries": self.delta_deliveries,
+            "full_deliveries": self.full_deliveries,
+            "resyncs": self.resyncs,
+            "frames": self.frames,
+            "coalesced_frames": self.coalesced_frames,
+            "dropped_batches": self.dropped_batches,
+            "slow_client_closes": self.slow_client_closes,
+            "apply_ms_avg": round(self.apply_ms_total / self.patches, 3) if self.patches else 0.0,
+            "apply_ms_max": round(self.apply_ms_max, 3),
+        }
 
 
 @dataclass(frozen=True)
@@ -136,6 +195,9 @@ class _PatchPreparation:
     patched_spec: MetaUISpec
     base_session_id: str
     base_state: Dict[str, Any]
+    base_revision: int
+    revision: int
+    delta: Optional[Dict[str, Any]] = None
 
 
 class MetaUIOrchestrator:
@@ -163,6 +225,8 @@ class MetaUIOrchestrator:
         event_history_limit: int = 4096,
         strict_component_types: bool = True,
         upload_store: Optional[UploadStore] = None,
+        send_queue_frames: int = 64,
+        slow_client_policy: str = "close",
     ) -> None:
         self.host = host
         self.port = int(port)
@@ -174,11 +238,15 @@ class MetaUIOrchestrator:
         self.wait_ack_seconds = max(0.0, float(wait_ack_seconds))
         self.event_history_limit = max(64, int(event_history_limit))
         self.strict_component_types = bool(strict_component_types)
+        self.send_queue_frames = max(1, int(send_queue_frames))
+        self.slow_client_policy = str(slow_client_policy or "close").strip().lower()
 
         self._server: Any = None
         self._endpoint: Optional[MetaUIEndpoint] = None
         self._state_lock = asyncio.Lock()
-        self._events_cond = asyncio.Condition()
+        # Serializes prepare -> broadcast -> commit so delta revisions chain.
+        self._patch_lock = asyncio.Lock()
+        self._wire_stats = MetaUIWireStats()
         self._clients: Dict[str, _ClientConnection] = {}
         self._client_ready = asyncio.Event()
 
@@ -236,6 +304,7 @@ class MetaUIOrchestrator:
         self._server = None
         self._endpoint = None
         async with self._state_lock:
+            connections = list(self._clients.values())
             self._clients.clear()
             self._client_ready.clear()
             for waiter in self._ack_tracker.waiters.values():
@@ -243,6 +312,9 @@ class MetaUIOrchestrator:
                     waiter.future.set_result(None)
             self._ack_tracker.clear()
             self._event_store.clear()
+        for connection in connections:
+            if connection.outbox is not None:
+                await connection.outbox.aclose()
 
     async def ensure_started(self) -> MetaUIEndpoint:
         return await self.start()
@@ -272,6 +344,7 @@ class MetaUIOrchestrator:
                 "auto_ui": self._auto_ui,
                 "event_history_size": self._event_store.size,
                 "event_store_health": event_store_health.to_dict(),
+                "wire_stats": self._wire_stats.to_dict(),
             }
 
     async def set_auto_ui(self, enabled: bool) -> Dict[str, Any]:
@@ -323,15 +396,17 @@ class MetaUIOrchestrator:
         since_ts: Optional[float] = None,
         limit: int = 50,
         consume: bool = False,
+        after_seq: Optional[int] = None,
     ) -> Dict[str, Any]:
         async with self._state_lock:
-            selected, consumed = self._event_store.query(
+            selected, consumed, cursor = self._event_store.query(
                 ui_id=ui_id,
                 session_id=session_id,
                 event_types=event_types,
                 since_ts=since_ts,
                 limit=limit,
                 consume=consume,
+                after_seq=after_seq,
             )
 
         return {
@@ -339,6 +414,7 @@ class MetaUIOrchestrator:
             "events": [event.model_dump(mode="json") for event in selected],
             "count": len(selected),
             "consumed": consumed,
+            "cursor": cursor,
         }
 
     async def wait_event(
@@ -351,26 +427,37 @@ class MetaUIOrchestrator:
         consume: bool = True,
     ) -> Dict[str, Any]:
         deadline = asyncio.get_running_loop().time() + max(0.1, float(timeout))
-        while True:
-            batch = await self.get_events(
+        # Registered before the first query so no matching event can slip
+        # between the query and the wait; only matching events wake it.
+        async with self._state_lock:
+            waiter = self._event_store.add_waiter(
                 ui_id=ui_id,
                 session_id=session_id,
                 event_types=event_types,
-                limit=1,
-                consume=consume,
             )
-            if batch["events"]:
-                return {"success": True, "event": batch["events"][0], "consumed": batch["consumed"]}
-
-            remaining = deadline - asyncio.get_running_loop().time()
-            if remaining <= 0:
-                return {"success": False, "error": "timeout", "event": None}
+        try:
+            while True:
+                waiter.wakeup.clear()
+                batch = await self.get_events(
+                    ui_id=ui_id,
+                    session_id=session_id,
+                    event_types=event_types,
+                    limit=1,
+                    consume=consume,
+                )
+                if batch["events"]:
+                    return {"success": True, "event": batch["events"][0], "consumed": batch["consumed"]}
 
-            async with self._events_cond:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    return {"success": False, "error": "timeout", "event": None}
                 try:
-                    await asyncio.wait_for(self._events_cond.wait(), timeout=remaining)
+                    await asyncio.wait_for(waiter.wakeup.wait(), timeout=remaining)
                 except asyncio.TimeoutError:
                     return {"success": False, "error": "timeout", "event": None}
+        finally:
+            async with self._state_lock:
+                self._event_store.remove_waiter(waiter)
 
     async def render_full(
         self,
@@ -433,32 +520,39 @@ class MetaUIOrchestrator:
         patch: Dict[str, Any],
         session_id: Optional[str] = None,
     ) -> Dict[str, Any]:
+        started = time.perf_counter()
         normalized_patch = normalize_metaui_patch(
             patch,
             strict_component_types=self.strict_component_types,
         )
-        preparation, preparation_error = await self._prepare_patch(
-            ui_id=ui_id,
-            normalized_patch=normalized_patch,
-        )
-        if preparation_error is not None:
-            return preparation_error
-        if preparation is None:
-            return {"success": False, "error": "patch preparation failed unexpectedly."}
+        async with self._patch_lock:
+            preparation, preparation_error = await self._prepare_patch(
+                ui_id=ui_id,
+                normalized_patch=normalized_patch,
+            )
+            if preparation_error is not None:
+                return preparation_error
+            if preparation is None:
+                return {"success": False, "error": "patch preparation failed unexpectedly."}
+            self._wire_stats.record_apply((time.perf_counter() - started) * 1000.0)
 
-        render_session = MetaUISession(
-            ui_id=ui_id,
-            session_id=preparation.base_session_id if session_id is None else session_id,
-            spec=preparation.patched_spec,
-            state=preparation.base_state,
-            phase=MetaUIPhase.RENDERING,
-        )
-        result = await self._broadcast_render_full_session(session=render_session, expect_ack=False)
-        return await self._commit_patch_result(
-            ui_id=ui_id,
-            result=result,
-            patched_spec=preparation.patched_spec,
-        )
+            render_session = MetaUISession(
+                ui_id=ui_id,
+                session_id=preparation.base_session_id if session_id is None else session_id,
+                spec=preparation.patched_spec,
+                state=preparation.base_state,
+                phase=MetaUIPhase.RENDERING,
+                spec_revision=preparation.revision,
+            )
+            result = await self._broadcast_patch_session(
+                session=render_session,
+                preparation=preparation,
+            )
+            return await self._commit_patch_result(
+                ui_id=ui_id,
+                result=result,
+                patched_spec=preparation.patched_spec,
+            )
 
     async def _prepare_patch(
         self,
@@ -470,30 +564,55 @@ class MetaUIOrchestrator:
             session = self._sessions.get(ui_id)
             if session is None:
                 return None, {"success": False, "error": f"unknown ui_id: {ui_id}"}
+            delta_scope: Optional[tuple[tuple[str, ...], tuple[str, ...]]] = None
             try:
-                patched_dict = apply_structural_patch_to_spec(
-                    session.spec.model_dump(mode="json"),
-                    normalized_patch,
-                )
-                patched_dict = normalize_metaui_spec(
-                    patched_dict,
-                    strict_component_types=self.strict_component_types,
-                )
-                interaction_issues = collect_interaction_contract_issues(patched_dict)
-                if interaction_issues:
-                    return None, _interaction_contract_error_payload(
-                        summary="invalid interaction contract in patch result",
-                        issues=interaction_issues,
+                incremental = apply_incremental_patch(session.spec, normalized_patch)
+                if incremental is not None:
+                    if incremental.issues:
+                        return None, _interaction_contract_error_payload(
+                            summary="invalid interaction contract in patch result",
+                            issues=incremental.issues,
+                        )
+                    patched_spec = incremental.spec
+                    delta_scope = (incremental.upserted, incremental.removed)
+                else:
+                    patched_dict = apply_structural_patch_to_spec(
+                        session.spec.model_dump(mode="json"),
+                        normalized_patch,
+                    )
+                    patched_dict = normalize_metaui_spec(
+                        patched_dict,
+                        strict_component_types=self.strict_component_types,
                     )
-                patched_spec = MetaUISpec.model_validate(patched_dict)
+                    interaction_issues = collect_interaction_contract_issues(patched_dict)
+                    if interaction_issues:
+                        return None, _interaction_contract_error_payload(
+                            summary="invalid interaction contract in patch result",
+                            issues=interaction_issues,
+                        )
+                    patched_spec = MetaUISpec.model_validate(patched_dict)
             except Exception as exc:
                 return None, {"success": False, "error": f"invalid patch: {exc}"}
+            base_revision = session.spec_revision
             session.update_phase(MetaUIPhase.RENDERING)
             session.bump_version()
+            session.spec_revision += 1
+            delta = None
+            if delta_scope is not None:
+                delta = build_surface_patch_message(
+                    patched_spec,
+                    upserted=delta_scope[0],
+                    removed=delta_scope[1],
+                    base_revision=base_revision,
+                    revision=session.spec_revision,
+                )
             preparation = _PatchPreparation(
                 patched_spec=patched_spec,
                 base_session_id=session.session_id,
                 base_state=deepcopy(session.state),
+                base_revision=base_revision,
+                revision=session.spec_revision,
+                delta=delta,
             )
             return preparation, None
 
@@ -518,6 +637,10 @@ class MetaUIOrchestrator:
                     committed_result["spec_synced_for_replay"] = True
             else:
                 session.update_phase(MetaUIPhase.RECOVERING, error=committed_result.get("error"))
+                # Clients that did get this revision now hold a spec the server
+                # discarded; force a full render for everyone next time.
+                for connection in self._clients.values():
+                    connection.surface_revisions.pop(ui_id, None)
         return committed_result
 
     async def set_state(
@@ -606,17 +729,65 @@ class MetaUIOrchestrator:
                 self._ack_tracker.waiters.pop(command_id, None)
         return self._ack_count(command_id)
 
+    def _outbox(self, connection: _ClientConnection) -> ClientOutbox:
+        if connection.outbox is None:
+            connection.outbox = ClientOutbox(
+                connection.websocket,
+                max_frames=self.send_queue_frames,
+                send_timeout_seconds=self.send_timeout_seconds,
+                slow_client_policy=self.slow_client_policy,
+            )
+        return connection.outbox
+
+    def _encode_frames(
+        self,
+        *,
+        connection: _ClientConnection,
+        payloads: Sequence[Dict[str, Any]],
+        cache: Dict[int, tuple[str, int]],
+    ) -> list[str]:
+        """
+        JSON-encode payloads, reusing `cache` (keyed by payload identity) so a
+        payload shared by several clients is serialized once per broadcast.
+        """
+        encoded: list[str] = []
+        for payload in payloads:
+            cached = cache.get(id(payload))
+            if cached is None:
+                text = json.dumps(payload, ensure_ascii=False)
+                cached = cache[id(payload)] = (text, len(text.encode("utf-8")))
+            encoded.append(cached[0])
+            self._wire_stats.record_message(payload, cached[1])
+        if len(encoded) > 1 and connection.capabilities.supports_feature(_BATCH_FRAME_FEATURE):
+            self._wire_stats.coalesced_frames += 1
+            encoded = ["[" + ",".join(encoded) + "]"]
+        self._wire_stats.frames += len(encoded)
+        return encoded
+
+    def _enqueue_frames(
+        self,
+        connection: _ClientConnection,
+        frames: Sequence[str],
+    ) -> Optional[asyncio.Future[None]]:
+        outbox = self._outbox(connection)
+        future = outbox.offer(frames)
+        if future is None:
+            self._wire_stats.dropped_batches += 1
+            if outbox.closed:
+                self._wire_stats.slow_client_closes += 1
+        return future
+
     async def _send_payload_batch(
         self,
         *,
         connection: _ClientConnection,
         payloads: Sequence[Dict[str, Any]],
     ) -> bool:
-        for payload in payloads:
-            await asyncio.wait_for(
-                connection.websocket.send(json.dumps(payload, ensure_ascii=False)),
-                timeout=self.send_timeout_seconds,
-            )
+        frames = self._encode_frames(connection=connection, payloads=payloads, cache={})
+        future = self._enqueue_frames(connection, frames)
+        if future is None:
+            raise OutboxClosedError("client send queue is full")
+        await future
         return any(
             isinstance(payload, dict) and payload.get("command_id")
             for payload in payloads
@@ -626,10 +797,12 @@ class MetaUIOrchestrator:
         if not client_ids:
             return
         async with self._state_lock:
-            for client_id in client_ids:
-                self._clients.pop(client_id, None)
+            removed = [self._clients.pop(client_id, None) for client_id in client_ids]
             if not self._clients:
                 self._client_ready.clear()
+        for connection in removed:
+            if connection is not None and connection.outbox is not None:
+                await connection.outbox.aclose()
 
     async def _send_payloads_to_clients(
         self,
@@ -640,6 +813,7 @@ class MetaUIOrchestrator:
         session_id: Optional[str],
         expect_ack: bool,
         snapshot: _SendSnapshot,
+        revision: Optional[int] = None,
     ) -> Dict[str, Any]:
         clients = list(snapshot.clients)
 
@@ -656,24 +830,50 @@ class MetaUIOrchestrator:
                 expect_ack=expect_ack,
             )
 
-        sent = 0
-        ack_sent = 0
+        # Encode once, enqueue on every client's outbox, then wait for all
+        # writers concurrently so one slow client does not delay the rest.
+        encoded_cache: Dict[int, tuple[str, int]] = {}
+        in_flight: Dict[asyncio.Future[None], tuple[str, bool]] = {}
         stale_clients: list[str] = []
         for client_id, connection in clients:
             payloads = payloads_by_client.get(client_id) or ()
             if not payloads:
                 continue
+            frames = self._encode_frames(connection=connection, payloads=payloads, cache=encoded_cache)
             try:
-                has_command_payload = await self._send_payload_batch(
-                    connection=connection,
-                    payloads=payloads,
-                )
+                future = self._enqueue_frames(connection, frames)
+            except OutboxClosedError:
+                stale_clients.append(client_id)
+                continue
+            if future is None:
+                if connection.outbox is not None and connection.outbox.closed:
+                    stale_clients.append(client_id)
+                elif ui_id:
+                    # Dropped under the `drop` policy: the client no longer
+                    # holds any known revision of this surface.
+                    connection.surface_revisions.pop(ui_id, None)
+                continue
+            future.add_done_callback(self._delivery_callback(connection, ui_id=ui_id, revision=revision))
+            has_command_payload = any(
+                isinstance(payload, dict) and payload.get("command_id")
+                for payload in payloads
+            )
+            in_flight[future] = (client_id, has_command_payload)
+
+        sent = 0
+        ack_sent = 0
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight, timeout=self.send_timeout_seconds)
+            for future in done:
+                client_id, has_command_payload = in_flight[future]
+                if future.cancelled() or future.exception() is not None:
+                    exc = None if future.cancelled() else future.exception()
+                    logger.debug("MetaUI send failed (%s): %s", client_id, exc)
+                    stale_clients.append(client_id)
+                    continue
                 sent += 1
                 if has_command_payload:
                     ack_sent += 1
-            except Exception as exc:  # pragma: no cover - transport edge
-                logger.debug("MetaUI send failed (%s): %s", client_id, exc)
-                stale_clients.append(client_id)
 
         await self._remove_stale_clients(stale_clients)
 
@@ -694,6 +894,21 @@ class MetaUIOrchestrator:
             expect_ack=expect_ack,
         )
 
+    @staticmethod
+    def _delivery_callback(
+        connection: _ClientConnection,
+        *,
+        ui_id: Optional[str],
+        revision: Optional[int],
+    ) -> Any:
+        def _on_done(future: asyncio.Future[None]) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            if revision is not None and ui_id:
+                connection.surface_revisions[ui_id] = revision
+
+        return _on_done
+
     async def _prepare_send_snapshot(self) -> _SendSnapshot:
         endpoint = await self.ensure_started()
         async with self._state_lock:
@@ -745,13 +960,23 @@ class MetaUIOrchestrator:
         session: MetaUISession,
         command_id: str,
         include_state: bool,
+        variants: Optional[Dict[bool, Sequence[Dict[str, Any]]]] = None,
     ) -> Sequence[Dict[str, Any]]:
-        _ = (connection, command_id)
-        return build_ui_render_sequence(
+        _ = command_id
+        supports_delta = connection.capabilities.supports_feature(_SURFACE_DELTA_FEATURE)
+        if variants is not None and supports_delta in variants:
+            # Same payload objects for every client of this variant, so the
+            # broadcast encodes them once.
+            return variants[supports_delta]
+        payloads = build_ui_render_sequence(
             spec=session.spec,
             state=session.state if include_state and session.state else None,
             catalog_id=build_catalog_snapshot(get_component_catalog())["catalogId"],
+            revision=session.spec_revision if supports_delta else None,
         )
+        if variants is not None:
+            variants[supports_delta] = payloads
+        return payloads
 
     async def _broadcast_render_full_session(
         self,
@@ -763,12 +988,14 @@ class MetaUIOrchestrator:
         snapshot = await self._prepare_send_snapshot()
         clients = dict(snapshot.clients)
         payloads_by_client: Dict[str, Sequence[Dict[str, Any]]] = {}
+        variants: Dict[bool, Sequence[Dict[str, Any]]] = {}
         for client_id, connection in clients.items():
             payloads_by_client[client_id] = self._build_render_payloads_for_client(
                 connection=connection,
                 session=session,
                 command_id=command_id,
                 include_state=True,
+                variants=variants,
             )
         return await self._send_payloads_to_clients(
             payloads_by_client=payloads_by_client,
@@ -777,6 +1004,45 @@ class MetaUIOrchestrator:
             session_id=session.session_id,
             expect_ack=expect_ack,
             snapshot=snapshot,
+            revision=session.spec_revision,
+        )
+
+    async def _broadcast_patch_session(
+        self,
+        *,
+        session: MetaUISession,
+        preparation: _PatchPreparation,
+    ) -> Dict[str, Any]:
+        command_id = new_command_id()
+        snapshot = await self._prepare_send_snapshot()
+        payloads_by_client: Dict[str, Sequence[Dict[str, Any]]] = {}
+        variants: Dict[bool, Sequence[Dict[str, Any]]] = {}
+        for client_id, connection in snapshot.clients:
+            up_to_date = (
+                preparation.delta is not None
+                and connection.capabilities.supports_feature(_SURFACE_DELTA_FEATURE)
+                and connection.surface_revisions.get(session.ui_id) == preparation.base_revision
+            )
+            if up_to_date:
+                payloads_by_client[client_id] = (preparation.delta,)
+                self._wire_stats.delta_deliveries += 1
+            else:
+                payloads_by_client[client_id] = self._build_render_payloads_for_client(
+                    connection=connection,
+                    session=session,
+                    command_id=command_id,
+                    include_state=True,
+                    variants=variants,
+                )
+                self._wire_stats.full_deliveries += 1
+        return await self._send_payloads_to_clients(
+            payloads_by_client=payloads_by_client,
+            command_id=command_id,
+            ui_id=session.ui_id,
+            session_id=session.session_id,
+            expect_ack=False,
+            snapshot=snapshot,
+            revision=session.spec_revision,
         )
 
     async def _broadcast_state_update(
@@ -790,17 +1056,18 @@ class MetaUIOrchestrator:
         snapshot = await self._prepare_send_snapshot()
         clients = dict(snapshot.clients)
 
+        payloads = (
+            build_data_model_update_message(
+                surface_id=ui_id,
+                state_patch=state_patch,
+                path="/",
+            ),
+        )
         payloads_by_client: Dict[str, Sequence[Dict[str, Any]]] = {}
         for client_id, connection in clients.items():
             if not connection.capabilities.supports_feature("a2ui_stream_v1"):
                 continue
-            payloads_by_client[client_id] = (
-                build_data_model_update_message(
-                    surface_id=ui_id,
-                    state_patch=state_patch,
-                    path="/",
-                ),
-            )
+            payloads_by_client[client_id] = payloads
 
         return await self._send_payloads_to_clients(
             payloads_by_client=payloads_by_client,
@@ -821,11 +1088,12 @@ class MetaUIOrchestrator:
         snapshot = await self._prepare_send_snapshot()
         clients = dict(snapshot.clients)
 
+        payloads = (build_delete_surface_message(surface_id=ui_id),)
         payloads_by_client: Dict[str, Sequence[Dict[str, Any]]] = {}
         for client_id, connection in clients.items():
             if not connection.capabilities.supports_feature("a2ui_stream_v1"):
                 continue
-            payloads_by_client[client_id] = (build_delete_surface_message(surface_id=ui_id),)
+            payloads_by_client[client_id] = payloads
 
         return await self._send_payloads_to_clients(
             payloads_by_client=payloads_by_client,
@@ -848,9 +1116,11 @@ class MetaUIOrchestrator:
 
     async def _unregister_client(self, client_id: str) -> None:
         async with self._state_lock:
-            self._clients.pop(client_id, None)
+            connection = self._clients.pop(client_id, None)
             if not self._clients:
                 self._client_ready.clear()
+        if connection is not None and connection.outbox is not None:
+            await connection.outbox.aclose()
 
     async def _accept_client_connection(
         self,
@@ -893,11 +1163,19 @@ class MetaUIOrchestrator:
         )
         return client_id, connection, hello_ack
 
-    async def _consume_client_messages(self, *, websocket: Any) -> None:
+    async def _consume_client_messages(
+        self,
+        *,
+        websocket: Any,
+        connection: Optional[_ClientConnection] = None,
+    ) -> None:
         async for raw in websocket:
             message = self._decode_json(raw)
             if not isinstance(message, dict):
                 continue
+            if message.get("type") == "resync" and connection is not None:
+                await self._resync_client(connection, str(message.get("surface_id") or ""))
+                continue
             translated_event = translate_client_event_message(message)
             if translated_event is not None:
                 await self._record_event(translated_event)
@@ -916,18 +1194,43 @@ class MetaUIOrchestrator:
         if client_id is None or connection is None or hello_ack is None:
             return
 
-        await self._register_client(client_id=client_id, connection=connection)
-
-        await websocket.send(
-            json.dumps(hello_ack.model_dump(mode="json"), ensure_ascii=False)
+        # hello_ack goes through the outbox before registration so broadcasts
+        # can never overtake it.
+        hello_sent = self._enqueue_frames(
+            connection,
+            [json.dumps(hello_ack.model_dump(mode="json"), ensure_ascii=False)],
         )
+        if hello_sent is not None:
+            await hello_sent
+        await self._register_client(client_id=client_id, connection=connection)
         await self._replay_sessions_to_client(connection)
 
         try:
-            await self._consume_client_messages(websocket=websocket)
+            await self._consume_client_messages(websocket=websocket, connection=connection)
         finally:
             await self._unregister_client(client_id)
 
+    async def _resync_client(self, connection: _ClientConnection, ui_id: str) -> None:
+        """Full render for a client whose delta base revision did not match."""
+        async with self._state_lock:
+            session = self._sessions.get(ui_id)
+        if session is None:
+            return
+        self._wire_stats.resyncs += 1
+        connection.surface_revisions.pop(ui_id, None)
+        payloads = self._build_render_payloads_for_client(
+            connection=connection,
+            session=session,
+            command_id=new_command_id(),
+            include_state=True,
+        )
+        try:
+            await self._send_payload_batch(connection=connection, payloads=payloads)
+        except Exception as exc:
+            logger.debug("MetaUI resync failed for ui_id=%s: %s", ui_id, exc)
+            return
+        connection.surface_revisions[ui_id] = session.spec_revision
+
     async def _replay_sessions_to_client(self, connection: _ClientConnection) -> None:
         async with self._state_lock:
             sessions = list(self._sessions.values())
@@ -943,11 +1246,8 @@ class MetaUIOrchestrator:
                 include_state=True,
             )
             try:
-                for payload in payloads:
-                    await asyncio.wait_for(
-                        connection.websocket.send(json.dumps(payload, ensure_ascii=False)),
-                        timeout=self.send_timeout_seconds,
-                    )
+                await self._send_payload_batch(connection=connection, payloads=payloads)
+                connection.surface_revisions[session.ui_id] = session.spec_revision
             except Exception as exc:
                 logger.warning(
                     "MetaUI replay failed for ui_id=%s session_id=%s: %s",
@@ -1004,9 +1304,6 @@ class MetaUIOrchestrator:
         )
         await self._append_event_and_update_phase(event=event, validation_errors=validation_errors)
 
-        async with self._events_cond:
-            self._events_cond.notify_all()
-
     async def _accept_event_id(self, event_id: str) -> bool:
         async with self._state_lock:
             return self._event_store.accept_event_id(event_id)
@@ -1160,6 +1457,14 @@ def configure_metaui_runtime(config_dict: dict[str, Any]) -> None:
         strict_component_types=bool(
             block.get("strict_component_types", _RUNTIME_SETTINGS.strict_component_types)
         ),
+        send_queue_frames=_normalize_int(
+            block.get("send_queue_frames"),
+            _RUNTIME_SETTINGS.send_queue_frames,
+            minimum=1,
+        ),
+        slow_client_policy=str(
+            block.get("slow_client_policy") or _RUNTIME_SETTINGS.slow_client_policy
+        ).strip().lower(),
     )
     _ORCHESTRATOR = None
 
@@ -1217,5 +1522,7 @@ def get_metaui_orchestrator(
         event_history_limit=settings.event_history_limit,
         strict_component_types=resolved_strict,
         upload_store=upload_store,
+        send_queue_frames=settings.send_queue_frames,
+        slow_client_policy=settings.slow_client_policy,
     )
     return _ORCHESTRATOR
@@ -28,6 +28,7 @@ class MetaUISession:
     updated_at: float = field(default_factory=time.time)
     last_error: Optional[str] = None
     version: int = 1
+    spec_revision: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -38,6 +39,7 @@ class MetaUISession:
             "updated_at": self.updated_at,
             "last_error": self.last_error,
             "version": self.version,
+            "spec_revision": self.spec_revision,
             "title": self.spec.title,
         }
 
@@ -10,7 +10,6 @@ from .function_catalog import (
 )
 from .interaction_contract import (
     ACTION_VARIANTS,
-    COMPONENT_SUPPORTED_EVENTS,
     FUNCTION_CALL_RETURN_TYPES,
 )
 from .protocol import UI_COMPONENT_TYPES
@@ -1197,6 +1196,75 @@ def normalize_metaui_patch(
     return normalized
 
 
+def _has_path_value_binding(raw_value: Any) -> bool:
+    if not isinstance(raw_value, Mapping):
+        return False
+    path = str(raw_value.get("path") or "").strip()
+    return bool(path)
+
+
+def component_interaction_issues(component: Mapping[str, Any]) -> tuple[list[str], bool]:
+    """
+    Interaction-contract issues for one interactive-mode component.
+
+    Returns `(issues, actionable)`; `actionable` is True for a Button with a
+    valid action or a value-bound input component.
+    """
+    if not isinstance(component, Mapping):
+        return [], False
+    component_id = str(component.get("id") or "").strip() or "<unknown>"
+    component_type = str(component.get("type") or "").strip()
+    props = component.get("props")
+    if not isinstance(props, Mapping):
+        return [], False
+    issues: list[str] = []
+    actionable = False
+    if component_type == "Button":
+        action = props.get("action")
+        if action is None:
+            issues.append(
+                f"component '{component_id}' (Button) requires props.action in interactive mode."
+            )
+        else:
+            try:
+                _normalize_action_object(action, owner=f"component '{component_id}'")
+                actionable = True
+            except Exception as exc:
+                issues.append(str(exc))
+        return issues, actionable
+
+    if component_type in _INTERACTIVE_VALUE_BOUND_COMPONENTS:
+        if not _has_path_value_binding(props.get("value")):
+            issues.append(
+                f"component '{component_id}' ({component_type}) requires props.value "
+                "to be a data binding object with a non-empty `path` in interactive mode."
+            )
+        else:
+            actionable = True
+
+    if "action" in props:
+        issues.append(
+            f"component '{component_id}' ({component_type}) does not support props.action. "
+            "Use Button.action to trigger server-side actions."
+        )
+    return issues, actionable
+
+
+NO_ACTIONABLE_COMPONENT_ISSUE = (
+    "interactive mode requires at least one actionable component: "
+    "either a Button with props.action or an input component with props.value.path binding."
+)
+
+
+def validate_component_graph(
+    *,
+    components: Sequence[Mapping[str, Any]],
+    root_ids: Sequence[str],
+) -> None:
+    """Check ids, child references and reachability of already-normalized components."""
+    _validate_component_graph(components=components, root_ids=root_ids)
+
+
 def collect_interaction_contract_issues(
     spec: Mapping[str, Any],
     *,
@@ -1212,56 +1280,14 @@ def collect_interaction_contract_issues(
     if interaction_mode != "interactive":
         return issues
 
-    interactive_component_types = set(COMPONENT_SUPPORTED_EVENTS.keys())
     actionable_components = 0
-
-    def _has_path_value_binding(raw_value: Any) -> bool:
-        if not isinstance(raw_value, Mapping):
-            return False
-        path = str(raw_value.get("path") or "").strip()
-        return bool(path)
-
     for component in components:
-        if not isinstance(component, Mapping):
-            continue
-        component_id = str(component.get("id") or "").strip() or "<unknown>"
-        component_type = str(component.get("type") or "").strip()
-        props = component.get("props")
-        if not isinstance(props, Mapping):
-            continue
-        if component_type == "Button":
-            action = props.get("action")
-            if action is None:
-                issues.append(
-                    f"component '{component_id}' (Button) requires props.action in interactive mode."
-                )
-            else:
-                try:
-                    _normalize_action_object(action, owner=f"component '{component_id}'")
-                    actionable_components += 1
-                except Exception as exc:
-                    issues.append(str(exc))
-            continue
-
-        if component_type in _INTERACTIVE_VALUE_BOUND_COMPONENTS:
-            if not _has_path_value_binding(props.get("value")):
-                issues.append(
-                    f"component '{component_id}' ({component_type}) requires props.value "
-                    "to be a data binding object with a non-empty `path` in interactive mode."
-                )
-            else:
-                actionable_components += 1
-
-        if component_type != "Button" and "action" in props:
-            issues.append(
-                f"component '{component_id}' ({component_type}) does not support props.action. "
-                "Use Button.action to trigger server-side actions."
-            )
+        component_issues, actionable = component_interaction_issues(component)
+        issues.extend(component_issues)
+        if actionable:
+            actionable_components += 1
 
     if actionable_components <= 0:
-        issues.append(
-            "interactive mode requires at least one actionable component: "
-            "either a Button with props.action or an input component with props.value.path binding."
-        )
+        issues.append(NO_ACTIONABLE_COMPONENT_ISSUE)
 
     return issues
@@ -2,7 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from copy import deepcopy
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Optional
+
+from .protocol import MetaUIComponent, MetaUISpec
+from .spec_normalizer import (
+    NO_ACTIONABLE_COMPONENT_ISSUE,
+    component_interaction_issues,
+    normalize_component,
+    validate_component_graph,
+)
 
 
 _STRUCTURAL_OPS = frozenset(
@@ -15,6 +23,8 @@ _STRUCTURAL_OPS = frozenset(
     }
 )
 
+_INCREMENTAL_OPS = frozenset({"update_component", "append_component", "remove_component"})
+
 
 @dataclass(frozen=True)
 class PatchRoutingDecision:
@@ -200,3 +210,113 @@ def apply_structural_patch_to_spec(
     current["components"] = [by_id[item] for item in order if item in by_id]
     current["root"] = _sanitize_root(current.get("root"), current["components"])
     return current
+
+
+@dataclass(frozen=True)
+class IncrementalPatchResult:
+    spec: MetaUISpec
+    upserted: tuple[str, ...]
+    removed: tuple[str, ...]
+    issues: tuple[str, ...] = ()
+
+
+def _component_view(component: MetaUIComponent) -> Dict[str, Any]:
+    # Read-only mapping view for graph/contract checks; avoids model_dump copies.
+    return {"id": component.id, "type": component.type, "props": component.props}
+
+
+def apply_incremental_patch(
+    spec: MetaUISpec,
+    patch: Mapping[str, Any],
+) -> Optional[IncrementalPatchResult]:
+    """
+    Apply a normalized component-level patch without re-normalizing the spec.
+
+    Handles `update_component`, `append_component` and `remove_component`;
+    returns None for every other op, and for removals that touch `root`, so
+    callers take the full path. Only the
+    touched component is normalized and model-validated; the component graph
+    check stays global but works on the existing models without copying.
+    """
+    op = str(patch.get("op") or "").strip().lower()
+    if op not in _INCREMENTAL_OPS:
+        return None
+
+    by_id: Dict[str, MetaUIComponent] = {component.id: component for component in spec.components}
+    order = list(by_id)
+    root = list(spec.root)
+    upserted: list[str] = []
+    removed: list[str] = []
+
+    if op == "append_component":
+        component = patch.get("component")
+        if not isinstance(component, Mapping):
+            return None
+        target_id = str(component.get("id") or "").strip()
+        if target_id:
+            if target_id in by_id:
+                merged = _merge_dicts(by_id[target_id].model_dump(mode="json"), component)
+            else:
+                merged = deepcopy(dict(component))
+                order.append(target_id)
+            by_id[target_id] = MetaUIComponent.model_validate(normalize_component(merged))
+            upserted.append(target_id)
+    elif op == "remove_component":
+        target_id = str(patch.get("id") or "").strip()
+        if target_id in root:
+            # Root fallback selection lives in the full path.
+            return None
+        if target_id in by_id:
+            del by_id[target_id]
+            order.remove(target_id)
+            removed.append(target_id)
+    else:
+        target_id = str(patch.get("id") or "").strip()
+        if not target_id and isinstance(patch.get("component"), Mapping):
+            target_id = str(patch["component"].get("id") or "").strip()
+        if target_id:
+            current = by_id.get(target_id)
+            updated = current.model_dump(mode="json") if current is not None else {"id": target_id}
+            component_block = patch.get("component")
+            if isinstance(component_block, Mapping):
+                updated = _merge_dicts(updated, component_block)
+            patch_type = patch.get("type")
+            if patch_type is not None:
+                updated["type"] = patch_type
+            patch_props = patch.get("props")
+            if isinstance(patch_props, Mapping):
+                updated["props"] = _merge_dicts(updated.get("props") or {}, patch_props)
+            if current is None:
+                order.append(target_id)
+            by_id[target_id] = MetaUIComponent.model_validate(normalize_component(updated))
+            upserted.append(target_id)
+
+    components = [by_id[component_id] for component_id in order]
+    validate_component_graph(
+        components=[_component_view(component) for component in components],
+        root_ids=root,
+    )
+
+    issues: list[str] = []
+    if spec.interaction_mode == "interactive":
+        actionable = False
+        for component_id in upserted:
+            component_issues, is_actionable = component_interaction_issues(_component_view(by_id[component_id]))
+            issues.extend(component_issues)
+            actionable = actionable or is_actionable
+        if not actionable:
+            touched = set(upserted)
+            actionable = any(
+                component_interaction_issues(_component_view(component))[1]
+                for component in components
+                if component.id not in touched
+            )
+        if not actionable:
+            issues.append(NO_ACTIONABLE_COMPONENT_ISSUE)
+
+    return IncrementalPatchResult(
+        spec=spec.model_copy(update={"components": components}),
+        upserted=tuple(upserted),
+        removed=tuple(removed),
+        issues=tuple(issues),
+    )
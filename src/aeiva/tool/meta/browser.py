@@ -73,6 +73,19 @@ async def browser(
         target_id: Active tab target id.
         ref: Stable snapshot ref for element operations.
         request: Operation-specific payload for advanced/compound actions.
+            For `snapshot`, pass `{"since": <snapshot_id>}` to receive only the
+            nodes added, changed or removed since that snapshot. Snapshots are
+            returned as compact `columns`/`rows` (integer cells index into
+            `strings`); `{"query": ...}` ranks matching nodes first when the
+            `budget_chars` limit applies, and `{"format": "full"}` returns
+            the full node dicts.
+            For `navigate`/`open`, pass `{"load": "fast" | "text" | {...}}` to
+            block images/fonts/media/trackers (`fast`) or also stylesheets and
+            third-party scripts (`text`) for that navigation; on `start` the
+            same value sets the profile's default load policy.
+            For `fill_fields`, pass `{"batch": true}` to set plain inputs,
+            textareas and native selects in one page call; date pickers and
+            custom widgets still run step by step.
         full_page: Full-page screenshot flag.
         image_type: Screenshot image format (`png` or `jpeg`).
         limit: Result limit for list/snapshot/event operations.
@@ -6,11 +6,13 @@ from the large browser service/runtime modules (security policies, shared
 helpers, and future refactors).
 """
 
+from .browser_pool import BrowserContextPool
 from .browser_runtime import BrowserSessionManager, BrowserRuntime, PlaywrightRuntime, DEFAULT_TIMEOUT_MS
 from .security import BrowserSecurityPolicy
 from .browser_service import BrowserService, get_browser_service, set_browser_service
 
 __all__ = [
+    "BrowserContextPool",
     "BrowserService",
     "BrowserRuntime",
     "BrowserSecurityPolicy",
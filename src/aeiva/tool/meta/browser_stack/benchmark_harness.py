@@ -0,0 +1,412 @@
+"""Offline latency benchmark for the browser stack.
+
+Synthetic fixture pages (a large DOM, nested iframes, a long form and an
+infinite-scroll feed) are served from a local HTTP server, and each scenario
+drives ``BrowserService.execute`` against them. Every operation is timed and
+summarised as p50/p95 so regressions in ``browser_stack`` hot paths show up as
+numbers. The runtime factory is pluggable: the default launches Playwright,
+while tests and profilers can pass any ``(profile, headless) -> BrowserRuntime``.
+"""
+
+from __future__ import annotations
+
+import html
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import parse_qs, urlparse
+
+from .browser_service import BrowserService
+from .runtime_common import BrowserRuntime
+from .security import BrowserSecurityPolicy
+from .session_manager import BrowserSessionManager
+
+_PAGE_TEMPLATE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>body{{font-family:sans-serif}} .row{{padding:4px 0}} iframe{{width:90%;height:240px}}</style>
+</head><body>
+{body}
+</body></html>"""
+
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int, maximum: int) -> int:
+    try:
+        value = int((query.get(name) or [default])[0])
+    except (TypeError, ValueError):
+        value = default
+    return max(0, min(value, maximum))
+
+
+def _page(title: str, body: str) -> str:
+    return _PAGE_TEMPLATE.format(title=html.escape(title), body=body)
+
+
+def large_dom_page(query: Dict[str, List[str]]) -> str:
+    rows = _int_param(query, "rows", 1500, 20_000)
+    parts = ['<h1>Catalog</h1><input type="search" name="q" aria-label="Search catalog">']
+    for i in range(rows):
+        parts.append(
+            f'<div class="row" id="row-{i}"><span>Item {i}</span> '
+            f'<a href="#item-{i}">Open item {i}</a> '
+            f'<button type="button" onclick="this.textContent=\'Added {i}\'">Add {i}</button></div>'
+        )
+    return _page("Large DOM", "\n".join(parts))
+
+
+def nested_frames_page(query: Dict[str, List[str]]) -> str:
+    depth = _int_param(query, "depth", 3, 8)
+    body = [
+        f"<h2>Frame depth {depth}</h2>",
+        f"<p>Content at depth {depth}.</p>",
+        f'<button type="button">Frame button {depth}</button>',
+        f'<label>Frame note {depth} <input type="text" name="note_{depth}"></label>',
+    ]
+    if depth > 0:
+        body.append(f'<iframe title="Frame {depth - 1}" src="/frames?depth={depth - 1}"></iframe>')
+    return _page(f"Frames {depth}", "\n".join(body))
+
+
+def long_form_page(query: Dict[str, List[str]]) -> str:
+    fields = _int_param(query, "fields", 24, 200)
+    input_types = ("text", "email", "tel", "number")
+    parts = ['<h1>Application</h1><form onsubmit="event.preventDefault();document.title=\'Submitted\'">']
+    for i in range(fields):
+        input_type = input_types[i % len(input_types)]
+        parts.append(
+            f'<div class="row"><label for="f{i}">Field {i}</label> '
+            f'<input id="f{i}" name="field_{i}" type="{input_type}"></div>'
+        )
+    parts.append(
+        '<div class="row"><label for="country">Country</label> <select id="country" name="country">'
+        '<option value="">Choose</option><option value="uk">United Kingdom</option>'
+        '<option value="us">United States</option></select></div>'
+        '<div class="row"><label for="start">Start date</label> <input id="start" name="start" type="date"></div>'
+        '<div class="row"><label for="notes">Notes</label> <textarea id="notes" name="notes"></textarea></div>'
+        '<button type="submit">Submit application</button></form>'
+    )
+    return _page("Long form", "\n".join(parts))
+
+
+def infinite_scroll_page(query: Dict[str, List[str]]) -> str:
+    batch = _int_param(query, "batch", 40, 500)
+    body = f"""<h1>Feed</h1><div id="feed"></div>
+<script>
+  let next = 0;
+  const feed = document.getElementById("feed");
+  const append = () => {{
+    for (let i = 0; i < {batch}; i++, next++) {{
+      const row = document.createElement("div");
+      row.className = "row";
+      row.innerHTML = `<span>Post ${{next}}</span> <a href="#post-${{next}}">Read post ${{next}}</a>`;
+      feed.appendChild(row);
+    }}
+  }};
+  append();
+  window.addEventListener("scroll", () => {{
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) append();
+  }});
+</script>"""
+    return _page("Infinite scroll", body)
+
+
+FIXTURE_PAGES: Dict[str, Callable[[Dict[str, List[str]]], str]] = {
+    "/large": large_dom_page,
+    "/frames": nested_frames_page,
+    "/form": long_form_page,
+    "/feed": infinite_scroll_page,
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        parsed = urlparse(self.path)
+        render = FIXTURE_PAGES.get(parsed.path)
+        if render is None:
+            self.send_error(404)
+            return
+        payload = render(parse_qs(parsed.query)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+class FixtureServer:
+    """Serve ``FIXTURE_PAGES`` on an ephemeral localhost port from a daemon thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = ThreadingHTTPServer((host, port), _FixtureHandler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def start(self) -> "FixtureServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+@dataclass(frozen=True)
+class BenchmarkStep:
+    operation: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    # Timing key; defaults to the operation so variants (e.g. batched fill) can be told apart.
+    label: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return self.label or self.operation
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    name: str
+    path: str
+    steps: Sequence[BenchmarkStep]
+
+
+def _form_steps(fields: int) -> List[Dict[str, Any]]:
+    steps: List[Dict[str, Any]] = []
+    for i in range(fields):
+        value = f"{i}{i}" if i % 4 == 3 else (f"user{i}@example.com" if i % 4 == 1 else f"Value {i}")
+        steps.append({"operation": "type", "field": f"Field {i}", "value": value})
+    steps.append({"operation": "select", "field": "Country", "value": "uk"})
+    steps.append({"operation": "type", "field": "Notes", "value": "Benchmark run"})
+    return steps
+
+
+def default_scenarios() -> List[BenchmarkScenario]:
+    form_steps = _form_steps(24)
+    return [
+        BenchmarkScenario(
+            name="large_dom",
+            path="/large?rows=1500",
+            steps=(
+                BenchmarkStep("snapshot", {"limit": 200}),
+                BenchmarkStep("search", {"query": "Item 1200"}),
+                BenchmarkStep("click", {"text": "Add 7"}),
+            ),
+        ),
+        BenchmarkScenario(
+            name="nested_frames",
+            path="/frames?depth=3",
+            steps=(
+                BenchmarkStep("snapshot", {"limit": 80}),
+                BenchmarkStep("get_text", {}),
+            ),
+        ),
+        BenchmarkScenario(
+            name="long_form",
+            path="/form?fields=24",
+            steps=(
+                BenchmarkStep(
+                    "fill_fields",
+                    {"request": {"steps": form_steps, "max_steps": 30, "continue_on_error": True}},
+                ),
+                BenchmarkStep(
+                    "fill_fields",
+                    {"request": {"steps": form_steps, "max_steps": 30, "continue_on_error": True, "batch": True}},
+                    label="fill_fields_batch",
+                ),
+            ),
+        ),
+        BenchmarkScenario(
+            name="infinite_scroll",
+            path="/feed?batch=40",
+            steps=(
+                BenchmarkStep("scroll", {"request": {"delta_y": 1500}}),
+                BenchmarkStep("scroll", {"request": {"delta_y": 1500}}),
+                BenchmarkStep("snapshot", {"limit": 120}),
+            ),
+        ),
+    ]
+
+
+def _percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Linear-interpolated percentile (``q`` in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * (q / 100.0)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class OperationTimings:
+    samples_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    last_error: Optional[str] = None
+
+    def record(self, elapsed_ms: float, error: Optional[str] = None) -> None:
+        self.samples_ms.append(elapsed_ms)
+        if error:
+            self.errors += 1
+            self.last_error = error
+
+    def summary(self) -> Dict[str, Any]:
+        def _round(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        samples = self.samples_ms
+        return {
+            "count": len(samples),
+            "errors": self.errors,
+            "p50_ms": _round(_percentile(samples, 50)),
+            "p95_ms": _round(_percentile(samples, 95)),
+            "mean_ms": _round(sum(samples) / len(samples)) if samples else None,
+            "max_ms": _round(max(samples)) if samples else None,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    iterations: int
+    operations: Dict[str, OperationTimings] = field(default_factory=dict)
+    scenarios: Dict[str, Dict[str, OperationTimings]] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def record(self, scenario: str, key: str, elapsed_ms: float, error: Optional[str]) -> None:
+        self.operations.setdefault(key, OperationTimings()).record(elapsed_ms, error)
+        self.scenarios.setdefault(scenario, {}).setdefault(key, OperationTimings()).record(elapsed_ms, error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": self.iterations,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "operations": {key: timings.summary() for key, timings in self.operations.items()},
+            "scenarios": {
+                name: {key: timings.summary() for key, timings in ops.items()}
+                for name, ops in self.scenarios.items()
+            },
+        }
+
+    def render_markdown(self) -> str:
+        lines = [
+            "# Browser stack benchmark",
+            "",
+            f"Iterations per scenario: {self.iterations}; wall time {self.wall_seconds:.1f}s.",
+            "",
+            "| Scenario | Operation | n | errors | p50 ms | p95 ms | max ms |",
+            "| --- | --- | ---: | ---: | ---: | ---: | ---: |",
+        ]
+        for name, ops in self.scenarios.items():
+            for key, timings in ops.items():
+                row = timings.summary()
+                lines.append(
+                    f"| {name} | {key} | {row['count']} | {row['errors']} | "
+                    f"{row['p50_ms']} | {row['p95_ms']} | {row['max_ms']} |"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _error_of(payload: Any) -> Optional[str]:
+    if not isinstance(payload, dict):
+        return "non-dict payload"
+    if payload.get("success") is False:
+        return str(payload.get("error") or "operation failed")
+    return None
+
+
+async def run_browser_benchmark(
+    *,
+    runtime_factory: Optional[Callable[[str, bool], BrowserRuntime]] = None,
+    scenarios: Optional[Iterable[BenchmarkScenario]] = None,
+    iterations: int = 5,
+    headless: bool = True,
+    timeout_ms: int = 15_000,
+    server: Optional[FixtureServer] = None,
+    profile_prefix: str = "bench",
+) -> BenchmarkReport:
+    """Run each scenario ``iterations`` times and collect per-operation timings.
+
+    Every iteration navigates to the scenario page (timed as ``navigate``) and
+    then executes its steps against the returned tab. Failed operations are
+    still timed and counted as errors rather than aborting the run.
+    """
+    selected = list(scenarios) if scenarios is not None else default_scenarios()
+    report = BenchmarkReport(iterations=max(1, int(iterations)))
+    owns_server = server is None
+    fixture_server = (server or FixtureServer()).start()
+    sessions = BrowserSessionManager(runtime_factory=runtime_factory)
+    service = BrowserService(
+        session_manager=sessions,
+        security_policy=BrowserSecurityPolicy(
+            allow_evaluate=False,
+            allow_private_network_requests=False,
+            request_allowlist=(),
+        ),
+    )
+    started = time.perf_counter()
+    try:
+        for scenario in selected:
+            profile = f"{profile_prefix}-{scenario.name}"
+            for _ in range(report.iterations):
+                begin = time.perf_counter()
+                payload = await service.execute(
+                    operation="navigate",
+                    url=fixture_server.url(scenario.path),
+                    profile=profile,
+                    headless=headless,
+                    timeout=timeout_ms,
+                )
+                report.record(
+                    scenario.name,
+                    "navigate",
+                    (time.perf_counter() - begin) * 1000.0,
+                    _error_of(payload),
+                )
+                target_id = payload.get("target_id") if isinstance(payload, dict) else None
+                for step in scenario.steps:
+                    params = dict(step.params)
+                    begin = time.perf_counter()
+                    try:
+                        payload = await service.execute(
+                            operation=step.operation,
+                            profile=profile,
+                            headless=headless,
+                            timeout=timeout_ms,
+                            target_id=target_id,
+                            **params,
+                        )
+                        error = _error_of(payload)
+                    except Exception as exc:
+                        error = str(exc) or type(exc).__name__
+                    report.record(scenario.name, step.key, (time.perf_counter() - begin) * 1000.0, error)
+    finally:
+        report.wall_seconds = time.perf_counter() - started
+        await sessions.stop_all()
+        if owns_server:
+            fixture_server.stop()
+    return report
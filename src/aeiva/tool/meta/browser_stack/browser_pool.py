@@ -0,0 +1,364 @@
+"""Shared browser process with pooled, isolated contexts.
+
+In pooled mode every profile gets its own ``BrowserContext`` (cookies,
+storage and pages stay isolated) but all contexts of one headless mode live
+in a single browser process driven by a single Playwright driver. A few
+fresh contexts are kept pre-warmed so a new profile does not pay for a
+process launch; contexts are never reused across profiles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .runtime_common import _parse_int_env, _repair_subprocess_policy_for_loop
+from .runtime_launch import RuntimeLaunchMixin
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_SAMPLES = 64
+
+
+async def _default_driver_factory() -> Any:
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError as exc:
+        raise RuntimeError(
+            "playwright is not installed. Install extras: pip install -e '.[tools]'"
+        ) from exc
+    _repair_subprocess_policy_for_loop(asyncio.get_running_loop())
+    return await async_playwright().start()
+
+
+class _PoolLauncher(RuntimeLaunchMixin):
+    """Reuses the runtime launch fallback chain for the shared browser."""
+
+    def __init__(self, headless: bool):
+        self.headless = bool(headless)
+
+
+@dataclass
+class _WarmContext:
+    context: Any
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class _SharedBrowser:
+    headless: bool
+    driver: Any = None
+    browser: Any = None
+    launch_strategy: Optional[str] = None
+    launch_ms: Optional[float] = None
+    warm: List[_WarmContext] = field(default_factory=list)
+    leased: Set[int] = field(default_factory=set)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refill_task: Optional[asyncio.Task] = None
+    last_used_at: float = field(default_factory=time.time)
+
+
+def _process_tree_rss() -> Optional[int]:
+    """RSS of the Playwright driver(s) spawned by this process and their browsers."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        total = 0
+        for child in psutil.Process().children():
+            try:
+                cmdline = " ".join(child.cmdline())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if "playwright" not in cmdline:
+                continue
+            for proc in [child, *child.children(recursive=True)]:
+                try:
+                    total += proc.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        return total
+    except Exception:
+        return None
+
+
+def _system_memory_percent() -> Optional[float]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return float(psutil.virtual_memory().percent)
+    except Exception:
+        return None
+
+
+class BrowserContextPool:
+    """
+    One shared browser per headless mode, handing out isolated contexts.
+
+    ``lease`` returns a pre-warmed context when one is available, otherwise a
+    new one; ``release`` closes it. Warm contexts are topped back up to
+    ``warm_size`` in the background, replaced once older than the idle TTL,
+    and a browser with no leased contexts is shut down after the idle TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        warm_size: Optional[int] = None,
+        idle_ttl_seconds: Optional[int] = None,
+        max_rss_mb: Optional[int] = None,
+        memory_percent: Optional[int] = None,
+        driver_factory: Optional[Callable[[], Awaitable[Any]]] = None,
+        rss_probe: Optional[Callable[[], Optional[int]]] = None,
+        memory_probe: Optional[Callable[[], Optional[float]]] = None,
+    ) -> None:
+        self._warm_size = (
+            max(0, int(warm_size))
+            if warm_size is not None
+            else _parse_int_env("AEIVA_BROWSER_POOL_WARM", 2, 0)
+        )
+        self._idle_ttl_seconds = (
+            max(1, int(idle_ttl_seconds))
+            if idle_ttl_seconds is not None
+            else _parse_int_env("AEIVA_BROWSER_POOL_IDLE_SECS", 600, 1)
+        )
+        # 0 disables the corresponding memory-pressure check.
+        self._max_rss_bytes = (
+            max(0, int(max_rss_mb))
+            if max_rss_mb is not None
+            else _parse_int_env("AEIVA_BROWSER_POOL_MAX_RSS_MB", 0, 0)
+        ) * 1024 * 1024
+        self._memory_percent = (
+            max(0, int(memory_percent))
+            if memory_percent is not None
+            else _parse_int_env("AEIVA_BROWSER_POOL_MEMORY_PERCENT", 90, 0)
+        )
+        self._driver_factory = driver_factory or _default_driver_factory
+        self._rss_probe = rss_probe or _process_tree_rss
+        self._memory_probe = memory_probe or _system_memory_percent
+        self._browsers: Dict[bool, _SharedBrowser] = {}
+        self._lease_ms: List[float] = []
+        self._warm_hits = 0
+        self._cold_leases = 0
+        self._recycled = 0
+
+    def _shared(self, headless: bool) -> _SharedBrowser:
+        key = bool(headless)
+        shared = self._browsers.get(key)
+        if shared is None:
+            shared = _SharedBrowser(headless=key)
+            self._browsers[key] = shared
+        return shared
+
+    async def _ensure_browser(self, shared: _SharedBrowser) -> None:
+        await self._drop_disconnected(shared)
+        if shared.browser is not None:
+            return
+        started = time.perf_counter()
+        driver = await self._driver_factory()
+        try:
+            browser, strategy = await _PoolLauncher(shared.headless)._launch_browser_with_fallback(driver)
+        except Exception:
+            try:
+                await driver.stop()
+            except Exception:
+                pass
+            raise
+        shared.driver = driver
+        shared.browser = browser
+        shared.launch_strategy = strategy
+        shared.launch_ms = (time.perf_counter() - started) * 1000.0
+        logger.info(
+            "Shared browser started headless=%s launch_strategy=%s launch_ms=%.0f",
+            shared.headless,
+            strategy,
+            shared.launch_ms,
+        )
+
+    async def _drop_disconnected(self, shared: _SharedBrowser) -> None:
+        """Forget a crashed or disconnected browser so the next lease relaunches it."""
+        browser = shared.browser
+        if browser is None:
+            return
+        is_connected = getattr(browser, "is_connected", None)
+        if not callable(is_connected) or is_connected():
+            return
+        logger.warning("Shared browser disconnected headless=%s; relaunching", shared.headless)
+        # Warm contexts died with the browser; leased ones are dropped when
+        # their sessions release them.
+        shared.warm.clear()
+        driver = shared.driver
+        shared.browser = None
+        shared.driver = None
+        shared.launch_ms = None
+        if driver is not None:
+            try:
+                await driver.stop()
+            except Exception:
+                pass
+
+    async def lease(self, headless: bool) -> Tuple[Any, Optional[str]]:
+        """Return ``(context, launch_strategy)`` for a new profile session."""
+        shared = self._shared(headless)
+        started = time.perf_counter()
+        async with shared.lock:
+            await self._ensure_browser(shared)
+            context: Any = None
+            while shared.warm and context is None:
+                candidate = shared.warm.pop(0)
+                if time.time() - candidate.created_at < self._idle_ttl_seconds:
+                    context = candidate.context
+                    self._warm_hits += 1
+                else:
+                    await self._close_quietly(candidate.context)
+                    self._recycled += 1
+            if context is None:
+                context = await shared.browser.new_context()
+                self._cold_leases += 1
+            shared.leased.add(id(context))
+            shared.last_used_at = time.time()
+        self._lease_ms.append((time.perf_counter() - started) * 1000.0)
+        del self._lease_ms[:-_LATENCY_SAMPLES]
+        self._schedule_refill(shared)
+        return context, shared.launch_strategy
+
+    async def release(self, context: Any) -> None:
+        for shared in self._browsers.values():
+            if id(context) in shared.leased:
+                shared.leased.discard(id(context))
+                shared.last_used_at = time.time()
+                break
+        await context.close()
+
+    async def prewarm(self, headless: bool) -> int:
+        """Top warm contexts up to the target size; returns how many were added."""
+        shared = self._shared(headless)
+        added = 0
+        async with shared.lock:
+            if self._warm_size <= 0 or self.memory_pressure():
+                return 0
+            await self._ensure_browser(shared)
+            while len(shared.warm) < self._warm_size:
+                shared.warm.append(_WarmContext(context=await shared.browser.new_context()))
+                added += 1
+        return added
+
+    def _schedule_refill(self, shared: _SharedBrowser) -> None:
+        if self._warm_size <= 0 or len(shared.warm) >= self._warm_size:
+            return
+        if shared.refill_task is not None and not shared.refill_task.done():
+            return
+
+        async def refill() -> None:
+            try:
+                await self.prewarm(shared.headless)
+            except Exception as exc:
+                logger.warning("Browser context prewarm failed headless=%s: %s", shared.headless, exc)
+
+        shared.refill_task = asyncio.create_task(refill())
+
+    async def maintain(self) -> None:
+        """Recycle stale warm contexts and shut down browsers idle past the TTL."""
+        now = time.time()
+        pressure = self.memory_pressure()
+        for shared in list(self._browsers.values()):
+            async with shared.lock:
+                await self._drop_disconnected(shared)
+                if shared.browser is None:
+                    continue
+                keep: List[_WarmContext] = []
+                for warm in shared.warm:
+                    if pressure or now - warm.created_at >= self._idle_ttl_seconds:
+                        await self._close_quietly(warm.context)
+                        self._recycled += 1
+                    else:
+                        keep.append(warm)
+                shared.warm = keep
+                idle = not shared.leased and now - shared.last_used_at >= self._idle_ttl_seconds
+                if idle:
+                    await self._shutdown_browser(shared)
+                    continue
+            if not pressure:
+                self._schedule_refill(shared)
+
+    def memory_pressure(self) -> bool:
+        if self._max_rss_bytes > 0:
+            rss = self._rss_probe()
+            if rss is not None and rss >= self._max_rss_bytes:
+                return True
+        if self._memory_percent > 0:
+            percent = self._memory_probe()
+            if percent is not None and percent >= self._memory_percent:
+                return True
+        return False
+
+    def rss_bytes(self) -> Optional[int]:
+        return self._rss_probe()
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self._lease_ms)
+
+        def pick(q: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))], 2)
+
+        return {
+            "browsers": {
+                ("headless" if shared.headless else "headed"): {
+                    "running": shared.browser is not None,
+                    "launch_strategy": shared.launch_strategy,
+                    "launch_ms": round(shared.launch_ms, 2) if shared.launch_ms is not None else None,
+                    "leased_contexts": len(shared.leased),
+                    "warm_contexts": len(shared.warm),
+                }
+                for shared in self._browsers.values()
+            },
+            "warm_target": self._warm_size,
+            "warm_hits": self._warm_hits,
+            "cold_leases": self._cold_leases,
+            "recycled_contexts": self._recycled,
+            "lease_ms_p50": pick(0.5),
+            "lease_ms_p95": pick(0.95),
+            "rss_bytes": self.rss_bytes(),
+            "memory_pressure": self.memory_pressure(),
+        }
+
+    async def close(self) -> None:
+        for shared in list(self._browsers.values()):
+            async with shared.lock:
+                await self._shutdown_browser(shared)
+        self._browsers.clear()
+
+    async def _shutdown_browser(self, shared: _SharedBrowser) -> None:
+        task = shared.refill_task
+        shared.refill_task = None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        for warm in shared.warm:
+            await self._close_quietly(warm.context)
+        shared.warm.clear()
+        browser, driver = shared.browser, shared.driver
+        shared.browser = None
+        shared.driver = None
+        shared.launch_ms = None
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            if driver is not None:
+                await driver.stop()
+        logger.info("Shared browser stopped headless=%s", shared.headless)
+
+    @staticmethod
+    async def _close_quietly(context: Any) -> None:
+        try:
+            await context.close()
+        except Exception:
+            pass
@@ -29,11 +29,15 @@ from .runtime_common import (
     DEFAULT_TIMEOUT_MS,
     BrowserRuntime,
     TabState,
+    _parse_bool_env,
     _repair_subprocess_policy_for_loop,
     _safe_title,
 )
+from .browser_pool import BrowserContextPool
+from .runtime_load_policy import LoadPolicy
 from .session_manager import BrowserSessionManager
 from .security import BrowserSecurityPolicy
+from .runtime_interaction_scripts import BATCH_FILL_JS
 from .runtime_scroll_script import ACTIVE_CONTAINER_SCROLL_JS, ELEMENT_SCROLL_JS
 
 logger = logging.getLogger(__name__)
@@ -59,9 +63,11 @@ class PlaywrightRuntime(
 ):
     """Persistent local Playwright runtime for one profile."""
 
-    def __init__(self, profile: str, headless: bool = True):
+    def __init__(self, profile: str, headless: bool = True, pool: Optional[BrowserContextPool] = None):
         self.profile = profile
         self.headless = bool(headless)
+        # With a pool the browser process is shared and only the context is ours.
+        self._pool = pool
 
         self._started = False
         self._started_at: Optional[float] = None
@@ -76,10 +82,16 @@ class PlaywrightRuntime(
         self._launch_strategy: Optional[str] = None
         self._launch_user_data_dir: Optional[str] = None
         self._security = BrowserSecurityPolicy.from_env()
+        self._incremental_snapshots = _parse_bool_env("AEIVA_BROWSER_INCREMENTAL_SNAPSHOT", False)
+        self._load_policy = LoadPolicy.from_env()
+        self._load_routing = False
 
     async def start(self) -> None:
         if self._started:
             return
+        if self._pool is not None:
+            await self._start_pooled()
+            return
 
         try:
             from playwright.async_api import async_playwright
@@ -98,6 +110,8 @@ class PlaywrightRuntime(
                 )
                 self._context = await self._browser.new_context()
                 self._context.on("page", self._on_page_created)
+                if self._load_policy.blocks_anything:
+                    await self._ensure_load_routing()
                 self._started = True
                 self._started_at = time.time()
                 logger.info(
@@ -120,6 +134,30 @@ class PlaywrightRuntime(
                 await self._cleanup_partial_start()
                 raise
 
+    async def _start_pooled(self) -> None:
+        self._context, self._launch_strategy = await self._pool.lease(self.headless)
+        try:
+            self._context.on("page", self._on_page_created)
+            if self._load_policy.blocks_anything:
+                await self._ensure_load_routing()
+        except Exception:
+            await self._cleanup_partial_start()
+            raise
+        self._started = True
+        self._started_at = time.time()
+        logger.info(
+            "Browser runtime started profile=%s headless=%s launch_strategy=%s pooled=True",
+            self.profile,
+            self.headless,
+            self._launch_strategy,
+        )
+
+    async def _close_context(self, context: Any) -> None:
+        if self._pool is not None:
+            await self._pool.release(context)
+        else:
+            await context.close()
+
     async def _cleanup_partial_start(self) -> None:
         context = self._context
         browser = self._browser
@@ -131,13 +169,14 @@ class PlaywrightRuntime(
         self._browser = None
         self._playwright = None
         self._launch_strategy = None
+        self._load_routing = False
         self._tab_states.clear()
         self._page_to_tab.clear()
         self._last_target_id = None
 
         try:
             if context is not None:
-                await context.close()
+                await self._close_context(context)
         except Exception:
             pass
         try:
@@ -165,13 +204,14 @@ class PlaywrightRuntime(
         self._context = None
         self._browser = None
         self._playwright = None
+        self._load_routing = False
         self._tab_states.clear()
         self._page_to_tab.clear()
         self._last_target_id = None
 
         try:
             if context is not None:
-                await context.close()
+                await self._close_context(context)
         finally:
             try:
                 if browser is not None:
@@ -211,6 +251,8 @@ class PlaywrightRuntime(
             "last_target_id": self._last_target_id,
             "started_at": self._started_at,
             "launch_strategy": self._launch_strategy,
+            "pooled": self._pool is not None,
+            "load_policy": self._load_policy.describe(),
         }
 
     async def list_tabs(self) -> List[Dict[str, Any]]:
@@ -235,16 +277,25 @@ class PlaywrightRuntime(
             )
         return tabs
 
-    async def open_tab(self, url: str, timeout_ms: int) -> Dict[str, Any]:
+    async def open_tab(self, url: str, timeout_ms: int, load: Any = None) -> Dict[str, Any]:
         await self._ensure_started()
         page = await self._context.new_page()
         target_id = self._register_page(page)
 
         clean_url = (url or "").strip()
+        load_info = None
         if clean_url:
-            await self._goto(page, clean_url, timeout_ms)
+            load_info = await self._goto(page, clean_url, timeout_ms, self._call_load_policy(load))
 
-        return await self._tab_payload(target_id)
+        payload = await self._tab_payload(target_id)
+        if load_info is not None:
+            payload["load"] = load_info
+        return payload
+
+    def _call_load_policy(self, load: Any) -> Optional[LoadPolicy]:
+        if load is None:
+            return None
+        return LoadPolicy.from_request(load, base=self._load_policy)
 
     async def focus_tab(self, target_id: str) -> Dict[str, Any]:
         page, resolved_target = await self._resolve_page(target_id=target_id, create=False)
@@ -295,14 +346,17 @@ class PlaywrightRuntime(
         url: str,
         timeout_ms: int,
         target_id: Optional[str] = None,
+        load: Any = None,
     ) -> Dict[str, Any]:
         clean_url = (url or "").strip()
         if not clean_url:
             raise ValueError("URL required for navigate operation")
 
         page, resolved_target = await self._resolve_page(target_id=target_id, create=True)
-        await self._goto(page, clean_url, timeout_ms)
-        return await self._tab_payload(resolved_target)
+        load_info = await self._goto(page, clean_url, timeout_ms, self._call_load_policy(load))
+        payload = await self._tab_payload(resolved_target)
+        payload["load"] = load_info
+        return payload
 
     async def click(
         self,
@@ -385,6 +439,36 @@ class PlaywrightRuntime(
             pass
         return payload
 
+    async def fill_batch(
+        self,
+        *,
+        fields: List[Dict[str, Any]],
+        target_id: Optional[str],
+        stop_on_failure: bool = False,
+    ) -> Dict[str, Any]:
+        page, resolved_target = await self._resolve_page(target_id=target_id, create=True)
+        items: List[Dict[str, Any]] = []
+        for field in fields:
+            try:
+                primary_selector, fallback_selector = self._resolve_selector(
+                    target_id=resolved_target, selector=None, ref=field.get("ref")
+                )
+            except ValueError:
+                primary_selector, fallback_selector = "", None
+            items.append(
+                {
+                    "ref": field.get("ref"),
+                    "kind": field.get("kind") or "text",
+                    "value": field.get("value"),
+                    "selector": primary_selector,
+                    "fallback_selector": fallback_selector or "",
+                }
+            )
+        results = await page.evaluate(BATCH_FILL_JS, {"items": items, "stop_on_failure": stop_on_failure})
+        payload = await self._tab_payload(resolved_target)
+        payload["fields"] = results if isinstance(results, list) else []
+        return payload
+
     async def _write_text_with_fallback(
         self,
         *,
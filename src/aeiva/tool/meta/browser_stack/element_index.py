@@ -0,0 +1,304 @@
+"""Per-snapshot match index for element matching heuristics.
+
+Matching helpers used to rebuild and casefold every node's haystack on each
+query. ``SnapshotMatchIndex`` computes each node's haystack and flags at most
+once per snapshot, on first use, and adds:
+
+- a token inverted index (query token -> bitset of nodes whose haystack
+  contains it), filled lazily and only for the nodes a query restricts to,
+  so candidate sets for later queries are a few integer ANDs;
+- bitsets (Python ints, bit ``i`` = ``index.entries[i]``) for refs,
+  enabled/writable/clickable/editable nodes and roles, each built the first
+  time a query asks for it.
+
+Indexes are cached per node list, so repeated queries against one snapshot
+(for example every step of a fill_fields call) share the work.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .element_node_utils import (
+    _NEGATIVE_ACTION_TOKENS,
+    _build_node_haystack,
+    _compact_node_match,
+    _node_has_nonempty_value,
+    _node_is_clickable,
+    _node_is_disabled,
+    _node_is_editable,
+    _node_is_readonly,
+)
+from .value_utils import _as_str
+
+_INDEX_CACHE_SIZE = 8
+
+
+def _bitset(positions: List[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _positions(mask: int) -> List[int]:
+    """Set bit positions of ``mask`` in ascending order."""
+    bits = bin(mask)[:1:-1]
+    out: List[int] = []
+    position = bits.find("1")
+    while position >= 0:
+        out.append(position)
+        position = bits.find("1", position + 1)
+    return out
+
+
+class _IndexedNode:
+    """One snapshot node; derived fields are computed on first use."""
+
+    __slots__ = (
+        "node",
+        "ref",
+        "_haystack",
+        "_name",
+        "_text",
+        "_role",
+        "_tag",
+        "_input_type",
+        "_disabled",
+        "_readonly",
+        "_editable",
+        "_clickable",
+        "_has_value",
+        "_has_aria_numeric",
+        "_negative",
+    )
+
+    def __init__(self, node: Dict[str, Any]):
+        self.node = node
+        self.ref = _as_str(node.get("ref"))
+        self._haystack: Optional[str] = None
+        self._name: Optional[str] = None
+        self._text: Optional[str] = None
+        self._role: Optional[str] = None
+        self._tag: Optional[str] = None
+        self._input_type: Optional[str] = None
+        self._disabled: Optional[bool] = None
+        self._readonly: Optional[bool] = None
+        self._editable: Optional[bool] = None
+        self._clickable: Optional[bool] = None
+        self._has_value: Optional[bool] = None
+        self._has_aria_numeric: Optional[bool] = None
+        self._negative: Optional[bool] = None
+
+    def _folded(self, key: str) -> str:
+        return str(self.node.get(key) or "").strip().casefold()
+
+    @property
+    def haystack(self) -> str:
+        if self._haystack is None:
+            self._haystack = _build_node_haystack(self.node)
+        return self._haystack
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = self._folded("name")
+        return self._name
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._folded("text")
+        return self._text
+
+    @property
+    def role(self) -> str:
+        if self._role is None:
+            self._role = self._folded("role")
+        return self._role
+
+    @property
+    def tag(self) -> str:
+        if self._tag is None:
+            self._tag = self._folded("tag")
+        return self._tag
+
+    @property
+    def input_type(self) -> str:
+        if self._input_type is None:
+            self._input_type = self._folded("input_type")
+        return self._input_type
+
+    @property
+    def disabled(self) -> bool:
+        if self._disabled is None:
+            self._disabled = _node_is_disabled(self.node)
+        return self._disabled
+
+    @property
+    def readonly(self) -> bool:
+        if self._readonly is None:
+            self._readonly = _node_is_readonly(self.node)
+        return self._readonly
+
+    @property
+    def editable(self) -> bool:
+        if self._editable is None:
+            self._editable = _node_is_editable(self.node)
+        return self._editable
+
+    @property
+    def clickable(self) -> bool:
+        if self._clickable is None:
+            self._clickable = _node_is_clickable(self.node)
+        return self._clickable
+
+    @property
+    def has_value(self) -> bool:
+        if self._has_value is None:
+            self._has_value = _node_has_nonempty_value(self.node)
+        return self._has_value
+
+    @property
+    def has_aria_numeric(self) -> bool:
+        if self._has_aria_numeric is None:
+            self._has_aria_numeric = bool(_as_str(self.node.get("aria_valuenow")))
+        return self._has_aria_numeric
+
+    @property
+    def negative(self) -> bool:
+        if self._negative is None:
+            self._negative = any(token in self.haystack for token in _NEGATIVE_ACTION_TOKENS)
+        return self._negative
+
+    def contains_hint(self, token: str) -> bool:
+        """Same result as ``_contains_hint_token(self.haystack, token)``."""
+        clean_token = (token or "").strip().casefold()
+        if not clean_token:
+            return False
+        if len(clean_token) <= 2 and clean_token.isascii():
+            return re.search(rf"\b{re.escape(clean_token)}\b", self.haystack) is not None
+        return clean_token in self.haystack
+
+    def compact(self) -> Dict[str, Any]:
+        return _compact_node_match(self.node)
+
+
+_FLAG_PREDICATES: Dict[str, Callable[[_IndexedNode], Any]] = {
+    "with_ref": lambda entry: entry.ref,
+    "nonempty": lambda entry: entry.haystack,
+    "enabled": lambda entry: not entry.disabled,
+    "writable": lambda entry: not entry.disabled and not entry.readonly,
+    "clickable": lambda entry: entry.clickable,
+    "editable": lambda entry: entry.editable,
+}
+
+
+class SnapshotMatchIndex:
+    def __init__(self, nodes: List[Any]):
+        self.nodes = nodes
+        self.size = len(nodes)
+        self.entries: List[_IndexedNode] = [_IndexedNode(node) for node in nodes if isinstance(node, dict)]
+        self.all = (1 << len(self.entries)) - 1
+        self._token_masks: Dict[Any, Tuple[int, int]] = {}
+        self._flag_masks: Dict[str, Tuple[int, int]] = {}
+        self._role_masks: Optional[Dict[str, int]] = None
+
+    def matches(self, nodes: List[Any]) -> bool:
+        return self.nodes is nodes and self.size == len(nodes)
+
+    def role_mask(self, *roles: str) -> int:
+        """Entries whose role is one of ``roles``."""
+        if self._role_masks is None:
+            positions: Dict[str, List[int]] = {}
+            for position, entry in enumerate(self.entries):
+                positions.setdefault(entry.role, []).append(position)
+            count = len(self.entries)
+            self._role_masks = {role: _bitset(items, count) for role, items in positions.items()}
+        mask = 0
+        for role in roles:
+            mask |= self._role_masks.get(role, 0)
+        return mask
+
+    def _scan(
+        self,
+        cache: Dict[Any, Tuple[int, int]],
+        key: Any,
+        within: Optional[int],
+        predicate: Callable[[_IndexedNode], Any],
+    ) -> int:
+        # Results are remembered with the entries they were checked against,
+        # so later queries only evaluate ``predicate`` on entries not yet seen.
+        within = self.all if within is None else within
+        checked, hits = cache.get(key, (0, 0))
+        missing = within & ~checked
+        if missing:
+            entries = self.entries
+            found = [position for position in _positions(missing) if predicate(entries[position])]
+            hits |= _bitset(found, len(entries))
+            cache[key] = (checked | missing, hits)
+        return hits & within
+
+    def flag_mask(self, name: str, within: Optional[int] = None) -> int:
+        """Entries in ``within`` for which flag ``name`` holds (see ``_FLAG_PREDICATES``)."""
+        return self._scan(self._flag_masks, name, within, _FLAG_PREDICATES[name])
+
+    def flags_mask(self, *names: str, within: Optional[int] = None) -> int:
+        """Entries for which every flag holds; cheap flags should come first."""
+        mask = self.all if within is None else within
+        for name in names:
+            if not mask:
+                break
+            mask = self.flag_mask(name, mask)
+        return mask
+
+    def substring_mask(self, token: str, within: Optional[int] = None) -> int:
+        """Entries in ``within`` whose haystack contains ``token``."""
+        return self._scan(self._token_masks, token, within, lambda entry: token in entry.haystack)
+
+    def all_substrings_mask(self, tokens: List[str], within: Optional[int] = None) -> int:
+        mask = self.all if within is None else within
+        for token in tokens:
+            if not mask:
+                break
+            mask = self.substring_mask(token, mask)
+        return mask
+
+    def any_substring_mask(self, tokens: Any, within: Optional[int] = None) -> int:
+        tokens = tuple(tokens)
+        return self._scan(
+            self._token_masks,
+            tokens,
+            within,
+            lambda entry: any(token in entry.haystack for token in tokens),
+        )
+
+    def iter_entries(self, mask: int) -> Iterator[_IndexedNode]:
+        """Yield entries for set bits in snapshot order."""
+        entries = self.entries
+        for position in _positions(mask):
+            yield entries[position]
+
+
+_INDEX_CACHE: "OrderedDict[int, SnapshotMatchIndex]" = OrderedDict()
+
+
+def _match_index(nodes: Any) -> SnapshotMatchIndex:
+    """Return the (cached) match index for a snapshot node list."""
+    if isinstance(nodes, SnapshotMatchIndex):
+        return nodes
+    if not isinstance(nodes, list):
+        nodes = list(nodes or [])
+    key = id(nodes)
+    index = _INDEX_CACHE.get(key)
+    if index is not None and index.matches(nodes):
+        _INDEX_CACHE.move_to_end(key)
+        return index
+    index = SnapshotMatchIndex(nodes)
+    # The cache holds the list itself, so its id cannot be reused while cached.
+    _INDEX_CACHE[key] = index
+    while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return index
@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import heapq
 import re
+from operator import itemgetter
 from typing import Any, Dict, Optional
 
 from .value_utils import _as_str
+from .element_index import _match_index
 from .element_node_utils import (
     _build_node_haystack,
-    _compact_node_match,
-    _contains_hint_token,
     _looks_like_date_literal,
-    _node_has_nonempty_value,
-    _node_is_clickable,
     _node_is_disabled,
     _node_is_editable,
     _node_is_readonly,
     _node_looks_negative_action,
 )
 
+_SCORE = itemgetter(0)
+
+
+def _top_scored(ranked: Any, limit: Optional[int]) -> list[tuple[int, Any]]:
+    """Highest scores first, ties in snapshot order (same as a stable sort)."""
+    if limit is None:
+        return sorted(ranked, key=_SCORE, reverse=True)
+    return heapq.nlargest(max(0, int(limit)), ranked, key=_SCORE)
+
 
 def _find_scroll_recovery_refs(nodes: list[Any], *, max_results: int = 8) -> list[Dict[str, Any]]:
     keywords = (
@@ -39,32 +47,25 @@ def _find_scroll_recovery_refs(nodes: list[Any], *, max_results: int = 8) -> lis
         "下一步",
         "提交",
     )
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        haystack = _build_node_haystack(node)
-        if not haystack:
-            continue
+    index = _match_index(nodes)
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(index.any_substring_mask(keywords, index.flag_mask("with_ref"))):
+        haystack = entry.haystack
         score = 0
         for token in keywords:
             if token in haystack:
                 score += 10
         if score == 0:
             continue
-        role = _as_str(node.get("role")) or ""
+        role = _as_str(entry.node.get("role")) or ""
         if role in {"button", "option", "link", "menuitem"}:
             score += 6
-        disabled_text = (_as_str(node.get("disabled")) or "").lower()
+        disabled_text = (_as_str(entry.node.get("disabled")) or "").lower()
         if disabled_text in {"true", "1"}:
             score -= 20
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return [item for _, item in ranked[:max_results]]
+    return [entry.compact() for _, entry in _top_scored(ranked, max_results)]
 
 
 def _find_click_target_candidates_from_nodes(
@@ -80,22 +81,12 @@ def _find_click_target_candidates_from_nodes(
     if not tokens:
         return []
 
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        if _node_is_disabled(node):
-            continue
-        if not _node_is_clickable(node):
-            continue
-
-        haystack = _build_node_haystack(node)
-        if not haystack:
-            continue
-
+    index = _match_index(nodes)
+    # A phrase match implies every token matches, so tokens bound the candidates.
+    mask = index.all_substrings_mask(tokens, index.flags_mask("with_ref", "enabled", "clickable"))
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(mask):
+        haystack = entry.haystack
         score = 0
         if clean in haystack:
             score += 90
@@ -104,32 +95,25 @@ def _find_click_target_candidates_from_nodes(
         else:
             continue
 
-        name = str(node.get("name") or "").strip().casefold()
-        text = str(node.get("text") or "").strip().casefold()
+        name = entry.name
+        text = entry.text
         if name == clean or text == clean:
             score += 25
         if clean in name or clean in text:
             score += 10
 
-        role = str(node.get("role") or "").strip().casefold()
-        if role in {"button", "option", "link", "menuitem", "tab"}:
+        if entry.role in {"button", "option", "link", "menuitem", "tab"}:
             score += 6
-        if _node_looks_negative_action(node):
+        if entry.negative:
             score -= 30
 
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
-    if not ranked:
-        return []
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    out: list[Dict[str, Any]] = []
-    for score, item in ranked:
-        if score <= 0:
-            continue
-        out.append(item)
-        if len(out) >= max(1, int(max_results)):
-            break
-    return out
+    return [
+        entry.compact()
+        for score, entry in _top_scored(ranked, max(1, int(max_results)))
+        if score > 0
+    ]
 
 
 def _find_click_target_from_nodes(nodes: list[Any], *, query_text: str) -> Optional[Dict[str, Any]]:
@@ -162,21 +146,11 @@ def _find_confirm_target_from_nodes(
         if matched is not None and not _node_looks_negative_action(matched):
             return matched
 
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        if _node_is_disabled(node):
-            continue
-        if not _node_is_clickable(node):
-            continue
-
-        haystack = _build_node_haystack(node)
-        if not haystack:
-            continue
+    index = _match_index(nodes)
+    mask = index.any_substring_mask(_CONFIRM_KEYWORDS, index.flags_mask("with_ref", "enabled", "clickable"))
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(mask):
+        haystack = entry.haystack
         score = 0
         for token in _CONFIRM_KEYWORDS:
             if token in haystack:
@@ -191,20 +165,18 @@ def _find_confirm_target_from_nodes(
             score -= search_action_hits * 18
         else:
             score += date_confirm_hits * 6
-        role = str(node.get("role") or "").strip().casefold()
-        if role in {"button", "option", "menuitem"}:
+        if entry.role in {"button", "option", "menuitem"}:
             score += 6
-        if _node_looks_negative_action(node):
+        if entry.negative:
             score -= 50
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
     if not ranked:
         return None
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    best_score, best = ranked[0]
+    best_score, best = _top_scored(ranked, 1)[0]
     if best_score <= 0:
         return None
-    return best
+    return best.compact()
 
 
 def _find_type_target_from_nodes(
@@ -217,6 +189,7 @@ def _find_type_target_from_nodes(
         nodes=nodes,
         value_text=value_text,
         field_hint=field_hint,
+        limit=1,
     )
     if not ranked:
         return None
@@ -233,12 +206,13 @@ def _find_type_target_candidates_from_nodes(
     field_hint: Optional[str] = None,
     max_results: int = 3,
 ) -> list[Dict[str, Any]]:
+    limit = max(1, int(max_results))
     ranked = _rank_type_targets_from_nodes(
         nodes=nodes,
         value_text=value_text,
         field_hint=field_hint,
+        limit=limit,
     )
-    limit = max(1, int(max_results))
     out: list[Dict[str, Any]] = []
     for score, item in ranked:
         if score <= 0:
@@ -254,6 +228,7 @@ def _rank_type_targets_from_nodes(
     nodes: list[Any],
     value_text: str,
     field_hint: Optional[str],
+    limit: Optional[int] = None,
 ) -> list[tuple[int, Dict[str, Any]]]:
     value = (value_text or "").strip()
     if not value:
@@ -263,23 +238,16 @@ def _rank_type_targets_from_nodes(
     field_tokens = [token for token in clean_field.split() if token]
     intent = _infer_input_intent(value)
 
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        if _node_is_disabled(node) or _node_is_readonly(node):
-            continue
-
-        haystack = _build_node_haystack(node)
-        role = str(node.get("role") or "").strip().casefold()
-        input_type = str(node.get("input_type") or "").strip().casefold()
-        tag = str(node.get("tag") or "").strip().casefold()
-        editable = _node_is_editable(node)
-        clickable = _node_is_clickable(node)
-        has_aria_numeric = bool(_as_str(node.get("aria_valuenow")))
+    index = _match_index(nodes)
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(index.flags_mask("with_ref", "writable")):
+        haystack = entry.haystack
+        role = entry.role
+        input_type = entry.input_type
+        tag = entry.tag
+        editable = entry.editable
+        clickable = entry.clickable
+        has_aria_numeric = entry.has_aria_numeric
         date_hint = any(token in haystack for token in _DATE_HINT_TOKENS)
         numeric_control = role == "spinbutton" or input_type in {"number", "range"} or has_aria_numeric
         date_control = input_type in {"date", "datetime-local", "time"} or date_hint
@@ -297,7 +265,7 @@ def _rank_type_targets_from_nodes(
             continue
 
         score = 0
-        has_value = _node_has_nonempty_value(node)
+        has_value = entry.has_value
 
         if role in {"combobox", "textbox", "searchbox", "spinbutton"}:
             score += 10
@@ -336,7 +304,7 @@ def _rank_type_targets_from_nodes(
         if clean_field:
             if len(clean_field) > 2 and clean_field in haystack:
                 score += 40
-            elif field_tokens and all(_contains_hint_token(haystack, token) for token in field_tokens):
+            elif field_tokens and all(entry.contains_hint(token) for token in field_tokens):
                 score += 20
 
         if intent == "numeric":
@@ -348,10 +316,9 @@ def _rank_type_targets_from_nodes(
             if date_hint:
                 score += 8
 
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return ranked
+    return [(score, entry.compact()) for score, entry in _top_scored(ranked, limit)]
 
 
 def _find_select_target_from_nodes(
@@ -364,6 +331,7 @@ def _find_select_target_from_nodes(
         nodes=nodes,
         values=values,
         field_hint=field_hint,
+        limit=1,
     )
     if not ranked:
         return None
@@ -380,12 +348,13 @@ def _find_select_target_candidates_from_nodes(
     field_hint: Optional[str] = None,
     max_results: int = 3,
 ) -> list[Dict[str, Any]]:
+    limit = max(1, int(max_results))
     ranked = _rank_select_targets_from_nodes(
         nodes=nodes,
         values=values,
         field_hint=field_hint,
+        limit=limit,
     )
-    limit = max(1, int(max_results))
     out: list[Dict[str, Any]] = []
     for score, item in ranked:
         if score <= 0:
@@ -401,30 +370,22 @@ def _rank_select_targets_from_nodes(
     nodes: list[Any],
     values: list[str],
     field_hint: Optional[str],
+    limit: Optional[int] = None,
 ) -> list[tuple[int, Dict[str, Any]]]:
     clean_field = (field_hint or "").strip().casefold()
     field_tokens = [token for token in clean_field.split() if token]
     value_tokens = [str(v).strip().casefold() for v in values if str(v).strip()]
 
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        if _node_is_disabled(node) or _node_is_readonly(node):
-            continue
-        role = str(node.get("role") or "").strip().casefold()
-        selectable_role = role in {"select", "combobox", "listbox", "option"}
-        if not (selectable_role or _node_is_clickable(node) or _node_is_editable(node)):
-            continue
-
-        haystack = _build_node_haystack(node)
-        if not haystack:
-            continue
+    index = _match_index(nodes)
+    candidates = index.flags_mask("with_ref", "writable", "nonempty")
+    targetable = candidates & index.role_mask("select", "combobox", "listbox", "option")
+    targetable |= index.flag_mask("clickable", candidates & ~targetable)
+    targetable |= index.flag_mask("editable", candidates & ~targetable)
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(targetable):
+        role = entry.role
         score = 0
-        has_value = _node_has_nonempty_value(node)
+        has_value = entry.has_value
         if role in {"select", "combobox", "listbox"}:
             score += 24
         elif role in {"option", "menuitem"}:
@@ -433,50 +394,38 @@ def _rank_select_targets_from_nodes(
             score += 8
 
         if clean_field:
-            if len(clean_field) > 2 and clean_field in haystack:
+            if len(clean_field) > 2 and clean_field in entry.haystack:
                 score += 36
-            elif field_tokens and all(_contains_hint_token(haystack, token) for token in field_tokens):
+            elif field_tokens and all(entry.contains_hint(token) for token in field_tokens):
                 score += 18
 
-        if value_tokens and all(_contains_hint_token(haystack, token) for token in value_tokens):
+        if value_tokens and all(entry.contains_hint(token) for token in value_tokens):
             score += 8
 
         if not clean_field and has_value:
             score -= 10
 
-        if _node_looks_negative_action(node):
+        if entry.negative:
             score -= 35
 
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return ranked
+    return [(score, entry.compact()) for score, entry in _top_scored(ranked, limit)]
 
 
 def _find_editable_recovery_refs(nodes: list[Any], *, max_results: int = 8) -> list[Dict[str, Any]]:
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        ref = _as_str(node.get("ref"))
-        if not ref:
-            continue
-        if _node_is_disabled(node) or _node_is_readonly(node):
-            continue
-        if not _node_is_editable(node):
-            continue
+    index = _match_index(nodes)
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(index.flags_mask("with_ref", "writable", "editable")):
         score = 0
-        role = str(node.get("role") or "").strip().casefold()
-        input_type = str(node.get("input_type") or "").strip().casefold()
-        if role in {"combobox", "textbox", "searchbox", "spinbutton"}:
+        if entry.role in {"combobox", "textbox", "searchbox", "spinbutton"}:
             score += 8
-        if input_type in {"date", "datetime-local", "number", "range"}:
+        if entry.input_type in {"date", "datetime-local", "number", "range"}:
             score += 5
-        if _node_has_nonempty_value(node):
+        if entry.has_value:
             score -= 3
-        ranked.append((score, _compact_node_match(node)))
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return [item for _, item in ranked[:max_results]]
+        ranked.append((score, entry))
+    return [entry.compact() for _, entry in _top_scored(ranked, max_results)]
 
 
 def _pick_editable_recovery_ref(refs: list[Any]) -> Optional[str]:
@@ -529,14 +478,10 @@ def _match_snapshot_nodes(nodes: list[Any], query: str, *, max_results: int = 20
         return []
 
     tokens = [token for token in clean.split() if token]
-    ranked: list[tuple[int, Dict[str, Any]]] = []
-    for node in nodes:
-        if not isinstance(node, dict):
-            continue
-        haystack = _build_node_haystack(node)
-        if not haystack:
-            continue
-
+    index = _match_index(nodes)
+    ranked: list[tuple[int, Any]] = []
+    for entry in index.iter_entries(index.all_substrings_mask(tokens, index.flag_mask("nonempty"))):
+        haystack = entry.haystack
         if clean in haystack:
             score = 100
         elif tokens and all(token in haystack for token in tokens):
@@ -544,15 +489,14 @@ def _match_snapshot_nodes(nodes: list[Any], query: str, *, max_results: int = 20
         else:
             continue
 
-        if clean in str(node.get("name", "")).casefold():
+        if clean in str(entry.node.get("name", "")).casefold():
             score += 15
-        if clean in str(node.get("text", "")).casefold():
+        if clean in str(entry.node.get("text", "")).casefold():
             score += 8
 
-        ranked.append((score, _compact_node_match(node)))
+        ranked.append((score, entry))
 
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return [item for _, item in ranked[:max_results]]
+    return [entry.compact() for _, entry in _top_scored(ranked, max_results)]
 
 
 def _is_stale_target_error(exc: Exception) -> bool:
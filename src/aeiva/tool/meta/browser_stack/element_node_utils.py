@@ -22,32 +22,36 @@ _NEGATIVE_ACTION_TOKENS = {
 }
 
 
+_HAYSTACK_KEYS = (
+    "ref",
+    "tag",
+    "role",
+    "name",
+    "label_text",
+    "name_attr",
+    "dom_id",
+    "text",
+    "value",
+    "aria_label",
+    "aria_valuenow",
+    "placeholder",
+    "input_type",
+    "selector",
+    "fallback_selector",
+)
+
+
 def _build_node_haystack(node: Dict[str, Any]) -> str:
     parts: list[str] = []
-    for key in (
-        "ref",
-        "tag",
-        "role",
-        "name",
-        "label_text",
-        "name_attr",
-        "dom_id",
-        "text",
-        "value",
-        "aria_label",
-        "aria_valuenow",
-        "placeholder",
-        "input_type",
-        "selector",
-        "fallback_selector",
-    ):
+    for key in _HAYSTACK_KEYS:
         value = node.get(key)
         if value is None:
             continue
-        text = str(value).strip().casefold()
+        text = str(value).strip()
         if text:
             parts.append(text)
-    return " ".join(parts)
+    # casefold maps characters independently, so folding the joined string is equivalent.
+    return " ".join(parts).casefold()
 
 
 def _compact_node_match(node: Dict[str, Any]) -> Dict[str, Any]:
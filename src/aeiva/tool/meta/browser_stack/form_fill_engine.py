@@ -18,6 +18,13 @@ from .logging_utils import _log_browser_event
 
 logger = logging.getLogger(__name__)
 
+_BATCH_TEXT_OPERATIONS = frozenset({"type", "fill", "set_number"})
+_BATCH_SELECT_OPERATIONS = frozenset({"select", "choose_option"})
+# Input types that behave like a text box when their value is assigned directly.
+# Date/time pickers, checkables, files and ranges keep the per-step Playwright path.
+_BATCH_INPUT_TYPES = frozenset({"", "text", "email", "search", "tel", "url", "password", "number"})
+_BATCH_INPUT_ROLES = frozenset({"input", "textarea", "select", "textbox", "searchbox", "spinbutton"})
+
 
 @dataclass(frozen=True)
 class FillFieldsHelpers:
@@ -52,6 +59,11 @@ class _FillFieldsRunContext:
     results: list[Dict[str, Any]] = field(default_factory=list)
     deduplicated_steps: int = 0
     retry_count: int = 0
+    batch: bool = False
+    ref_nodes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    batched_payloads: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    batch_attempted: set[int] = field(default_factory=set)
+    batched_steps: int = 0
 
 
 class FillFieldsEngine(FillFieldsStepOpsMixin):
@@ -171,6 +183,7 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
             max_retries_per_step=max_retries_per_step,
             retry_delay_ms=retry_delay_ms,
             default_step_timeout_ms=default_step_timeout_ms,
+            batch=self._h.as_bool(payload_req.get("batch"), default=False),
         )
 
         if self._h.as_bool(payload_req.get("prefetch_refs"), default=True):
@@ -194,6 +207,9 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
             prefetched_confirm_ref = self._h.as_str(prefetch.get("confirm_ref"))
             if prefetched_confirm_ref:
                 context.cached_confirm_ref = prefetched_confirm_ref
+            prefetch_nodes = prefetch.get("nodes")
+            if isinstance(prefetch_nodes, dict):
+                context.ref_nodes.update(prefetch_nodes)
         return context
 
     async def _execute_fill_fields_steps(
@@ -253,15 +269,22 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
                 )
             )
 
+            if context.batch and index not in context.batch_attempted:
+                await self._run_fill_fields_batch(context, start=index, first_step=step)
+            batched_payload = context.batched_payloads.pop(index, None)
+
             try:
-                step_payload = await self.run_fill_fields_step_operation(
-                    profile=context.profile,
-                    headless=context.headless,
-                    timeout_ms=step_timeout_ms,
-                    target_id=context.active_target,
-                    step=step,
-                    operation=op,
-                )
+                if batched_payload is not None:
+                    step_payload = batched_payload
+                else:
+                    step_payload = await self.run_fill_fields_step_operation(
+                        profile=context.profile,
+                        headless=context.headless,
+                        timeout_ms=step_timeout_ms,
+                        target_id=context.active_target,
+                        step=step,
+                        operation=op,
+                    )
                 retried = False
             except Exception as exc:
                 _log_browser_event(
@@ -433,8 +456,143 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
             "had_errors": error_count > 0,
             "deduplicated_steps": context.deduplicated_steps,
             "retry_count": context.retry_count,
+            "batched_steps": context.batched_steps,
+        }
+
+    def _batch_fill_item(
+        self,
+        context: _FillFieldsRunContext,
+        step: Dict[str, Any],
+        operation: str,
+    ) -> Optional[Dict[str, Any]]:
+        if operation in _BATCH_TEXT_OPERATIONS:
+            kind = "text"
+            value = self._h.as_str(step.get("value")) or self._h.as_str(step.get("text"))
+        elif operation in _BATCH_SELECT_OPERATIONS:
+            kind = "select"
+            raw_values = step.get("values")
+            if raw_values is None and step.get("value") is not None:
+                raw_values = step.get("value")
+            try:
+                values = self._h.normalize_values(raw_values)
+            except Exception:
+                values = []
+            value = values[0] if len(values) == 1 else None
+        else:
+            return None
+        if value is None or self._h.as_str(step.get("selector")):
+            return None
+        if any(self._h.as_bool(step.get(key), default=False) for key in ("submit", "slowly", "confirm")):
+            return None
+        field_key = self._h.build_fill_fields_field_key(step)
+        ref = self._h.as_str(step.get("ref")) or (context.field_ref_cache.get(field_key) if field_key else None)
+        node = context.ref_nodes.get(ref) if ref else None
+        if not isinstance(node, dict) or node.get("disabled") or node.get("readonly"):
+            return None
+        if node.get("scope") != "main":
+            # The batch script only searches the main document and ref
+            # counters are per frame, so a frame field could land on an
+            # unrelated main-document input.
+            return None
+        tag = str(node.get("tag") or "").lower()
+        role = str(node.get("role") or tag).lower()
+        if role not in _BATCH_INPUT_ROLES:
+            # Comboboxes, listboxes and other ARIA widgets need real input events.
+            return None
+        if kind == "select":
+            if tag != "select":
+                return None
+        elif tag == "input":
+            if str(node.get("input_type") or "").lower() not in _BATCH_INPUT_TYPES:
+                return None
+        elif tag != "textarea":
+            return None
+        return {
+            "ref": ref,
+            "kind": kind,
+            "value": value,
+            "field_hint": (
+                self._h.as_str(step.get("field"))
+                or self._h.as_str(step.get("label"))
+                or self._h.as_str(step.get("name"))
+            ),
         }
 
+    async def _run_fill_fields_batch(
+        self,
+        context: _FillFieldsRunContext,
+        *,
+        start: int,
+        first_step: Dict[str, Any],
+    ) -> None:
+        """Apply the run of plain-field steps starting at ``start`` in one page call.
+
+        Steps the batch cannot set (or whose value does not read back) get no
+        payload and run through the normal per-step path afterwards. A run
+        ends before a field it already sets, and without ``continue_on_error``
+        the page stops at the first failure, so per-step fallbacks never land
+        after a later write.
+        """
+        first_op = self._h.extract_operation_name(first_step)
+        first_item = self._batch_fill_item(context, first_step, first_op)
+        if first_item is None:
+            return
+        run: list[tuple[int, Dict[str, Any]]] = [(start, first_item)]
+        run_refs = {first_item["ref"]}
+        previous_signature = context.previous_signature
+        for index in range(start + 1, len(context.steps)):
+            step = context.steps[index]
+            if not isinstance(step, dict):
+                break
+            op = self._h.extract_operation_name(step)
+            if not op:
+                break
+            signature = self._h.build_fill_fields_step_signature(step=step, operation=op)
+            if context.deduplicate_repeats and signature == previous_signature:
+                continue
+            previous_signature = signature
+            item = self._batch_fill_item(context, step, op)
+            if item is None or item["ref"] in run_refs:
+                break
+            run.append((index, item))
+            run_refs.add(item["ref"])
+        context.batch_attempted.update(index for index, _ in run)
+
+        try:
+            batch_payload = await self._service._run_fill_batch(
+                profile=context.profile,
+                headless=context.headless,
+                target_id=context.active_target,
+                fields=[item for _, item in run],
+                stop_on_failure=not context.continue_on_error,
+            )
+        except Exception as exc:
+            _log_browser_event(
+                logger,
+                level=logging.DEBUG,
+                event="fill_batch_failed",
+                profile=context.profile,
+                steps=len(run),
+                error=exc,
+            )
+            return
+        applied = set(batch_payload.get("applied_indexes") or [])
+        batch_target = self._h.as_str(batch_payload.get("target_id")) or context.active_target
+        applied_steps = 0
+        for position, (index, item) in enumerate(run):
+            if position in applied:
+                context.batched_payloads[index] = {"target_id": batch_target, "resolved_ref": item["ref"]}
+                applied_steps += 1
+        context.batched_steps += applied_steps
+        _log_browser_event(
+            logger,
+            level=logging.DEBUG,
+            event="fill_batch_applied",
+            profile=context.profile,
+            steps=len(run),
+            applied=applied_steps,
+        )
+
     async def prefetch_fill_fields_refs(
         self,
         *,
@@ -482,6 +640,7 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
             return {"refs": {}, "target_id": target_id}
 
         refs: Dict[str, str] = {}
+        nodes_by_ref: Dict[str, Dict[str, Any]] = {}
         for field_key, op, step in descriptors:
             field_hint = (
                 self._h.as_str(step.get("field"))
@@ -513,9 +672,15 @@ class FillFieldsEngine(FillFieldsStepOpsMixin):
             ref = self._h.as_str((matched or {}).get("ref"))
             if ref:
                 refs[field_key] = ref
+        if refs:
+            wanted = set(refs.values())
+            for node in nodes:
+                if isinstance(node, dict) and node.get("ref") in wanted:
+                    nodes_by_ref[node["ref"]] = node
 
         return {
             "refs": refs,
+            "nodes": nodes_by_ref,
             "confirm_ref": self._h.as_str((_find_confirm_target_from_nodes(nodes) or {}).get("ref")),
             "target_id": resolved_target_id or target_id,
         }
@@ -11,8 +11,12 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Deque, Dict, List, Optional, Protocol
 
+from .runtime_load_policy import LoadPolicy, NavigationStats
+
 
 MAX_EVENT_HISTORY = 200
+# Recent snapshots a `since` delta can be taken against.
+MAX_SNAPSHOT_BASES = 8
 DEFAULT_TIMEOUT_MS = 30_000
 DEFAULT_POST_GOTO_SETTLE_MS = 650
 DEFAULT_TYPE_DELAY_MS = 6
@@ -206,6 +210,16 @@ class TabState:
     page: Any
     refs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     events: TabEvents = field(default_factory=TabEvents)
+    snapshot_seq: int = 0
+    snapshot_id: Optional[str] = None
+    # snapshot_id -> (url, nodes by ref), oldest first. Internal lookups take
+    # snapshots too, so one base is not enough between two `since` calls.
+    snapshot_bases: Dict[str, tuple[str, Dict[str, Dict[str, Any]]]] = field(default_factory=dict)
+    # Per-scope ("main", "frame-1", ...) in-page snapshot state for incremental mode.
+    snapshot_frames: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Per-navigation load policy override (None -> session policy) and accounting.
+    load_policy: Optional[LoadPolicy] = None
+    nav: NavigationStats = field(default_factory=NavigationStats)
 
 
 class BrowserRuntime(Protocol):
@@ -217,7 +231,7 @@ class BrowserRuntime(Protocol):
 
     async def list_tabs(self) -> List[Dict[str, Any]]: ...
 
-    async def open_tab(self, url: str, timeout_ms: int) -> Dict[str, Any]: ...
+    async def open_tab(self, url: str, timeout_ms: int, load: Any = None) -> Dict[str, Any]: ...
 
     async def focus_tab(self, target_id: str) -> Dict[str, Any]: ...
 
@@ -249,6 +263,7 @@ class BrowserRuntime(Protocol):
         url: str,
         timeout_ms: int,
         target_id: Optional[str] = None,
+        load: Any = None,
     ) -> Dict[str, Any]: ...
 
     async def click(
@@ -400,6 +415,8 @@ class BrowserRuntime(Protocol):
         target_id: Optional[str],
         timeout_ms: int,
         limit: int,
+        since: Optional[str] = None,
+        incremental: Optional[bool] = None,
     ) -> Dict[str, Any]: ...
 
     async def get_console(
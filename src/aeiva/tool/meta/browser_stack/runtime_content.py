@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
 from .logging_utils import _log_browser_event
-from .runtime_common import _coerce_bool, _safe_title
-from .runtime_snapshot_script import _SNAPSHOT_JS
+from .runtime_common import MAX_SNAPSHOT_BASES, _coerce_bool, _safe_title
+from .runtime_snapshot_script import _INCREMENTAL_SNAPSHOT_JS, _SNAPSHOT_JS
 
 logger = logging.getLogger(__name__)
 
@@ -135,30 +136,51 @@ class RuntimeContentMixin:
         target_id: Optional[str],
         timeout_ms: int,
         limit: int,
+        since: Optional[str] = None,
+        incremental: Optional[bool] = None,
     ) -> Dict[str, Any]:
         page, resolved_target = await self._resolve_page(target_id=target_id, create=True)
         await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
 
         max_items = max(1, min(int(limit), 200))
-        raw_scoped_nodes: List[tuple[str, List[Dict[str, Any]]]] = []
+        tab = self._tab_states.get(resolved_target)
+        if incremental is None:
+            incremental = getattr(self, "_incremental_snapshots", False)
         contexts = [("main", page)]
         for idx, frame in enumerate(self._iter_locator_contexts(page)[1:], start=1):
             contexts.append((f"frame-{idx}", frame))
 
+        frame_states: Dict[str, Dict[str, Any]] = tab.snapshot_frames if tab is not None else {}
+        if incremental:
+            live_scopes = {scope for scope, _ in contexts}
+            for stale in [scope for scope in frame_states if scope not in live_scopes]:
+                frame_states.pop(stale, None)
+        # Frames are independent documents, so evaluate them concurrently.
+        results = await asyncio.gather(
+            *(
+                self._snapshot_nodes_for_context(
+                    context,
+                    max_items,
+                    frame_state=frame_states.setdefault(scope, {}) if incremental else None,
+                )
+                for scope, context in contexts
+            )
+        )
+
+        raw_scoped_nodes: List[tuple[str, List[Dict[str, Any]]]] = []
         collected = 0
-        for scope, context in contexts:
+        for (scope, _), scoped in zip(contexts, results):
             remaining = max_items - collected
             if remaining <= 0:
                 break
-            nodes = await self._snapshot_nodes_for_context(context, remaining)
-            if not nodes:
+            scoped = scoped[:remaining]
+            if not scoped:
                 continue
-            raw_scoped_nodes.append((scope, nodes))
-            collected += len(nodes)
+            raw_scoped_nodes.append((scope, scoped))
+            collected += len(scoped)
 
         ref_map: Dict[str, Dict[str, Any]] = {}
         nodes: List[Dict[str, Any]] = []
-        lines: List[str] = []
 
         emitted = 0
         for scope, scoped_nodes in raw_scoped_nodes:
@@ -166,83 +188,122 @@ class RuntimeContentMixin:
                 if not isinstance(node, dict):
                     continue
                 emitted += 1
-                raw_ref = _safe_title(node.get("ref")).strip() or f"e{emitted}"
-                ref = raw_ref if scope == "main" else f"{scope}:{raw_ref}"
-                selector = _safe_title(node.get("selector")).strip()
-                fallback_selector = _safe_title(node.get("fallback_selector")).strip()
-                if not selector and not fallback_selector:
+                entry = self._normalize_snapshot_node(node, scope=scope, ordinal=emitted)
+                if entry is None:
                     continue
+                # The ref table only needs what ``_resolve_selector`` reads; full
+                # nodes already live in ``tab.snapshot_bases``.
+                ref_map[entry["ref"]] = {
+                    "selector": entry["selector"],
+                    "fallback_selector": entry["fallback_selector"],
+                }
+                nodes.append(entry)
 
-                role = _safe_title(node.get("role")).strip() or _safe_title(node.get("tag")).strip()
-                tag = _safe_title(node.get("tag")).strip()
-                name = _safe_title(node.get("name")).strip()
-                text_value = _safe_title(node.get("text")).strip()
-                aria_label = _safe_title(node.get("aria_label")).strip()
-                placeholder = _safe_title(node.get("placeholder")).strip()
-                value = _safe_title(node.get("value")).strip()
-                aria_valuenow = _safe_title(node.get("aria_valuenow")).strip()
-                input_type = _safe_title(node.get("input_type")).strip()
-                dom_id = _safe_title(node.get("dom_id")).strip()
-                name_attr = _safe_title(node.get("name_attr")).strip()
-                label_text = _safe_title(node.get("label_text")).strip()
-                readonly = _coerce_bool(node.get("readonly"))
-                disabled = _coerce_bool(node.get("disabled"))
+        url = _safe_title(getattr(page, "url", ""))
+        payload: Dict[str, Any] = {
+            "target_id": resolved_target,
+            "url": url,
+            "nodes": nodes,
+            "snapshot": "\n".join(self._snapshot_line(node) for node in nodes),
+        }
+        if tab is None:
+            return payload
 
-                ref_map[ref] = {
-                    "selector": selector or fallback_selector,
-                    "fallback_selector": fallback_selector or None,
-                    "tag": tag,
-                    "role": role,
-                    "name": name,
-                    "text": text_value,
-                    "aria_label": aria_label,
-                    "placeholder": placeholder,
-                    "value": value,
-                    "aria_valuenow": aria_valuenow,
-                    "input_type": input_type,
-                    "dom_id": dom_id,
-                    "name_attr": name_attr,
-                    "label_text": label_text,
-                    "readonly": readonly,
-                    "disabled": disabled,
-                    "scope": scope,
-                }
+        tab.refs = ref_map
+        since = _safe_title(since).strip()
+        base = tab.snapshot_bases.get(since) if since else None
+        tab.snapshot_seq += 1
+        tab.snapshot_id = f"snap-{tab.snapshot_seq}"
+        tab.snapshot_bases[tab.snapshot_id] = (url, {node["ref"]: node for node in nodes})
+        while len(tab.snapshot_bases) > MAX_SNAPSHOT_BASES:
+            tab.snapshot_bases.pop(next(iter(tab.snapshot_bases)))
+        payload["snapshot_id"] = tab.snapshot_id
 
-                nodes.append(
-                    {
-                        "ref": ref,
-                        "scope": scope,
-                        "tag": tag,
-                        "role": role,
-                        "name": name,
-                        "text": text_value,
-                        "aria_label": aria_label,
-                        "placeholder": placeholder,
-                        "value": value,
-                        "aria_valuenow": aria_valuenow,
-                        "input_type": input_type,
-                        "dom_id": dom_id,
-                        "name_attr": name_attr,
-                        "label_text": label_text,
-                        "readonly": readonly,
-                        "disabled": disabled,
-                        "selector": selector or fallback_selector,
-                        "fallback_selector": fallback_selector or None,
-                    }
-                )
+        if base is not None and base[0] == url:
+            payload.update(self._snapshot_delta(since, base[1], nodes))
+        elif since:
+            payload["base_snapshot_id"] = None
+            payload["delta_fallback"] = "base snapshot expired; returning full snapshot"
+        return payload
 
-                line_label = name or label_text or name_attr or text_value or value or selector or fallback_selector
-                scope_prefix = "" if scope == "main" else f"{scope} "
-                lines.append(f"{ref} [{scope_prefix}{role or 'node'}] {line_label}".strip())
+    @staticmethod
+    def _normalize_snapshot_node(
+        node: Dict[str, Any],
+        *,
+        scope: str,
+        ordinal: int,
+    ) -> Optional[Dict[str, Any]]:
+        raw_ref = _safe_title(node.get("ref")).strip() or f"e{ordinal}"
+        ref = raw_ref if scope == "main" else f"{scope}:{raw_ref}"
+        selector = _safe_title(node.get("selector")).strip()
+        fallback_selector = _safe_title(node.get("fallback_selector")).strip()
+        if not selector and not fallback_selector:
+            return None
 
-        tab = self._tab_states.get(resolved_target)
-        if tab is not None:
-            tab.refs = ref_map
+        tag = _safe_title(node.get("tag")).strip()
+        return {
+            "ref": ref,
+            "scope": scope,
+            "tag": tag,
+            "role": _safe_title(node.get("role")).strip() or tag,
+            "name": _safe_title(node.get("name")).strip(),
+            "text": _safe_title(node.get("text")).strip(),
+            "aria_label": _safe_title(node.get("aria_label")).strip(),
+            "placeholder": _safe_title(node.get("placeholder")).strip(),
+            "value": _safe_title(node.get("value")).strip(),
+            "aria_valuenow": _safe_title(node.get("aria_valuenow")).strip(),
+            "input_type": _safe_title(node.get("input_type")).strip(),
+            "dom_id": _safe_title(node.get("dom_id")).strip(),
+            "name_attr": _safe_title(node.get("name_attr")).strip(),
+            "label_text": _safe_title(node.get("label_text")).strip(),
+            "readonly": _coerce_bool(node.get("readonly")),
+            "disabled": _coerce_bool(node.get("disabled")),
+            "selector": selector or fallback_selector,
+            "fallback_selector": fallback_selector or None,
+        }
 
+    @staticmethod
+    def _snapshot_line(node: Dict[str, Any], marker: str = "") -> str:
+        line_label = (
+            node["name"]
+            or node["label_text"]
+            or node["name_attr"]
+            or node["text"]
+            or node["value"]
+            or node["selector"]
+            or node["fallback_selector"]
+            or ""
+        )
+        scope = node["scope"]
+        scope_prefix = "" if scope == "main" else f"{scope} "
+        return f"{marker}{node['ref']} [{scope_prefix}{node['role'] or 'node'}] {line_label}".strip()
+
+    def _snapshot_delta(
+        self,
+        since: str,
+        previous: Dict[str, Dict[str, Any]],
+        nodes: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Reduce a snapshot to what changed since ``previous`` (the ``since`` snapshot)."""
+        current_refs = {node["ref"] for node in nodes}
+        added = [node for node in nodes if node["ref"] not in previous]
+        changed = [node for node in nodes if node["ref"] in previous and previous[node["ref"]] != node]
+        removed = [ref for ref in previous if ref not in current_refs]
+
+        lines = [self._snapshot_line(node, "+ ") for node in added]
+        lines.extend(self._snapshot_line(node, "~ ") for node in changed)
+        lines.extend(f"- {ref}" for ref in removed)
+        if not lines:
+            lines.append(f"(no changes since {since})")
         return {
-            "target_id": resolved_target,
-            "url": _safe_title(getattr(page, "url", "")),
-            "nodes": nodes,
+            "base_snapshot_id": since,
+            "nodes": added + changed,
+            "delta": {
+                "added": [node["ref"] for node in added],
+                "changed": [node["ref"] for node in changed],
+                "removed": removed,
+                "unchanged": len(nodes) - len(added) - len(changed),
+            },
             "snapshot": "\n".join(lines),
         }
 
@@ -250,7 +311,10 @@ class RuntimeContentMixin:
         self,
         context: Any,
         limit: int,
+        frame_state: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
+        if frame_state is not None:
+            return await self._incremental_nodes_for_context(context, limit, frame_state)
         try:
             nodes = await context.evaluate(_SNAPSHOT_JS, {"limit": max(1, min(limit, 200))})
         except Exception as exc:
@@ -269,6 +333,52 @@ class RuntimeContentMixin:
                 normalized.append(node)
         return normalized
 
+    async def _incremental_nodes_for_context(
+        self,
+        context: Any,
+        limit: int,
+        frame_state: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Apply the in-page delta to ``frame_state`` and return the ordered raw nodes."""
+        for base in (frame_state.get("id"), None):
+            try:
+                result = await context.evaluate(
+                    _INCREMENTAL_SNAPSHOT_JS,
+                    {"limit": max(1, min(limit, 200)), "base": base},
+                )
+            except Exception as exc:
+                _log_browser_event(
+                    logger,
+                    level=logging.DEBUG,
+                    event="snapshot_context_eval_failed",
+                    error=exc,
+                )
+                frame_state.clear()
+                return []
+            if not isinstance(result, dict):
+                frame_state.clear()
+                return []
+
+            incoming = [node for node in result.get("nodes") or [] if isinstance(node, dict)]
+            if result.get("mode") != "delta":
+                ordered = incoming
+            else:
+                known: Dict[str, Dict[str, Any]] = dict(frame_state.get("nodes") or {})
+                for node in incoming:
+                    known[_safe_title(node.get("ref"))] = node
+                for ref in result.get("removed") or []:
+                    known.pop(_safe_title(ref), None)
+                ordered = [known.get(_safe_title(ref)) for ref in result.get("order") or []]
+                if any(node is None for node in ordered):
+                    # Our copy drifted from the page's; ask for a full list.
+                    frame_state.clear()
+                    continue
+            frame_state["id"] = _safe_title(result.get("id")) or None
+            frame_state["nodes"] = {_safe_title(node.get("ref")): node for node in ordered}
+            frame_state["refreshed"] = result.get("refreshed")
+            return ordered
+        return []
+
     async def get_console(
         self,
         *,
@@ -140,3 +140,83 @@ NUMERIC_VALUE_FALLBACK_JS = """(el, args) => {
     target
   };
 }"""
+
+# Sets many plain fields in one evaluate call. Values go through the native
+# prototype setter so framework-controlled inputs (React, Vue) notice the
+# change, then input/change fire exactly like a user edit. Anything that is
+# not a plain text-like input, textarea or native single select is reported
+# back unapplied so the caller can fall back to real Playwright input.
+BATCH_FILL_JS = """({ items, stop_on_failure }) => {
+  const blockedTypes = new Set([
+    "button", "checkbox", "color", "date", "datetime-local", "file", "hidden",
+    "image", "month", "radio", "range", "reset", "submit", "time", "week"
+  ]);
+  const find = (selector) => {
+    if (!selector) return null;
+    try { return document.querySelector(selector); } catch { return null; }
+  };
+  const emitInputEvents = (node) => {
+    node.dispatchEvent(new Event("input", { bubbles: true }));
+    node.dispatchEvent(new Event("change", { bubbles: true }));
+  };
+  const setNativeValue = (node, value) => {
+    const proto = node instanceof HTMLTextAreaElement
+      ? HTMLTextAreaElement.prototype
+      : node instanceof HTMLSelectElement
+        ? HTMLSelectElement.prototype
+        : HTMLInputElement.prototype;
+    const descriptor = Object.getOwnPropertyDescriptor(proto, "value");
+    if (descriptor && typeof descriptor.set === "function") {
+      descriptor.set.call(node, value);
+    } else {
+      node.value = value;
+    }
+  };
+  const norm = (value) => String(value ?? "").trim().toLowerCase();
+
+  const fill = (item) => {
+    const out = { ref: item.ref, applied: false };
+    const el = find(item.selector) || find(item.fallback_selector);
+    if (!el) return { ...out, reason: "missing" };
+    if (el.disabled || el.readOnly) return { ...out, reason: "not_editable" };
+    const tag = el.tagName.toLowerCase();
+    try {
+      if (item.kind === "select") {
+        if (tag !== "select" || el.multiple) return { ...out, reason: "not_native_select" };
+        const wanted = norm(item.value);
+        const options = Array.from(el.options || []);
+        const option =
+          options.find((opt) => norm(opt.value) === wanted) ||
+          options.find((opt) => norm(opt.label || opt.textContent) === wanted);
+        if (!option) return { ...out, reason: "no_option" };
+        setNativeValue(el, option.value);
+        emitInputEvents(el);
+        const selected = Array.from(el.selectedOptions || []);
+        return {
+          ...out,
+          applied: true,
+          selected_values: selected.flatMap((opt) => [opt.value, (opt.label || opt.textContent || "").trim()])
+        };
+      }
+      const plainInput = tag === "input" && !blockedTypes.has(norm(el.type || "text"));
+      if (tag !== "textarea" && !plainInput) return { ...out, reason: "not_plain_field" };
+      try { el.focus({ preventScroll: true }); } catch {}
+      setNativeValue(el, String(item.value ?? ""));
+      emitInputEvents(el);
+      return { ...out, applied: true, field_value: String(el.value ?? "") };
+    } catch (err) {
+      return { ...out, reason: String(err && err.message || err) };
+    }
+  };
+
+  // With stop_on_failure the caller re-runs the failed field on its own before
+  // touching later fields, so nothing after the first failure is written.
+  const results = [];
+  for (const item of items || []) {
+    const result = fill(item);
+    results.push(result);
+    const readBack = result.field_value === undefined || result.field_value === String(item.value ?? "");
+    if (stop_on_failure && !(result.applied && readBack)) break;
+  }
+  return results;
+}"""
@@ -0,0 +1,261 @@
+"""Resource load policies and per-navigation network accounting.
+
+``LoadPolicy`` decides which requests a page may make. ``full`` (the default)
+loads everything; ``fast`` drops images, media, fonts and known trackers;
+``text`` additionally drops stylesheets and third-party scripts for pages
+that are only read or filled in. Blocking runs through context-level route
+interception, which is only installed once a blocking policy is in use
+because routing disables Playwright's HTTP cache.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlparse
+
+_FAST_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+_TEXT_BLOCKED_TYPES = _FAST_BLOCKED_TYPES | frozenset({"stylesheet", "texttrack", "manifest"})
+
+_TRACKER_DOMAINS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "newrelic.com",
+    "nr-data.net",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "taboola.com",
+    "outbrain.com",
+    "criteo.com",
+    "adnxs.com",
+    "bat.bing.com",
+    "clarity.ms",
+)
+
+# Rough transfer sizes used to estimate bytes saved by blocked requests.
+_ESTIMATED_BYTES = {
+    "image": 45_000,
+    "media": 500_000,
+    "font": 35_000,
+    "stylesheet": 25_000,
+    "script": 30_000,
+    "texttrack": 5_000,
+    "manifest": 2_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+_DEFAULT_ESTIMATED_BYTES = 5_000
+
+# Long-lived connections never go quiet and must not hold readiness back.
+_IGNORED_FOR_QUIET = frozenset({"websocket", "eventsource"})
+
+
+def _host_of(url: str) -> str:
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+def _site_of(host: str) -> str:
+    """Approximate registrable domain (last two labels)."""
+    parts = [part for part in host.split(".") if part]
+    return ".".join(parts[-2:]) if len(parts) >= 2 else host
+
+
+def _domain_matches(host: str, domains: Tuple[str, ...]) -> Optional[str]:
+    for domain in domains:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return None
+
+
+def _as_str_tuple(value: Any) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = value.split(",")
+    items = []
+    for item in value:
+        text = str(item or "").strip().lower()
+        if text:
+            items.append(text)
+    return tuple(items)
+
+
+@dataclass(frozen=True)
+class LoadPolicy:
+    mode: str = "full"
+    block_resource_types: FrozenSet[str] = frozenset()
+    block_domains: Tuple[str, ...] = ()
+    block_trackers: bool = False
+    block_third_party_scripts: bool = False
+    # Readiness: the page counts as loaded once no request has been in flight
+    # for ``quiet_ms`` (bounded by the post-goto settle budget).
+    quiet_ms: int = 300
+
+    @classmethod
+    def preset(cls, mode: str) -> "LoadPolicy":
+        clean = str(mode or "").strip().lower()
+        if clean == "fast":
+            return cls(mode="fast", block_resource_types=_FAST_BLOCKED_TYPES, block_trackers=True, quiet_ms=200)
+        if clean == "text":
+            return cls(
+                mode="text",
+                block_resource_types=_TEXT_BLOCKED_TYPES,
+                block_trackers=True,
+                block_third_party_scripts=True,
+                quiet_ms=150,
+            )
+        return cls()
+
+    @classmethod
+    def from_env(cls) -> "LoadPolicy":
+        return cls.preset(os.getenv("AEIVA_BROWSER_LOAD_MODE", "full"))
+
+    @classmethod
+    def from_request(cls, value: Any, base: Optional["LoadPolicy"] = None) -> "LoadPolicy":
+        """Parse ``"fast"`` or ``{"mode": ..., "block_types": [...], "block_domains": [...]}``."""
+        if isinstance(value, LoadPolicy):
+            return value
+        if isinstance(value, str):
+            return cls.preset(value)
+        if not isinstance(value, dict):
+            return base or cls()
+        policy = cls.preset(value["mode"]) if value.get("mode") else (base or cls())
+        block_types = _as_str_tuple(value.get("block_types", value.get("block_resource_types")))
+        block_domains = _as_str_tuple(value.get("block_domains"))
+        quiet_ms = value.get("quiet_ms")
+        # Extra blocks on top of a named preset keep its name; on their own they are "custom".
+        mode = policy.mode if value.get("mode") or not (block_types or block_domains) else "custom"
+        return cls(
+            mode=mode,
+            block_resource_types=policy.block_resource_types | frozenset(block_types),
+            block_domains=tuple(dict.fromkeys(policy.block_domains + block_domains)),
+            block_trackers=bool(value.get("block_trackers", policy.block_trackers)),
+            block_third_party_scripts=bool(
+                value.get("block_third_party_scripts", policy.block_third_party_scripts)
+            ),
+            quiet_ms=max(50, int(quiet_ms)) if quiet_ms is not None else policy.quiet_ms,
+        )
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(
+            self.block_resource_types
+            or self.block_domains
+            or self.block_trackers
+            or self.block_third_party_scripts
+        )
+
+    def block_reason(self, url: str, resource_type: str, page_url: str = "") -> Optional[str]:
+        """Return why a request should be aborted, or ``None`` to let it through."""
+        if not self.blocks_anything:
+            return None
+        if resource_type == "document":
+            return None
+        if resource_type in self.block_resource_types:
+            return f"type:{resource_type}"
+        host = _host_of(url)
+        if not host:
+            return None
+        if self.block_domains:
+            matched = _domain_matches(host, self.block_domains)
+            if matched:
+                return f"domain:{matched}"
+        if self.block_trackers:
+            matched = _domain_matches(host, _TRACKER_DOMAINS)
+            if matched:
+                return "tracker"
+        if self.block_third_party_scripts and resource_type == "script":
+            page_host = _host_of(page_url)
+            if page_host and _site_of(host) != _site_of(page_host):
+                return "third_party_script"
+        return None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "block_resource_types": sorted(self.block_resource_types),
+            "block_domains": list(self.block_domains),
+            "block_trackers": self.block_trackers,
+            "block_third_party_scripts": self.block_third_party_scripts,
+            "quiet_ms": self.quiet_ms,
+        }
+
+
+@dataclass
+class NavigationStats:
+    """Network accounting for the current navigation of one tab."""
+
+    mode: str = "full"
+    started_at: float = field(default_factory=time.monotonic)
+    last_activity_at: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    finished: int = 0
+    failed: int = 0
+    blocked: int = 0
+    blocked_by_reason: Counter = field(default_factory=Counter)
+    bytes_loaded: int = 0
+    bytes_saved_estimate: int = 0
+    inflight: Dict[int, str] = field(default_factory=dict)
+
+    def on_request(self, request: Any, resource_type: str) -> None:
+        self.requests += 1
+        self.last_activity_at = time.monotonic()
+        if resource_type not in _IGNORED_FOR_QUIET:
+            self.inflight[id(request)] = resource_type
+
+    def on_done(self, request: Any, *, failed: bool) -> None:
+        self.last_activity_at = time.monotonic()
+        if self.inflight.pop(id(request), None) is None:
+            return
+        if failed:
+            self.failed += 1
+        else:
+            self.finished += 1
+
+    def on_response_size(self, size: int) -> None:
+        if size > 0:
+            self.bytes_loaded += size
+
+    def on_blocked(self, resource_type: str, reason: str) -> None:
+        self.blocked += 1
+        self.blocked_by_reason[reason] += 1
+        self.bytes_saved_estimate += _ESTIMATED_BYTES.get(resource_type, _DEFAULT_ESTIMATED_BYTES)
+
+    def quiet_for(self) -> float:
+        """Seconds since the last network activity, or 0 while requests are in flight."""
+        if self.inflight:
+            return 0.0
+        return time.monotonic() - self.last_activity_at
+
+    def payload(self, *, ready: str, wait_ms: float) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "ready": ready,
+            "ready_wait_ms": round(wait_ms, 1),
+            "elapsed_ms": round((time.monotonic() - self.started_at) * 1000.0, 1),
+            "requests": self.requests,
+            "blocked_requests": self.blocked,
+            "blocked_by_reason": dict(self.blocked_by_reason),
+            # Blocked requests never transfer, so their size is a per-type estimate.
+            "bytes_saved_estimate": self.bytes_saved_estimate,
+            "bytes_loaded": self.bytes_loaded,
+            "inflight": len(self.inflight),
+        }
@@ -1,19 +1,18 @@
-"""DOM snapshot script for browser runtime."""
+"""DOM snapshot scripts for browser runtime.
 
-_SNAPSHOT_JS = """
-({ limit }) => {
-  const maxItems = Math.max(1, Math.min(Number(limit || 80), 200));
+``_SNAPSHOT_JS`` collects interactive nodes from scratch on every call.
+``_INCREMENTAL_SNAPSHOT_JS`` keeps per-document state: a MutationObserver
+marks dirty subtrees, clean elements reuse their cached descriptors (form
+controls still re-check value, checked state and visibility), and the result
+is a delta against the snapshot the caller last received (``base``).
+"""
+
+_SNAPSHOT_HELPERS_JS = """
   const refAttr = "data-aeiva-ref";
   if (!Number.isInteger(window.__aeivaRefCounter) || window.__aeivaRefCounter < 1) {
     window.__aeivaRefCounter = 1;
   }
 
-  const candidates = Array.from(
-    document.querySelectorAll(
-      "input,textarea,select,button,a,summary,[role],[onclick],[tabindex],[contenteditable='true']"
-    )
-  );
-
   const esc = (value) => {
     if (window.CSS && typeof window.CSS.escape === "function") {
       return window.CSS.escape(String(value));
@@ -155,20 +154,10 @@ _SNAPSHOT_JS = """
     return value;
   };
 
-  const seen = new Set();
-  candidates.sort((a, b) => priorityOf(b) - priorityOf(a));
-  const out = [];
-  for (const el of candidates) {
-    if (!visible(el)) continue;
+  const describeNode = (el) => {
     const fallbackSelector = selectorOf(el);
     const ref = ensureRef(el);
-    const stableSelector = `[${refAttr}="${ref}"]`;
-
-    if ((!stableSelector && !fallbackSelector) || seen.has(ref)) continue;
-    seen.add(ref);
-    const labelText = labelTextOf(el);
-    const nameAttr = norm(el.getAttribute("name") || "", 120);
-    out.push({
+    return {
       ref,
       tag: el.tagName.toLowerCase(),
       role: roleOf(el),
@@ -180,15 +169,178 @@ _SNAPSHOT_JS = """
       aria_valuenow: norm(el.getAttribute("aria-valuenow") || "", 80),
       input_type: String(el.getAttribute("type") || "").toLowerCase(),
       dom_id: norm(el.id || "", 120),
-      name_attr: nameAttr,
-      label_text: labelText,
+      name_attr: norm(el.getAttribute("name") || "", 120),
+      label_text: labelTextOf(el),
       readonly: Boolean(el.readOnly === true || el.hasAttribute("readonly")),
       disabled: Boolean(el.disabled === true || el.hasAttribute("disabled")),
-      selector: stableSelector,
+      selector: `[${refAttr}="${ref}"]`,
       fallback_selector: fallbackSelector
-    });
+    };
+  };
+"""
+
+_SNAPSHOT_JS = (
+    """
+({ limit }) => {
+  const maxItems = Math.max(1, Math.min(Number(limit || 80), 200));
+"""
+    + _SNAPSHOT_HELPERS_JS
+    + """
+  const candidates = Array.from(
+    document.querySelectorAll(
+      "input,textarea,select,button,a,summary,[role],[onclick],[tabindex],[contenteditable='true']"
+    )
+  );
+
+  const seen = new Set();
+  candidates.sort((a, b) => priorityOf(b) - priorityOf(a));
+  const out = [];
+  for (const el of candidates) {
+    if (!visible(el)) continue;
+    const node = describeNode(el);
+    if (seen.has(node.ref)) continue;
+    seen.add(node.ref);
+    out.push(node);
     if (out.length >= maxItems) break;
   }
   return out;
 }
 """
+)
+
+_INCREMENTAL_SNAPSHOT_JS = (
+    """
+({ limit, base }) => {
+  const maxItems = Math.max(1, Math.min(Number(limit || 80), 200));
+"""
+    + _SNAPSHOT_HELPERS_JS
+    + """
+  const MAX_DIRTY_ROOTS = 64;
+  let state = window.__aeivaSnapshotState;
+  if (!state) {
+    state = {
+      token: Date.now().toString(36) + Math.random().toString(36).slice(2, 8),
+      generation: 0,
+      lastId: "",
+      rescanAll: true,
+      dirty: new Set(),
+      cache: new WeakMap(),
+      reported: new Map()
+    };
+    const markDirty = (node) => {
+      const el = node && node.nodeType === Node.ELEMENT_NODE ? node : node && node.parentElement;
+      if (!el) return;
+      const tag = el.tagName.toLowerCase();
+      // Stylesheets, <head> and labels affect elements outside their own subtree.
+      if (tag === "style" || tag === "link" || tag === "head" || (el.closest && el.closest("label,head"))) {
+        state.rescanAll = true;
+        return;
+      }
+      state.dirty.add(el);
+      if (state.dirty.size > MAX_DIRTY_ROOTS) state.rescanAll = true;
+    };
+    state.record = (mutations) => {
+      for (const mutation of mutations) {
+        if (mutation.type === "attributes" && mutation.attributeName === refAttr) continue;
+        if (mutation.type === "attributes" && mutation.attributeName === "id") state.rescanAll = true;
+        markDirty(mutation.target);
+      }
+    };
+    try {
+      const observer = new MutationObserver(state.record);
+      state.observer = observer;
+      observer.observe(document.documentElement, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true
+      });
+      // Form values change without DOM mutations.
+      document.addEventListener("input", (event) => markDirty(event.target), true);
+      document.addEventListener("change", (event) => markDirty(event.target), true);
+      window.addEventListener("resize", () => { state.rescanAll = true; });
+    } catch (_) {
+      state.disabled = true;
+    }
+    window.__aeivaSnapshotState = state;
+  }
+
+  if (state.observer) state.record(state.observer.takeRecords());
+  const rescanAll = state.rescanAll || state.disabled === true;
+  const dirtyRoots = rescanAll ? [] : Array.from(state.dirty);
+  state.dirty.clear();
+  state.rescanAll = false;
+  const isDirty = (el) => {
+    if (rescanAll) return true;
+    for (const root of dirtyRoots) {
+      if (root === el || root.contains(el)) return true;
+    }
+    return false;
+  };
+
+  const candidates = Array.from(
+    document.querySelectorAll(
+      "input,textarea,select,button,a,summary,[role],[onclick],[tabindex],[contenteditable='true']"
+    )
+  );
+  // Script writes (`el.value = ...`, `form.reset()`) and CSSOM edits do not
+  // mutate the DOM, so form controls re-read their live state on every call.
+  const isControl = (el) =>
+    el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement || el instanceof HTMLSelectElement;
+  let refreshed = 0;
+  const entries = [];
+  for (const el of candidates) {
+    let record = state.cache.get(el);
+    const dirty = !record || isDirty(el);
+    const control = isControl(el);
+    const shown = dirty || control ? visible(el) : record.visible;
+    const live = control ? `${shown}\u0000${el.value}\u0000${el.checked === true}` : "";
+    if (dirty || record.live !== live) {
+      record = { visible: shown, priority: priorityOf(el), node: null, key: "", live };
+      state.cache.set(el, record);
+      refreshed += 1;
+    }
+    if (record.visible) entries.push([el, record]);
+  }
+  entries.sort((a, b) => b[1].priority - a[1].priority);
+
+  const seen = new Set();
+  const top = [];
+  for (const [el, record] of entries) {
+    if (!record.node) {
+      record.node = describeNode(el);
+      record.key = JSON.stringify(record.node);
+    }
+    if (seen.has(record.node.ref)) continue;
+    seen.add(record.node.ref);
+    top.push(record);
+    if (top.length >= maxItems) break;
+  }
+
+  const current = new Map(top.map((record) => [record.node.ref, record.key]));
+  const isDelta = Boolean(base) && base === state.lastId;
+  const changed = [];
+  const removed = [];
+  if (isDelta) {
+    for (const record of top) {
+      if (state.reported.get(record.node.ref) !== record.key) changed.push(record.node);
+    }
+    for (const ref of state.reported.keys()) {
+      if (!current.has(ref)) removed.push(ref);
+    }
+  }
+  state.generation += 1;
+  state.lastId = `${state.token}:${state.generation}`;
+  state.reported = current;
+  return {
+    id: state.lastId,
+    mode: isDelta ? "delta" : "full",
+    nodes: isDelta ? changed : top.map((record) => record.node),
+    removed,
+    order: isDelta ? top.map((record) => record.node.ref) : [],
+    refreshed,
+    candidates: candidates.length
+  };
+}
+"""
+)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any, Dict, Optional
 
+from .runtime_load_policy import LoadPolicy, NavigationStats
 from .runtime_common import (
     DEFAULT_POST_GOTO_SETTLE_MS,
     TabState,
@@ -50,6 +53,10 @@ class RuntimeStateMixin:
             "requestfailed",
             lambda req, tid=target_id: self._record_network_failed(tid, req),
         )
+        page.on(
+            "requestfinished",
+            lambda req, tid=target_id: self._record_network_finished(tid, req),
+        )
         page.on(
             "close",
             lambda tid=target_id, page_obj=page: self._unregister_page(tid, page_obj),
@@ -96,6 +103,7 @@ class RuntimeStateMixin:
         tab = self._tab_states.get(target_id)
         if tab is None:
             return
+        tab.nav.on_request(req, _safe_title(_read_attr(req, "resource_type")))
         tab.events.network.append(
             {
                 "timestamp": _now_iso(),
@@ -112,6 +120,12 @@ class RuntimeStateMixin:
             return
         request = _read_attr(resp, "request", None)
         req_url = _safe_title(_read_attr(request, "url"))
+        headers = _read_attr(resp, "headers", None)
+        if isinstance(headers, dict):
+            try:
+                tab.nav.on_response_size(int(headers.get("content-length") or 0))
+            except (TypeError, ValueError):
+                pass
         tab.events.network.append(
             {
                 "timestamp": _now_iso(),
@@ -126,6 +140,7 @@ class RuntimeStateMixin:
         tab = self._tab_states.get(target_id)
         if tab is None:
             return
+        tab.nav.on_done(req, failed=True)
         failure = _read_attr(req, "failure", None)
         tab.events.network.append(
             {
@@ -137,6 +152,62 @@ class RuntimeStateMixin:
             }
         )
 
+    def _record_network_finished(self, target_id: str, req: Any) -> None:
+        tab = self._tab_states.get(target_id)
+        if tab is not None:
+            tab.nav.on_done(req, failed=False)
+
+    async def _ensure_load_routing(self) -> None:
+        # Routing disables the HTTP cache, so it is only installed once needed.
+        if self._load_routing or self._context is None:
+            return
+        await self._context.route("**/*", self._route_request)
+        self._load_routing = True
+
+    async def _route_request(self, route: Any, request: Any) -> None:
+        page = None
+        try:
+            page = request.frame.page
+        except Exception:
+            page = None
+        tab = self._tab_states.get(self._page_to_tab.get(id(page), "")) if page is not None else None
+        policy = (tab.load_policy if tab is not None else None) or self._load_policy
+        resource_type = _safe_title(_read_attr(request, "resource_type"))
+        reason = policy.block_reason(
+            _safe_title(_read_attr(request, "url")),
+            resource_type,
+            _safe_title(getattr(page, "url", "")),
+        )
+        try:
+            if reason is None:
+                await route.continue_()
+                return
+            if tab is not None:
+                tab.nav.on_blocked(resource_type, reason)
+            await route.abort("blockedbyclient")
+        except Exception:
+            # The page or context may close while the request is paused.
+            pass
+
+    async def set_load_policy(self, load: Any) -> Dict[str, Any]:
+        self._load_policy = LoadPolicy.from_request(load)
+        if self._started and self._load_policy.blocks_anything:
+            await self._ensure_load_routing()
+        return self._load_policy.describe()
+
+    async def _wait_for_network_quiet(self, tab: TabState, quiet_ms: int, max_ms: int) -> tuple[str, float]:
+        """Wait until no request has been in flight for ``quiet_ms`` (at most ``max_ms``)."""
+        started = time.monotonic()
+        quiet_s = quiet_ms / 1000.0
+        deadline = started + max_ms / 1000.0
+        poll_s = min(0.05, max(0.01, quiet_s / 4))
+        while True:
+            if tab.nav.quiet_for() >= quiet_s:
+                return "network_quiet", (time.monotonic() - started) * 1000.0
+            if time.monotonic() >= deadline:
+                return "settle_timeout", (time.monotonic() - started) * 1000.0
+            await asyncio.sleep(poll_s)
+
     async def _resolve_page(
         self,
         *,
@@ -220,7 +291,13 @@ class RuntimeStateMixin:
             "y": int(value.get("y") or 0),
         }
 
-    async def _goto(self, page: Any, url: str, timeout_ms: int) -> None:
+    async def _goto(
+        self,
+        page: Any,
+        url: str,
+        timeout_ms: int,
+        load_policy: Optional[LoadPolicy] = None,
+    ) -> Dict[str, Any]:
         normalized_timeout = _normalize_timeout(timeout_ms)
         settle_timeout = min(
             normalized_timeout,
@@ -230,8 +307,15 @@ class RuntimeStateMixin:
                 50,
             ),
         )
+        tab = self._tab_states.get(self._page_to_tab.get(id(page), ""))
+        policy = load_policy or self._load_policy
+        if policy.blocks_anything:
+            await self._ensure_load_routing()
         last_error: Optional[Exception] = None
         for _ in range(2):
+            if tab is not None:
+                tab.load_policy = load_policy
+                tab.nav = NavigationStats(mode=policy.mode)
             try:
                 await page.goto(
                     url,
@@ -239,17 +323,14 @@ class RuntimeStateMixin:
                     wait_until="domcontentloaded",
                 )
                 # Many modern SPAs mount critical form widgets shortly after DOM ready.
-                # Best-effort extra settle improves reliability without hard failing.
-                try:
-                    await page.wait_for_load_state(
-                        "networkidle",
-                        timeout=settle_timeout,
-                    )
-                except Exception:
-                    pass
-                return
+                # Wait for the network to go quiet rather than a fixed settle delay.
+                if tab is None:
+                    return {"mode": policy.mode}
+                ready, wait_ms = await self._wait_for_network_quiet(tab, policy.quiet_ms, settle_timeout)
+                return tab.nav.payload(ready=ready, wait_ms=wait_ms)
             except Exception as exc:
                 last_error = exc
                 await page.wait_for_timeout(120)
         if last_error is not None:
             raise last_error
+        return {"mode": policy.mode}
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import os
 import socket
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 from urllib.parse import urlparse
 
 IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
@@ -46,6 +50,17 @@ def _parse_bool_env(name: str, default: bool) -> bool:
     return default
 
 
+def _parse_int_env(name: str, default: int, minimum: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return max(minimum, int(default))
+    try:
+        parsed = int(raw.strip())
+    except Exception:
+        return max(minimum, int(default))
+    return max(minimum, parsed)
+
+
 def _split_csv_env(name: str) -> tuple[str, ...]:
     raw = os.getenv(name, "")
     values = []
@@ -124,10 +139,10 @@ def _ip_in_blocked_cidrs(ip: IPAddress, blocked_cidrs: tuple[IPNetwork, ...]) ->
     return any(ip in network for network in blocked_cidrs)
 
 
-def _resolve_host_ips(host: str) -> tuple[IPAddress, ...]:
+def _addrinfo_ips(infos: Iterable[Any]) -> tuple[IPAddress, ...]:
     resolved: list[IPAddress] = []
     seen: set[str] = set()
-    for _, _, _, _, sockaddr in socket.getaddrinfo(host, None):
+    for _, _, _, _, sockaddr in infos:
         if not sockaddr:
             continue
         candidate = str(sockaddr[0] or "").strip()
@@ -141,6 +156,132 @@ def _resolve_host_ips(host: str) -> tuple[IPAddress, ...]:
     return tuple(resolved)
 
 
+def _resolve_host_ips(host: str) -> tuple[IPAddress, ...]:
+    return _addrinfo_ips(socket.getaddrinfo(host, None))
+
+
+class _HostResolver:
+    """
+    TTL-bounded LRU cache of host -> resolved addresses.
+
+    Async lookups go through the running loop's ``getaddrinfo`` and are
+    single-flighted per host. Failures are cached for ``negative_ttl_seconds``
+    so a dead host is not re-queried on every request.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: Optional[float] = None,
+        negative_ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self.ttl_seconds = float(
+            ttl_seconds if ttl_seconds is not None else _parse_int_env("AEIVA_BROWSER_DNS_CACHE_TTL_SECS", 60, 0)
+        )
+        self.negative_ttl_seconds = float(
+            negative_ttl_seconds if negative_ttl_seconds is not None else min(self.ttl_seconds, 5.0)
+        )
+        self.max_entries = int(
+            max_entries if max_entries is not None else _parse_int_env("AEIVA_BROWSER_DNS_CACHE_SIZE", 512, 1)
+        )
+        # host -> (expires_at, addresses or the OSError raised by the lookup)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, host: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                self._entries.pop(host, None)
+                return False, None
+            self._entries.move_to_end(host)
+            self.hits += 1
+            return True, entry[1]
+
+    def _store(self, host: str, result: Any) -> None:
+        ttl = self.negative_ttl_seconds if isinstance(result, OSError) else self.ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[host] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(host)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _unwrap(result: Any) -> tuple[IPAddress, ...]:
+        if isinstance(result, OSError):
+            raise result
+        return result
+
+    def resolve(self, host: str) -> tuple[IPAddress, ...]:
+        """Blocking lookup for synchronous callers; shares the cache."""
+        found, result = self._cached(host)
+        if not found:
+            self.misses += 1
+            try:
+                result = _resolve_host_ips(host)
+            except OSError as exc:
+                result = exc
+            self._store(host, result)
+        return self._unwrap(result)
+
+    async def aresolve(self, host: str) -> tuple[IPAddress, ...]:
+        found, result = self._cached(host)
+        if found:
+            return self._unwrap(result)
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(host)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._lookup(loop, host))
+            self._inflight[host] = task
+            task.add_done_callback(lambda done: self._forget(host, done))
+        # Shielded so a cancelled caller does not cancel the lookup for the others.
+        return self._unwrap(await asyncio.shield(task))
+
+    async def _lookup(self, loop: asyncio.AbstractEventLoop, host: str) -> Any:
+        self.misses += 1
+        try:
+            result: Any = _addrinfo_ips(await loop.getaddrinfo(host, None))
+        except OSError as exc:
+            result = exc
+        self._store(host, result)
+        return result
+
+    def _forget(self, host: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(host) is task:
+            self._inflight.pop(host, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_HOST_RESOLVER = _HostResolver()
+
+_PRIVATE_BLOCKED_REASON = (
+    "Private/local network targets are blocked. Set "
+    "AEIVA_BROWSER_ALLOW_PRIVATE_NETWORK_REQUESTS=1 to override."
+)
+_VERDICT_CACHE_SIZE = 1024
+# Sentinel verdict: host passed the static checks and still needs a DNS check.
+_NEEDS_DNS = (True, "dns")
+
+
 def _is_path_within_root(path: Path, root: Path) -> bool:
     try:
         path.relative_to(root)
@@ -159,6 +300,11 @@ class BrowserSecurityPolicy:
     dns_fail_closed: bool = False
     allow_any_upload_path: bool = False
     upload_roots: tuple[Path, ...] = ()
+    dns_resolver: Optional[_HostResolver] = field(default=None, compare=False, repr=False)
+    # host / (host, resolved addresses) -> verdict; the policy is immutable.
+    _verdict_cache: "OrderedDict[Any, Tuple[bool, Optional[str]]]" = field(
+        default_factory=OrderedDict, init=False, compare=False, repr=False
+    )
 
     @classmethod
     def from_env(cls) -> "BrowserSecurityPolicy":
@@ -185,15 +331,53 @@ class BrowserSecurityPolicy:
         )
 
     def validate_request_url(self, url: str) -> Tuple[bool, Optional[str]]:
+        """Synchronous check; DNS lookups block but share the resolver cache."""
+        host, verdict = self._static_request_verdict(url)
+        if verdict is not _NEEDS_DNS:
+            return verdict
+        try:
+            resolved_ips: Any = self._resolver().resolve(host)
+        except OSError as exc:
+            resolved_ips = exc
+        return self._dns_verdict(host, resolved_ips)
+
+    async def avalidate_request_url(self, url: str) -> Tuple[bool, Optional[str]]:
+        """Same verdict as ``validate_request_url`` without blocking the event loop."""
+        host, verdict = self._static_request_verdict(url)
+        if verdict is not _NEEDS_DNS:
+            return verdict
+        try:
+            resolved_ips: Any = await self._resolver().aresolve(host)
+        except OSError as exc:
+            resolved_ips = exc
+        return self._dns_verdict(host, resolved_ips)
+
+    def _resolver(self) -> _HostResolver:
+        return self.dns_resolver or _HOST_RESOLVER
+
+    def _remember(self, key: Any, verdict: Tuple[bool, Optional[str]]) -> Tuple[bool, Optional[str]]:
+        cache = self._verdict_cache
+        cache[key] = verdict
+        if len(cache) > _VERDICT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return verdict
+
+    def _static_request_verdict(self, url: str) -> Tuple[str, Tuple[bool, Optional[str]]]:
         parsed = urlparse(str(url or "").strip())
         scheme = (parsed.scheme or "").lower()
         if scheme not in {"http", "https"}:
-            return False, "Only http(s) URLs are allowed for browser request."
+            return "", (False, "Only http(s) URLs are allowed for browser request.")
 
         host = (parsed.hostname or "").strip().lower()
         if not host:
-            return False, "Request URL must include a valid hostname."
+            return "", (False, "Request URL must include a valid hostname.")
 
+        cached = self._verdict_cache.get(host)
+        if cached is not None:
+            return host, cached
+        return host, self._remember(host, self._compute_static_verdict(host))
+
+    def _compute_static_verdict(self, host: str) -> Tuple[bool, Optional[str]]:
         if not _host_matches_allowlist(host, self.request_allowlist):
             allowlist_text = ", ".join(self.request_allowlist)
             return (
@@ -205,49 +389,52 @@ class BrowserSecurityPolicy:
         if self.allow_private_network_requests:
             return True, None
 
-        blocked_cidrs = self.request_blocked_cidrs or _DEFAULT_BLOCKED_NETWORKS
-
         if _is_local_host(host):
-            return (
-                False,
-                "Private/local network targets are blocked. Set "
-                "AEIVA_BROWSER_ALLOW_PRIVATE_NETWORK_REQUESTS=1 to override.",
-            )
+            return False, _PRIVATE_BLOCKED_REASON
 
         host_ip = _parse_host_ip(host)
-        if host_ip is not None and _ip_in_blocked_cidrs(host_ip, blocked_cidrs):
+        if host_ip is not None and _ip_in_blocked_cidrs(host_ip, self._blocked_cidrs()):
+            return False, _PRIVATE_BLOCKED_REASON
+
+        if self.check_dns_private_hosts:
+            return _NEEDS_DNS
+        return True, None
+
+    def _blocked_cidrs(self) -> tuple[IPNetwork, ...]:
+        return self.request_blocked_cidrs or _DEFAULT_BLOCKED_NETWORKS
+
+    def _dns_verdict(self, host: str, resolved_ips: Any) -> Tuple[bool, Optional[str]]:
+        if isinstance(resolved_ips, OSError):
+            if self.dns_fail_closed:
+                return (
+                    False,
+                    "DNS resolution failed for request host and policy is fail-closed "
+                    "(AEIVA_BROWSER_REQUEST_DNS_FAIL_CLOSED=1).",
+                )
+            resolved_ips = ()
+        # Cached resolver results are the same tuple until they expire.
+        key = (host, resolved_ips)
+        cached = self._verdict_cache.get(key)
+        if cached is not None:
+            return cached
+        return self._remember(key, self._compute_dns_verdict(resolved_ips))
+
+    def _compute_dns_verdict(self, resolved_ips: tuple[IPAddress, ...]) -> Tuple[bool, Optional[str]]:
+        if not resolved_ips and self.dns_fail_closed:
             return (
                 False,
-                "Private/local network targets are blocked. Set "
-                "AEIVA_BROWSER_ALLOW_PRIVATE_NETWORK_REQUESTS=1 to override.",
+                "DNS resolution produced no addresses for request host and policy is "
+                "fail-closed (AEIVA_BROWSER_REQUEST_DNS_FAIL_CLOSED=1).",
             )
-
-        if self.check_dns_private_hosts:
-            try:
-                resolved_ips = _resolve_host_ips(host)
-            except OSError:
-                if self.dns_fail_closed:
-                    return (
-                        False,
-                        "DNS resolution failed for request host and policy is fail-closed "
-                        "(AEIVA_BROWSER_REQUEST_DNS_FAIL_CLOSED=1).",
-                    )
-                resolved_ips = ()
-            if not resolved_ips and self.dns_fail_closed:
+        blocked_cidrs = self._blocked_cidrs()
+        for resolved in resolved_ips:
+            if _ip_in_blocked_cidrs(resolved, blocked_cidrs):
                 return (
                     False,
-                    "DNS resolution produced no addresses for request host and policy is "
-                    "fail-closed (AEIVA_BROWSER_REQUEST_DNS_FAIL_CLOSED=1).",
+                    "Request host resolves to a private/local address "
+                    f"({resolved}). Set "
+                    "AEIVA_BROWSER_ALLOW_PRIVATE_NETWORK_REQUESTS=1 to override.",
                 )
-            for resolved in resolved_ips:
-                if _ip_in_blocked_cidrs(resolved, blocked_cidrs):
-                    return (
-                        False,
-                        "Request host resolves to a private/local address "
-                        f"({resolved}). Set "
-                        "AEIVA_BROWSER_ALLOW_PRIVATE_NETWORK_REQUESTS=1 to override.",
-                    )
-
         return True, None
 
     def resolve_upload_paths(self, paths: Iterable[str]) -> list[str]:
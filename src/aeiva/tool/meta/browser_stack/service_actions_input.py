@@ -496,3 +496,53 @@ class BrowserServiceInputActionsMixin:
         if resolved_node:
             payload["resolved_node"] = resolved_node
         return payload
+
+    async def _run_fill_batch(
+        self,
+        *,
+        profile: str,
+        headless: bool,
+        target_id: Optional[str],
+        fields: list[Dict[str, Any]],
+        stop_on_failure: bool = False,
+    ) -> Dict[str, Any]:
+        payload = await self._sessions.run_with_session(
+            profile=profile,
+            headless=headless,
+            create=True,
+            fn=lambda runtime: runtime.fill_batch(
+                fields=fields,
+                target_id=target_id,
+                stop_on_failure=stop_on_failure,
+            ),
+        )
+        active_target = _as_str(payload.get("target_id")) or target_id
+        # Outcomes come back in field order; a ref may appear more than once.
+        outcomes = [item if isinstance(item, dict) else {} for item in payload.get("fields") or []]
+        applied_indexes: list[int] = []
+        for position, field in enumerate(fields):
+            ref = _as_str(field.get("ref"))
+            outcome = outcomes[position] if position < len(outcomes) else {}
+            if not ref or _as_str(outcome.get("ref")) != ref or not _as_bool(outcome.get("applied"), default=False):
+                verified = False
+            elif field.get("kind") == "select":
+                verified = self._selected_values_match_expected(
+                    outcome.get("selected_values"), [str(field.get("value") or "")]
+                )
+            else:
+                verified = self._field_value_matches_expected(
+                    str(outcome.get("field_value") or ""), str(field.get("value") or "")
+                )
+            if not verified:
+                if stop_on_failure:
+                    break
+                continue
+            applied_indexes.append(position)
+            self._remember_field_target_lock(
+                profile=profile,
+                target_id=active_target,
+                operation="select" if field.get("kind") == "select" else "type",
+                field_hint=_as_str(field.get("field_hint")),
+                ref=ref,
+            )
+        return {"target_id": active_target, "applied_indexes": applied_indexes}
@@ -64,11 +64,18 @@ class BrowserServiceDispatchCoreMixin:
             )
             if force_new_instance:
                 await self._sessions.stop_session(ctx.profile)
+            load = ctx.request.get("load")
+
+            async def start_runtime(runtime: Any) -> Dict[str, Any]:
+                if load is not None:
+                    await runtime.set_load_policy(load)
+                return await runtime.status()
+
             payload = await self._sessions.run_with_session(
                 profile=ctx.profile,
                 headless=ctx.headless,
                 create=True,
-                fn=lambda runtime: runtime.status(),
+                fn=start_runtime,
             )
             if force_new_instance:
                 payload["fresh_start"] = True
@@ -99,6 +106,9 @@ class BrowserServiceDispatchCoreMixin:
 
         if ctx.op == "profiles":
             profiles = await self._sessions.list_profiles()
+            pool = self._sessions.pool_stats()
+            if pool is not None:
+                return self._ok(profiles=profiles, pool=pool)
             return self._ok(profiles=profiles)
 
         if ctx.op == "tabs":
@@ -115,6 +125,8 @@ class BrowserServiceDispatchCoreMixin:
         return None
 
     async def _execute_navigation_ops(self, ctx: _ExecuteContext) -> Optional[Dict[str, Any]]:
+        load = ctx.request.get("load")
+        load_extra: Dict[str, Any] = {"load": load} if load is not None else {}
         if ctx.op in {"open", "open_tab"}:
             payload = await self._sessions.run_with_session(
                 profile=ctx.profile,
@@ -123,6 +135,7 @@ class BrowserServiceDispatchCoreMixin:
                 fn=lambda runtime: runtime.open_tab(
                     url=(ctx.url or "about:blank"),
                     timeout_ms=ctx.timeout_ms,
+                    **load_extra,
                 ),
             )
             return self._ok(**payload)
@@ -167,6 +180,7 @@ class BrowserServiceDispatchCoreMixin:
                 timeout_ms=ctx.timeout_ms,
                 target_id=ctx.target_id,
                 url=ctx.url,
+                load=load,
             )
             return self._ok(**payload)
 
@@ -10,6 +10,7 @@ from .service_utils import (
     _coalesce,
     _normalize_paths,
 )
+from .snapshot_encoding import compact_snapshot_payload, default_snapshot_format
 
 if TYPE_CHECKING:
     from .browser_service import _ExecuteContext
@@ -249,7 +250,15 @@ class BrowserServiceDispatchInteractionMixin:
             timeout_ms=ctx.timeout_ms,
             target_id=ctx.target_id,
             limit=snapshot_limit,
+            since=_as_str(ctx.request.get("since")),
         )
+        snapshot_format = (_as_str(ctx.request.get("format")) or default_snapshot_format()).lower()
+        if snapshot_format != "full":
+            payload = compact_snapshot_payload(
+                payload,
+                budget_chars=_as_int(ctx.request.get("budget_chars")),
+                query=_as_str(ctx.request.get("query")) or ctx.query,
+            )
         return self._ok(**payload)
 
     async def _interaction_act(self, ctx: _ExecuteContext) -> Dict[str, Any]:
@@ -28,7 +28,9 @@ class BrowserServiceRuntimeOpsMixin:
         timeout_ms: int,
         target_id: Optional[str],
         url: str,
+        load: Any = None,
     ) -> Dict[str, Any]:
+        extra: Dict[str, Any] = {"load": load} if load is not None else {}
         search_query = _extract_search_query_from_url(url)
         navigate_timeout = (
             min(int(timeout_ms), DEFAULT_SEARCH_NAV_FALLBACK_TIMEOUT_MS)
@@ -43,6 +45,7 @@ class BrowserServiceRuntimeOpsMixin:
                 url=url,
                 timeout_ms=navigate_timeout,
                 target_id=target_id,
+                **extra,
             ),
         )
         if not search_query or not _looks_like_bot_challenge(payload):
@@ -64,6 +67,7 @@ class BrowserServiceRuntimeOpsMixin:
                         url=_url,
                         timeout_ms=navigate_timeout,
                         target_id=fallback_target_id,
+                        **extra,
                     ),
                 )
             except Exception as exc:
@@ -128,7 +132,9 @@ class BrowserServiceRuntimeOpsMixin:
         timeout_ms: int,
         target_id: Optional[str],
         limit: int,
+        since: Optional[str] = None,
     ) -> Dict[str, Any]:
+        extra: Dict[str, Any] = {"since": since} if since else {}
         return await self._sessions.run_with_session(
             profile=profile,
             headless=headless,
@@ -137,6 +143,7 @@ class BrowserServiceRuntimeOpsMixin:
                 target_id=target_id,
                 timeout_ms=timeout_ms,
                 limit=limit,
+                **extra,
             ),
         )
 
@@ -362,7 +369,7 @@ class BrowserServiceRuntimeOpsMixin:
     ) -> Dict[str, Any]:
         if not url:
             return self._err("URL required for request operation")
-        allowed, reason = self._security.validate_request_url(url)
+        allowed, reason = await self._security.avalidate_request_url(url)
         if not allowed:
             _log_browser_event(
                 logger,
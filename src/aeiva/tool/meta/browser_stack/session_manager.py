@@ -7,14 +7,19 @@ import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
-from .runtime_common import BrowserRuntime, _parse_int_env
+from .browser_pool import BrowserContextPool
+from .runtime_common import BrowserRuntime, _parse_bool_env, _parse_int_env
 
 
-def _default_runtime_factory(profile: str, headless: bool) -> BrowserRuntime:
+def _default_runtime_factory(
+    profile: str,
+    headless: bool,
+    pool: Optional[BrowserContextPool] = None,
+) -> BrowserRuntime:
     # Lazy import avoids circular imports while keeping startup overhead low.
     from .browser_runtime import PlaywrightRuntime
 
-    return PlaywrightRuntime(profile=profile, headless=headless)
+    return PlaywrightRuntime(profile=profile, headless=headless, pool=pool)
 
 
 @dataclass
@@ -25,6 +30,7 @@ class BrowserSession:
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     created_at: float = field(default_factory=time.time)
     last_used_at: float = field(default_factory=time.time)
+    startup_ms: Optional[float] = None
 
 
 class BrowserSessionManager:
@@ -32,6 +38,9 @@ class BrowserSessionManager:
     Profile-scoped browser runtime manager.
 
     Each profile has one persistent runtime guarded by a per-profile lock.
+    In pooled mode (``AEIVA_BROWSER_POOLED=1``) runtimes lease isolated
+    contexts from one shared browser process instead of launching their own,
+    and idle sessions are also evicted LRU-first under memory pressure.
     """
 
     def __init__(
@@ -40,8 +49,21 @@ class BrowserSessionManager:
         *,
         max_sessions: Optional[int] = None,
         idle_ttl_seconds: Optional[int] = None,
+        pooled: Optional[bool] = None,
+        pool: Optional[BrowserContextPool] = None,
     ) -> None:
-        self._runtime_factory = runtime_factory or _default_runtime_factory
+        if pooled is None:
+            pooled = pool is not None or _parse_bool_env("AEIVA_BROWSER_POOLED", False)
+        self._pool: Optional[BrowserContextPool] = (pool or BrowserContextPool()) if pooled else None
+        if runtime_factory is not None:
+            self._runtime_factory = runtime_factory
+        elif self._pool is not None:
+            pool_ref = self._pool
+            self._runtime_factory = lambda profile, headless: _default_runtime_factory(
+                profile, headless, pool_ref
+            )
+        else:
+            self._runtime_factory = _default_runtime_factory
         self._sessions: Dict[str, BrowserSession] = {}
         self._manager_lock = asyncio.Lock()
         self._max_sessions = self._normalize_positive_int(
@@ -93,6 +115,7 @@ class BrowserSessionManager:
             headless=bool(headless),
             runtime=runtime,
         )
+        started = time.perf_counter()
         try:
             await runtime.start()
         except Exception:
@@ -102,6 +125,7 @@ class BrowserSessionManager:
             except Exception:
                 pass
             raise
+        session.startup_ms = (time.perf_counter() - started) * 1000.0
 
         async with self._manager_lock:
             existing = self._sessions.get(clean_profile)
@@ -145,6 +169,31 @@ class BrowserSessionManager:
             async with session.lock:
                 await session.runtime.stop()
 
+        if self._pool is not None:
+            await self._evict_under_memory_pressure(excluded)
+            await self._pool.maintain()
+
+    async def _evict_under_memory_pressure(self, excluded: set[str]) -> None:
+        while self._pool is not None and self._pool.memory_pressure():
+            async with self._manager_lock:
+                candidates = [
+                    (profile, session)
+                    for profile, session in self._sessions.items()
+                    if profile not in excluded and not session.lock.locked()
+                ]
+                if not candidates:
+                    return
+                profile, _ = min(candidates, key=lambda item: float(item[1].last_used_at))
+                session = self._sessions.pop(profile)
+            async with session.lock:
+                await session.runtime.stop()
+
+    async def prewarm(self, headless: bool = True) -> int:
+        """Pre-start the shared browser and warm contexts (pooled mode only)."""
+        if self._pool is None:
+            return 0
+        return await self._pool.prewarm(headless)
+
     async def run_with_session(
         self,
         *,
@@ -182,11 +231,20 @@ class BrowserSessionManager:
         for session in sessions:
             async with session.lock:
                 await session.runtime.stop()
+        if self._pool is not None:
+            await self._pool.close()
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        if self._pool is None:
+            return None
+        return self._pool.stats()
 
     async def list_profiles(self) -> List[Dict[str, Any]]:
         async with self._manager_lock:
             items = list(self._sessions.values())
 
+        # The shared browser's memory cannot be attributed to single contexts.
+        browser_rss = self._pool.rss_bytes() if self._pool is not None else None
         profiles: List[Dict[str, Any]] = []
         for session in items:
             runtime_status = await session.runtime.status()
@@ -196,6 +254,9 @@ class BrowserSessionManager:
                     "headless": session.headless,
                     "created_at": session.created_at,
                     "last_used_at": session.last_used_at,
+                    "startup_ms": round(session.startup_ms, 2) if session.startup_ms is not None else None,
+                    "pooled": self._pool is not None,
+                    "browser_rss_bytes": browser_rss,
                     "status": runtime_status,
                 }
             )
@@ -0,0 +1,202 @@
+"""Compact LLM-facing encoding of snapshot payloads.
+
+The runtime snapshot carries full node dicts (18 mostly-empty fields each) for
+server-side target resolution. What the model needs is much smaller, so the
+``snapshot`` operation returns a columnar view instead:
+
+- ``columns`` names the fields present in at least one kept node; each entry
+  in ``rows`` lists values in that order, with ``null`` for empty cells and
+  trailing empties dropped. Values repeated across rows are interned into
+  ``strings`` and referenced by integer index.
+- Selectors never leave the server; refs are enough to act on a node.
+- The view is budgeted (``budget_chars``). When nodes do not fit, the most
+  relevant ones are kept (query matches, then editable fields, then buttons
+  and links) and the remainder is reported in ``omitted_nodes``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .element_matching import _match_snapshot_nodes
+from .runtime_common import _parse_int_env
+
+SNAPSHOT_FORMATS = ("compact", "full")
+
+# (column, node key) in output order. ``scope`` is implied by the ref prefix
+# and ``tag`` is only kept when it differs from the role.
+_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ref", "ref"),
+    ("role", "role"),
+    ("name", "name"),
+    ("label", "label_text"),
+    ("value", "value"),
+    ("placeholder", "placeholder"),
+    ("type", "input_type"),
+    ("flags", ""),
+    ("text", "text"),
+    ("aria_label", "aria_label"),
+    ("valuenow", "aria_valuenow"),
+    ("id", "dom_id"),
+    ("name_attr", "name_attr"),
+    ("tag", "tag"),
+)
+# Fields that commonly repeat the accessible name verbatim.
+_NAME_ECHO_COLUMNS = frozenset({"label", "text", "aria_label", "name_attr"})
+_EDITABLE_ROLES = frozenset(
+    {"input", "textarea", "select", "textbox", "searchbox", "combobox", "spinbutton", "listbox", "slider"}
+)
+_ACTION_ROLES = frozenset({"button", "a", "link", "menuitem", "tab", "option", "checkbox", "radio", "switch", "summary"})
+_INTERN_MIN_LENGTH = 6
+# Bytes of envelope (keys, metadata) reserved outside the rows.
+_ENVELOPE_RESERVE = 200
+
+
+def default_snapshot_format() -> str:
+    value = os.getenv("AEIVA_BROWSER_SNAPSHOT_FORMAT", "compact").strip().lower()
+    return value if value in SNAPSHOT_FORMATS else "compact"
+
+
+def default_snapshot_budget() -> int:
+    return _parse_int_env("AEIVA_BROWSER_SNAPSHOT_BUDGET_CHARS", 6000, 500)
+
+
+def _cell(node: Dict[str, Any], column: str, key: str) -> Optional[str]:
+    if column == "flags":
+        flags = [flag for flag in ("disabled", "readonly") if node.get(flag)]
+        return ",".join(flags) or None
+    value = str(node.get(key) or "").strip()
+    if not value:
+        return None
+    if column in _NAME_ECHO_COLUMNS and value == str(node.get("name") or "").strip():
+        return None
+    if column == "tag" and value == str(node.get("role") or "").strip():
+        return None
+    return value
+
+
+def _relevance(node: Dict[str, Any], query_rank: Dict[str, int]) -> Tuple[int, int]:
+    rank = query_rank.get(str(node.get("ref") or ""))
+    if rank is not None:
+        return (0, rank)
+    role = str(node.get("role") or node.get("tag") or "").lower()
+    if node.get("disabled"):
+        tier = 4
+    elif role in _EDITABLE_ROLES:
+        tier = 1
+    elif role in _ACTION_ROLES:
+        tier = 2
+    else:
+        tier = 3
+    return (tier, 0)
+
+
+def _row_size(row: Sequence[Any]) -> int:
+    return len(json.dumps(row, ensure_ascii=False, separators=(",", ":"))) + 1
+
+
+def encode_nodes(
+    nodes: Sequence[Dict[str, Any]],
+    *,
+    budget_chars: int,
+    query: Optional[str] = None,
+    pinned_refs: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """Encode ``nodes`` as budgeted columnar rows, keeping original order."""
+    valid = [node for node in nodes if isinstance(node, dict) and node.get("ref")]
+    raw_rows = [[_cell(node, column, key) for column, key in _COLUMNS] for node in valid]
+
+    query_rank: Dict[str, int] = {ref: -1 for ref in pinned_refs}
+    if query and query.strip():
+        for position, match in enumerate(_match_snapshot_nodes(valid, query, max_results=len(valid))):
+            query_rank.setdefault(str(match.get("ref") or ""), position)
+    order = sorted(range(len(valid)), key=lambda i: (_relevance(valid[i], query_rank), i))
+
+    budget = max(0, budget_chars - _ENVELOPE_RESERVE)
+    kept: List[int] = []
+    used = 0
+    for position in order:
+        size = _row_size(raw_rows[position])
+        if kept and used + size > budget:
+            continue
+        kept.append(position)
+        used += size
+    kept.sort()
+
+    present = [
+        index
+        for index in range(len(_COLUMNS))
+        if any(raw_rows[row][index] is not None for row in kept)
+    ]
+    counts = Counter(
+        raw_rows[row][index]
+        for row in kept
+        for index in present
+        if index != 0 and raw_rows[row][index] is not None
+    )
+    strings = [value for value, count in counts.items() if count > 1 and len(value) >= _INTERN_MIN_LENGTH]
+    interned = {value: position for position, value in enumerate(strings)}
+
+    rows: List[List[Any]] = []
+    for row_index in kept:
+        row: List[Any] = []
+        for index in present:
+            value = raw_rows[row_index][index]
+            row.append(interned.get(value, value) if value is not None and index != 0 else value)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+
+    encoded: Dict[str, Any] = {
+        "columns": [_COLUMNS[index][0] for index in present],
+        "rows": rows,
+        "node_count": len(valid),
+    }
+    if strings:
+        encoded["strings"] = strings
+    if len(kept) < len(valid):
+        encoded["omitted_nodes"] = len(valid) - len(kept)
+        encoded["omitted_hint"] = "pass request.query to rank matching nodes first, or raise request.budget_chars"
+    return encoded
+
+
+def decode_rows(encoded: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Expand a compact view back into sparse node dicts (tests and debugging)."""
+    columns = list(encoded.get("columns") or [])
+    strings = list(encoded.get("strings") or [])
+    decoded: List[Dict[str, Any]] = []
+    for row in encoded.get("rows") or []:
+        node: Dict[str, Any] = {}
+        for column, value in zip(columns, row):
+            if value is None:
+                continue
+            node[column] = strings[value] if isinstance(value, int) and column != "ref" else value
+        decoded.append(node)
+    return decoded
+
+
+def compact_snapshot_payload(
+    payload: Dict[str, Any],
+    *,
+    budget_chars: Optional[int] = None,
+    query: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Replace ``nodes``/``snapshot`` in a runtime snapshot payload with the compact view."""
+    compact = {key: value for key, value in payload.items() if key not in {"nodes", "snapshot"}}
+    delta = payload.get("delta")
+    pinned: Sequence[str] = ()
+    if isinstance(delta, dict):
+        pinned = list(delta.get("added") or []) + list(delta.get("changed") or [])
+    compact.update(
+        encode_nodes(
+            payload.get("nodes") or [],
+            budget_chars=budget_chars if budget_chars is not None else default_snapshot_budget(),
+            query=query,
+            pinned_refs=pinned,
+        )
+    )
+    compact["format"] = "compact"
+    return compact
@@ -8,7 +8,7 @@ import asyncio
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from ..decorator import tool
 from ..capability import Capability
@@ -99,6 +99,45 @@ async def _read(path: str, encoding: str, **_) -> Dict[str, Any]:
     return {"success": True, "content": content, "error": None}
 
 
+_STREAM_READ_CHARS = 16 * 1024
+
+
+async def stream_read(
+    path: str,
+    encoding: str = "utf-8",
+    **_: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Read a file in chunks, yielding `{"type": "chunk", "field": "content"}`
+    frames and a final `result` frame, so large files never sit in memory whole.
+    """
+    path = os.path.expanduser(path)
+    if not os.path.isfile(path):
+        yield {"type": "result", "ok": True, "result": {
+            "success": False, "content": None, "error": f"File not found: {path}",
+        }}
+        return
+    try:
+        handle = await asyncio.to_thread(open, path, "r", encoding=encoding)
+    except Exception as e:
+        yield {"type": "result", "ok": True, "result": {"success": False, "error": str(e)}}
+        return
+    try:
+        while True:
+            try:
+                data = await asyncio.to_thread(handle.read, _STREAM_READ_CHARS)
+            except Exception as e:
+                # Same shape `filesystem` returns for a failed read.
+                yield {"type": "result", "ok": True, "result": {"success": False, "error": str(e)}}
+                return
+            if not data:
+                break
+            yield {"type": "chunk", "field": "content", "data": data}
+    finally:
+        handle.close()
+    yield {"type": "result", "ok": True, "result": {"success": True, "content": "", "error": None}}
+
+
 async def _write(path: str, content: str, encoding: str, create_dirs: bool, **_) -> Dict[str, Any]:
     """Write content to file."""
     if content is None:
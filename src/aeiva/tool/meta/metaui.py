@@ -286,6 +286,7 @@ class _OperationRequest:
     consume: bool
     event_types: Optional[List[str]]
     since_ts: Optional[float]
+    after_seq: Optional[int]
     host: Optional[str]
     port: Optional[int]
     token: Optional[str]
@@ -836,6 +837,7 @@ def _build_operation_request(
     consume: bool,
     event_types: Optional[List[str]],
     since_ts: Optional[float],
+    after_seq: Optional[int],
     host: Optional[str],
     port: Optional[int],
     token: Optional[str],
@@ -859,6 +861,7 @@ def _build_operation_request(
         consume=consume,
         event_types=event_types,
         since_ts=since_ts,
+        after_seq=after_seq,
         host=host,
         port=port,
         token=token,
@@ -1156,6 +1159,7 @@ async def _handle_poll_events(
         session_id=request.session_id,
         event_types=request.event_types,
         since_ts=request.since_ts,
+        after_seq=request.after_seq,
         limit=request.limit,
         consume=request.consume,
     )
@@ -1240,6 +1244,7 @@ async def metaui(
     consume: bool = False,
     event_types: Optional[List[str]] = None,
     since_ts: Optional[float] = None,
+    after_seq: Optional[int] = None,
     host: Optional[str] = None,
     port: Optional[int] = None,
     token: Optional[str] = None,
@@ -1285,6 +1290,7 @@ async def metaui(
             consume=consume,
             event_types=event_types,
             since_ts=since_ts,
+            after_seq=after_seq,
             host=host,
             port=port,
             token=token,
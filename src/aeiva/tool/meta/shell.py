@@ -5,7 +5,10 @@ The most fundamental meta tool - enables all system interactions.
 """
 
 import asyncio
-from typing import Dict, Any, Optional
+import codecs
+import os
+import signal
+from typing import AsyncIterator, Dict, Any, Optional
 
 from ..decorator import tool
 from ..capability import Capability
@@ -66,3 +69,99 @@ async def shell(
             "return_code": -1,
             "success": False,
         }
+
+
+_STREAM_READ_BYTES = 16 * 1024
+
+
+async def stream_shell(
+    command: str,
+    timeout: int = 30,
+    cwd: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a shell command and yield its output incrementally.
+
+    Yields `{"type": "chunk", "field": "stdout" | "stderr", "data": str}`
+    frames as output arrives, then one `{"type": "result", ...}` frame whose
+    stdout/stderr are empty (the chunks carry the text). Closing the
+    generator early kills the process.
+    """
+    if isinstance(cwd, str) and not cwd.strip():
+        cwd = None
+    try:
+        # Own process group so an early close also stops the shell's children.
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=os.name == "posix",
+        )
+    except OSError as e:
+        yield {"type": "result", "ok": True, "result": {
+            "stdout": "", "stderr": str(e), "return_code": -1, "success": False,
+        }}
+        return
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump(field: str, reader: asyncio.StreamReader) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            block = await reader.read(_STREAM_READ_BYTES)
+            text = decoder.decode(block, final=not block)
+            if text:
+                await queue.put((field, text))
+            if not block:
+                break
+        await queue.put((field, None))
+
+    pumps = [
+        asyncio.create_task(pump("stdout", process.stdout)),
+        asyncio.create_task(pump("stderr", process.stderr)),
+    ]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        open_streams = len(pumps)
+        try:
+            while open_streams:
+                field, text = await asyncio.wait_for(queue.get(), max(0.0, deadline - loop.time()))
+                if text is None:
+                    open_streams -= 1
+                    continue
+                yield {"type": "chunk", "field": field, "data": text}
+            await asyncio.wait_for(process.wait(), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            yield {"type": "result", "ok": True, "result": {
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout}s",
+                "return_code": -1,
+                "success": False,
+            }}
+            return
+        yield {"type": "result", "ok": True, "result": {
+            "stdout": "",
+            "stderr": "",
+            "return_code": process.returncode,
+            "success": process.returncode == 0,
+        }}
+    finally:
+        for task in pumps:
+            task.cancel()
+        if process.returncode is None:
+            _kill_process_group(process)
+            await process.wait()
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            return
+        except OSError:
+            pass
+    process.kill()
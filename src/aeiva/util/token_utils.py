@@ -1,8 +1,10 @@
 
 import os
-from transformers import AutoTokenizer
 from aeiva.common.constants import DEFAULT_PAD_TOKEN
 
+# transformers is imported lazily in get_tokenizer(); for prompt token counts
+# use aeiva.llm.token_counter, which does not need it.
+
 
 def pad_or_truncate_tokens(tokens, max_length, pad_token_id):
     """ This function aims to pad or truncate tokens to max_length.
@@ -33,6 +35,8 @@ def get_tokenizer(tokenizer_name_or_path, tokenizer_cls=None, add_special_tokens
     if os.path.isdir(tokenizer_name_or_path) and tokenizer_cls is not None:
         return tokenizer_cls.from_pretrained(tokenizer_name_or_path)
 
+    from transformers import AutoTokenizer
+
     tokenizer = AutoTokenizer.from_pretrained(tokenizer_name_or_path)  #!!!
     if tokenizer.pad_token is None:
         tokenizer.add_special_tokens({'pad_token': DEFAULT_PAD_TOKEN})  #!!! NOTE: currently, the pad_token_id is 32000. It is not the same with the macaw implementation. I don't know why.
@@ -0,0 +1,72 @@
+import asyncio
+from urllib.request import urlopen
+
+import pytest
+
+from aeiva.tool.meta.browser_stack.benchmark_harness import (
+    BenchmarkScenario,
+    BenchmarkStep,
+    FixtureServer,
+    _percentile,
+    run_browser_benchmark,
+)
+
+
+class FakeRuntime:
+    def __init__(self):
+        self.urls = []
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def navigate(self, url, timeout_ms, target_id=None):
+        self.urls.append(url)
+        with urlopen(url) as response:
+            assert response.status == 200
+        return {"target_id": "t1", "url": url}
+
+    async def snapshot(self, target_id, timeout_ms, limit):
+        await asyncio.sleep(0.001)
+        return {"target_id": "t1", "nodes": []}
+
+
+def test_fixture_server_serves_parameterised_pages():
+    with FixtureServer() as server:
+        with urlopen(server.url("/form?fields=5")) as response:
+            body = response.read().decode("utf-8")
+        assert body.count("<input id=\"f") == 5
+        with urlopen(server.url("/frames?depth=2")) as response:
+            assert 'src="/frames?depth=1"' in response.read().decode("utf-8")
+
+    assert _percentile([], 50) is None
+    assert _percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert _percentile(list(range(1, 101)), 95) == pytest.approx(95.05)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_times_each_operation_through_runtime_factory():
+    runtimes = []
+
+    def factory(profile, headless):
+        runtime = FakeRuntime()
+        runtimes.append(runtime)
+        return runtime
+
+    scenario = BenchmarkScenario(
+        name="large_dom",
+        path="/large?rows=10",
+        steps=(BenchmarkStep("snapshot", {"limit": 20}), BenchmarkStep("hover", {"text": "Add 1"})),
+    )
+    report = await run_browser_benchmark(runtime_factory=factory, scenarios=[scenario], iterations=3)
+
+    summary = report.to_dict()
+    assert summary["operations"]["navigate"]["count"] == 3
+    assert summary["operations"]["navigate"]["errors"] == 0
+    assert summary["operations"]["snapshot"]["p95_ms"] >= summary["operations"]["snapshot"]["p50_ms"] > 0
+    # The fake runtime has no hover support, so every hover is timed and counted as an error.
+    assert summary["scenarios"]["large_dom"]["hover"]["errors"] == 3
+    assert len(runtimes) == 1 and runtimes[0].urls[0].endswith("/large?rows=10")
+    assert "| large_dom | snapshot | 3 |" in report.render_markdown()
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+
+from aeiva.tool.meta.browser_stack.browser_pool import BrowserContextPool
+from aeiva.tool.meta.browser_stack.session_manager import BrowserSessionManager
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeDriver:
+    launches = 0
+
+    def __init__(self):
+        self.chromium = self
+        self.stopped = False
+
+    async def launch(self, **kwargs):
+        FakeDriver.launches += 1
+        self.browser = FakeBrowser()
+        return self.browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+async def _driver():
+    return FakeDriver()
+
+
+def _pool(**kwargs):
+    FakeDriver.launches = 0
+    kwargs.setdefault("memory_percent", 0)
+    return BrowserContextPool(driver_factory=_driver, rss_probe=lambda: 123, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_profiles_share_one_browser_with_isolated_contexts():
+    pool = _pool(warm_size=2)
+    manager = BrowserSessionManager(pool=pool)
+    assert await manager.prewarm(headless=True) == 2
+
+    first = await manager.ensure_session("alice", headless=True)
+    second = await manager.ensure_session("bob", headless=True)
+
+    assert FakeDriver.launches == 1
+    assert first.runtime._context is not second.runtime._context
+    stats = pool.stats()
+    assert stats["warm_hits"] == 2
+    assert stats["browsers"]["headless"]["leased_contexts"] == 2
+
+    profiles = await manager.list_profiles()
+    assert {item["profile"] for item in profiles} == {"alice", "bob"}
+    assert all(item["pooled"] and item["startup_ms"] is not None for item in profiles)
+    assert all(item["browser_rss_bytes"] == 123 for item in profiles)
+
+    context = first.runtime._context
+    assert await manager.stop_session("alice")
+    assert context.closed
+    await manager.stop_all()
+    assert FakeDriver.launches == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_pressure_evicts_least_recently_used_session():
+    rss = {"value": 0}
+    FakeDriver.launches = 0
+    pool = BrowserContextPool(
+        warm_size=0,
+        max_rss_mb=1,
+        memory_percent=0,
+        driver_factory=_driver,
+        rss_probe=lambda: rss["value"],
+    )
+    manager = BrowserSessionManager(pool=pool)
+    for profile in ("a", "b", "c"):
+        await manager.ensure_session(profile, headless=True)
+        await asyncio.sleep(0.001)
+
+    rss["value"] = 2 * 1024 * 1024
+    evicted = []
+    original = pool.release
+
+    async def release(context):
+        evicted.append(context)
+        if len(evicted) == 2:
+            rss["value"] = 0
+        await original(context)
+
+    pool.release = release
+    await manager.ensure_session("c", headless=True)
+
+    assert [item["profile"] for item in await manager.list_profiles()] == ["c"]
+    await manager.stop_all()
+
+
+@pytest.mark.asyncio
+async def test_maintain_recycles_stale_warm_contexts_and_idle_browser():
+    pool = _pool(warm_size=1, idle_ttl_seconds=1)
+    await pool.prewarm(headless=True)
+    shared = pool._browsers[True]
+    stale = shared.warm[0]
+    stale.created_at -= 5
+
+    context, _ = await pool.lease(True)
+    assert context is not stale.context
+    assert stale.context.closed
+    await pool.release(context)
+
+    shared.last_used_at -= 5
+    await pool.maintain()
+    assert shared.browser is None
+    assert pool.stats()["recycled_contexts"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_disconnected_browser_is_relaunched_on_next_lease():
+    pool = _pool(warm_size=1)
+    await pool.prewarm(headless=True)
+    shared = pool._browsers[True]
+    crashed, old_driver = shared.browser, shared.driver
+    context, _ = await pool.lease(True)
+
+    crashed.connected = False
+    replacement, _ = await pool.lease(True)
+
+    assert FakeDriver.launches == 2 and old_driver.stopped
+    assert shared.browser is not crashed and replacement in shared.browser.contexts
+    await pool.release(context)  # a session on the dead browser can still let go
+    assert pool.stats()["browsers"]["headless"]["leased_contexts"] == 1
+    await pool.close()
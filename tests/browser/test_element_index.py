@@ -0,0 +1,46 @@
+from aeiva.tool.meta.browser_stack.element_index import _match_index
+from aeiva.tool.meta.browser_stack.element_matching import (
+    _find_click_target_candidates_from_nodes,
+    _find_type_target_from_nodes,
+    _match_snapshot_nodes,
+)
+
+
+def _node(ref, role, name, **extra):
+    node = {"ref": ref, "tag": "button" if role == "button" else "input", "role": role, "name": name}
+    node.update(extra)
+    return node
+
+
+def test_index_is_shared_per_node_list():
+    nodes = [_node("e1", "textbox", "Email"), _node("e2", "button", "Submit")]
+    index = _match_index(nodes)
+
+    assert _match_index(nodes) is index
+    _find_type_target_from_nodes(nodes, value_text="a@b.c", field_hint="email")
+    assert _match_index(nodes) is index
+
+    nodes.append(_node("e3", "textbox", "Phone"))
+    assert _match_index(nodes) is not index
+    assert _match_index(list(nodes)) is not _match_index(nodes)
+
+
+def test_candidates_keep_snapshot_order_on_ties_and_respect_limit():
+    nodes = [_node(f"e{i}", "button", "Continue") for i in range(6)]
+    nodes.insert(2, _node("x", "button", "Continue", disabled=True))
+
+    matches = _find_click_target_candidates_from_nodes(nodes, query_text="continue", max_results=3)
+
+    assert [match["ref"] for match in matches] == ["e0", "e1", "e2"]
+
+
+def test_short_hint_tokens_match_whole_words_only():
+    nodes = [
+        _node("e1", "textbox", "Paid amount"),
+        _node("e2", "textbox", "ID number"),
+    ]
+    best = _find_type_target_from_nodes(nodes, value_text="A123", field_hint="id")
+    assert best["ref"] == "e2"
+
+    # Plain queries are substring matches, so both nodes contain "id".
+    assert [m["ref"] for m in _match_snapshot_nodes(nodes, "id")] == ["e1", "e2"]
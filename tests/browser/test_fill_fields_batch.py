@@ -0,0 +1,192 @@
+import pytest
+
+from aeiva.tool.meta.browser_stack.browser_service import BrowserService
+from aeiva.tool.meta.browser_stack.security import BrowserSecurityPolicy
+
+
+def _node(ref, tag, label, input_type="", role=None, scope="main"):
+    return {
+        "ref": ref,
+        "scope": scope,
+        "tag": tag,
+        "role": role or tag,
+        "name": label,
+        "text": "",
+        "aria_label": "",
+        "placeholder": "",
+        "value": "",
+        "input_type": input_type,
+        "dom_id": "",
+        "name_attr": label.lower().replace(" ", "_"),
+        "label_text": label,
+        "readonly": False,
+        "disabled": False,
+    }
+
+
+_NODES = [
+    _node("e1", "input", "Full name", "text"),
+    _node("e2", "input", "Email", "email"),
+    _node("e3", "input", "Birth date", "date"),
+    _node("e4", "select", "Country"),
+    _node("e5", "textarea", "Notes"),
+    _node("e6", "input", "City", "text", role="combobox"),
+    _node("frame-1:e1", "input", "Card number", "text", scope="frame-1"),
+]
+
+_STEPS = [
+    {"op": "type", "field": "Full name", "value": "Ada Lovelace"},
+    {"op": "type", "field": "Email", "value": "ada@example.com"},
+    {"op": "set_date", "field": "Birth date", "value": "1815-12-10"},
+    {"op": "select", "field": "Country", "value": "UK"},
+    {"op": "type", "field": "Notes", "value": "Analytical engine"},
+    {"op": "type", "field": "City", "value": "London"},
+]
+
+
+class FakeRuntime:
+    def __init__(self, broken_refs=()):
+        self.calls = []
+        self.broken_refs = set(broken_refs)
+        self.values = {}
+
+    async def snapshot(self, target_id, timeout_ms, limit):
+        self.calls.append(("snapshot",))
+        return {"target_id": "t1", "nodes": [dict(node) for node in _NODES]}
+
+    async def fill_batch(self, *, fields, target_id, stop_on_failure=False):
+        self.calls.append(("fill_batch", tuple(field["ref"] for field in fields)))
+        results = []
+        for field in fields:
+            if field["ref"] in self.broken_refs:
+                self.values[field["ref"]] = ""
+                results.append({"ref": field["ref"], "applied": True, "field_value": ""})
+                if stop_on_failure:
+                    break
+            elif field["kind"] == "select":
+                self.values[field["ref"]] = field["value"]
+                results.append({"ref": field["ref"], "applied": True, "selected_values": ["uk", "United Kingdom"]})
+            else:
+                self.values[field["ref"]] = field["value"]
+                results.append({"ref": field["ref"], "applied": True, "field_value": field["value"]})
+        return {"target_id": "t1", "fields": results}
+
+    async def type_text(self, *, text, target_id, timeout_ms, selector=None, ref=None, submit=False, slowly=False):
+        self.calls.append(("type_text", ref))
+        self.values[ref] = text
+        return {"target_id": "t1", "field_value": text}
+
+    async def select(self, *, values, target_id, timeout_ms, selector=None, ref=None):
+        self.calls.append(("select", ref))
+        return {"target_id": "t1", "selected_values": list(values)}
+
+
+class FakeSessions:
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    async def run_with_session(self, profile, headless, create, fn):
+        return await fn(self.runtime)
+
+
+def _service(runtime):
+    policy = BrowserSecurityPolicy(
+        allow_evaluate=False,
+        allow_private_network_requests=False,
+        request_allowlist=(),
+    )
+    return BrowserService(session_manager=FakeSessions(runtime), security_policy=policy)
+
+
+async def _fill(runtime, steps=_STEPS, **options):
+    service = _service(runtime)
+    return await service._run_fill_fields(
+        profile="default",
+        headless=True,
+        timeout_ms=5000,
+        target_id="t1",
+        request={"steps": [dict(step) for step in steps], **options},
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_groups_plain_fields_and_keeps_widgets_per_step():
+    runtime = FakeRuntime()
+    payload = await _fill(runtime, batch=True)
+
+    ops = [call for call in runtime.calls if call[0] != "snapshot"]
+    assert ops == [
+        ("fill_batch", ("e1", "e2")),
+        ("type_text", "e3"),
+        ("fill_batch", ("e4", "e5")),
+        ("type_text", "e6"),
+    ]
+    assert payload["batched_steps"] == 4
+    assert payload["success_count"] == len(_STEPS)
+
+
+@pytest.mark.asyncio
+async def test_batch_results_match_per_step_results_and_fall_back_on_mismatch():
+    sequential = await _fill(FakeRuntime())
+    runtime = FakeRuntime(broken_refs={"e2"})
+    batched = await _fill(runtime, batch=True)
+
+    assert batched["steps"] == sequential["steps"]
+    assert sequential["batched_steps"] == 0
+    assert batched["batched_steps"] == 3
+    # The field whose value did not read back is retried through Playwright typing.
+    assert ("type_text", "e2") in runtime.calls
+
+
+@pytest.mark.asyncio
+async def test_batch_ends_at_a_repeated_field_so_the_last_value_wins():
+    runtime = FakeRuntime()
+    steps = [
+        {"op": "type", "field": "Full name", "value": "Ada"},
+        {"op": "type", "field": "Email", "value": "ada@example.com"},
+        {"op": "type", "field": "Full name", "value": "Ada Lovelace"},
+    ]
+    payload = await _fill(runtime, steps=steps, batch=True)
+
+    ops = [call for call in runtime.calls if call[0] != "snapshot"]
+    assert ops == [("fill_batch", ("e1", "e2")), ("fill_batch", ("e1",))]
+    assert runtime.values["e1"] == "Ada Lovelace"
+    assert payload["batched_steps"] == 3 and payload["success_count"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("continue_on_error", [False, True])
+async def test_batch_failure_falls_back_before_later_fields_are_written(continue_on_error):
+    runtime = FakeRuntime(broken_refs={"e1"})
+    steps = [
+        {"op": "type", "field": "Full name", "value": "Ada Lovelace"},
+        {"op": "type", "field": "Email", "value": "ada@example.com"},
+    ]
+    payload = await _fill(runtime, steps=steps, batch=True, continue_on_error=continue_on_error)
+
+    ops = [call for call in runtime.calls if call[0] != "snapshot"]
+    if continue_on_error:
+        assert ops == [("fill_batch", ("e1", "e2")), ("type_text", "e1")]
+        assert payload["batched_steps"] == 1
+    else:
+        # The page stops at the failed field; Email is typed after the fallback.
+        assert ops == [("fill_batch", ("e1", "e2")), ("type_text", "e1"), ("type_text", "e2")]
+        assert payload["batched_steps"] == 0
+    assert runtime.values == {"e1": "Ada Lovelace", "e2": "ada@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_frame_fields_are_filled_per_step():
+    runtime = FakeRuntime()
+    steps = [
+        {"op": "type", "field": "Full name", "value": "Ada Lovelace"},
+        {"op": "type", "field": "Card number", "value": "4242"},
+        {"op": "type", "field": "Email", "value": "ada@example.com"},
+    ]
+    payload = await _fill(runtime, steps=steps, batch=True)
+
+    ops = [call for call in runtime.calls if call[0] != "snapshot"]
+    # "frame-1:e1" would be looked up as e1 in the main document.
+    assert ops == [("fill_batch", ("e1",)), ("type_text", "frame-1:e1"), ("fill_batch", ("e2",))]
+    assert runtime.values == {"e1": "Ada Lovelace", "frame-1:e1": "4242", "e2": "ada@example.com"}
+    assert payload["batched_steps"] == 2 and payload["success_count"] == 3
@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from aeiva.tool.meta.browser_stack.browser_runtime import PlaywrightRuntime
+from aeiva.tool.meta.browser_stack.runtime_common import MAX_SNAPSHOT_BASES, TabState
+from aeiva.tool.meta.browser_stack.runtime_snapshot_script import _INCREMENTAL_SNAPSHOT_JS
+
+
+def _node(ref, name, value=""):
+    return {
+        "ref": ref,
+        "tag": "input",
+        "role": "textbox",
+        "name": name,
+        "value": value,
+        "selector": f'[data-aeiva-ref="{ref}"]',
+        "fallback_selector": f"#{ref}",
+    }
+
+
+class FakeDocument:
+    """Mimics the in-page incremental snapshot protocol."""
+
+    def __init__(self, nodes, delay=0.0):
+        self.nodes = list(nodes)
+        self.delay = delay
+        self.calls = []
+        self._generation = 0
+        self._reported = {}
+
+    async def evaluate(self, script, args):
+        assert script is _INCREMENTAL_SNAPSHOT_JS
+        self.calls.append(args["base"])
+        await asyncio.sleep(self.delay)
+        top = [dict(node) for node in self.nodes[: args["limit"]]]
+        current = {node["ref"]: repr(sorted(node.items())) for node in top}
+        delta = bool(args["base"]) and args["base"] == f"doc:{self._generation}"
+        self._generation += 1
+        result = {"id": f"doc:{self._generation}", "mode": "delta" if delta else "full", "removed": [], "order": []}
+        if delta:
+            result["nodes"] = [n for n in top if self._reported.get(n["ref"]) != current[n["ref"]]]
+            result["removed"] = [ref for ref in self._reported if ref not in current]
+            result["order"] = [n["ref"] for n in top]
+        else:
+            result["nodes"] = top
+        self._reported = current
+        return result
+
+
+class FakePage(FakeDocument):
+    url = "https://example.test/form"
+
+    def __init__(self, nodes, frames=(), delay=0.0):
+        super().__init__(nodes, delay)
+        self.main_frame = object()
+        self.frames = [self.main_frame, *frames]
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+
+def _runtime(page):
+    runtime = PlaywrightRuntime(profile="test")
+    runtime._incremental_snapshots = True
+    runtime._tab_states["tab-1"] = TabState(target_id="tab-1", page=page)
+
+    async def resolve_page(*, target_id, create):
+        return page, "tab-1"
+
+    runtime._resolve_page = resolve_page
+    return runtime
+
+
+@pytest.mark.asyncio
+async def test_since_returns_only_changed_nodes():
+    page = FakePage([_node("e1", "Email"), _node("e2", "Name"), _node("e3", "Phone")])
+    runtime = _runtime(page)
+
+    first = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80)
+    assert len(first["nodes"]) == 3
+    assert first["snapshot_id"] == "snap-1"
+
+    page.nodes[0] = _node("e1", "Email", value="a@b.c")
+    page.nodes.pop(2)
+    page.nodes.append(_node("e4", "City"))
+    second = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80, since="snap-1")
+
+    assert page.calls == [None, "doc:1"]
+    assert second["base_snapshot_id"] == "snap-1"
+    assert second["delta"] == {"added": ["e4"], "changed": ["e1"], "removed": ["e3"], "unchanged": 1}
+    assert [node["ref"] for node in second["nodes"]] == ["e4", "e1"]
+    assert second["snapshot"].splitlines() == ["+ e4 [textbox] City", "~ e1 [textbox] Email", "- e3"]
+    # Ref resolution still sees the whole page.
+    assert set(runtime._tab_states["tab-1"].refs) == {"e1", "e2", "e4"}
+
+
+@pytest.mark.asyncio
+async def test_stale_since_falls_back_to_full_snapshot():
+    page = FakePage([_node("e1", "Email")])
+    runtime = _runtime(page)
+    for _ in range(MAX_SNAPSHOT_BASES + 1):
+        await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80)
+
+    payload = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80, since="snap-1")
+    assert payload["base_snapshot_id"] is None
+    assert [node["ref"] for node in payload["nodes"]] == ["e1"]
+
+
+@pytest.mark.asyncio
+async def test_internal_snapshots_do_not_expire_the_since_base():
+    page = FakePage([_node("e1", "Email"), _node("e2", "Name")])
+    runtime = _runtime(page)
+    first = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80)
+
+    page.nodes[0] = _node("e1", "Email", value="a@b.c")
+    # A click or type that resolves its target by hint takes its own snapshot.
+    await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80)
+    page.nodes[1] = _node("e2", "Name", value="Ada")
+
+    payload = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80, since=first["snapshot_id"])
+    assert payload["base_snapshot_id"] == "snap-1"
+    assert payload["delta"] == {"added": [], "changed": ["e1", "e2"], "removed": [], "unchanged": 0}
+
+    page.url = "https://example.test/next"
+    moved = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80, since=payload["snapshot_id"])
+    assert moved["base_snapshot_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_frames_are_evaluated_concurrently():
+    frames = [FakeDocument([_node(f"f{i}", f"Field {i}")], delay=0.1) for i in range(3)]
+    page = FakePage([_node("e1", "Email")], frames=frames, delay=0.1)
+    runtime = _runtime(page)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    payload = await runtime.snapshot(target_id=None, timeout_ms=1000, limit=80)
+
+    assert loop.time() - started < 0.3
+    assert [node["ref"] for node in payload["nodes"]] == ["e1", "frame-1:f0", "frame-2:f1", "frame-3:f2"]
+
+
+def test_incremental_snapshots_are_opt_in(monkeypatch):
+    monkeypatch.delenv("AEIVA_BROWSER_INCREMENTAL_SNAPSHOT", raising=False)
+    assert PlaywrightRuntime(profile="test")._incremental_snapshots is False
+    monkeypatch.setenv("AEIVA_BROWSER_INCREMENTAL_SNAPSHOT", "1")
+    assert PlaywrightRuntime(profile="test")._incremental_snapshots is True
+
+
+@pytest.mark.asyncio
+async def test_programmatic_value_changes_reach_the_delta():
+    async_api = pytest.importorskip("playwright.async_api")
+    async with async_api.async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch()
+        except Exception as exc:
+            pytest.skip(f"chromium unavailable: {exc}")
+        try:
+            page = await browser.new_page()
+            await page.set_content('<form><input id="email" value="a"><button type="button">Go</button></form>')
+
+            async def snapshot(base):
+                return await page.evaluate(_INCREMENTAL_SNAPSHOT_JS, {"limit": 80, "base": base})
+
+            first = await snapshot(None)
+            await page.evaluate("() => { document.getElementById('email').value = 'typed@example.test'; }")
+            second = await snapshot(first["id"])
+            assert second["mode"] == "delta"
+            assert [node["value"] for node in second["nodes"]] == ["typed@example.test"]
+
+            await page.evaluate("() => document.querySelector('form').reset()")
+            third = await snapshot(second["id"])
+            assert [node["value"] for node in third["nodes"]] == ["a"]
+
+            await page.add_style_tag(content="")
+            fourth = await snapshot(third["id"])  # the new <style> forces one full rescan
+            await page.evaluate("() => document.styleSheets[0].insertRule('#email { display: none; }')")
+            fifth = await snapshot(fourth["id"])
+            assert fifth["removed"] == [n["ref"] for n in first["nodes"] if n["dom_id"] == "email"]
+        finally:
+            await browser.close()
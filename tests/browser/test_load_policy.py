@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from aeiva.tool.meta.browser_stack.browser_runtime import PlaywrightRuntime
+from aeiva.tool.meta.browser_stack.runtime_load_policy import LoadPolicy
+
+
+class FakeRoute:
+    def __init__(self):
+        self.outcome = None
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+    async def abort(self, error_code=None):
+        self.outcome = "abort"
+
+
+class FakeFrame:
+    def __init__(self, page):
+        self.page = page
+
+
+class FakeRequest:
+    def __init__(self, page, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = "GET"
+        self.frame = FakeFrame(page)
+        self.failure = None
+
+
+class FakeResponse:
+    def __init__(self, request, size):
+        self.request = request
+        self.url = request.url
+        self.status = 200
+        self.ok = True
+        self.headers = {"content-length": str(size)}
+
+
+class FakePage:
+    def __init__(self, context, resources):
+        self.context = context
+        self.url = "about:blank"
+        self.resources = resources
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, event, *args):
+        if event in self.handlers:
+            self.handlers[event](*args)
+
+    async def goto(self, url, timeout, wait_until):
+        self.url = url
+        loop = asyncio.get_running_loop()
+        for resource_url, resource_type in self.resources:
+            request = FakeRequest(self, resource_url, resource_type)
+            self.emit("request", request)
+            route = FakeRoute()
+            if self.context.route_handler is not None:
+                await self.context.route_handler(route, request)
+            if route.outcome == "abort":
+                self.emit("requestfailed", request)
+                continue
+
+            def finish(request=request):
+                self.emit("response", FakeResponse(request, 1000))
+                self.emit("requestfinished", request)
+
+            loop.call_later(0.05, finish)
+
+    async def wait_for_timeout(self, ms):
+        await asyncio.sleep(ms / 1000)
+
+
+class FakeContext:
+    def __init__(self):
+        self.route_handler = None
+        self.pages = []
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+
+def _runtime(resources):
+    runtime = PlaywrightRuntime(profile="test")
+    runtime._started = True
+    runtime._context = FakeContext()
+    page = FakePage(runtime._context, resources)
+    runtime._context.pages.append(page)
+    runtime._register_page(page)
+    return runtime, page
+
+
+_RESOURCES = [
+    ("https://shop.example/app.js", "script"),
+    ("https://shop.example/hero.jpg", "image"),
+    ("https://cdn.other.net/widget.js", "script"),
+    ("https://www.google-analytics.com/collect", "xhr"),
+    ("https://shop.example/site.css", "stylesheet"),
+]
+
+
+def test_presets_block_by_type_domain_and_third_party():
+    fast = LoadPolicy.preset("fast")
+    assert fast.block_reason("https://shop.example/hero.jpg", "image") == "type:image"
+    assert fast.block_reason("https://www.google-analytics.com/collect", "xhr") == "tracker"
+    assert fast.block_reason("https://cdn.other.net/widget.js", "script", "https://shop.example/") is None
+    assert fast.block_reason("https://shop.example/", "document") is None
+
+    text = LoadPolicy.preset("text")
+    assert text.block_reason("https://cdn.other.net/w.js", "script", "https://www.shop.example/") == "third_party_script"
+    assert text.block_reason("https://static.shop.example/a.js", "script", "https://www.shop.example/") is None
+
+    custom = LoadPolicy.from_request({"block_domains": ["ads.example"]})
+    assert custom.mode == "custom"
+    assert custom.block_reason("https://x.ads.example/pixel", "image") == "domain:ads.example"
+    assert not LoadPolicy.from_request("full").blocks_anything
+
+
+@pytest.mark.asyncio
+async def test_navigate_with_text_policy_reports_savings_and_quiet_readiness():
+    runtime, page = _runtime(_RESOURCES)
+
+    payload = await runtime.navigate("https://shop.example/", timeout_ms=5000, load="text")
+
+    load = payload["load"]
+    assert load["mode"] == "text"
+    assert load["requests"] == 5
+    assert load["blocked_requests"] == 4
+    assert load["blocked_by_reason"] == {
+        "type:image": 1,
+        "third_party_script": 1,
+        "tracker": 1,
+        "type:stylesheet": 1,
+    }
+    assert load["bytes_saved_estimate"] > 0
+    assert load["bytes_loaded"] == 1000
+    assert load["ready"] == "network_quiet"
+    assert load["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_policy_does_not_install_routing():
+    runtime, page = _runtime(_RESOURCES[:1])
+
+    payload = await runtime.navigate("https://shop.example/", timeout_ms=5000)
+
+    assert runtime._context.route_handler is None
+    assert payload["load"]["mode"] == "full"
+    assert payload["load"]["blocked_requests"] == 0
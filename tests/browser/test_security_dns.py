@@ -0,0 +1,89 @@
+import asyncio
+import socket
+
+import pytest
+
+from aeiva.tool.meta.browser_stack import security
+from aeiva.tool.meta.browser_stack.security import BrowserSecurityPolicy, _HostResolver
+
+
+def _policy(resolver, **kwargs):
+    return BrowserSecurityPolicy(
+        allow_evaluate=False,
+        allow_private_network_requests=False,
+        request_allowlist=(),
+        dns_resolver=resolver,
+        **kwargs,
+    )
+
+
+def _addrinfo(*ips):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0)) for ip in ips]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_are_single_flighted_and_cached(monkeypatch):
+    loop = asyncio.get_running_loop()
+    calls = []
+
+    async def getaddrinfo(host, port):
+        calls.append(host)
+        await asyncio.sleep(0.01)
+        return _addrinfo("10.1.2.3" if host == "internal.example" else "93.184.216.34")
+
+    monkeypatch.setattr(loop, "getaddrinfo", getaddrinfo)
+    policy = _policy(_HostResolver(ttl_seconds=60, max_entries=8))
+
+    results = await asyncio.gather(
+        *(policy.avalidate_request_url(f"https://example.com/{i}") for i in range(10)),
+        policy.avalidate_request_url("https://internal.example/"),
+    )
+
+    assert calls.count("example.com") == 1
+    assert all(result == (True, None) for result in results[:10])
+    assert results[10][0] is False and "10.1.2.3" in results[10][1]
+
+    assert await policy.avalidate_request_url("http://example.com/again") == (True, None)
+    assert calls.count("example.com") == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_respect_fail_closed_and_negative_ttl(monkeypatch):
+    loop = asyncio.get_running_loop()
+    calls = []
+
+    async def getaddrinfo(host, port):
+        calls.append(host)
+        raise socket.gaierror("no such host")
+
+    monkeypatch.setattr(loop, "getaddrinfo", getaddrinfo)
+    resolver = _HostResolver(ttl_seconds=60, negative_ttl_seconds=0.05)
+    closed = _policy(resolver, dns_fail_closed=True)
+    open_policy = _policy(resolver)
+
+    assert (await closed.avalidate_request_url("https://gone.example/"))[0] is False
+    assert await open_policy.avalidate_request_url("https://gone.example/") == (True, None)
+    assert calls == ["gone.example"]
+
+    await asyncio.sleep(0.06)
+    await open_policy.avalidate_request_url("https://gone.example/")
+    assert calls == ["gone.example", "gone.example"]
+
+
+def test_sync_validation_shares_cache_with_lru_cap(monkeypatch):
+    calls = []
+
+    def resolve(host):
+        calls.append(host)
+        return (security.ipaddress.ip_address("93.184.216.34"),)
+
+    monkeypatch.setattr(security, "_resolve_host_ips", resolve)
+    resolver = _HostResolver(ttl_seconds=60, max_entries=2)
+    policy = _policy(resolver)
+
+    for host in ("a.example", "b.example", "a.example", "c.example", "a.example", "b.example"):
+        assert policy.validate_request_url(f"https://{host}/") == (True, None)
+
+    # b.example was the least recently used entry when c.example arrived.
+    assert calls == ["a.example", "b.example", "c.example", "b.example"]
+    assert resolver.stats()["entries"] == 2
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from aeiva.tool.meta.browser_stack.browser_service import BrowserService
+from aeiva.tool.meta.browser_stack.security import BrowserSecurityPolicy
+from aeiva.tool.meta.browser_stack.snapshot_encoding import decode_rows, encode_nodes
+
+
+def _node(i, role="button", name=None, **extra):
+    node = {
+        "ref": f"e{i}",
+        "scope": "main",
+        "tag": "input" if role == "textbox" else role,
+        "role": role,
+        "name": name or f"Add to cart {i}",
+        "text": name or f"Add to cart {i}",
+        "aria_label": "",
+        "placeholder": "",
+        "value": "",
+        "aria_valuenow": "",
+        "input_type": "text" if role == "textbox" else "",
+        "dom_id": "",
+        "name_attr": "",
+        "label_text": "",
+        "readonly": False,
+        "disabled": False,
+        "selector": f'[data-aeiva-ref="e{i}"]',
+        "fallback_selector": f"div.products > div:nth-of-type({i + 1}) > button.add-to-cart",
+    }
+    node.update(extra)
+    return node
+
+
+def _nodes(count):
+    nodes = [_node(i, role="link", name="Product details") for i in range(count)]
+    nodes.append(_node(count, role="textbox", name="Promo code", placeholder="Enter code"))
+    nodes.append(_node(count + 1, role="button", name="Checkout", disabled=True))
+    return nodes
+
+
+def _json_size(value):
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def test_compact_rows_drop_empties_selectors_and_intern_repeats():
+    nodes = _nodes(20)
+    encoded = encode_nodes(nodes, budget_chars=100_000)
+
+    assert encoded["node_count"] == 22 and "omitted_nodes" not in encoded
+    assert "selector" not in json.dumps(encoded)
+    assert encoded["strings"] == ["Product details"]
+    assert _json_size(encoded) * 4 < _json_size(nodes)
+
+    decoded = decode_rows(encoded)
+    assert decoded[0] == {"ref": "e0", "role": "link", "name": "Product details"}
+    assert decoded[20] == {"ref": "e20", "role": "textbox", "name": "Promo code", "placeholder": "Enter code", "type": "text", "tag": "input"}
+    assert decoded[21]["flags"] == "disabled"
+
+
+def test_budget_keeps_query_matches_and_fields_first_in_page_order():
+    nodes = _nodes(300)
+    nodes.insert(150, _node(999, role="link", name="Shipping policy"))
+
+    encoded = encode_nodes(nodes, budget_chars=1200, query="shipping")
+
+    refs = [row[0] for row in encoded["rows"]]
+    assert _json_size(encoded) <= 1200
+    assert encoded["omitted_nodes"] == len(nodes) - len(refs)
+    assert {"e999", "e300"} <= set(refs)
+    # Disabled controls rank last and the view keeps original page order.
+    assert "e301" not in refs
+    assert refs == sorted(refs, key=lambda ref: [n["ref"] for n in nodes].index(ref))
+
+
+class FakeRuntime:
+    async def snapshot(self, target_id, timeout_ms, limit):
+        return {"target_id": "t1", "url": "https://shop.example/", "nodes": _nodes(5), "snapshot": "...", "snapshot_id": "snap-1"}
+
+
+class FakeSessions:
+    async def run_with_session(self, profile, headless, create, fn):
+        return await fn(FakeRuntime())
+
+
+@pytest.mark.asyncio
+async def test_snapshot_operation_returns_compact_view_unless_full_requested():
+    service = BrowserService(
+        session_manager=FakeSessions(),
+        security_policy=BrowserSecurityPolicy(
+            allow_evaluate=False,
+            allow_private_network_requests=False,
+            request_allowlist=(),
+        ),
+    )
+
+    compact = await service.execute(operation="snapshot", target_id="t1")
+    assert compact["success"] and compact["format"] == "compact"
+    assert "nodes" not in compact and "snapshot" not in compact
+    assert compact["snapshot_id"] == "snap-1" and len(compact["rows"]) == 7
+
+    full = await service.execute(operation="snapshot", target_id="t1", request={"format": "full"})
+    assert len(full["nodes"]) == 7 and full["snapshot"] == "..."
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from aeiva.host.host_config import HostConfig
+from aeiva.host.host_router import HostRouter
+
+
+class FakeHosts:
+    """MockTransport handler for several hosts keyed by hostname."""
+
+    def __init__(self, delays=None, down=()):
+        self.delays = dict(delays or {})
+        self.down = set(down)
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    def _check(self, request):
+        host = request.url.host
+        if host in self.down:
+            raise httpx.ConnectError(f"{host} refused", request=request)
+        return host
+
+    async def __call__(self, request):
+        host = self._check(request)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(host, 0.01))
+        finally:
+            self.active -= 1
+        self.calls.append(host)
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True, "id": body["id"], "result": host})
+
+    def sync(self, request):
+        host = self._check(request)
+        return httpx.Response(200, json={"ok": True, "allowed_tools": "all"})
+
+
+def _router(fake, hosts, **extra):
+    config = HostConfig.from_dict({
+        "enabled": True,
+        "hosts": {name: {"url": f"http://{name}", "tools": ["echo"], **opts} for name, opts in hosts.items()},
+        **extra,
+    })
+    return HostRouter(
+        config,
+        transport=httpx.MockTransport(fake.sync),
+        async_transport=httpx.MockTransport(fake),
+    )
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_requests_respects_weights_and_limits():
+    fake = FakeHosts()
+    router = _router(fake, {"big": {"weight": 3}, "small": {}})
+    await asyncio.gather(*(router.execute("echo", {}) for _ in range(8)))
+    assert fake.calls.count("big") == 6 and fake.calls.count("small") == 2
+
+    fake = FakeHosts()
+    router = _router(fake, {"solo": {"max_concurrency": 1}})
+    results = await asyncio.gather(*(router.execute("echo", {}) for _ in range(3)))
+    assert results == ["solo"] * 3 and fake.max_active == 1
+
+
+@pytest.mark.asyncio
+async def test_dead_host_is_ejected_then_recovered_by_probe():
+    fake = FakeHosts(down={"a"})
+    router = _router(fake, {"a": {}, "b": {}}, eject_after=2, eject_seconds=60)
+
+    for _ in range(4):
+        assert await router.execute("echo", {}) == "b"
+    stats = router.stats()
+    assert stats["a"]["healthy"] is False and stats["a"]["ejections"] == 1
+    assert stats["a"]["failovers"] == 2  # only the calls before ejection touched `a`
+
+    fake.down.clear()
+    assert router.probe_hosts() == {"a": True, "b": True}
+    assert router.stats()["a"]["healthy"] is True
+    await asyncio.gather(*(router.execute("echo", {}) for _ in range(4)))
+    assert "a" in fake.calls
+
+
+@pytest.mark.asyncio
+async def test_idempotent_tools_are_hedged_to_a_second_host():
+    fake = FakeHosts(delays={"slow": 1.0, "fast": 0.01})
+    router = _router(fake, {"slow": {}, "fast": {}}, hedge_tools=["echo"], hedge_delay_ms=50)
+
+    started = time.perf_counter()
+    assert await router.execute("echo", {}) == "fast"
+    assert time.perf_counter() - started < 0.5
+    stats = router.stats()
+    assert stats["slow"]["hedges"] == 1 and stats["slow"]["inflight"] == 0
+    assert stats["slow"]["healthy"] is True  # the cancelled request is not a failure
+
+
+@pytest.mark.asyncio
+async def test_saturated_host_serves_waiters_in_arrival_order():
+    order = []
+
+    async def handler(request):
+        body = json.loads(request.content)
+        order.append(body["args"]["n"])
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"ok": True, "id": body["id"], "result": body["args"]["n"]})
+
+    config = HostConfig.from_dict({
+        "enabled": True,
+        "hosts": {"solo": {"url": "http://solo", "tools": ["echo"], "max_concurrency": 1}},
+    })
+    router = HostRouter(config, async_transport=httpx.MockTransport(handler))
+    tasks = []
+    for n in range(5):
+        tasks.append(asyncio.create_task(router.execute("echo", {"n": n})))
+        await asyncio.sleep(0.001)
+    tasks[2].cancel()  # a cancelled waiter gives up its place without taking a slot
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert order == [0, 1, 3, 4]
+    assert isinstance(results[2], asyncio.CancelledError)
+    host = router._hosts["solo"]
+    assert host.inflight == 0 and not host.waiters
+    await router.aclose()
+
+
+def test_sync_callers_wait_for_a_released_slot():
+
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True, "id": body["id"], "result": body["args"]["n"]})
+
+    config = HostConfig.from_dict({
+        "enabled": True,
+        "hosts": {"solo": {"url": "http://solo", "tools": ["echo"], "max_concurrency": 1, "timeout": 5}},
+    })
+    router = HostRouter(config, transport=httpx.MockTransport(handler))
+    results = [None] * 4
+    threads = [
+        threading.Thread(target=lambda n=n: results.__setitem__(n, router.execute_sync("echo", {"n": n})))
+        for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [0, 1, 2, 3] and active["max"] == 1
+    assert router._hosts["solo"].inflight == 0
+    router.close()
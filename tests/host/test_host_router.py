@@ -0,0 +1,104 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+import aeiva.host.host_daemon as host_daemon
+from aeiva.host.host_config import HostConfig
+from aeiva.host.host_router import HostRouter
+
+
+class FakeRunner:
+    def __init__(self, allowed_tools=None, command_policy=None):
+        self.allowed = set(allowed_tools or [])
+
+    async def execute(self, tool, args):
+        if self.allowed and tool not in self.allowed:
+            raise PermissionError(f"Tool not allowed on host: {tool}")
+        await asyncio.sleep(0.05)
+        return {"tool": tool, "echo": args}
+
+
+def _config(url):
+    return HostConfig.from_dict({
+        "enabled": True,
+        "hosts": {"box": {"url": url, "tools": ["echo", "shell"], "token": "secret"}},
+    })
+
+
+@pytest.fixture
+def daemon_url(monkeypatch, serve):
+    monkeypatch.setattr(host_daemon, "HostRunner", FakeRunner)
+    return serve(host_daemon.build_app(allowed_tools=["echo"], auth_token="secret"))
+
+
+def test_sync_calls_reuse_one_keepalive_connection(daemon_url):
+    router = HostRouter(_config(daemon_url))
+    try:
+        for i in range(5):
+            assert router.execute_sync("echo", {"n": i}) == {"tool": "echo", "echo": {"n": i}}
+        assert router.execute_sync("unrouted", {}) is None
+        stats = router.stats()["box"]
+        assert stats["requests"] == 5 and stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4 and stats["latency_ms_avg"] > 0
+    finally:
+        router.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_one_request_and_keeps_call_order(daemon_url):
+    router = HostRouter(_config(daemon_url))
+    try:
+        started = time.perf_counter()
+        results = await router.execute_batch(
+            [("echo", {"n": 1}), ("unrouted", {}), ("shell", {"command": "ls"}), ("echo", {"n": 2})]
+        )
+        assert time.perf_counter() - started < 0.5  # the daemon runs the calls concurrently
+        assert results[0] == {"tool": "echo", "echo": {"n": 1}}
+        assert results[1] is None
+        assert results[2]["error"] == "forbidden"
+        assert results[3] == {"tool": "echo", "echo": {"n": 2}}
+        stats = router.stats()["box"]
+        assert (stats["requests"], stats["calls"]) == (1, 3)
+
+        assert router.execute_batch_sync([("echo", {"n": 3}), ("echo", {"n": 4})])[1]["echo"] == {"n": 4}
+    finally:
+        await router.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_falls_back_to_single_invokes_on_old_daemons():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path == "/invoke_batch":
+            return httpx.Response(404, json={"detail": "Not Found"})
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"ok": True, "id": body["id"], "result": body["args"]})
+
+    router = HostRouter(_config("http://box"), async_transport=httpx.MockTransport(handler))
+    results = await router.execute_batch([("echo", {"n": 1}), ("echo", {"n": 2})])
+    assert results == [{"n": 1}, {"n": 2}]
+    assert seen == ["/invoke_batch", "/invoke", "/invoke"]
+    await router.aclose()
+
+
+def test_async_clients_are_closed_when_their_loop_shuts_down(daemon_url):
+    router = HostRouter(_config(daemon_url))
+    host = router._hosts["box"]
+
+    async def call():
+        assert await router.execute("echo", {"n": 1}) == {"tool": "echo", "echo": {"n": 1}}
+        return router._async_client(host)
+
+    try:
+        first = asyncio.run(call())
+        assert first.is_closed and router._async_clients == {}
+        second = asyncio.run(call())
+        assert second is not first and second.is_closed
+        assert router._async_clients == {} and router._loop_guards == {}
+    finally:
+        router.close()
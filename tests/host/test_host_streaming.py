@@ -0,0 +1,99 @@
+import sys
+import time
+
+import pytest
+
+import aeiva.host.host_daemon as host_daemon
+from aeiva.host.host_config import HostConfig
+from aeiva.host.host_router import HostRouter
+from aeiva.host.host_runner import HostRunner
+
+
+class StreamingRunner(HostRunner):
+    """HostRunner without tool discovery; only the streaming tools are used."""
+
+    def __init__(self, allowed_tools=None, command_policy=None):
+        self._allowed = None
+        self._command_policy = command_policy or host_daemon.ShellCommandPolicy()
+        self._registry = None
+
+
+@pytest.fixture
+def router(monkeypatch, serve):
+    monkeypatch.setattr(host_daemon, "HostRunner", StreamingRunner)
+    url = serve(host_daemon.build_app(require_auth=False))
+    router = HostRouter(HostConfig.from_dict({
+        "enabled": True,
+        "hosts": {"box": {"url": url, "tools": ["shell", "filesystem"]}},
+        "stream_max_chars": 500,
+    }))
+    yield router
+    router.close()
+
+
+def test_streamed_shell_result_matches_buffered_shape(router):
+    command = f"{sys.executable} -c \"import sys; print('hi'); print('err', file=sys.stderr)\""
+    result = router.execute_sync("shell", {"command": command})
+    assert result == {"stdout": "hi\n", "stderr": "err\n", "return_code": 0, "success": True}
+
+
+def _slow_printer(marker):
+    script = (
+        "import time; "
+        "[print('x' * 100, flush=True) or time.sleep(0.002) for _ in range(300)]; "
+        f"open({str(marker)!r}, 'w').close()"
+    )
+    return {"command": f"{sys.executable} -c \"{script}\"", "timeout": 60}
+
+
+@pytest.mark.asyncio
+async def test_stream_past_budget_discards_output_but_lets_command_finish(router, tmp_path):
+    marker = tmp_path / "finished"
+    chunks = []
+    result = await router.execute_stream(
+        "shell",
+        _slow_printer(marker),
+        on_chunk=lambda field, text: chunks.append((field, text)),
+    )
+    assert marker.exists()
+    assert result["return_code"] == 0 and result["success"] is True
+    assert result["truncated"] is True and len(result["stdout"]) == 500
+    assert "".join(text for _, text in chunks) == result["stdout"]
+
+
+@pytest.mark.asyncio
+async def test_stream_kill_on_budget_stops_at_budget_and_cancels_host_command(router, tmp_path):
+    marker = tmp_path / "finished"
+    started = time.perf_counter()
+    result = await router.execute_stream("shell", _slow_printer(marker), kill_on_budget=True)
+    assert time.perf_counter() - started < 0.5
+    assert result["truncated"] is True and len(result["stdout"]) == 500
+    time.sleep(1.0)  # left alone, the command finishes in ~0.6s
+    assert not marker.exists()  # closing the stream killed it
+
+
+@pytest.mark.asyncio
+async def test_output_of_exactly_the_budget_is_not_truncated(router):
+    command = f"{sys.executable} -c \"print('y' * 499)\""
+    result = await router.execute_stream("shell", {"command": command})
+    assert result == {"stdout": "y" * 499 + "\n", "stderr": "", "return_code": 0, "success": True}
+
+
+def test_large_file_read_streams_in_chunks(router, tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_text("0123456789" * 5000)
+    result = router._invoke_stream_sync(
+        router._pick_host("filesystem"),
+        {"tool": "filesystem", "args": {"operation": "read", "path": str(path)}, "id": "r1"},
+        max_chars=0,
+    )
+    assert result == {"success": True, "content": "0123456789" * 5000, "error": None}
+    truncated = router.execute_sync("filesystem", {"operation": "read", "path": str(path)})
+    assert truncated["truncated"] is True and len(truncated["content"]) == 500
+
+
+def test_failed_streamed_read_keeps_the_tool_result_shape(router, tmp_path):
+    path = tmp_path / "latin1.txt"
+    path.write_bytes(b"caf\xe9")
+    result = router.execute_sync("filesystem", {"operation": "read", "path": str(path)})
+    assert result["success"] is False and "decode" in result["error"]
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+from aeiva.llm.backend import LLMBackend
+from aeiva.llm.llm_gateway_config import LLMGatewayConfig
+from aeiva.llm.rate_limiter import (
+    RequestGovernor,
+    extract_headers,
+    llm_priority,
+    parse_duration,
+    parse_retry_after,
+)
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.litellm_response_headers = headers
+
+
+class GatedHandler:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.fail_next = None
+
+    async def execute(self, params, stream: bool = False):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_next is not None:
+                exc, self.fail_next = self.fail_next, None
+                raise exc
+            return {"ok": params}
+        finally:
+            self.active -= 1
+
+
+def test_header_parsing():
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("1.5") == 1.5
+    assert parse_retry_after({"retry-after-ms": "250"}) == pytest.approx(0.25)
+    assert parse_retry_after({"retry-after": "3"}) == 3.0
+
+    headers = extract_headers(RateLimited({"llm_provider-Retry-After": "2"}))
+    assert headers["retry-after"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_backend_caps_concurrency_per_model():
+    cfg = LLMGatewayConfig(
+        llm_model_name="gpt-4o-governor-cap", llm_api_key="test", llm_max_concurrent_requests=2,
+    )
+    handler = GatedHandler()
+    backend = LLMBackend(cfg, handler=handler)
+
+    await asyncio.gather(*(backend.execute(i, stream=False) for i in range(8)))
+
+    assert handler.peak == 2
+    stats = backend.governor.stats()
+    assert stats["acquired"] == 8
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_depth"] >= 6
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_halves_concurrency_and_honours_retry_after():
+    cfg = LLMGatewayConfig(
+        llm_model_name="gpt-4o-governor-429", llm_api_key="test", llm_max_concurrent_requests=4,
+    )
+    handler = GatedHandler()
+    backend = LLMBackend(cfg, handler=handler)
+    handler.fail_next = RateLimited({"retry-after-ms": "100"})
+
+    with pytest.raises(RateLimited):
+        await backend.execute("x", stream=False)
+    stats = backend.governor.stats()
+    assert stats["throttled"] == 1
+    assert stats["concurrency_limit"] == 2
+    assert stats["blocked_for_s"] > 0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await backend.execute("y", stream=False)
+    assert loop.time() - started >= 0.08
+
+
+def test_limit_recovers_after_successes():
+    governor = RequestGovernor(max_concurrent=4, recovery_successes=2)
+    governor.observe_rate_limited({"retry-after": "0"})
+    assert governor.limit == 2
+    for _ in range(4):
+        governor.observe_success()
+    assert governor.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_preempt_background_queue():
+    governor = RequestGovernor(max_concurrent=1)
+    order = []
+
+    async def request(tag, priority):
+        with llm_priority(priority):
+            async with governor.slot():
+                order.append(tag)
+                await asyncio.sleep(0.01)
+
+    blocker = asyncio.create_task(request("first", "interactive"))
+    await asyncio.sleep(0)
+    background = [asyncio.create_task(request(f"bg{i}", "background")) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("user", "interactive"))
+    await asyncio.gather(blocker, interactive, *background)
+
+    assert order[:2] == ["first", "user"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests():
+    governor = RequestGovernor(max_concurrent=8, requests_per_minute=600)  # 10/s, burst 600
+    governor._tokens = 1.0
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        async with governor.slot():
+            pass
+    # One burst token, then two refills at 10/s.
+    assert loop.time() - started >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_waiters_queued_before_a_429_are_woken_after_the_pause():
+    governor = RequestGovernor(max_concurrent=2)
+    await governor.acquire()
+    await governor.acquire()
+
+    async def queued():
+        async with governor.slot():
+            await asyncio.sleep(0.01)
+
+    waiters = [asyncio.create_task(queued()) for _ in range(2)]
+    await asyncio.sleep(0.01)  # both now wait with no time-based wake-up
+    governor.observe_rate_limited({"retry-after-ms": "150"})
+    governor.release()
+    governor.release()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=2)
+    assert loop.time() - started >= 0.12
+    assert governor.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_holds_the_slot_until_the_stream_is_consumed():
+    class StreamingHandler:
+        async def execute(self, params, stream: bool = False):
+            async def chunks():
+                for index in range(3):
+                    await asyncio.sleep(0.01)
+                    yield index
+
+            return chunks()
+
+    cfg = LLMGatewayConfig(
+        llm_model_name="gpt-4o-governor-stream", llm_api_key="test", llm_max_concurrent_requests=1,
+    )
+    backend = LLMBackend(cfg, handler=StreamingHandler())
+    stream = await backend.execute("x", stream=True)
+    assert backend.governor.stats()["in_flight"] == 1
+    assert [chunk async for chunk in stream] == [0, 1, 2]
+    assert backend.governor.stats()["in_flight"] == 0
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from aeiva.llm.backend import LLMResponse
+from aeiva.llm.llm_client import LLMClient
+from aeiva.llm.llm_gateway_config import LLMGatewayConfig
+from aeiva.llm.response_cache import LLMResponseCache, make_cache_key
+
+
+class CountingBackend:
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def build_params(self, messages, tools=None, **kwargs):
+        return {"messages": messages}
+
+    async def execute(self, params, stream: bool = False):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"n": self.calls}
+
+    def execute_sync(self, params):
+        self.calls += 1
+        return {"n": self.calls}
+
+    def parse_response(self, response):
+        usage = {"prompt_tokens": 10, "completion_tokens": 5}
+        return LLMResponse(f"answer {response['n']}", [], f"resp_{response['n']}", usage, response)
+
+
+def _client(**overrides):
+    cfg = LLMGatewayConfig(
+        llm_model_name="gpt-4o",
+        llm_api_key="test",
+        llm_temperature=0.0,
+        llm_cache_enabled=True,
+        **overrides,
+    )
+    client = LLMClient(cfg)
+    client.response_cache = LLMResponseCache(path=cfg.llm_cache_path)
+    backend = CountingBackend(delay=0.05)
+    client.engine.backend = backend
+    return client, backend
+
+
+def test_cache_key_is_canonical():
+    assert make_cache_key({"a": 1, "b": [1, 2]}) == make_cache_key({"b": [1, 2], "a": 1})
+    assert make_cache_key({"a": 1}) != make_cache_key({"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_hit_cache_and_collapse_in_flight():
+    client, backend = _client()
+    prompt = [{"role": "user", "content": "summarize"}]
+
+    results = await asyncio.gather(*(client.arun(list(prompt)) for _ in range(5)))
+    assert backend.calls == 1
+    assert {r.text for r in results} == {"answer 1"}
+
+    history = list(prompt)
+    await client.arun(history)
+    assert backend.calls == 1
+    assert history[-1] == {"role": "assistant", "content": "answer 1"}
+    assert client.metrics.cache_hits == 5
+    assert client.metrics.cache_misses == 1
+    assert client.metrics.cache_saved_tokens == 75
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_requests_bypass_cache():
+    client, backend = _client()
+    prompt = [{"role": "user", "content": "write a poem"}]
+    await client.arun(list(prompt), temperature=0.9)
+    await client.arun(list(prompt), temperature=0.9)
+    assert backend.calls == 2
+
+
+def test_sqlite_tier_survives_new_cache(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    client, backend = _client(llm_cache_path=path)
+    prompt = [{"role": "user", "content": "hello"}]
+    assert client.run(list(prompt)).text == "answer 1"
+
+    fresh, fresh_backend = _client(llm_cache_path=path)
+    assert fresh.run(list(prompt)).text == "answer 1"
+    assert fresh_backend.calls == 0
+    assert fresh.response_cache.disk_hits == 1
+
+
+def test_memory_tier_evicts_and_expires():
+    cache = LLMResponseCache(max_entries=2, ttl_seconds=None)
+    for index in range(3):
+        cache.put(f"k{index}", {"text": str(index)})
+    assert cache.get("k0") is None
+    assert cache.get("k2") == {"text": "2"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_collapsed_waiters():
+    cache = LLMResponseCache()
+    calls = []
+
+    async def compute():
+        calls.append(len(calls))
+        await asyncio.sleep(0.05)
+        return {"text": f"call {len(calls)}"}
+
+    leader = asyncio.create_task(cache.aget_or_compute("k", compute))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.aget_or_compute("k", compute))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await waiter == ({"text": "call 2"}, False)  # the waiter computes it itself
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+import pytest
+
+from aeiva.llm.llm_client import LLMClient
+from aeiva.llm.llm_gateway_config import LLMGatewayConfig
+from aeiva.llm.llm_gateway_exceptions import LLMInputTooLargeError
+from aeiva.llm.token_counter import TokenCounter, heuristic_count, model_family, register_tokenizer
+
+
+def test_model_family_routing():
+    assert model_family("gpt-4o-mini") == "o200k"
+    assert model_family("openai/gpt-4-turbo") == "cl100k"
+    assert model_family("o3-mini") == "o200k"
+    assert model_family("claude-3-5-sonnet") == "heuristic"
+
+
+def test_count_messages_memoizes_per_message():
+    counter = TokenCounter(family="heuristic")
+    messages = [
+        {"role": "system", "content": "You are helpful."},
+        {"role": "user", "content": "hello " * 50},
+    ]
+    first = counter.count_messages(messages)
+    messages.append({"role": "assistant", "content": "ok"})
+    second = counter.count_messages(messages)
+
+    assert second > first
+    assert counter.cache_hits == 2
+    assert counter.cache_misses == 3
+    assert first >= heuristic_count("hello " * 50)
+
+
+def test_registered_tokenizer_is_used_in_batches():
+    batches = []
+
+    def factory():
+        def count(texts):
+            batches.append(list(texts))
+            return [len(text.split()) for text in texts]
+        return count
+
+    register_tokenizer("test-words", factory)
+    counter = TokenCounter(family="test-words")
+    assert counter.exact
+    assert counter.count_texts(["a b c", "d"]) == [3, 1]
+    counter.count_messages([{"role": "user", "content": "x y"}, {"role": "assistant", "content": "z"}])
+    assert len(batches) == 2
+
+
+class NeverCalledBackend:
+    def build_params(self, messages, tools=None, **kwargs):
+        raise AssertionError("oversized request should not be built")
+
+    async def execute(self, params, stream: bool = False):
+        raise AssertionError("oversized request should not be sent")
+
+
+@pytest.mark.asyncio
+async def test_preflight_rejects_oversized_request_without_retry():
+    cfg = LLMGatewayConfig(
+        llm_model_name="gpt-4o",
+        llm_api_key="test",
+        llm_max_input_tokens=100,
+        llm_preflight_input_tokens=True,
+        llm_num_retries=3,
+        llm_retry_backoff_factor=5,
+    )
+    client = LLMClient(cfg)
+    client.engine.backend = NeverCalledBackend()
+
+    with pytest.raises(LLMInputTooLargeError) as excinfo:
+        await client.arun([{"role": "user", "content": "word " * 1000}])
+    assert excinfo.value.token_count > 100
+    assert excinfo.value.max_tokens == 100
+
+
+def test_preflight_disabled_by_default():
+    client = LLMClient(LLMGatewayConfig(llm_model_name="gpt-4o", llm_api_key="test"))
+    assert client.engine.token_counter is None
+    assert client.count_tokens([{"role": "user", "content": "hi"}]) > 0
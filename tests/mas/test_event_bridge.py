@@ -0,0 +1,171 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from aeiva.event.event import Event
+from aeiva.event.event_bus import EventBus
+from aeiva.mas.mas import EventBatch, EventBridge, bridge_options
+from aeiva.neuron import Signal
+
+
+def _agent():
+    return SimpleNamespace(event_bus=EventBus())
+
+
+async def _collect(bus, pattern):
+    received = []
+
+    async def on_event(event):
+        received.append(event)
+
+    on_event.__name__ = f"collect_{pattern}"
+    bus.subscribe(pattern, on_event)
+    return received
+
+
+@pytest.mark.asyncio
+async def test_bridge_filters_rate_limits_and_batches():
+    source, target = _agent(), _agent()
+    source.event_bus.start()
+    target.event_bus.start()
+    bridge = EventBridge(
+        "main_to_memory",
+        source,
+        target,
+        ["cognition.thought", "perception.output", "action.result"],
+        **bridge_options(
+            {
+                "events": [],
+                "filter": lambda event: not (isinstance(event.payload, Signal) and event.payload.data.get("partial")),
+                "rate_limit": {"perception.output": 2},
+                "batch_window_ms": {"cognition.thought": 50},
+            }
+        ),
+    )
+    bridge.bind()
+    thoughts = await _collect(target.event_bus, "cognition.thought")
+    outputs = await _collect(target.event_bus, "perception.output")
+    actions = await _collect(target.event_bus, "action.result")
+
+    for i in range(5):
+        await source.event_bus.emit("cognition.thought", payload=Signal(source="cognition", data={"chunk": i}))
+    await source.event_bus.emit("cognition.thought", payload=Signal(source="cognition", data={"partial": True}))
+    for i in range(5):
+        await source.event_bus.emit("perception.output", payload={"i": i})
+    await source.event_bus.emit("action.result", payload="done")
+    await source.event_bus.wait_until_all_events_processed()
+    await asyncio.sleep(0.1)
+    await target.event_bus.wait_until_all_events_processed()
+
+    # Delivered as one batch, replayed on the target as the original events.
+    chunks = [event.payload for event in thoughts]
+    assert [signal.data["chunk"] for signal in chunks] == [0, 1, 2, 3, 4]
+    assert all(signal.hop_count == 1 for signal in chunks)
+    assert [event.payload for event in outputs] == [{"i": 0}, {"i": 1}]  # bucket of 2, no refill yet
+    assert [event.payload for event in actions] == ["done"]
+
+    stats = bridge.stats.to_dict()
+    assert stats["received"] == 12 and stats["filtered"] == 1 and stats["rate_limited"] == 3
+    assert stats["forwarded"] == 8 and stats["emissions"] == 4 and stats["batches"] == 1
+    assert stats["lag_ms_max"] >= 40  # batched events waited for the window
+    source.event_bus.stop()
+    target.event_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_max_flushes_early_and_flush_drains():
+    source, target = _agent(), _agent()
+    target.event_bus.start()
+    bridge = EventBridge("a_to_b", source, target, ["tick"], batch_windows={"tick": 60.0}, batch_max=3)
+    ticks = await _collect(target.event_bus, "tick")
+
+    for i in range(4):
+        await bridge.forward(Event(name="tick", payload=i), "tick")
+    await bridge.flush()
+    await target.event_bus.wait_until_all_events_processed()
+
+    assert [event.payload for event in ticks] == [0, 1, 2, 3]
+    assert bridge.stats.batches == 2
+    assert not bridge._flush_tasks
+    target.event_bus.stop()
+
+
+class BusAgent:
+    def __init__(self, config):
+        self.event_bus = EventBus()
+        self.raw_memory = None
+        self._stop_requested = False
+
+    async def setup_async(self):
+        return None
+
+    def request_stop(self):
+        self._stop_requested = True
+
+    async def run(self, raw_memory_session=None):
+        self.event_bus.start()
+        while not self._stop_requested:
+            await asyncio.sleep(0.01)
+        await self.event_bus.wait_until_all_events_processed()
+        self.event_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_stopping_the_system_delivers_pending_batches():
+    from aeiva.event.event_names import EventNames
+    from aeiva.mas.mas import MultiAgentSystem
+
+    mas = MultiAgentSystem(
+        {
+            "mas_config": {
+                "main_agent": "main",
+                "agents": {"main": {"role": "main"}, "memory": {"role": "memory"}},
+                "links": [{"source": "main", "target": "memory", "events": ["tick"], "batch_window_ms": 60000}],
+            }
+        },
+        agent_factory=BusAgent,
+    )
+    await mas.setup_async()
+    ticks = await _collect(mas.agents["memory"].event_bus, "tick")
+    run = asyncio.create_task(mas.run())
+    await asyncio.sleep(0.02)
+
+    for i in range(3):
+        await mas.main_agent.event_bus.emit("tick", payload=i)
+    await mas.main_agent.event_bus.emit(EventNames.AGENT_STOP)
+    await asyncio.wait_for(run, timeout=5)
+
+    assert [event.payload for event in ticks] == [0, 1, 2]  # not held for the 60s window
+    assert all(not bridge._callbacks and not bridge._pending for bridge in mas.bridges)
+
+
+@pytest.mark.asyncio
+async def test_batched_links_keep_the_signal_contract_for_handlers():
+    from aeiva.mas.process_runtime import emit_frame, encode_event
+
+    source, target = _agent(), _agent()
+    target.event_bus.start()
+    bridge = EventBridge("a_to_b", source, target, ["cognition.thought"], batch_windows={"cognition.thought": 60.0})
+    seen = []
+
+    @target.event_bus.on("cognition.thought")
+    async def on_thought(event):
+        signal = event.payload
+        assert isinstance(signal, Signal)
+        seen.append((signal.data["chunk"], event.priority))
+
+    for i in range(3):
+        event = Event(name="cognition.thought", payload=Signal(source="cognition", data={"chunk": i}), priority=i)
+        await bridge.forward(event, "cognition.thought")
+    await bridge.flush()
+    await target.event_bus.wait_until_all_events_processed()
+    assert sorted(seen) == [(0, 0), (1, 1), (2, 2)]
+
+    # A batch that crossed a process boundary is unpacked the same way.
+    seen.clear()
+    batch = EventBatch(name="cognition.thought", payloads=[Signal(source="cognition", data={"chunk": 7})])
+    await emit_frame({"b": target}, "b", encode_event("cognition.thought", batch, 0))
+    await target.event_bus.wait_until_all_events_processed()
+    assert seen == [(7, 0)]
+    target.event_bus.stop()
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from aeiva.event.event_bus import EventBus
+from aeiva.event.event_names import EventNames
+from aeiva.mas.mas import MultiAgentSystem
+from aeiva.mas.process_runtime import (
+    FRAME_EVENT,
+    _FrameChannel,
+    _FrameEmitter,
+    decode_event,
+    encode_event,
+    resolve_process_groups,
+)
+from aeiva.neuron import Signal
+
+
+class FakeAgent:
+    """Minimal Agent stand-in: relays `ping` -> `relay` -> `pong` and stops on `pong` in main."""
+
+    def __init__(self, config):
+        self.role = config.get("fake_role", "idle")
+        self.event_bus = EventBus()
+        self.raw_memory = None
+        self.received = []
+        self._stop_requested = False
+
+    async def setup_async(self):
+        await asyncio.sleep(0.2)  # concurrent setup keeps this off the critical path
+
+    def request_stop(self):
+        self._stop_requested = True
+
+    async def run(self, raw_memory_session=None):
+        bus = self.event_bus
+        bus.start()
+
+        async def on_event(event):
+            self.received.append(event)
+            signal = event.payload
+            pids = list(signal.data.get("pids", [])) + [os.getpid()]
+            if self.role == "first_hop":
+                await bus.emit("relay", payload=signal.child(source="memory", data={"pids": pids}))
+            elif self.role == "second_hop":
+                await bus.emit("pong", payload=signal.child(source="emotion", data={"pids": pids}))
+            elif self.role == "main" and event.name == "pong":
+                await bus.emit(EventNames.AGENT_STOP)
+
+        on_event.__name__ = f"fake_{self.role}"
+        bus.subscribe({"first_hop": "ping", "second_hop": "relay", "main": "pong"}.get(self.role, "none"), on_event)
+        while not self._stop_requested:
+            await asyncio.sleep(0.01)
+        await bus.wait_until_all_events_processed()
+        bus.stop()
+
+
+class FailingMainAgent(FakeAgent):
+    async def setup_async(self):
+        if self.role == "main":
+            raise RuntimeError("main setup failed")
+        await super().setup_async()
+
+
+def _config():
+    return {
+        "mas_config": {
+            "execution": "process",
+            "main_agent": "main",
+            "agents": {
+                "main": {"role": "main", "config": {"fake_role": "main"}},
+                "memory": {"role": "memory", "config": {"fake_role": "first_hop"}},
+                "emotion": {"role": "emotion", "config": {"fake_role": "second_hop"}},
+            },
+            "links": [
+                {"source": "main", "target": "memory", "events": ["ping"]},
+                {"source": "memory", "target": "emotion", "events": ["relay"]},
+                {"source": "emotion", "target": "main", "events": ["pong"]},
+            ],
+        }
+    }
+
+
+def test_signal_frames_round_trip_and_group_resolution():
+    signal = Signal(source="main", data={"text": "hi"}, hop_count=2, priority=3)
+    name, payload, priority = decode_event(encode_event("perception.output", signal, priority=5))
+    assert (name, priority) == ("perception.output", 5)
+    assert payload == signal and isinstance(payload, Signal)
+    assert decode_event(encode_event("x", {"a": 1}))[1] == {"a": 1}
+
+    local, remote = resolve_process_groups(
+        ["main", "memory", "emotion", "goal"], "main", [["memory", "goal"], ["main", "emotion"]]
+    )
+    assert local == ["main", "emotion"] and remote == [("memory", "goal")]
+    assert resolve_process_groups(["main", "memory"], "main", None) == (["main"], [("memory",)])
+
+
+@pytest.mark.asyncio
+async def test_agents_run_in_worker_processes_and_stop_together():
+    mas = MultiAgentSystem(_config(), agent_factory=FakeAgent)
+    await mas.setup_async()
+    assert list(mas.agents) == ["main"]
+    workers = [worker.process for worker in mas._process_runtime.workers]
+    assert len(workers) == 2 and all(process.is_alive() for process in workers)
+
+    run = asyncio.create_task(mas.run())
+    await mas.main_agent.event_bus.emit("ping", payload=Signal(source="main", data={"pids": [os.getpid()]}))
+    await asyncio.wait_for(run, timeout=30)
+
+    pong = next(event for event in mas.main_agent.received if event.name == "pong")
+    pids = pong.payload.data["pids"]
+    assert len(set(pids)) == 3  # main, memory worker, emotion worker
+    assert pong.payload.hop_count == 5  # three bridges plus two re-emits
+    assert not any(process.is_alive() for process in workers)
+
+
+@pytest.mark.asyncio
+async def test_inline_setup_runs_agents_concurrently():
+    config = _config()
+    config["mas_config"]["execution"] = "inline"
+    mas = MultiAgentSystem(config, agent_factory=FakeAgent)
+    started = asyncio.get_running_loop().time()
+    await mas.setup_async()
+    assert set(mas.agents) == {"main", "memory", "emotion"}
+    assert asyncio.get_running_loop().time() - started < 0.5  # three 0.2s setups overlap
+    assert len(mas.bridges) == 3
+
+
+def test_frame_channel_sends_do_not_block_on_a_full_pipe():
+    left, right = multiprocessing.Pipe()
+    channel = _FrameChannel(left, "test")
+    started = time.perf_counter()
+    for _ in range(8):  # far more than the OS pipe buffer, with nobody reading yet
+        assert channel.send(FRAME_EVENT, "memory", b"x" * 256 * 1024)
+    assert time.perf_counter() - started < 0.5
+    assert len([right.recv_bytes() for _ in range(8)]) == 8
+    channel.close()
+    right.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_terminates_spawned_workers():
+    mas = MultiAgentSystem(_config(), agent_factory=FailingMainAgent)
+    with pytest.raises(RuntimeError, match="main setup failed"):
+        await mas.setup_async()
+    workers = [worker.process for worker in mas._process_runtime.workers]
+    assert len(workers) == 2 and not any(process.is_alive() for process in workers)
+
+
+@pytest.mark.asyncio
+async def test_frame_emit_failures_are_logged_and_drained(caplog):
+    class BrokenBus:
+        async def emit(self, name, payload=None, priority=0):
+            raise ValueError("bus is gone")
+
+    class Target:
+        event_bus = BrokenBus()
+
+    emitter = _FrameEmitter({"memory": Target()})
+    with caplog.at_level(logging.WARNING, logger="aeiva.mas.process_runtime"):
+        emitter.emit("memory", encode_event("ping", {"n": 1}))
+        await emitter.drain()
+    assert "bus is gone" in caplog.text
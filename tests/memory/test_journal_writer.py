@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+import pytest
+
+from aeiva.cognition.memory.journal_writer import JournalWriter
+from aeiva.cognition.memory.raw_memory import RawMemoryConfig, RawMemoryJournal, RawMemoryNeuron
+from aeiva.event.event_names import EventNames
+from aeiva.neuron import Signal
+
+
+def _daily_text(base_dir, user="User"):
+    files = sorted((base_dir / user).glob("??-??-??.md"))
+    return "".join(path.read_text(encoding="utf-8") for path in files)
+
+
+def _neuron(base_dir, **overrides):
+    cfg = {
+        "raw_memory": {"base_dir": str(base_dir), "user_id": "User", "timezone": "UTC"},
+        "flush_interval": 0,
+    }
+    cfg.update(overrides)
+    return RawMemoryNeuron(config=cfg)
+
+
+async def _say(neuron, content, session_id=None):
+    data = {"user_id": "User", "role": "user", "content": content}
+    if session_id:
+        data["session_id"] = session_id
+    await neuron.process(Signal(source=EventNames.RAW_MEMORY_UTTERANCE, data=data))
+
+
+@pytest.mark.asyncio
+async def test_writer_buffers_until_threshold_and_close(tmp_path):
+    path = tmp_path / "journal.md"
+    writer = JournalWriter(flush_bytes=100, flush_interval=0, fsync_policy="session")
+
+    writer.append(path, "a" * 40, header="# Journal\n\n")
+    writer.append(path, "b" * 40, header="# ignored\n\n")
+    assert not path.exists() and writer.pending_text(path) == "a" * 40 + "b" * 40
+
+    writer.append(path, "c" * 40)  # crosses flush_bytes: flushed in the background
+    await writer._flush_task
+    assert path.read_text(encoding="utf-8") == "# Journal\n\n" + "a" * 40 + "b" * 40 + "c" * 40
+    assert writer.pending_bytes == 0 and writer.fsyncs == 0
+
+    writer.append(path, "tail\n")
+    await writer.close()
+    assert path.read_text(encoding="utf-8").endswith("c" * 40 + "tail\n")
+    assert writer.stats()["open_files"] == 0 and writer.fsyncs == 1
+
+
+@pytest.mark.asyncio
+async def test_background_flush_failures_are_logged(tmp_path, caplog):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    writer = JournalWriter(flush_bytes=1, flush_interval=0)
+    with caplog.at_level(logging.WARNING, logger="aeiva.cognition.memory.journal_writer"):
+        writer.append(blocker / "journal.md", "lost")
+        await asyncio.gather(writer._flush_task, return_exceptions=True)
+        await asyncio.sleep(0)
+    assert "background flush failed" in caplog.text
+
+
+def test_session_blocks_are_written_once(tmp_path):
+    config = RawMemoryConfig(base_dir=str(tmp_path), user_id="User", timezone="UTC")
+    journal = RawMemoryJournal(config)
+    journal.append_utterance("s1", "user", "hello")
+    path = journal.end_session("s1")
+    journal.end_session("s1")
+    RawMemoryJournal(config).end_session("s1")  # a fresh journal scans the file instead
+    assert path.read_text(encoding="utf-8").count("## Session s1") == 1
+
+
+@pytest.mark.asyncio
+async def test_neuron_session_end_is_durable_and_teardown_flushes(tmp_path):
+    neuron = _neuron(tmp_path)
+    await neuron.setup()
+
+    await _say(neuron, "first session", session_id="s1")
+    result = await neuron.process(Signal(
+        source=EventNames.RAW_MEMORY_SESSION_END,
+        data={"user_id": "User", "session_id": "s1"},
+    ))
+    assert result["success"] and "first session" in _daily_text(tmp_path)
+    assert neuron._writer.fsyncs >= 1 and neuron._writer.pending_bytes == 0
+    assert "s1" not in neuron._journal("User")._sessions
+
+    await _say(neuron, "still open at shutdown")  # auto-started session
+    assert "still open" not in _daily_text(tmp_path)
+    await neuron.teardown()
+    assert "still open at shutdown" in _daily_text(tmp_path)
+    assert neuron._active_sessions == {} and neuron._writer.stats()["open_files"] == 0
+
+
+@pytest.mark.asyncio
+async def test_auto_close_on_reply_writes_in_a_tracked_task(tmp_path):
+    neuron = _neuron(tmp_path, auto_close_on_reply=True)
+    await neuron.setup()
+    await neuron.process(Signal(source="perception.output", data={"user_id": "User", "content": "hi"}))
+    await neuron.process(Signal(source="cognition.thought", data={"user_id": "User", "thought": "hello back"}))
+
+    assert len(neuron._pending_writes) == 1
+    await neuron.teardown()
+    assert neuron._pending_writes == set()
+    text = _daily_text(tmp_path)
+    assert "hi" in text and "hello back" in text
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aeiva.cognition.memory.raw_memory import RawMemoryConfig, RawMemoryJournal
+from aeiva.cognition.memory.summary_memory import SummaryMemoryNeuron
+from aeiva.event.event_names import EventNames
+from aeiva.neuron import Signal
+
+
+class SlowLLM:
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    async def agenerate(self, messages):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return json.dumps({"summary": "ok", "user_memory_updates": []})
+
+
+def _write_sessions(base_dir, count):
+    journal = RawMemoryJournal(RawMemoryConfig(base_dir=str(base_dir), user_id="User", timezone="UTC"))
+    when = datetime.now(timezone.utc) - timedelta(days=1)
+    for index in range(count):
+        sid = f"s{index:03d}"
+        journal.start_session(session_id=sid, start_time=when)
+        journal.append_utterance(sid, "user", f"hello {index}", timestamp=when)
+        journal.append_utterance(sid, "assistant", "hi", timestamp=when)
+        journal.end_session(sid, end_time=when)
+
+
+def _neuron(base_dir, **overrides):
+    cfg = {
+        "raw_memory": {"base_dir": str(base_dir), "user_id": "User", "timezone": "UTC"},
+        "summary_periods": ["dialogue", "daily"],
+        "startup_catchup_concurrency": 3,
+    }
+    cfg.update(overrides)
+    return SummaryMemoryNeuron(config=cfg)
+
+
+@pytest.mark.asyncio
+async def test_startup_catchup_is_concurrent_and_bounded(tmp_path):
+    _write_sessions(tmp_path, 6)
+    neuron = _neuron(tmp_path)
+    llm = SlowLLM()
+    neuron._llm_client = llm
+
+    results = await neuron.startup_catchup()
+
+    assert results["dialogue_summaries"] == 6
+    assert results["period_summaries"] == 1
+    assert 1 < llm.max_active <= 3
+    progress = neuron.catchup_progress()
+    assert progress["state"] == "completed"
+    assert progress["completed"] == progress["total"] == 7
+
+
+@pytest.mark.asyncio
+async def test_startup_catchup_resumes_from_checkpoint(tmp_path):
+    _write_sessions(tmp_path, 4)
+    neuron = _neuron(tmp_path, startup_catchup_concurrency=1)
+    llm = SlowLLM(delay=0.05)
+    neuron._llm_client = llm
+
+    task = neuron.start_background_catchup()
+    while neuron.catchup_progress().get("completed", 0) < 2:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert neuron.catchup_progress()["state"] == "cancelled"
+
+    resumed = _neuron(tmp_path, startup_catchup_concurrency=1)
+    resumed_llm = SlowLLM(delay=0)
+    resumed._llm_client = resumed_llm
+    await resumed.startup_catchup()
+
+    # 5 jobs in total; only the job in flight at cancel time may run twice.
+    assert llm.calls + resumed_llm.calls <= 6
+    assert resumed.catchup_progress()["state"] == "completed"
+    daily_files = (tmp_path / "User").glob("??-??-??.md")
+    content = "".join(path.read_text() for path in daily_files)
+    for index in range(4):
+        assert content.count(f"### Session Summary s{index:03d}") == 1
+
+
+def _summary_counts(base_dir):
+    content = "".join(path.read_text() for path in (base_dir / "User").rglob("*.md"))
+    return content.count("### Session Summary s000"), content.count(RawMemoryJournal.summary_heading("daily"))
+
+
+@pytest.mark.asyncio
+async def test_session_start_defers_to_a_running_catchup(tmp_path):
+    _write_sessions(tmp_path, 1)
+    neuron = _neuron(tmp_path)
+    llm = SlowLLM()
+    neuron._llm_client = llm
+
+    task = neuron.start_background_catchup()
+    result = await neuron.process(Signal(source=EventNames.RAW_MEMORY_SESSION_START, data={}))
+    assert result["skipped"] and result["reason"] == "catchup_in_progress"
+    await task
+
+    assert llm.calls == 2  # one session, one daily summary
+    assert _summary_counts(tmp_path) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handlers_write_each_summary_once(tmp_path):
+    _write_sessions(tmp_path, 1)
+    neuron = _neuron(tmp_path, startup_catchup_enabled=False)
+    neuron._llm_client = SlowLLM()
+
+    signal = Signal(source=EventNames.RAW_MEMORY_SESSION_START, data={})
+    await asyncio.gather(neuron.process(signal), neuron.process(signal))
+
+    assert _summary_counts(tmp_path) == (1, 1)
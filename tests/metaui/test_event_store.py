@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from aeiva.metaui.event_store import MetaUIEventStore
+from aeiva.metaui.orchestrator import MetaUIOrchestrator
+from aeiva.metaui.protocol import MetaUIEvent
+
+
+def _event(ui_id, event_type="change", session_id=None, **payload):
+    return MetaUIEvent(ui_id=ui_id, session_id=session_id, event_type=event_type, payload=payload)
+
+
+def _query(store, **kwargs):
+    params = {"ui_id": None, "session_id": None, "event_types": None, "since_ts": None, "limit": 50, "consume": False}
+    params.update(kwargs)
+    return store.query(**params)
+
+
+def test_cursor_queries_and_consume_only_touch_matching_partitions():
+    store = MetaUIEventStore(limit=64)
+    for index in range(10):
+        store.append(_event("a", "change", session_id="s1", n=index))
+        store.append(_event("b", "submit" if index % 3 == 0 else "change", n=index))
+
+    events, _, cursor = _query(store, ui_id="a", session_id="s1", limit=4)
+    assert [event.payload["n"] for event in events] == [0, 1, 2, 3]
+    events, _, cursor = _query(store, ui_id="a", after_seq=cursor, limit=50)
+    assert [event.payload["n"] for event in events] == [4, 5, 6, 7, 8, 9]
+    assert _query(store, ui_id="a", after_seq=cursor) == ([], False, store.last_seq)
+
+    submits, consumed, _ = _query(store, event_types=["submit"], consume=True)
+    assert consumed and [event.payload["n"] for event in submits] == [0, 3, 6, 9]
+    assert _query(store, event_types=["submit"])[0] == []
+    assert len(_query(store, ui_id="b")[0]) == 6 and store.size == 16
+
+    for index in range(200):  # oldest events are evicted and their indexes trimmed
+        store.append(_event("c", n=index))
+    assert store.size == 64 and _query(store, ui_id="a")[0] == []
+    assert store.health_snapshot().partitions == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_wake_only_for_their_own_session():
+    orchestrator = MetaUIOrchestrator(port=0)
+    woken = []
+    store = orchestrator._event_store
+    original_query = store.query
+
+    def counting_query(**kwargs):
+        woken.append(kwargs["ui_id"])
+        return original_query(**kwargs)
+
+    store.query = counting_query
+    waiter = asyncio.create_task(orchestrator.wait_event(ui_id="target", event_types=["submit"], timeout=2))
+    await asyncio.sleep(0.05)
+
+    for index in range(20):
+        await orchestrator._record_event({"ui_id": "noise", "event_type": "submit", "payload": {"n": index}})
+    await orchestrator._record_event({"ui_id": "target", "event_type": "change"})
+    await asyncio.sleep(0.05)
+    assert woken == ["target"]  # only the initial query ran
+
+    await orchestrator._record_event({"ui_id": "target", "event_type": "submit", "payload": {"ok": True}})
+    result = await asyncio.wait_for(waiter, timeout=1)
+    assert result["success"] and result["event"]["payload"] == {"ok": True}
+    assert woken == ["target", "target"]
+    assert store.health_snapshot().waiters == 0
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from aeiva.metaui.capabilities import negotiate_client_capabilities
+from aeiva.metaui.component_catalog import get_component_catalog
+from aeiva.metaui.orchestrator import MetaUIOrchestrator, _ClientConnection
+
+
+SPEC = {
+    "ui_id": "ui_fanout",
+    "title": "Fanout",
+    "components": [
+        {"id": "root", "type": "Column", "props": {"children": ["go"]}},
+        {"id": "go_label", "type": "Text", "props": {"text": "Go"}},
+        {"id": "go", "type": "Button", "props": {"child": "go_label", "action": {"event": {"name": "submit"}}}},
+    ],
+    "root": ["root"],
+}
+
+
+class RawWebSocket:
+    def __init__(self, *, blocked=False):
+        self.frames = []
+        self.closed_with = None
+        self._release = asyncio.Event()
+        if not blocked:
+            self._release.set()
+
+    async def send(self, raw):
+        await self._release.wait()
+        self.frames.append(raw)
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = (code, reason)
+
+
+async def _connect(orchestrator, client_id, websocket, features=()):
+    capabilities = negotiate_client_capabilities(
+        hello_payload={"features": list(features)},
+        server_catalog=get_component_catalog(),
+    )
+    connection = _ClientConnection(websocket=websocket, capabilities=capabilities, connected_at=time.time())
+    await orchestrator._register_client(client_id=client_id, connection=connection)
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_a_stuck_client_does_not_block_others():
+    orchestrator = MetaUIOrchestrator(port=0, send_timeout_seconds=0.3)
+    fast = [RawWebSocket() for _ in range(3)]
+    stuck = RawWebSocket(blocked=True)
+    for index, websocket in enumerate(fast):
+        await _connect(orchestrator, f"fast-{index}", websocket)
+    await _connect(orchestrator, "stuck", stuck)
+
+    started = time.perf_counter()
+    result = await orchestrator.render_full(spec=SPEC)
+    assert time.perf_counter() - started < 0.6
+    assert result["sent"] == 3
+    assert all(websocket.frames[0] is fast[0].frames[0] for websocket in fast)  # one json.dumps per payload
+
+    await asyncio.sleep(0.4)  # the stuck client's writer times out and drops it
+    assert stuck.closed_with == (1013, "send failed")
+    result = await orchestrator.render_full(spec=SPEC)
+    assert result["connected_clients"] == 3
+    await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_clients_get_one_frame_per_render():
+    orchestrator = MetaUIOrchestrator(port=0)
+    batched = RawWebSocket()
+    await _connect(orchestrator, "batched", batched, features=["a2ui_batch_v1"])
+    await orchestrator.render_full(spec=SPEC)
+
+    assert len(batched.frames) == 1
+    messages = json.loads(batched.frames[0])
+    assert [next(iter(message)) for message in messages] == ["createSurface", "updateComponents"]
+    assert (await orchestrator.status())["wire_stats"]["coalesced_frames"] == 1
+    await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["close", "drop"])
+async def test_full_send_queue_applies_slow_client_policy(policy):
+    orchestrator = MetaUIOrchestrator(port=0, send_timeout_seconds=5, send_queue_frames=3, slow_client_policy=policy)
+    slow = RawWebSocket(blocked=True)
+    connection = await _connect(orchestrator, "slow", slow)
+    orchestrator._outbox(connection)  # the writer keeps the 5s send timeout
+    orchestrator.send_timeout_seconds = 0.05  # only bound how long the broadcast waits
+
+    for _ in range(3):
+        await orchestrator.render_full(spec=SPEC)  # two frames each; the third render overflows
+
+    stats = (await orchestrator.status())["wire_stats"]
+    assert stats["dropped_batches"] >= 1
+    if policy == "close":
+        assert slow.closed_with == (1013, "client too slow") and stats["slow_client_closes"] == 1
+        assert (await orchestrator.status())["connected_clients"] == 0
+    else:
+        assert slow.closed_with is None and connection.outbox.depth() == 3
+        assert "ui_fanout" not in connection.surface_revisions
+    await orchestrator.stop()
@@ -0,0 +1,102 @@
+import json
+import time
+
+import pytest
+
+from aeiva.metaui.capabilities import negotiate_client_capabilities
+from aeiva.metaui.component_catalog import get_component_catalog
+from aeiva.metaui.orchestrator import MetaUIOrchestrator, _ClientConnection
+from aeiva.metaui.protocol import MetaUISpec
+from aeiva.metaui.spec_normalizer import normalize_metaui_patch, normalize_metaui_spec
+from aeiva.metaui.update_strategy import apply_incremental_patch, apply_structural_patch_to_spec
+
+
+SPEC = {
+    "ui_id": "ui_demo",
+    "title": "Demo",
+    "components": [
+        {"id": "root", "type": "Column", "props": {"children": ["title", "go"]}},
+        {"id": "title", "type": "Text", "props": {"text": "Hello"}},
+        {"id": "go_label", "type": "Text", "props": {"text": "Go"}},
+        {"id": "go", "type": "Button", "props": {"child": "go_label", "action": {"event": {"name": "submit"}}}},
+    ],
+    "root": ["root"],
+}
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, raw):
+        self.sent.append(json.loads(raw))
+
+    def kinds(self):
+        return [next(key for key in payload if key != "version") for payload in self.sent]
+
+
+async def _connect(orchestrator, client_id, features):
+    websocket = FakeWebSocket()
+    capabilities = negotiate_client_capabilities(
+        hello_payload={"features": features},
+        server_catalog=get_component_catalog(),
+    )
+    connection = _ClientConnection(websocket=websocket, capabilities=capabilities, connected_at=time.time())
+    await orchestrator._register_client(client_id=client_id, connection=connection)
+    return websocket, connection
+
+
+def test_incremental_patch_matches_full_normalization():
+    spec = MetaUISpec.model_validate(normalize_metaui_spec(SPEC))
+    patches = [
+        {"op": "update_component", "id": "title", "props": {"text": "Bye"}},
+        {"op": "update_component", "id": "go", "props": {"variant": "primary"}},
+        {"op": "append_component", "component": {"id": "go_label", "type": "Text", "props": {"text": "Run"}}},
+    ]
+    for raw in patches:
+        patch = normalize_metaui_patch(raw)
+        incremental = apply_incremental_patch(spec, patch)
+        full = normalize_metaui_spec(apply_structural_patch_to_spec(spec.model_dump(mode="json"), patch))
+        assert incremental.spec.model_dump(mode="json") == full and incremental.issues == ()
+        spec = incremental.spec
+
+    assert apply_incremental_patch(spec, normalize_metaui_patch({"op": "set_title", "title": "x"})) is None
+    assert apply_incremental_patch(spec, normalize_metaui_patch({"op": "remove_component", "id": "root"})) is None
+    with pytest.raises(ValueError, match="unreachable"):
+        apply_incremental_patch(spec, normalize_metaui_patch({"op": "append_component", "component": {"id": "n", "type": "Text", "props": {"text": "n"}}}))
+
+
+@pytest.mark.asyncio
+async def test_patch_sends_delta_only_to_clients_at_the_base_revision():
+    orchestrator = MetaUIOrchestrator(port=0)
+    delta_ws, delta_conn = await _connect(orchestrator, "delta", ["surface_delta_v1"])
+    legacy_ws, _ = await _connect(orchestrator, "legacy", [])
+
+    assert (await orchestrator.render_full(spec=SPEC))["success"]
+    assert delta_ws.sent[1]["updateComponents"]["revision"] == 1
+    assert "revision" not in legacy_ws.sent[1]["updateComponents"]
+    delta_ws.sent.clear()
+    legacy_ws.sent.clear()
+
+    result = await orchestrator.patch(ui_id="ui_demo", patch={"op": "update_component", "id": "title", "props": {"text": "Bye"}})
+    assert result["success"]
+    message = delta_ws.sent[0]["patchSurface"]
+    assert (message["baseRevision"], message["revision"]) == (1, 2)
+    assert [item["id"] for item in message["upsert"]] == ["title"] and message["remove"] == []
+    assert legacy_ws.kinds() == ["createSurface", "updateComponents"]
+
+    # A client that missed a revision gets a full render instead of a delta.
+    delta_ws.sent.clear()
+    delta_conn.surface_revisions["ui_demo"] = 1
+    await orchestrator.patch(ui_id="ui_demo", patch={"op": "update_component", "id": "go_label", "props": {"text": "Run"}})
+    assert delta_ws.kinds()[:2] == ["createSurface", "updateComponents"]
+    assert delta_conn.surface_revisions["ui_demo"] == 3
+
+    status = await orchestrator.status()
+    wire = status["wire_stats"]
+    assert wire["patches"] == 2 and wire["delta_deliveries"] == 1 and wire["full_deliveries"] == 3
+    assert wire["bytes_by_kind"]["patchSurface"] < wire["bytes_by_kind"]["updateComponents"]
+    spec = (await orchestrator.get_session("ui_demo"))["spec"]
+    texts = {item["id"]: item["props"].get("text") for item in spec["components"]}
+    assert texts["title"] == "Bye" and texts["go_label"] == "Run"
+    await orchestrator.stop()